@@ -4,29 +4,52 @@ AI Council - A production-grade multi-agent orchestration system.
 This package provides intelligent coordination of multiple AI models
 to solve complex problems through structured decomposition, routing,
 execution, arbitration, and synthesis.
+
+The public names below are imported on first access, so ``import ai_council``
+stays cheap for CLI and serverless cold starts.
 """
 
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_attributes
+
 __version__ = "0.1.0"
 __author__ = "AI Council Team"
 
-from .core.models import (
-    Task,
-    Subtask,
-    SelfAssessment,
-    AgentResponse,
-    FinalResponse,
-    TaskType,
-    ExecutionMode,
-    RiskLevel,
-)
-
-from .main import AICouncil
-from .factory import AICouncilFactory
-from .utils.config import AICouncilConfig, load_config, create_default_config
+if TYPE_CHECKING:
+    from .core.models import (
+        Task,
+        Subtask,
+        SelfAssessment,
+        AgentResponse,
+        FinalResponse,
+        TaskType,
+        ExecutionMode,
+        RiskLevel,
+    )
+    from .main import AICouncil
+    from .factory import AICouncilFactory
+    from .utils.config import AICouncilConfig, load_config, create_default_config
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "Task": ".core.models",
+    "Subtask": ".core.models",
+    "SelfAssessment": ".core.models",
+    "AgentResponse": ".core.models",
+    "FinalResponse": ".core.models",
+    "TaskType": ".core.models",
+    "ExecutionMode": ".core.models",
+    "RiskLevel": ".core.models",
+    "AICouncil": ".main",
+    "AICouncilFactory": ".factory",
+    "AICouncilConfig": ".utils.config",
+    "load_config": ".utils.config",
+    "create_default_config": ".utils.config",
+})
 
 __all__ = [
     "Task",
-    "Subtask", 
+    "Subtask",
     "SelfAssessment",
     "AgentResponse",
     "FinalResponse",
@@ -38,4 +61,4 @@ __all__ = [
     "AICouncilConfig",
     "load_config",
     "create_default_config",
-]
\ No newline at end of file
+]
@@ -1,6 +1,16 @@
 """Analysis module for AI Council system."""
 
-from .engine import BasicAnalysisEngine
-from .decomposer import BasicTaskDecomposer
+from typing import TYPE_CHECKING
 
-__all__ = ['BasicAnalysisEngine', 'BasicTaskDecomposer']
\ No newline at end of file
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .engine import BasicAnalysisEngine
+    from .decomposer import BasicTaskDecomposer
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "BasicAnalysisEngine": ".engine",
+    "BasicTaskDecomposer": ".decomposer",
+})
+
+__all__ = ['BasicAnalysisEngine', 'BasicTaskDecomposer']
@@ -1,5 +1,14 @@
 """Arbitration layer for conflict resolution."""
 
-from .layer import ConcreteArbitrationLayer
+from typing import TYPE_CHECKING
 
-__all__ = ['ConcreteArbitrationLayer']
\ No newline at end of file
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .layer import ConcreteArbitrationLayer
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ConcreteArbitrationLayer": ".layer",
+})
+
+__all__ = ['ConcreteArbitrationLayer']
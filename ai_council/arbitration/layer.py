@@ -1,7 +1,10 @@
 """Implementation of the ArbitrationLayer for conflict resolution between agent responses."""
 
 import logging
-from typing import List, Dict, Set, Optional
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator, List, Dict, Set, Optional, Tuple
 from datetime import datetime
 
 from ..core.interfaces import ArbitrationLayer, Conflict, Resolution, ArbitrationResult
@@ -11,6 +14,19 @@ from ..core.models import AgentResponse, RiskLevel
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ResponseFeatures:
+    """Arbitration features of a response, computed once per arbitration."""
+    response_id: str
+    response: AgentResponse
+    quality_score: float = 0.0
+    confidence: float = 0.0
+    risk_score: float = 0.0
+    latency: float = 0.0
+    cost: float = 0.0
+    has_assessment: bool = False
+
+
 class ConcreteArbitrationLayer(ArbitrationLayer):
     """
     Concrete implementation of ArbitrationLayer that resolves conflicts between
@@ -23,16 +39,35 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
     - Validating output consistency and coherence
     """
     
-    def __init__(self, confidence_threshold: float = 0.7, quality_weight: float = 0.6):
+    def __init__(
+        self,
+        confidence_threshold: float = 0.7,
+        quality_weight: float = 0.6,
+        max_workers: int = 4,
+        use_processes: bool = False
+    ):
         """
         Initialize the arbitration layer with configurable parameters.
         
         Args:
             confidence_threshold: Minimum confidence score to consider a response reliable
             quality_weight: Weight given to quality metrics vs confidence in arbitration
+            max_workers: Maximum number of subtask groups arbitrated concurrently;
+                1 arbitrates groups one after another
+            use_processes: Arbitrate groups in a process pool instead of threads,
+                so CPU-bound conflict detection on large responses is not
+                serialized by the GIL
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
         self.confidence_threshold = confidence_threshold
         self.quality_weight = quality_weight
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        # Created on the first fan-out and reused until shutdown()
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
         logger.info(f"ArbitrationLayer initialized with confidence_threshold={confidence_threshold}, quality_weight={quality_weight}")
     
     def arbitrate(self, responses: List[AgentResponse]) -> ArbitrationResult:
@@ -59,10 +94,16 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
                 logger.warning(f"Single response failed quality validation: {response.subtask_id}")
                 return ArbitrationResult(validated_responses=[], conflicts_resolved=[])
         
+        groups = self._group_responses_by_subtask(responses)
+        if self.max_workers > 1 and sum(1 for group in groups if len(group) > 1) > 1:
+            # Groups are independent, so several with conflicts to detect run concurrently
+            return self._merge_results(responses, self.arbitrate_groups(responses))
+        
         logger.info(f"Starting arbitration for {len(responses)} responses")
         
-        # Step 1: Detect conflicts between responses
-        conflicts = self.detect_conflicts(responses)
+        # Step 1: Detect conflicts between responses, scoring each response once
+        features = self._compute_features(responses)
+        conflicts = self._detect_conflicts(features)
         logger.info(f"Detected {len(conflicts)} conflicts")
         
         # Step 2: Resolve each conflict
@@ -76,11 +117,102 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
                 logger.error(f"Failed to resolve conflict {conflict.conflict_type}: {e}")
         
         # Step 3: Build validated response list based on resolutions
-        validated_responses = self._build_validated_responses(responses, conflicts, resolutions)
+        validated_responses = self._build_validated_responses(
+            responses, conflicts, resolutions, [feature.response_id for feature in features]
+        )
+        
+        logger.info(f"Arbitration complete: {len(validated_responses)} validated responses, {len(resolutions)} conflicts resolved")
+        return ArbitrationResult(validated_responses=validated_responses, conflicts_resolved=resolutions)
+    
+    def arbitrate_groups(self, responses: List[AgentResponse]) -> Iterator[ArbitrationResult]:
+        """
+        Arbitrate each subtask's responses independently, yielding results as they complete.
+        
+        Responses for different subtasks never conflict, so each subtask group
+        is arbitrated on its own worker and callers can start synthesizing a
+        group while later groups are still being arbitrated.
+        
+        Args:
+            responses: List of agent responses to arbitrate
+            
+        Yields:
+            ArbitrationResult for one subtask group, in completion order
+        """
+        groups = self._group_responses_by_subtask(responses)
+        if self.max_workers == 1 or len(groups) < 2:
+            for group in groups:
+                yield self._arbitrate_group(group)
+            return
+        
+        executor = self._get_executor()
+        futures = {executor.submit(_arbitrate_group, self, group): group for group in groups}
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if self.use_processes:
+                    # Worker processes return copies; hand back the caller's objects
+                    group = futures[future]
+                    result.validated_responses = [
+                        group[group.index(response)] for response in result.validated_responses
+                    ]
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the worker pool; a later fan-out creates a new one."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _get_executor(self) -> Executor:
+        """Return the layer's worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                self._executor = executor_class(max_workers=self.max_workers)
+                logger.info(f"Arbitration {executor_class.__name__} started with {self.max_workers} workers")
+            return self._executor
+    
+    def __getstate__(self) -> Dict:
+        # Copies sent to worker processes arbitrate one group and never fan out
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        del state["_executor_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
+    
+    def _arbitrate_group(self, responses: List[AgentResponse]) -> ArbitrationResult:
+        """Arbitrate the responses for a single subtask."""
+        # A single group never fans out again
+        return self.arbitrate(responses)
+    
+    def _merge_results(
+        self, responses: List[AgentResponse], results: Iterator[ArbitrationResult]
+    ) -> ArbitrationResult:
+        """Combine per-group results, keeping validated responses in input order."""
+        validated_ids = set()
+        resolutions = []
+        for result in results:
+            validated_ids.update(id(response) for response in result.validated_responses)
+            resolutions.extend(result.conflicts_resolved)
         
+        validated_responses = [r for r in responses if id(r) in validated_ids]
         logger.info(f"Arbitration complete: {len(validated_responses)} validated responses, {len(resolutions)} conflicts resolved")
         return ArbitrationResult(validated_responses=validated_responses, conflicts_resolved=resolutions)
     
+    def _group_responses_by_subtask(self, responses: List[AgentResponse]) -> List[List[AgentResponse]]:
+        """Group responses by their subtask ID, in order of first appearance."""
+        groups: Dict[str, List[AgentResponse]] = {}
+        for response in responses:
+            groups.setdefault(response.subtask_id, []).append(response)
+        return list(groups.values())
+    
     def detect_conflicts(self, responses: List[AgentResponse]) -> List[Conflict]:
         """
         Detect conflicts between multiple agent responses.
@@ -91,22 +223,50 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
         Returns:
             List[Conflict]: List of detected conflicts
         """
+        return self._detect_conflicts(self._compute_features(responses))
+    
+    def _detect_conflicts(self, features: List[ResponseFeatures]) -> List[Conflict]:
+        """Detect conflicts from precomputed response features."""
         conflicts = []
         
         # Group responses by subtask for comparison
-        subtask_groups = self._group_responses_by_subtask(responses)
+        subtask_groups: Dict[str, List[ResponseFeatures]] = {}
+        for feature in features:
+            subtask_groups.setdefault(feature.response.subtask_id, []).append(feature)
         
-        for subtask_id, subtask_responses in subtask_groups.items():
-            if len(subtask_responses) < 2:
+        for subtask_id, subtask_features in subtask_groups.items():
+            if len(subtask_features) < 2:
                 continue  # No conflicts possible with single response
             
             # Detect different types of conflicts within each subtask group
-            conflicts.extend(self._detect_content_contradictions(subtask_responses))
-            conflicts.extend(self._detect_confidence_conflicts(subtask_responses))
-            conflicts.extend(self._detect_quality_conflicts(subtask_responses))
+            conflicts.extend(self._detect_content_contradictions(subtask_features))
+            conflicts.extend(self._detect_confidence_conflicts(subtask_features))
+            conflicts.extend(self._detect_quality_conflicts(subtask_features))
         
         return conflicts
     
+    def _compute_features(self, responses: List[AgentResponse]) -> List[ResponseFeatures]:
+        """Compute the ID, scores, latency and cost of each response once."""
+        features = []
+        for response in responses:
+            response_id = response.subtask_id + "_" + response.model_used
+            assessment = response.self_assessment
+            if not response.success or not assessment:
+                features.append(ResponseFeatures(response_id=response_id, response=response))
+                continue
+            
+            features.append(ResponseFeatures(
+                response_id=response_id,
+                response=response,
+                quality_score=self._calculate_quality_score(response),
+                confidence=assessment.confidence_score,
+                risk_score=self._risk_level_to_score(assessment.risk_level),
+                latency=assessment.execution_time,
+                cost=assessment.estimated_cost,
+                has_assessment=True
+            ))
+        return features
+    
     def resolve_contradiction(self, conflict: Conflict) -> Resolution:
         """
         Resolve a specific contradiction between responses.
@@ -132,147 +292,161 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
                 confidence=0.5
             )
     
-    def _group_responses_by_subtask(self, responses: List[AgentResponse]) -> Dict[str, List[AgentResponse]]:
-        """Group responses by their subtask ID."""
-        groups = {}
-        for response in responses:
-            if response.subtask_id not in groups:
-                groups[response.subtask_id] = []
-            groups[response.subtask_id].append(response)
-        return groups
-    
-    def _detect_content_contradictions(self, responses: List[AgentResponse]) -> List[Conflict]:
+    def _detect_content_contradictions(self, features: List[ResponseFeatures]) -> List[Conflict]:
         """Detect contradictions in response content."""
         conflicts = []
         
         # Simple heuristic: if responses have very different lengths or key terms, flag as contradiction
-        contents = [r.content.lower().strip() for r in responses if r.success]
-        if len(contents) < 2:
+        successful = [f for f in features if f.response.success]
+        if len(successful) < 2:
             return conflicts
+        views = [f.response.text_view for f in successful]
         
         # Check for significant length differences (potential indicator of contradiction)
-        lengths = [len(content) for content in contents]
+        lengths = [view.stripped_length for view in views]
         max_length = max(lengths)
         min_length = min(lengths)
         
         if max_length > 0 and (max_length - min_length) / max_length > 0.7:
             # Significant length difference detected
-            response_ids = [r.subtask_id + "_" + r.model_used for r in responses if r.success]
-            conflicts.append(Conflict(
-                response_ids=response_ids,
-                conflict_type="content_contradiction",
-                description=f"Significant content length variation detected (min: {min_length}, max: {max_length})"
+            conflicts.append(self._create_conflict(
+                successful,
+                "content_contradiction",
+                f"Significant content length variation detected (min: {min_length}, max: {max_length})"
             ))
         
         # Check for contradictory keywords (simple heuristic)
         positive_indicators = ["yes", "true", "correct", "valid", "success"]
         negative_indicators = ["no", "false", "incorrect", "invalid", "fail", "error"]
         
-        has_positive = any(any(indicator in content for indicator in positive_indicators) for content in contents)
-        has_negative = any(any(indicator in content for indicator in negative_indicators) for content in contents)
+        has_positive = any(view.contains_any(positive_indicators) for view in views)
+        has_negative = any(view.contains_any(negative_indicators) for view in views)
         
         if has_positive and has_negative:
-            response_ids = [r.subtask_id + "_" + r.model_used for r in responses if r.success]
-            conflicts.append(Conflict(
-                response_ids=response_ids,
-                conflict_type="content_contradiction",
-                description="Contradictory sentiment detected in responses (positive vs negative indicators)"
+            conflicts.append(self._create_conflict(
+                successful,
+                "content_contradiction",
+                "Contradictory sentiment detected in responses (positive vs negative indicators)"
             ))
         
         return conflicts
     
-    def _detect_confidence_conflicts(self, responses: List[AgentResponse]) -> List[Conflict]:
+    def _detect_confidence_conflicts(self, features: List[ResponseFeatures]) -> List[Conflict]:
         """Detect conflicts based on confidence score disparities."""
         conflicts = []
         
-        # Get confidence scores from self-assessments
-        confidence_scores = []
-        valid_responses = []
-        
-        for response in responses:
-            if response.success and response.self_assessment:
-                confidence_scores.append(response.self_assessment.confidence_score)
-                valid_responses.append(response)
-        
-        if len(confidence_scores) < 2:
+        assessed = [f for f in features if f.has_assessment]
+        if len(assessed) < 2:
             return conflicts
         
         # Check for significant confidence disparities
-        max_confidence = max(confidence_scores)
-        min_confidence = min(confidence_scores)
+        max_confidence = max(f.confidence for f in assessed)
+        min_confidence = min(f.confidence for f in assessed)
         
         if max_confidence - min_confidence > 0.4:  # Significant confidence gap
-            response_ids = [r.subtask_id + "_" + r.model_used for r in valid_responses]
-            conflicts.append(Conflict(
-                response_ids=response_ids,
-                conflict_type="confidence_conflict",
-                description=f"Significant confidence disparity detected (range: {min_confidence:.2f} - {max_confidence:.2f})"
+            conflicts.append(self._create_conflict(
+                assessed,
+                "confidence_conflict",
+                f"Significant confidence disparity detected (range: {min_confidence:.2f} - {max_confidence:.2f})"
             ))
         
         return conflicts
     
-    def _detect_quality_conflicts(self, responses: List[AgentResponse]) -> List[Conflict]:
+    def _detect_quality_conflicts(self, features: List[ResponseFeatures]) -> List[Conflict]:
         """Detect conflicts based on response quality indicators."""
         conflicts = []
         
-        # Analyze quality indicators from self-assessments
-        quality_scores = []
-        valid_responses = []
-        
-        for response in responses:
-            if response.success and response.self_assessment:
-                # Calculate composite quality score
-                quality_score = self._calculate_quality_score(response)
-                quality_scores.append(quality_score)
-                valid_responses.append(response)
-        
-        if len(quality_scores) < 2:
+        assessed = [f for f in features if f.has_assessment]
+        if len(assessed) < 2:
             return conflicts
         
         # Check for significant quality disparities
-        max_quality = max(quality_scores)
-        min_quality = min(quality_scores)
+        max_quality = max(f.quality_score for f in assessed)
+        min_quality = min(f.quality_score for f in assessed)
         
         if max_quality - min_quality > 0.3:  # Significant quality gap
-            response_ids = [r.subtask_id + "_" + r.model_used for r in valid_responses]
-            conflicts.append(Conflict(
-                response_ids=response_ids,
-                conflict_type="quality_conflict",
-                description=f"Significant quality disparity detected (range: {min_quality:.2f} - {max_quality:.2f})"
+            conflicts.append(self._create_conflict(
+                assessed,
+                "quality_conflict",
+                f"Significant quality disparity detected (range: {min_quality:.2f} - {max_quality:.2f})"
             ))
         
         return conflicts
     
+    def _create_conflict(
+        self, features: List[ResponseFeatures], conflict_type: str, description: str
+    ) -> Conflict:
+        """Create a conflict carrying the features of the responses involved."""
+        return Conflict(
+            response_ids=[f.response_id for f in features],
+            conflict_type=conflict_type,
+            description=description,
+            candidates={f.response_id: f for f in features}
+        )
+    
     def _resolve_content_contradiction(self, conflict: Conflict) -> Resolution:
         """Resolve content contradictions by choosing the most reliable response."""
-        # For content contradictions, prioritize responses with higher confidence and better quality
-        # This is a simplified resolution - in practice, might involve more sophisticated analysis
-        
+        chosen_id = self._select_best(conflict, lambda f: (f.quality_score, f.confidence))
         reasoning = f"Resolved content contradiction by selecting response with highest composite score"
         return Resolution(
-            chosen_response_id=conflict.response_ids[0],  # Simplified: choose first
+            chosen_response_id=chosen_id,
             reasoning=reasoning,
             confidence=0.7
         )
     
     def _resolve_confidence_conflict(self, conflict: Conflict) -> Resolution:
         """Resolve confidence conflicts by choosing the most confident response."""
+        chosen_id = self._select_best(conflict, lambda f: (f.confidence, f.risk_score))
         reasoning = f"Resolved confidence conflict by selecting response with highest confidence score"
         return Resolution(
-            chosen_response_id=conflict.response_ids[0],  # Simplified: choose first
+            chosen_response_id=chosen_id,
             reasoning=reasoning,
             confidence=0.8
         )
     
     def _resolve_quality_conflict(self, conflict: Conflict) -> Resolution:
         """Resolve quality conflicts by choosing the highest quality response."""
+        chosen_id = self._select_best(conflict, lambda f: (f.quality_score, f.risk_score))
         reasoning = f"Resolved quality conflict by selecting response with highest quality score"
         return Resolution(
-            chosen_response_id=conflict.response_ids[0],  # Simplified: choose first
+            chosen_response_id=chosen_id,
             reasoning=reasoning,
             confidence=0.75
         )
     
+    def _select_best(self, conflict: Conflict, score) -> str:
+        """
+        Choose the conflicting response with the highest score.
+        
+        Ties are broken by lower latency, then lower cost. Conflicts created
+        without candidate features fall back to the first response.
+        
+        Args:
+            conflict: The conflict to resolve
+            score: Function mapping ResponseFeatures to a comparable score
+            
+        Returns:
+            str: ID of the chosen response
+        """
+        candidates = [
+            conflict.candidates[response_id]
+            for response_id in conflict.response_ids
+            if response_id in conflict.candidates
+        ]
+        if not candidates:
+            return conflict.response_ids[0]
+        
+        def rank(feature: ResponseFeatures) -> Tuple:
+            return (score(feature), -feature.latency, -feature.cost)
+        
+        return max(candidates, key=rank).response_id
+    
+    def score_response(self, response: AgentResponse) -> float:
+        """Score a single response with the composite arbitration quality score."""
+        if not response.success:
+            return 0.0
+        return self._calculate_quality_score(response)
+    
     def _calculate_quality_score(self, response: AgentResponse) -> float:
         """Calculate a composite quality score for a response."""
         if not response.self_assessment:
@@ -319,7 +493,8 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
         self, 
         responses: List[AgentResponse], 
         conflicts: List[Conflict], 
-        resolutions: List[Resolution]
+        resolutions: List[Resolution],
+        response_ids: Optional[List[str]] = None
     ) -> List[AgentResponse]:
         """Build the final list of validated responses based on conflict resolutions."""
         if not conflicts:
@@ -339,9 +514,10 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
         for conflict in conflicts:
             conflicted_response_ids.update(conflict.response_ids)
         
-        for response in responses:
-            response_id = response.subtask_id + "_" + response.model_used
-            
+        if response_ids is None:
+            response_ids = [r.subtask_id + "_" + r.model_used for r in responses]
+        
+        for response, response_id in zip(responses, response_ids):
             if response_id in conflicted_response_ids:
                 # This response was involved in a conflict - only include if chosen
                 if response_id in chosen_ids and self._validate_response_quality(response):
@@ -354,6 +530,11 @@ class ConcreteArbitrationLayer(ArbitrationLayer):
         return validated
 
 
+def _arbitrate_group(layer: ConcreteArbitrationLayer, responses: List[AgentResponse]) -> ArbitrationResult:
+    """Module-level entry point so groups can be arbitrated in worker processes."""
+    return layer._arbitrate_group(responses)
+
+
 class NoOpArbitrationLayer(ArbitrationLayer):
     """
     No-operation arbitration layer that passes through all responses without arbitration.
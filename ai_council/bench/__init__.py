@@ -0,0 +1,48 @@
+"""Benchmark suite with latency-distribution mock models and a provider stub server."""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .models import DistributionMockModel, LatencyDistribution
+    from .runner import (
+        BenchmarkReport, ScenarioResult, compare_reports, percentile,
+        run_benchmark, run_scenario
+    )
+    from .scenarios import SCENARIOS, BenchmarkConfig, Scenario, build_layer
+    from .stub_server import StubProviderServer, StubServerConfig
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "DistributionMockModel": ".models",
+    "LatencyDistribution": ".models",
+    "BenchmarkReport": ".runner",
+    "ScenarioResult": ".runner",
+    "compare_reports": ".runner",
+    "percentile": ".runner",
+    "run_benchmark": ".runner",
+    "run_scenario": ".runner",
+    "SCENARIOS": ".scenarios",
+    "BenchmarkConfig": ".scenarios",
+    "Scenario": ".scenarios",
+    "build_layer": ".scenarios",
+    "StubProviderServer": ".stub_server",
+    "StubServerConfig": ".stub_server",
+})
+
+__all__ = [
+    "DistributionMockModel",
+    "LatencyDistribution",
+    "BenchmarkReport",
+    "ScenarioResult",
+    "compare_reports",
+    "percentile",
+    "run_benchmark",
+    "run_scenario",
+    "SCENARIOS",
+    "BenchmarkConfig",
+    "Scenario",
+    "build_layer",
+    "StubProviderServer",
+    "StubServerConfig",
+]
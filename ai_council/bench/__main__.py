@@ -0,0 +1,113 @@
+"""
+Benchmark the orchestration pipeline against latency-distribution mock models.
+
+Runs each scenario (single, decomposed, batch, concurrent, open_loop) against
+a fresh orchestration layer and reports throughput, p50/p95/p99 latency, CPU
+time per request and peak memory. Write the report as JSON with --output and
+compare it with an earlier one with --baseline to catch regressions. With
+--virtual-time model latencies, timeouts and rate limit windows run on a
+virtual clock, so hours of simulated traffic take seconds.
+
+Usage:
+    python -m ai_council.bench [--scenario batch] [--requests 50] [--median-ms 50]
+        [--spike-probability 0.01] [--failure-rate 0.02] [--output report.json]
+        [--baseline baseline.json --max-regression 0.1]
+    python -m ai_council.bench --virtual-time --scenario open_loop --requests 10000 --arrival-rate 5
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from ..core.models import ExecutionMode
+from .models import LatencyDistribution
+from .runner import compare_reports, run_benchmark
+from .scenarios import SCENARIOS, BenchmarkConfig
+
+
+def main(argv=None) -> int:
+    """Run the benchmark; exit with 1 if a baseline comparison finds regressions."""
+    parser = argparse.ArgumentParser(prog="python -m ai_council.bench", description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent users or workers")
+    parser.add_argument("--arrival-rate", type=float, default=20.0,
+                        help="Requests per second arriving in the open_loop scenario")
+    parser.add_argument("--models", type=int, default=3, help="Mock models to register")
+    parser.add_argument("--mode", choices=[mode.value for mode in ExecutionMode],
+                        default=ExecutionMode.BALANCED.value, help="Execution mode")
+    parser.add_argument("--median-ms", type=float, default=50.0, help="Median model latency in milliseconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Lognormal shape of model latency")
+    parser.add_argument("--spike-probability", type=float, default=0.0, help="Chance of a tail latency spike")
+    parser.add_argument("--spike-multiplier", type=float, default=10.0, help="Latency factor of a spike")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Chance that a model call fails")
+    parser.add_argument("--max-retries", type=int, default=1, help="Execution agent retries per subtask")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the mock models")
+    parser.add_argument("--virtual-time", action="store_true",
+                        help="Simulate time on a virtual clock instead of waiting it out")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory run")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.1,
+                        help="Allowed relative regression against the baseline")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline warnings")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    try:
+        config = BenchmarkConfig(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            arrival_rate=args.arrival_rate,
+            models=args.models,
+            latency=LatencyDistribution(
+                median=args.median_ms / 1000,
+                sigma=args.sigma,
+                spike_probability=args.spike_probability,
+                spike_multiplier=args.spike_multiplier
+            ),
+            failure_rate=args.failure_rate,
+            execution_mode=ExecutionMode(args.mode),
+            max_retries=args.max_retries,
+            seed=args.seed,
+            virtual_time=args.virtual_time
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = run_benchmark(args.scenario, config, measure_memory=not args.no_memory)
+
+    print(f"{'scenario':<12} {'ok/req':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'cpu ms/req':>11} {'peak KiB':>10}")
+    for result in report.results:
+        peak = f"{result.peak_memory_bytes / 1024:.0f}" if result.peak_memory_bytes is not None else "-"
+        print(f"{result.scenario:<12} {f'{result.successes}/{result.requests}':>9} "
+              f"{result.throughput:>8.1f} {result.latency['p50'] * 1000:>8.1f} "
+              f"{result.latency['p95'] * 1000:>8.1f} {result.latency['p99'] * 1000:>8.1f} "
+              f"{result.cpu_time_per_request * 1000:>11.2f} {peak:>10}")
+    if config.virtual_time:
+        simulated = sum(result.wall_time for result in report.results)
+        real = sum(result.real_time for result in report.results)
+        print(f"Simulated {simulated:.1f}s of traffic in {real:.1f}s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report.to_json() + "\n")
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report.to_dict(), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.max_regression:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
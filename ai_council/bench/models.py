@@ -0,0 +1,144 @@
+"""Mock models whose latency and failures follow configurable distributions."""
+
+import math
+import random
+import threading
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from ..core.clock import Clock
+from ..core.interfaces import ModelError
+from ..execution.mock_models import MockAIModel, MockModelBehavior
+
+
+@dataclass
+class LatencyDistribution:
+    """Lognormal model latency with occasional tail spikes.
+
+    A sample is drawn from a lognormal distribution with the given median and
+    shape; with probability ``spike_probability`` it is multiplied by
+    ``spike_multiplier`` to model the slow tail real providers show (cold
+    starts, queueing, retried connections).
+
+    Attributes:
+        median: Median latency in seconds (0 disables the delay)
+        sigma: Shape of the lognormal; larger values widen the spread
+        spike_probability: Chance that a call lands in the slow tail
+        spike_multiplier: Factor applied to tail latencies
+        max_latency: Optional cap on any single latency in seconds
+    """
+    median: float = 0.05
+    sigma: float = 0.5
+    spike_probability: float = 0.0
+    spike_multiplier: float = 10.0
+    max_latency: Optional[float] = None
+
+    def __post_init__(self):
+        """Validate the distribution parameters."""
+        if self.median < 0:
+            raise ValueError("median must be non-negative")
+        if self.sigma < 0:
+            raise ValueError("sigma must be non-negative")
+        if not 0.0 <= self.spike_probability <= 1.0:
+            raise ValueError("spike_probability must be between 0.0 and 1.0")
+        if self.spike_multiplier < 1.0:
+            raise ValueError("spike_multiplier must be at least 1.0")
+        if self.max_latency is not None and self.max_latency < 0:
+            raise ValueError("max_latency must be non-negative")
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.median == 0:
+            return 0.0
+        latency = rng.lognormvariate(math.log(self.median), self.sigma)
+        if self.spike_probability and rng.random() < self.spike_probability:
+            latency *= self.spike_multiplier
+        if self.max_latency is not None:
+            latency = min(latency, self.max_latency)
+        return latency
+
+
+class DistributionMockModel(MockAIModel):
+    """Mock model that sleeps for a sampled latency and fails at a given rate.
+
+    Unlike :class:`MockAIModel` it has no per-model rate limit and draws from
+    its own seeded random generator, so a benchmark run is repeatable and
+    safe to call from many threads. Injected failures are raised as
+    ``ConnectionError`` model errors after the sampled latency, which the
+    execution agent treats as transient and retries.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        latency: Optional[LatencyDistribution] = None,
+        failure_rate: float = 0.0,
+        response_template: Optional[str] = None,
+        seed: Optional[int] = None,
+        max_tokens: int = 1000,
+        clock: Optional[Clock] = None
+    ):
+        """Initialize the model.
+
+        Args:
+            model_id: Unique identifier for the model
+            latency: Latency distribution (defaults to a 50 ms median lognormal)
+            failure_rate: Probability that a call fails (0.0 to 1.0)
+            response_template: Template for generating responses
+            seed: Seed for the model's random generator
+            max_tokens: Maximum tokens the model can generate
+            clock: Clock to wait out the sampled latency in (defaults to the process clock)
+        """
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0.0 and 1.0")
+        super().__init__(
+            model_id,
+            behavior=MockModelBehavior.NORMAL,
+            response_template=response_template,
+            failure_rate=failure_rate,
+            response_delay=0.0,
+            max_tokens=max_tokens,
+            clock=clock
+        )
+        self.latency = latency or LatencyDistribution()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate_response(self, prompt: str, **kwargs) -> str:
+        """Generate a response after a sampled delay.
+
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters (max_tokens, temperature, etc.)
+
+        Returns:
+            str: The generated response
+
+        Raises:
+            ModelError: When the call is chosen for failure injection
+        """
+        delay, fail = self._draw()
+        clock = self.clock
+        start_time = clock.time()
+        clock.sleep(delay)
+        elapsed = clock.time() - start_time
+        with self._lock:
+            self.request_count += 1
+            self.total_response_time += elapsed
+            if fail:
+                self.failure_count += 1
+            else:
+                self.success_count += 1
+        if fail:
+            raise ModelError(
+                model_id=self.model_id,
+                error_message="Injected failure",
+                error_type="ConnectionError"
+            )
+        return self._generate_mock_response(prompt, **kwargs)
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._lock:
+            delay = self.latency.sample(self._random)
+            fail = self.failure_rate > 0 and self._random.random() < self.failure_rate
+        return delay, fail
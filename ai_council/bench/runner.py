@@ -0,0 +1,272 @@
+"""Run benchmark scenarios and report throughput, latency percentiles, CPU time and memory."""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..core.clock import Clock, VirtualClock, get_clock, use_clock
+from .scenarios import SCENARIOS, BenchmarkConfig, RequestSample, Scenario, build_layer
+
+
+REPORT_VERSION = 1
+
+# Metrics compared against a baseline, and whether a larger value is better
+COMPARED_METRICS = [
+    ("throughput", True),
+    ("latency.p50", False),
+    ("latency.p95", False),
+    ("latency.p99", False),
+    ("cpu_time_per_request", False),
+    ("peak_memory_bytes", False),
+]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Percentile of values by linear interpolation between closest ranks.
+
+    Args:
+        values: Observations (need not be sorted)
+        q: Percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 when there are no values
+    """
+    if not 0 <= q <= 100:
+        raise ValueError("q must be between 0 and 100")
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one scenario run.
+
+    Attributes:
+        scenario: Scenario name
+        requests: Requests issued
+        successes: Requests that returned a successful response
+        wall_time: Seconds from the first request to the last result, in
+            simulated time on a virtual clock
+        throughput: Requests completed per second of wall_time
+        latency: Mean, max and p50/p95/p99 request latency in seconds
+        cpu_time_per_request: Process CPU seconds (all threads) per request
+        peak_memory_bytes: Peak traced Python memory of a repeat run, if measured
+        real_time: Real seconds the run took
+    """
+    scenario: str
+    requests: int
+    successes: int
+    wall_time: float
+    throughput: float
+    latency: Dict[str, float] = field(default_factory=dict)
+    cpu_time_per_request: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+    real_time: Optional[float] = None
+
+    @property
+    def failures(self) -> int:
+        """Requests that did not succeed."""
+        return self.requests - self.successes
+
+    @classmethod
+    def from_samples(
+        cls,
+        scenario: str,
+        samples: List[RequestSample],
+        wall_time: float,
+        cpu_time: float
+    ) -> "ScenarioResult":
+        """Summarize per-request samples."""
+        latencies = [latency for latency, _ in samples]
+        return cls(
+            scenario=scenario,
+            requests=len(samples),
+            successes=sum(1 for _, success in samples if success),
+            wall_time=wall_time,
+            throughput=len(samples) / wall_time if wall_time > 0 else 0.0,
+            latency={
+                "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies, default=0.0),
+            },
+            cpu_time_per_request=cpu_time / len(samples) if samples else 0.0
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Result as plain JSON-compatible values."""
+        return {
+            "scenario": self.scenario,
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "wall_time": self.wall_time,
+            "throughput": self.throughput,
+            "latency": dict(self.latency),
+            "cpu_time_per_request": self.cpu_time_per_request,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "real_time": self.real_time,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run with the settings and environment that produced them."""
+    results: List[ScenarioResult]
+    config: Dict[str, Any]
+    environment: Dict[str, str] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Report as plain JSON-compatible values."""
+        return {
+            "version": REPORT_VERSION,
+            "created_at": self.created_at,
+            "environment": dict(self.environment),
+            "config": dict(self.config),
+            "results": {result.scenario: result.to_dict() for result in self.results},
+        }
+
+    def to_json(self) -> str:
+        """Report as indented JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def run_scenario(
+    scenario: Scenario,
+    config: BenchmarkConfig,
+    measure_memory: bool = True
+) -> ScenarioResult:
+    """Run one scenario against a freshly built layer.
+
+    Timing and CPU time come from one run. Tracing allocations slows Python
+    down several times over, so peak memory comes from a second run against
+    another fresh layer. With ``config.virtual_time`` each run gets its own
+    virtual clock as the process default.
+
+    Args:
+        scenario: Workload to run
+        config: Workload and model settings
+        measure_memory: Whether to make the memory run
+
+    Returns:
+        ScenarioResult: The measurements
+    """
+    with use_clock(_scenario_clock(config)) as clock:
+        layer = build_layer(config)
+        gc.collect()
+        cpu_start = time.process_time()
+        real_start = time.perf_counter()
+        wall_start = clock.monotonic()
+        samples = scenario.run(layer, config)
+        wall_time = clock.monotonic() - wall_start
+        real_time = time.perf_counter() - real_start
+        cpu_time = time.process_time() - cpu_start
+    result = ScenarioResult.from_samples(scenario.name, samples, wall_time, cpu_time)
+    result.real_time = real_time
+
+    if measure_memory:
+        with use_clock(_scenario_clock(config)):
+            layer = build_layer(config)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                scenario.run(layer, config)
+                _, result.peak_memory_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    return result
+
+
+def _scenario_clock(config: BenchmarkConfig) -> Clock:
+    return VirtualClock() if config.virtual_time else get_clock()
+
+
+def run_benchmark(
+    scenarios: Optional[Iterable[str]] = None,
+    config: Optional[BenchmarkConfig] = None,
+    measure_memory: bool = True
+) -> BenchmarkReport:
+    """Run scenarios by name and collect a report.
+
+    Args:
+        scenarios: Scenario names (defaults to all of them)
+        config: Workload and model settings (defaults to ``BenchmarkConfig()``)
+        measure_memory: Whether to measure peak memory
+
+    Returns:
+        BenchmarkReport: Results in scenario order
+
+    Raises:
+        ValueError: If a scenario name is unknown
+    """
+    config = config or BenchmarkConfig()
+    names = list(scenarios) if scenarios is not None else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}. Choose from: {', '.join(SCENARIOS)}")
+    results = [run_scenario(SCENARIOS[name], config, measure_memory) for name in names]
+    return BenchmarkReport(
+        results=results,
+        config=config.to_dict(),
+        environment={
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        }
+    )
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_regression: float = 0.1
+) -> List[str]:
+    """Find metrics that got worse than a baseline report by more than a tolerance.
+
+    Scenarios or metrics missing from either report are skipped.
+
+    Args:
+        baseline: Earlier report, as produced by ``BenchmarkReport.to_dict``
+        current: Report to check
+        max_regression: Allowed relative change for the worse (0.1 = 10%)
+
+    Returns:
+        List[str]: One description per regressed metric
+    """
+    regressions = []
+    for scenario, result in current.get("results", {}).items():
+        previous = baseline.get("results", {}).get(scenario)
+        if previous is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            before, after = _lookup(previous, metric), _lookup(result, metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > max_regression:
+                regressions.append(
+                    f"{scenario}: {metric} {before:.6g} -> {after:.6g} ({change:+.1%})"
+                )
+    return regressions
+
+
+def _lookup(result: Dict[str, Any], metric: str) -> Optional[float]:
+    value: Any = result
+    for key in metric.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
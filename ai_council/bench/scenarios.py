@@ -0,0 +1,264 @@
+"""Benchmark scenarios run against an orchestration layer backed by distribution mock models."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..analysis.decomposer import BasicTaskDecomposer
+from ..analysis.engine import BasicAnalysisEngine
+from ..arbitration.layer import ConcreteArbitrationLayer
+from ..core.clock import get_clock
+from ..core.models import ExecutionMode, ModelCapabilities, TaskType
+from ..execution.agent import BaseExecutionAgent
+from ..orchestration.layer import ConcreteOrchestrationLayer
+from ..routing.context_protocol import ModelContextProtocolImpl
+from ..routing.registry import ModelRegistryImpl
+from ..synthesis.layer import SynthesisLayerImpl
+from .models import DistributionMockModel, LatencyDistribution
+
+
+# One (latency in seconds, success) pair per request
+RequestSample = Tuple[float, bool]
+
+SIMPLE_TOPICS = [
+    "how caching works",
+    "the difference between processes and threads",
+    "what a hash table is",
+    "how TCP congestion control works",
+    "why databases use write-ahead logs",
+]
+
+DECOMPOSED_PROMPT = (
+    "1. Research the trade-offs of write-through caching for {topic}. "
+    "2. Analyze the failure modes of cache invalidation. "
+    "3. Write a Python function that implements an LRU cache. "
+    "4. Summarize the findings in a short report."
+)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Workload and model settings shared by every scenario.
+
+    Attributes:
+        requests: Requests issued per scenario
+        concurrency: Simulated users, or workers for the batch and open-loop scenarios
+        arrival_rate: Mean requests per second arriving in the open-loop scenario
+        models: Number of mock models registered
+        latency: Latency distribution of every model
+        failure_rate: Probability that a model call fails
+        execution_mode: Execution mode of every request
+        max_retries: Retries the execution agent makes per subtask
+        seed: Seed for the models' and arrivals' random generators
+        virtual_time: Run on a virtual clock, so model latencies and waits
+            take simulated rather than real time
+    """
+    requests: int = 50
+    concurrency: int = 8
+    arrival_rate: float = 20.0
+    models: int = 3
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    failure_rate: float = 0.0
+    execution_mode: ExecutionMode = ExecutionMode.BALANCED
+    max_retries: int = 1
+    seed: int = 0
+    virtual_time: bool = False
+
+    def __post_init__(self):
+        """Validate the workload settings."""
+        if self.requests < 1:
+            raise ValueError("requests must be at least 1")
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.arrival_rate <= 0:
+            raise ValueError("arrival_rate must be positive")
+        if self.models < 1:
+            raise ValueError("models must be at least 1")
+        if not 0.0 <= self.failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0.0 and 1.0")
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Settings as plain JSON-compatible values."""
+        return {
+            "requests": self.requests,
+            "concurrency": self.concurrency,
+            "arrival_rate": self.arrival_rate,
+            "models": self.models,
+            "latency": {
+                "median": self.latency.median,
+                "sigma": self.latency.sigma,
+                "spike_probability": self.latency.spike_probability,
+                "spike_multiplier": self.latency.spike_multiplier,
+                "max_latency": self.latency.max_latency,
+            },
+            "failure_rate": self.failure_rate,
+            "execution_mode": self.execution_mode.value,
+            "max_retries": self.max_retries,
+            "seed": self.seed,
+            "virtual_time": self.virtual_time,
+        }
+
+
+class _BenchmarkExecutionAgent(BaseExecutionAgent):
+    """Execution agent whose mock models don't share a provider's request quota."""
+
+    def _get_model_provider(self, model_id: str) -> str:
+        # Provider quotas (30 requests a minute by default) would turn any
+        # sizeable run into a measurement of the rate limiter's waits
+        return "benchmark"
+
+
+def build_layer(config: BenchmarkConfig) -> ConcreteOrchestrationLayer:
+    """Build an orchestration layer backed by fresh distribution mock models.
+
+    Args:
+        config: Model settings
+
+    Returns:
+        ConcreteOrchestrationLayer: Layer with ``config.models`` mock models
+    """
+    registry = ModelRegistryImpl()
+    for index in range(config.models):
+        model = DistributionMockModel(
+            f"bench-model-{index + 1}",
+            latency=config.latency,
+            failure_rate=config.failure_rate,
+            response_template="Benchmark answer covering the request in a few plain sentences.",
+            seed=config.seed + index
+        )
+        registry.register_model(model, ModelCapabilities(
+            task_types=list(TaskType),
+            cost_per_token=0.001 * (index + 1),
+            average_latency=config.latency.median,
+            max_context_length=8192,
+            reliability_score=0.9 - 0.05 * index
+        ))
+    return ConcreteOrchestrationLayer(
+        analysis_engine=BasicAnalysisEngine(),
+        task_decomposer=BasicTaskDecomposer(),
+        model_context_protocol=ModelContextProtocolImpl(registry),
+        execution_agent=_BenchmarkExecutionAgent(max_retries=config.max_retries),
+        arbitration_layer=ConcreteArbitrationLayer(),
+        synthesis_layer=SynthesisLayerImpl(),
+        model_registry=registry
+    )
+
+
+def simple_prompt(index: int) -> str:
+    """The simple request issued as request number index."""
+    topic = SIMPLE_TOPICS[index % len(SIMPLE_TOPICS)]
+    return f"Explain {topic} [request {index}]"
+
+
+def decomposed_prompt(index: int) -> str:
+    """The multi-step request issued as request number index."""
+    topic = SIMPLE_TOPICS[index % len(SIMPLE_TOPICS)]
+    return DECOMPOSED_PROMPT.format(topic=topic) + f" [request {index}]"
+
+
+def _succeeds(layer: ConcreteOrchestrationLayer, prompt: str, mode: ExecutionMode) -> bool:
+    try:
+        return layer.process_request(prompt, mode).success
+    except Exception:
+        # The request-level timeout is raised rather than reported in a response
+        return False
+
+
+def _timed_request(layer: ConcreteOrchestrationLayer, prompt: str, mode: ExecutionMode) -> RequestSample:
+    clock = get_clock()
+    start = clock.monotonic()
+    success = _succeeds(layer, prompt, mode)
+    return clock.monotonic() - start, success
+
+
+def run_single(layer: ConcreteOrchestrationLayer, config: BenchmarkConfig) -> List[RequestSample]:
+    """Issue simple requests one after another."""
+    return [
+        _timed_request(layer, simple_prompt(index), config.execution_mode)
+        for index in range(config.requests)
+    ]
+
+
+def run_decomposed(layer: ConcreteOrchestrationLayer, config: BenchmarkConfig) -> List[RequestSample]:
+    """Issue multi-step requests that decompose into several subtasks, one after another."""
+    return [
+        _timed_request(layer, decomposed_prompt(index), config.execution_mode)
+        for index in range(config.requests)
+    ]
+
+
+def run_batch(layer: ConcreteOrchestrationLayer, config: BenchmarkConfig) -> List[RequestSample]:
+    """Submit all simple requests as one batch; latency is time until each result arrives."""
+    clock = get_clock()
+    prompts = (simple_prompt(index) for index in range(config.requests))
+    start = clock.monotonic()
+    return [
+        (clock.monotonic() - start, response.success)
+        for _, response in layer.process_batch(prompts, config.execution_mode, config.concurrency)
+    ]
+
+
+def run_concurrent(layer: ConcreteOrchestrationLayer, config: BenchmarkConfig) -> List[RequestSample]:
+    """Simulate ``config.concurrency`` users, each issuing its share of requests in turn."""
+    def user(first: int) -> List[RequestSample]:
+        return [
+            _timed_request(layer, simple_prompt(index), config.execution_mode)
+            for index in range(first, config.requests, config.concurrency)
+        ]
+
+    users = min(config.concurrency, config.requests)
+    with ThreadPoolExecutor(max_workers=users, thread_name_prefix="bench-user") as pool:
+        shares = list(pool.map(user, range(users)))
+    return [sample for share in shares for sample in share]
+
+
+def run_open_loop(layer: ConcreteOrchestrationLayer, config: BenchmarkConfig) -> List[RequestSample]:
+    """Send simple requests as Poisson arrivals to ``config.concurrency`` workers.
+
+    Arrivals don't wait for earlier requests to finish, so latency (measured
+    from arrival) includes time spent queued for a worker once the offered
+    load exceeds what the layer can serve.
+    """
+    clock = get_clock()
+    arrivals = random.Random(config.seed)
+
+    def serve(prompt: str, arrived: float) -> RequestSample:
+        success = _succeeds(layer, prompt, config.execution_mode)
+        return clock.monotonic() - arrived, success
+
+    futures = []
+    with ThreadPoolExecutor(max_workers=config.concurrency, thread_name_prefix="bench-worker") as pool:
+        arrival = clock.monotonic()
+        for index in range(config.requests):
+            arrival += arrivals.expovariate(config.arrival_rate)
+            clock.sleep(arrival - clock.monotonic())
+            futures.append(pool.submit(serve, simple_prompt(index), arrival))
+    return [future.result() for future in futures]
+
+
+@dataclass
+class Scenario:
+    """A named workload.
+
+    Attributes:
+        name: Scenario name used on the command line and in reports
+        description: One-line description
+        run: Issues the workload against a layer and returns one sample per request
+    """
+    name: str
+    description: str
+    run: Callable[[ConcreteOrchestrationLayer, BenchmarkConfig], List[RequestSample]]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in [
+        Scenario("single", "Sequential simple requests", run_single),
+        Scenario("decomposed", "Sequential requests decomposed into four subtasks", run_decomposed),
+        Scenario("batch", "One batch of simple requests", run_batch),
+        Scenario("concurrent", "Concurrent users issuing simple requests", run_concurrent),
+        Scenario("open_loop", "Poisson arrivals of simple requests served by a worker pool", run_open_loop),
+    ]
+}
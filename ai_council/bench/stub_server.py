@@ -0,0 +1,611 @@
+"""
+Local HTTP server that emulates the model providers' APIs.
+
+Serves the request and response shapes the adapters in
+``web_app/backend/ai_adapters.py`` speak: OpenAI-style chat completions
+(OpenAI, Groq, Mistral, xAI), Anthropic messages and Gemini
+``generateContent``, each with SSE streaming. Time to first token follows a
+:class:`LatencyDistribution` and tokens are emitted at a fixed throughput.
+Requests can be rejected with 429 responses carrying each provider's rate
+limit headers, either at random or once a requests-per-minute window is
+used up, and can fail with injected 500 errors. The server counts TCP
+connections as well as requests, so connection reuse by a client shows up
+directly in its statistics.
+
+Point a model at it through ``ModelConfig.base_url`` (see
+:meth:`StubProviderServer.base_url`); any API key is accepted.
+
+Usage:
+    python -m ai_council.bench.stub_server [--port 8089] [--median-ms 200]
+        [--tokens-per-second 50] [--rate-limit-rate 0.02] [--error-rate 0.01]
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .models import LatencyDistribution
+
+
+logger = logging.getLogger(__name__)
+
+
+# Path prefix each provider's adapter puts in front of its endpoints
+PROVIDER_PATHS = {
+    "openai": "/v1",
+    "anthropic": "/v1",
+    "google": "/v1beta",
+    "groq": "/openai/v1",
+    "mistral": "/v1",
+    "xai": "/v1",
+}
+
+_GEMINI_PATH = re.compile(r"/models/([^/:]+):(generateContent|streamGenerateContent)$")
+_FILLER = (
+    "the council weighs each answer against the request and keeps the parts that "
+    "agree while noting where the models differ"
+).split()
+
+
+@dataclass
+class StubServerConfig:
+    """Behavior of the stub provider server.
+
+    Attributes:
+        latency: Time to first token
+        tokens_per_second: Rate tokens are generated at after the first (0 for instant)
+        response_tokens: Tokens in a response, capped by the request's max tokens
+        error_rate: Probability that a request fails with a 500 after its latency
+        rate_limit_rate: Probability that a request is rejected with a 429
+        requests_per_minute: Requests allowed per minute before 429s, or None
+        retry_after: Seconds a random 429 asks the client to wait
+        seed: Seed for latency and fault sampling
+    """
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    tokens_per_second: float = 0.0
+    response_tokens: int = 32
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    requests_per_minute: Optional[int] = None
+    retry_after: float = 1.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate the settings."""
+        if self.tokens_per_second < 0:
+            raise ValueError("tokens_per_second must be non-negative")
+        if self.response_tokens < 1:
+            raise ValueError("response_tokens must be at least 1")
+        if not 0.0 <= self.error_rate <= 1.0 or not 0.0 <= self.rate_limit_rate <= 1.0:
+            raise ValueError("error_rate and rate_limit_rate must be between 0.0 and 1.0")
+        if self.requests_per_minute is not None and self.requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be at least 1")
+        if self.retry_after < 0:
+            raise ValueError("retry_after must be non-negative")
+
+
+@dataclass
+class _StubCall:
+    """A parsed request in one of the three API shapes."""
+    shape: str  # "openai", "anthropic" or "google"
+    model: str
+    prompt: str
+    max_tokens: Optional[int]
+    stream: bool
+    sse: bool = True
+    include_usage: bool = False
+
+
+class StubProviderServer:
+    """Threaded HTTP server emulating the providers' chat APIs."""
+
+    def __init__(self, config: Optional[StubServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server; call :meth:`start` to begin serving.
+
+        Args:
+            config: Server behavior (defaults to ``StubServerConfig()``)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.config = config or StubServerConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+        self._counter = 0
+        self._stats: Dict[str, Any] = {
+            "connections": 0,
+            "requests": 0,
+            "streamed": 0,
+            "rate_limited": 0,
+            "errors": 0,
+            "by_shape": {},
+        }
+        self._httpd = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, provider: str) -> str:
+        """
+        Base URL to configure for a provider's adapter.
+
+        Raises:
+            ValueError: If the provider is unknown
+        """
+        try:
+            return self.url + PROVIDER_PATHS[provider.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown provider: {provider}. Choose from: {', '.join(PROVIDER_PATHS)}")
+
+    def start(self) -> "StubProviderServer":
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="stub-provider", daemon=True
+            )
+            self._thread.start()
+            logger.info(f"Stub provider server listening on {self.url}")
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until the server is shut down."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Counts of connections, requests, streamed responses, 429s and injected errors."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["by_shape"] = dict(self._stats["by_shape"])
+            return stats
+
+    def __enter__(self) -> "StubProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count(self, key: str, shape: Optional[str] = None) -> None:
+        with self._lock:
+            self._stats[key] += 1
+            if shape:
+                self._stats["by_shape"][shape] = self._stats["by_shape"].get(shape, 0) + 1
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._counter += 1
+            return self._counter
+
+    def _check_rate_limit(self) -> Tuple[Optional[float], Optional[int]]:
+        """Return (retry-after seconds if rejected, requests remaining in the window)."""
+        with self._lock:
+            if self.config.rate_limit_rate and self._rng.random() < self.config.rate_limit_rate:
+                return self.config.retry_after, None
+            if self.config.requests_per_minute is None:
+                return None, None
+            now = time.time()
+            if now - self._window_start >= 60.0:
+                self._window_start, self._window_count = now, 0
+            if self._window_count >= self.config.requests_per_minute:
+                return max(0.0, self._window_start + 60.0 - now), 0
+            self._window_count += 1
+            return None, self.config.requests_per_minute - self._window_count
+
+    def _sample(self) -> Tuple[float, bool]:
+        """Draw a time to first token and whether to inject an error."""
+        with self._lock:
+            latency = self.config.latency.sample(self._rng)
+            failed = bool(self.config.error_rate) and self._rng.random() < self.config.error_rate
+            return latency, failed
+
+    def _tokens(self, call: _StubCall) -> List[str]:
+        count = self.config.response_tokens
+        if call.max_tokens is not None:
+            count = max(1, min(count, call.max_tokens))
+        words = f"Stub response from {call.model} to: {call.prompt[:200]}".split()
+        while len(words) < count:
+            words.extend(_FILLER)
+        return [word if i == 0 else " " + word for i, word in enumerate(words[:count])]
+
+    def _token_delay(self) -> float:
+        return 1.0 / self.config.tokens_per_second if self.config.tokens_per_second else 0.0
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Handles one connection; HTTP/1.1 keeps it open for further requests."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "AICouncilStub/1.0"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.stub._count("connections")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_POST(self) -> None:
+        stub: StubProviderServer = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path, _, query = self.path.partition("?")
+        try:
+            call = _parse_call(path, query, json.loads(body or b"{}"))
+        except ValueError as e:
+            self._send_json(400, {"error": {"message": f"Invalid request body: {str(e)}"}})
+            return
+        if call is None:
+            self._send_json(404, {"error": {"message": f"Unknown endpoint: {path}"}})
+            return
+        stub._count("requests", call.shape)
+
+        retry_after, remaining = stub._check_rate_limit()
+        if retry_after is not None:
+            stub._count("rate_limited")
+            self._send_json(429, _rate_limit_body(call.shape, retry_after),
+                            _rate_limit_headers(call.shape, stub.config, retry_after, 0))
+            return
+        headers = {}
+        if remaining is not None:
+            headers = _rate_limit_headers(call.shape, stub.config, None, remaining)
+
+        latency, failed = stub._sample()
+        time.sleep(latency)
+        if failed:
+            stub._count("errors")
+            self._send_json(500, _error_body(call.shape, 500, "Injected server error"))
+            return
+
+        tokens = stub._tokens(call)
+        response_id = stub._next_id()
+        if call.stream:
+            stub._count("streamed")
+            self._stream(call, tokens, response_id, stub._token_delay(), headers)
+        else:
+            time.sleep(stub._token_delay() * max(0, len(tokens) - 1))
+            self._send_json(200, _completion_body(call, tokens, response_id), headers)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(
+        self,
+        call: _StubCall,
+        tokens: List[str],
+        response_id: int,
+        token_delay: float,
+        headers: Dict[str, str]
+    ) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if call.sse else "application/json")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        events = _stream_events(call, tokens, response_id)
+        try:
+            if not call.sse:
+                # Gemini without alt=sse streams one JSON array of chunks
+                chunks = [payload for _, payload in events]
+                self._write_chunk(json.dumps(chunks).encode("utf-8"))
+            else:
+                for index, (event, payload) in enumerate(events):
+                    if index and token_delay:
+                        time.sleep(token_delay)
+                    data = payload if isinstance(payload, str) else json.dumps(payload)
+                    prefix = f"event: {event}\n" if event else ""
+                    self._write_chunk(f"{prefix}data: {data}\n\n".encode("utf-8"))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+def _parse_call(path: str, query: str, body: Dict[str, Any]) -> Optional[_StubCall]:
+    """Recognize the API shape of a request from its path and body."""
+    if not isinstance(body, dict):
+        raise ValueError("expected a JSON object")
+    if path.endswith("/chat/completions"):
+        return _StubCall(
+            shape="openai",
+            model=str(body.get("model", "")),
+            prompt=_message_text(body.get("messages", [])),
+            max_tokens=body.get("max_completion_tokens") or body.get("max_tokens"),
+            stream=bool(body.get("stream")),
+            include_usage=bool((body.get("stream_options") or {}).get("include_usage"))
+        )
+    if path.endswith("/messages"):
+        return _StubCall(
+            shape="anthropic",
+            model=str(body.get("model", "")),
+            prompt=_message_text(body.get("messages", [])),
+            max_tokens=body.get("max_tokens"),
+            stream=bool(body.get("stream"))
+        )
+    match = _GEMINI_PATH.search(path)
+    if match:
+        contents = body.get("contents") or [{}]
+        return _StubCall(
+            shape="google",
+            model=match.group(1),
+            prompt="".join(part.get("text", "") for part in contents[-1].get("parts", [])),
+            max_tokens=(body.get("generationConfig") or {}).get("maxOutputTokens"),
+            stream=match.group(2) == "streamGenerateContent",
+            sse="alt=sse" in query.split("&")
+        )
+    return None
+
+
+def _message_text(messages: List[Dict[str, Any]]) -> str:
+    """Text of the last chat message, whose content may be a string or content blocks."""
+    if not messages:
+        return ""
+    content = messages[-1].get("content", "")
+    if isinstance(content, list):
+        return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return str(content)
+
+
+def _usage(call: _StubCall, tokens: List[str]) -> Tuple[int, int]:
+    return max(1, len(call.prompt) // 4), len(tokens)
+
+
+def _completion_body(call: _StubCall, tokens: List[str], response_id: int) -> Dict[str, Any]:
+    """Non-streaming response body in the request's API shape."""
+    text = "".join(tokens)
+    prompt_tokens, completion_tokens = _usage(call, tokens)
+    truncated = call.max_tokens is not None and completion_tokens >= call.max_tokens
+    if call.shape == "openai":
+        return {
+            "id": f"chatcmpl-stub-{response_id}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": call.model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "length" if truncated else "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    if call.shape == "anthropic":
+        return {
+            "id": f"msg_stub_{response_id}",
+            "type": "message",
+            "role": "assistant",
+            "model": call.model,
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "max_tokens" if truncated else "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": prompt_tokens, "output_tokens": completion_tokens},
+        }
+    return _gemini_chunk(text, "MAX_TOKENS" if truncated else "STOP", prompt_tokens, completion_tokens)
+
+
+def _gemini_chunk(
+    text: str,
+    finish_reason: Optional[str],
+    prompt_tokens: int,
+    completion_tokens: int
+) -> Dict[str, Any]:
+    candidate: Dict[str, Any] = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+    if finish_reason:
+        candidate["finishReason"] = finish_reason
+    return {
+        "candidates": [candidate],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": completion_tokens,
+            "totalTokenCount": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _stream_events(
+    call: _StubCall,
+    tokens: List[str],
+    response_id: int
+) -> Iterator[Tuple[Optional[str], Any]]:
+    """Yield the (SSE event name, payload) pairs of a streamed response."""
+    prompt_tokens, completion_tokens = _usage(call, tokens)
+    if call.shape == "openai":
+        created = int(time.time())
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+            return {
+                "id": f"chatcmpl-stub-{response_id}",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": call.model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        yield None, chunk({"role": "assistant", "content": ""})
+        for token in tokens:
+            yield None, chunk({"content": token})
+        yield None, chunk({}, "stop")
+        if call.include_usage:
+            usage_chunk = chunk({})
+            usage_chunk["choices"] = []
+            usage_chunk["usage"] = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            }
+            yield None, usage_chunk
+        yield None, "[DONE]"
+    elif call.shape == "anthropic":
+        yield "message_start", {"type": "message_start", "message": {
+            "id": f"msg_stub_{response_id}", "type": "message", "role": "assistant", "model": call.model,
+            "content": [], "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": prompt_tokens, "output_tokens": 1},
+        }}
+        yield "content_block_start", {
+            "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}
+        }
+        for token in tokens:
+            yield "content_block_delta", {
+                "type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": token}
+            }
+        yield "content_block_stop", {"type": "content_block_stop", "index": 0}
+        yield "message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": completion_tokens},
+        }
+        yield "message_stop", {"type": "message_stop"}
+    else:
+        for index, token in enumerate(tokens):
+            last = index == len(tokens) - 1
+            yield None, _gemini_chunk(token, "STOP" if last else None, prompt_tokens, index + 1)
+
+
+def _rate_limit_headers(
+    shape: str,
+    config: StubServerConfig,
+    retry_after: Optional[float],
+    remaining: int
+) -> Dict[str, str]:
+    """Rate limit headers in the style of the request's provider."""
+    limit = str(config.requests_per_minute or 0)
+    reset = retry_after if retry_after is not None else 60.0
+    headers = {}
+    if retry_after is not None:
+        headers["retry-after"] = str(max(1, round(retry_after)))
+    if shape == "openai":
+        headers.update({
+            "x-ratelimit-limit-requests": limit,
+            "x-ratelimit-remaining-requests": str(remaining),
+            "x-ratelimit-reset-requests": f"{reset:.3f}s",
+        })
+    elif shape == "anthropic":
+        reset_at = datetime.now(timezone.utc) + timedelta(seconds=reset)
+        headers.update({
+            "anthropic-ratelimit-requests-limit": limit,
+            "anthropic-ratelimit-requests-remaining": str(remaining),
+            "anthropic-ratelimit-requests-reset": reset_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return headers
+
+
+def _rate_limit_body(shape: str, retry_after: float) -> Dict[str, Any]:
+    body = _error_body(shape, 429, "Rate limit exceeded")
+    if shape == "google":
+        body["error"]["details"] = [{
+            "@type": "type.googleapis.com/google.rpc.RetryInfo",
+            "retryDelay": f"{max(1, round(retry_after))}s",
+        }]
+    return body
+
+
+def _error_body(shape: str, status: int, message: str) -> Dict[str, Any]:
+    """Error body in the request's API shape."""
+    if shape == "anthropic":
+        error_type = "rate_limit_error" if status == 429 else "api_error"
+        return {"type": "error", "error": {"type": error_type, "message": message}}
+    if shape == "google":
+        return {"error": {
+            "code": status,
+            "message": message,
+            "status": "RESOURCE_EXHAUSTED" if status == 429 else "INTERNAL",
+        }}
+    return {"error": {
+        "message": message,
+        "type": "requests" if status == 429 else "server_error",
+        "param": None,
+        "code": "rate_limit_exceeded" if status == 429 else None,
+    }}
+
+
+def main(argv=None) -> int:
+    """Run the stub server until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_council.bench.stub_server", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8089, help="Port to listen on")
+    parser.add_argument("--median-ms", type=float, default=50.0,
+                        help="Median time to first token in milliseconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Lognormal shape of the time to first token")
+    parser.add_argument("--spike-probability", type=float, default=0.0, help="Chance of a tail latency spike")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="Token generation rate (0 for instant)")
+    parser.add_argument("--response-tokens", type=int, default=32, help="Tokens per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Chance of an injected 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Chance of an injected 429")
+    parser.add_argument("--requests-per-minute", type=int, help="Requests allowed per minute before 429s")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Seconds an injected 429 asks to wait")
+    parser.add_argument("--seed", type=int, help="Seed for latency and fault sampling")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        config = StubServerConfig(
+            latency=LatencyDistribution(
+                median=args.median_ms / 1000, sigma=args.sigma, spike_probability=args.spike_probability
+            ),
+            tokens_per_second=args.tokens_per_second,
+            response_tokens=args.response_tokens,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            requests_per_minute=args.requests_per_minute,
+            retry_after=args.retry_after,
+            seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = StubProviderServer(config, args.host, args.port)
+    for provider in PROVIDER_PATHS:
+        print(f"{provider:<10} base_url: {server.base_url(provider)}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.get_statistics(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
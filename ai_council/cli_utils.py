@@ -1,13 +1,19 @@
 import argparse
+import json
 import sys
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple, TYPE_CHECKING
 
 from .core.models import ExecutionMode
 
 if TYPE_CHECKING:
     from .main import AICouncil
 
+# Record fields tried, in order, for a batch record's ID and request text
+BATCH_ID_FIELDS = ("id", "request_id")
+BATCH_QUERY_FIELDS = ("query", "request", "body")
+
 
 class CLIHandler:
     """
@@ -16,12 +22,14 @@ class CLIHandler:
 
     def __init__(self):
         self.parser = self._setup_arg_parser()
+        self.batch_parser = self._setup_batch_parser()
+        self.profiles_parser = self._setup_profiles_parser()
 
     def _setup_arg_parser(self) -> argparse.ArgumentParser:
         """Configures and returns the argument parser."""
         parser = argparse.ArgumentParser(description="AI Council - Multi-Agent Orchestration System")
         parser.add_argument("--config", type=Path, help="Path to configuration file")
-        parser.add_argument("--mode", choices=["fast", "balanced", "best_quality"], 
+        parser.add_argument("--mode", choices=["fast", "balanced", "best_quality", "cascade"], 
                            default="balanced", help="Execution mode")
         parser.add_argument("--estimate-only", action="store_true", 
                            help="Only estimate cost and time, don't execute")
@@ -34,9 +42,56 @@ class CLIHandler:
         parser.add_argument("request", nargs="?", help="User request to process")
         return parser
 
-    def parse_args(self) -> argparse.Namespace:
-        """Parses command line arguments."""
-        return self.parser.parse_args()
+    def _setup_batch_parser(self) -> argparse.ArgumentParser:
+        """Configures the parser for the batch subcommand."""
+        parser = argparse.ArgumentParser(
+            prog="ai-council batch",
+            description="Process a JSONL file of requests concurrently"
+        )
+        parser.add_argument("--config", type=Path, help="Path to configuration file")
+        parser.add_argument("--mode", choices=["fast", "balanced", "best_quality", "cascade"],
+                           default="balanced", help="Execution mode")
+        parser.add_argument("--input", type=Path, required=True,
+                           help="JSONL file with one request per line")
+        parser.add_argument("--output", type=Path, required=True,
+                           help="JSONL file results are appended to; IDs already in it are skipped")
+        parser.add_argument("--concurrency", type=int, default=None,
+                           help="Requests processed at once (defaults to max_parallel_executions)")
+        return parser
+
+    def _setup_profiles_parser(self) -> argparse.ArgumentParser:
+        """Configures the parser for the profiles subcommand."""
+        parser = argparse.ArgumentParser(
+            prog="ai-council profiles",
+            description="Aggregate request profiles into collapsed stacks for flamegraphs"
+        )
+        parser.add_argument("--config", type=Path, help="Path to configuration file")
+        parser.add_argument("--input", type=Path, nargs="+", default=None,
+                           help="Profile files or directories (defaults to the configured profile directory)")
+        parser.add_argument("--output", type=Path, default=None,
+                           help="File the collapsed stacks are written to (defaults to stdout)")
+        parser.add_argument("--since-minutes", type=float, default=None,
+                           help="Only include requests profiled in the last this many minutes")
+        parser.add_argument("--frame", default=None,
+                           help="Only include stacks passing through a frame containing this text")
+        return parser
+
+    def parse_args(self, argv: Optional[List[str]] = None) -> argparse.Namespace:
+        """Parses command line arguments, dispatching the batch and profiles subcommands."""
+        argv = sys.argv[1:] if argv is None else argv
+        if argv and argv[0] == "batch":
+            args = self.batch_parser.parse_args(argv[1:])
+            if args.concurrency is not None and args.concurrency < 1:
+                self.batch_parser.error("--concurrency must be at least 1")
+            args.command = "batch"
+            return args
+        if argv and argv[0] == "profiles":
+            args = self.profiles_parser.parse_args(argv[1:])
+            args.command = "profiles"
+            return args
+        args = self.parser.parse_args(argv)
+        args.command = None
+        return args
 
     def print_system_status(self, ai_council: 'AICouncil'):
         """Prints the current system status."""
@@ -144,6 +199,154 @@ class CLIHandler:
         print("="*60)
         self._print_response(response)
 
+    def handle_batch(
+        self,
+        ai_council: 'AICouncil',
+        input_path: Path,
+        output_path: Path,
+        mode: str,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Processes a JSONL file of requests, appending results as they finish.
+
+        Records are read lazily and at most ``concurrency`` are in progress, so
+        memory stays bounded for large files. Each record needs a request text
+        (``query``, ``request`` or ``body``) and may carry an ID (``id`` or
+        ``request_id``, defaulting to its line number). Records whose ID is
+        already in the output file are skipped, so an interrupted run resumes
+        where it stopped.
+
+        Returns:
+            Counts of processed, failed, skipped and invalid records
+        """
+        execution_mode = ExecutionMode(mode)
+        counts = {"processed": 0, "failed": 0, "skipped": 0, "invalid": 0}
+        done_ids = self._read_completed_ids(output_path)
+        pending_ids: Dict[int, str] = {}
+
+        def queries() -> Iterator[str]:
+            records = self._read_batch_records(input_path, done_ids, counts)
+            for index, (record_id, query) in enumerate(records):
+                pending_ids[index] = record_id
+                yield query
+
+        start = time.time()
+        print(f"\nProcessing {input_path} in {execution_mode.value} mode...")
+        with open(output_path, "a", encoding="utf-8") as output:
+            if output.tell() > 0 and not self._ends_with_newline(output_path):
+                output.write("\n")  # Complete a line cut off by an interrupted run
+            for index, response in ai_council.process_batch(queries(), execution_mode, concurrency):
+                record_id = pending_ids.pop(index)
+                output.write(json.dumps(self._batch_result(record_id, response)) + "\n")
+                output.flush()
+                counts["processed"] += 1
+                if not response.success:
+                    counts["failed"] += 1
+
+        print(f"Processed {counts['processed']} requests ({counts['failed']} failed) in "
+              f"{time.time() - start:.1f}s; skipped {counts['skipped']} already done, "
+              f"{counts['invalid']} invalid")
+        return counts
+
+    def handle_profiles(
+        self,
+        inputs: List[Path],
+        output_path: Optional[Path] = None,
+        since_minutes: Optional[float] = None,
+        frame: Optional[str] = None
+    ) -> int:
+        """
+        Merges request profiles into collapsed stacks, one ``frame;frame weight`` line each.
+
+        The output is the input format of flamegraph.pl, speedscope and
+        inferno; weights are microseconds.
+
+        Returns:
+            Number of profiles aggregated
+        """
+        from .core.profiling import aggregate_profiles, format_collapsed, load_profiles
+
+        since = time.time() - since_minutes * 60 if since_minutes is not None else None
+        count = 0
+
+        def counted() -> Iterator[Dict[str, Any]]:
+            nonlocal count
+            for profile in load_profiles(inputs):
+                count += 1
+                yield profile
+
+        collapsed = format_collapsed(aggregate_profiles(counted(), since, frame))
+        if output_path is None:
+            sys.stdout.write(collapsed)
+        else:
+            with open(output_path, "w", encoding="utf-8") as output:
+                output.write(collapsed)
+            print(f"Wrote {len(collapsed.splitlines())} stacks from {count} profiles to {output_path}")
+        return count
+
+    def _ends_with_newline(self, path: Path) -> bool:
+        """Checks the last byte of a file without reading the rest."""
+        with open(path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _read_completed_ids(self, output_path: Path) -> Set[str]:
+        """Collects the IDs already written to a batch output file."""
+        done_ids = set()
+        if not output_path.exists():
+            return done_ids
+        with open(output_path, "r", encoding="utf-8") as output:
+            for line in output:
+                try:
+                    done_ids.add(str(json.loads(line)["id"]))
+                except (ValueError, KeyError, TypeError):
+                    continue  # Partial line from an interrupted run
+        return done_ids
+
+    def _read_batch_records(
+        self, input_path: Path, done_ids: Set[str], counts: Dict[str, int]
+    ) -> Iterator[Tuple[str, str]]:
+        """Yields (id, request text) for records still to do, one line at a time."""
+        with open(input_path, "r", encoding="utf-8") as records:
+            for line_number, line in enumerate(records, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, str):
+                    record = {"query": record}
+                query = next((record[field] for field in BATCH_QUERY_FIELDS
+                              if isinstance(record, dict) and isinstance(record.get(field), str)), None)
+                if not query or not query.strip():
+                    print(f"Skipping invalid record on line {line_number}", file=sys.stderr)
+                    counts["invalid"] += 1
+                    continue
+
+                record_id = next((str(record[field]) for field in BATCH_ID_FIELDS
+                                  if record.get(field) is not None), str(line_number))
+                if record_id in done_ids:
+                    counts["skipped"] += 1
+                    continue
+                done_ids.add(record_id)
+                yield record_id, query
+
+    def _batch_result(self, record_id: str, response) -> Dict[str, Any]:
+        """Builds the output record for one batch response."""
+        return {
+            "id": record_id,
+            "success": response.success,
+            "content": response.content,
+            "confidence": response.overall_confidence,
+            "models_used": response.models_used,
+            "execution_time": response.execution_metadata.total_execution_time if response.execution_metadata else 0,
+            "cost": response.cost_breakdown.total_cost if response.cost_breakdown else 0,
+            "error_message": response.error_message if not response.success else None,
+            "error_type": response.error_type if not response.success else None
+        }
+
     def _print_estimate(self, estimate: Dict[str, Any]):
         print(f"  Estimated Cost: ${estimate.get('estimated_cost', 0):.4f}")
         print(f"  Estimated Time: {estimate.get('estimated_time', 0):.1f}s")
@@ -1,17 +1,59 @@
 """Core components and data models for AI Council."""
 
-from .models import (
-    Task, Subtask, SelfAssessment, AgentResponse, FinalResponse,
-    CostBreakdown, ExecutionMetadata, ModelCapabilities, CostProfile, PerformanceMetrics,
-    TaskType, ExecutionMode, RiskLevel, Priority, ComplexityLevel, TaskIntent
-)
+from typing import TYPE_CHECKING
 
-from .interfaces import (
-    AnalysisEngine, TaskDecomposer, ModelContextProtocol, ExecutionAgent,
-    ArbitrationLayer, SynthesisLayer, OrchestrationLayer, ModelRegistry,
-    AIModel, ModelSelection, ExecutionPlan, Conflict, Resolution, ArbitrationResult,
-    FailureResponse, ModelError, CostEstimate, ExecutionFailure, FallbackStrategy
-)
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .models import (
+        Task, Subtask, SelfAssessment, AgentResponse, FinalResponse,
+        CostBreakdown, ExecutionMetadata, ModelCapabilities, CostProfile, PerformanceMetrics,
+        TaskType, ExecutionMode, RiskLevel, Priority, ComplexityLevel, TaskIntent
+    )
+    from .interfaces import (
+        AnalysisEngine, TaskDecomposer, ModelContextProtocol, ExecutionAgent,
+        ArbitrationLayer, SynthesisLayer, OrchestrationLayer, ModelRegistry,
+        AIModel, ModelSelection, ExecutionPlan, Conflict, Resolution, ArbitrationResult,
+        FailureResponse, ModelError, CostEstimate, ExecutionFailure, FallbackStrategy
+    )
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "Task": ".models",
+    "Subtask": ".models",
+    "SelfAssessment": ".models",
+    "AgentResponse": ".models",
+    "FinalResponse": ".models",
+    "CostBreakdown": ".models",
+    "ExecutionMetadata": ".models",
+    "ModelCapabilities": ".models",
+    "CostProfile": ".models",
+    "PerformanceMetrics": ".models",
+    "TaskType": ".models",
+    "ExecutionMode": ".models",
+    "RiskLevel": ".models",
+    "Priority": ".models",
+    "ComplexityLevel": ".models",
+    "TaskIntent": ".models",
+    "AnalysisEngine": ".interfaces",
+    "TaskDecomposer": ".interfaces",
+    "ModelContextProtocol": ".interfaces",
+    "ExecutionAgent": ".interfaces",
+    "ArbitrationLayer": ".interfaces",
+    "SynthesisLayer": ".interfaces",
+    "OrchestrationLayer": ".interfaces",
+    "ModelRegistry": ".interfaces",
+    "AIModel": ".interfaces",
+    "ModelSelection": ".interfaces",
+    "ExecutionPlan": ".interfaces",
+    "Conflict": ".interfaces",
+    "Resolution": ".interfaces",
+    "ArbitrationResult": ".interfaces",
+    "FailureResponse": ".interfaces",
+    "ModelError": ".interfaces",
+    "CostEstimate": ".interfaces",
+    "ExecutionFailure": ".interfaces",
+    "FallbackStrategy": ".interfaces",
+})
 
 __all__ = [
     # Data models
@@ -28,4 +70,4 @@ __all__ = [
     # Supporting classes
     'ModelSelection', 'ExecutionPlan', 'Conflict', 'Resolution', 'ArbitrationResult',
     'FailureResponse', 'ModelError', 'CostEstimate', 'ExecutionFailure', 'FallbackStrategy'
-]
\ No newline at end of file
+]
@@ -0,0 +1,223 @@
+"""Bounded off-loop execution with admission control for async front ends.
+
+The pipeline is synchronous. Async servers hand it to a :class:`BoundedExecutor`
+instead of calling it on the event loop: a fixed pool of worker threads runs
+requests, a bounded backlog holds the ones waiting for a worker, and anything
+beyond that is rejected immediately with an estimate of when to retry. A slow
+request then occupies one worker instead of the whole event loop.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when the executor's workers and backlog are all taken."""
+
+    def __init__(self, message: str, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded backlog and load-based retry estimates."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        name: str = "pipeline",
+        smoothing: float = 0.2
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Requests run concurrently
+            max_queue: Admitted requests that may wait for a worker
+            name: Prefix for worker thread names
+            smoothing: Weight given to each new service time sample
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be non-negative")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.smoothing = smoothing
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+        self._rejected = 0
+        self._average_service_time: Optional[float] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Requests admitted and not yet finished, running or queued."""
+        return self._admitted
+
+    @property
+    def queued(self) -> int:
+        """Admitted requests still waiting for a worker."""
+        return self._admitted - self._running
+
+    def retry_after(self) -> int:
+        """Estimate whole seconds until a rejected caller would be admitted."""
+        with self._lock:
+            average = self._average_service_time or 1.0
+            backlog = max(0, self._admitted - self.max_workers) + 1
+        return max(1, math.ceil(average * backlog / self.max_workers))
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Admit a call and schedule it on a worker.
+
+        Args:
+            fn: The blocking function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the call's result
+
+        Raises:
+            AdmissionRejectedError: If the workers and backlog are full
+        """
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                admitted = self._admitted
+            else:
+                self._admitted += 1
+                admitted = None
+
+        if admitted is not None:
+            retry_after = self.retry_after()
+            logger.warning(f"Rejected request with {admitted} in flight; retry after {retry_after}s")
+            raise AdmissionRejectedError(
+                f"Server busy: {admitted} requests in flight", retry_after=retry_after
+            )
+
+        try:
+            return self._executor.submit(self._run, fn, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._admitted -= 1
+            raise
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call off the event loop and await its result.
+
+        Raises:
+            AdmissionRejectedError: If the workers and backlog are full
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stream(self, fn: Callable[..., Iterable[Any]], *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Run a blocking generator off the event loop and relay its items.
+
+        Admission is decided here, before the first item, so callers can still
+        reject the request before starting a streaming response. Closing the
+        returned iterator (for example when the client disconnects) stops the
+        worker at the next item and closes the iterable, releasing the slot.
+
+        Args:
+            fn: Function returning the iterable to consume on a worker
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Async iterator over the produced items; errors are re-raised from it
+
+        Raises:
+            AdmissionRejectedError: If the workers and backlog are full
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+        end = object()
+        stopped = threading.Event()
+
+        def put(entry) -> None:
+            try:
+                loop.call_soon_threadsafe(items.put_nowait, entry)
+            except RuntimeError:
+                pass  # The loop closed; nobody is listening anymore
+
+        def produce() -> None:
+            iterator = None
+            try:
+                iterator = iter(fn(*args, **kwargs))
+                for item in iterator:
+                    if stopped.is_set():
+                        logger.info("Stream consumer went away; stopping its producer")
+                        break
+                    put((item, None))
+            except BaseException as e:
+                put((end, e))
+            else:
+                put((end, None))
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        self.submit(produce)
+
+        async def relay() -> AsyncIterator[Any]:
+            try:
+                while True:
+                    item, error = await items.get()
+                    if item is end:
+                        if error is not None:
+                            raise error
+                        return
+                    yield item
+            finally:
+                stopped.set()
+
+        return relay()
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        with self._lock:
+            self._running += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self._admitted -= 1
+                if self._average_service_time is None:
+                    self._average_service_time = elapsed
+                else:
+                    self._average_service_time += self.smoothing * (elapsed - self._average_service_time)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current load for status reporting."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._admitted - self._running,
+                "rejected": self._rejected,
+                "average_service_time": self._average_service_time,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,238 @@
+"""Injectable clocks, including a virtual clock for discrete-event simulation.
+
+Components that wait or measure time for scheduling decisions (timeouts, rate
+limits, circuit breakers, retry budgets, adaptive timeouts and the mock
+models) read time through a :class:`Clock`. Each accepts a ``clock`` argument
+and otherwise follows the process default, which is the system clock unless
+:func:`use_clock` or :func:`set_clock` installs another.
+
+:class:`VirtualClock` keeps simulated time that only moves when it is advanced
+or, with autojump enabled, when no thread has touched the clock for a short
+stretch of real time while some thread is waiting on it. The clock then jumps
+straight to the earliest pending deadline, so a model that "sleeps" for two
+seconds returns as soon as the rest of the process is idle. Work between clock
+calls counts as taking no simulated time, as in any discrete-event simulation.
+A quiet stretch may also be CPU work that doesn't touch the clock, so the
+clock waits ``timeout_patience`` times longer before jumping to the deadline
+of a timeout (:meth:`Clock.wait_future`): a sleep reached early only reorders
+events slightly, but a timeout reached early fails work that was running.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class Clock(ABC):
+    """Source of time and of waits measured in it."""
+
+    @abstractmethod
+    def time(self) -> float:
+        """Seconds since the epoch."""
+        pass
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary origin that never go backwards."""
+        return self.time()
+
+    def utcnow(self) -> datetime:
+        """Current UTC time as a naive datetime."""
+        return _EPOCH + timedelta(seconds=self.time())
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Block the calling thread for seconds of this clock's time."""
+        pass
+
+    @abstractmethod
+    def wait_future(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a future's result for at most timeout seconds of this clock's time.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the future is not done in time
+        """
+        pass
+
+
+class SystemClock(Clock):
+    """The real clock."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def utcnow(self) -> datetime:
+        return datetime.utcnow()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait_future(self, future: Future, timeout: Optional[float] = None) -> Any:
+        return future.result(timeout=timeout)
+
+
+class VirtualClock(Clock):
+    """Simulated time for discrete-event runs of the real, threaded code."""
+
+    def __init__(
+        self,
+        start: float = 0.0,
+        autojump_threshold: Optional[float] = 0.001,
+        timeout_patience: float = 100.0
+    ):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial time in seconds since the epoch
+            autojump_threshold: Real seconds without clock activity after which
+                the clock jumps to the earliest pending deadline, or None to
+                move only on :meth:`advance`
+            timeout_patience: Multiple of autojump_threshold to wait instead
+                when the earliest deadline is a timeout
+
+        Raises:
+            ValueError: If autojump_threshold is negative or timeout_patience below 1
+        """
+        if autojump_threshold is not None and autojump_threshold < 0:
+            raise ValueError("autojump_threshold must be non-negative")
+        if timeout_patience < 1:
+            raise ValueError("timeout_patience must be at least 1")
+        self.autojump_threshold = autojump_threshold
+        self.timeout_patience = timeout_patience
+        self.jumps = 0
+        self._now = float(start)
+        self._lock = threading.Lock()
+        # Waiters block on _wakeup; the autojump watchdog blocks on _activity
+        self._wakeup = threading.Condition(self._lock)
+        self._activity = threading.Condition(self._lock)
+        # Pending waits as (deadline, sequence, is_timeout)
+        self._deadlines: List[Tuple[float, int, bool]] = []
+        self._sequence = itertools.count()
+        self._last_activity = time.perf_counter()
+        self._watching = False
+
+    def time(self) -> float:
+        self._last_activity = time.perf_counter()
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            self._last_activity = time.perf_counter()
+            return
+        self._wait_until(seconds, lambda: False, is_timeout=False)
+
+    def wait_future(self, future: Future, timeout: Optional[float] = None) -> Any:
+        if timeout is None:
+            return future.result()
+        future.add_done_callback(self._on_future_done)
+        if not self._wait_until(timeout, future.done, is_timeout=True):
+            raise FutureTimeoutError()
+        return future.result()
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move time forward, waking every waiter whose deadline has passed.
+
+        Raises:
+            ValueError: If seconds is negative
+        """
+        if seconds < 0:
+            raise ValueError("Time cannot move backwards")
+        with self._lock:
+            self._now += seconds
+            self._last_activity = time.perf_counter()
+            self._wakeup.notify_all()
+
+    @property
+    def pending(self) -> int:
+        """Number of threads waiting on the clock."""
+        with self._lock:
+            return len(self._deadlines)
+
+    def _wait_until(self, seconds: float, done: Callable[[], bool], is_timeout: bool) -> bool:
+        """Block until done() or seconds have passed; return done()."""
+        with self._lock:
+            entry = (self._now + seconds, next(self._sequence), is_timeout)
+            heapq.heappush(self._deadlines, entry)
+            self._touch()
+            try:
+                while not done() and self._now < entry[0]:
+                    self._wakeup.wait()
+                return done()
+            finally:
+                self._deadlines.remove(entry)
+                heapq.heapify(self._deadlines)
+                self._touch()
+
+    def _touch(self) -> None:
+        # Called with the lock held
+        self._last_activity = time.perf_counter()
+        if self.autojump_threshold is None:
+            return
+        if not self._watching and self._deadlines:
+            self._watching = True
+            threading.Thread(target=self._watch, name="virtual-clock", daemon=True).start()
+        self._activity.notify()
+
+    def _on_future_done(self, future: Future) -> None:
+        with self._lock:
+            self._last_activity = time.perf_counter()
+            self._wakeup.notify_all()
+
+    def _watch(self) -> None:
+        """Jump to the earliest deadline whenever the process has gone quiet."""
+        with self._lock:
+            while self._deadlines:
+                earliest, _, is_timeout = self._deadlines[0]
+                threshold = self.autojump_threshold * (self.timeout_patience if is_timeout else 1)
+                idle = time.perf_counter() - self._last_activity
+                if idle < threshold:
+                    self._activity.wait(threshold - idle)
+                    continue
+                if earliest > self._now:
+                    self._now = earliest
+                    self.jumps += 1
+                self._last_activity = time.perf_counter()
+                self._wakeup.notify_all()
+            self._watching = False
+
+
+# Process default clock
+system_clock = SystemClock()
+_default_clock: Clock = system_clock
+
+
+def get_clock() -> Clock:
+    """The process default clock."""
+    return _default_clock
+
+
+def set_clock(clock: Optional[Clock]) -> None:
+    """Install clock as the process default, or restore the system clock if None."""
+    global _default_clock
+    _default_clock = clock or system_clock
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """Make clock the process default for the enclosed block."""
+    previous = _default_clock
+    set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
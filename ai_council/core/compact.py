@@ -0,0 +1,447 @@
+"""Compact, slotted representations of the core data models.
+
+The dataclasses in ``models`` are convenient but costly to create in bulk:
+each instance carries a ``__dict__``, calls ``uuid4()`` and
+``datetime.utcnow()``, allocates its metadata dict and lists up front, and
+validates its fields on every construction, including internal copies. At high
+request rates with many subtasks per request this churn shows up in GC pauses.
+
+The classes here hold the same fields with:
+
+* ``__slots__`` instead of an instance dictionary;
+* monotonic integer timestamps (nanoseconds), converted to ``datetime`` only
+  when read;
+* IDs from a counter-based ``IdGenerator`` rather than ``uuid4()``;
+* metadata dicts and lists created on first access;
+* validation that trusted internal code can skip with ``validate=False``.
+
+``to_model()`` and ``from_model()`` convert to and from the regular
+dataclasses at API boundaries.
+"""
+
+import itertools
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from .models import (
+    AgentResponse, ComplexityLevel, ExecutionMetadata, ExecutionMode, FinalResponse,
+    CostBreakdown, Priority, RiskLevel, SelfAssessment, Subtask, Task, TaskIntent, TaskType
+)
+
+
+_EPOCH = datetime(1970, 1, 1)
+# Pairs a wall-clock reading with a monotonic one so monotonic readings can be
+# converted to wall-clock time
+_WALL_ANCHOR_NS = time.time_ns()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+
+
+def timestamp_to_datetime(timestamp_ns: int) -> datetime:
+    """
+    Convert a monotonic timestamp to a naive UTC datetime.
+
+    Args:
+        timestamp_ns: Monotonic time in nanoseconds
+
+    Returns:
+        datetime: The corresponding wall-clock time, like ``datetime.utcnow()``
+    """
+    wall_ns = _WALL_ANCHOR_NS + (timestamp_ns - _MONOTONIC_ANCHOR_NS)
+    return _EPOCH + timedelta(microseconds=wall_ns // 1000)
+
+
+def datetime_to_timestamp(value: datetime) -> int:
+    """
+    Convert a naive UTC datetime to a monotonic timestamp.
+
+    Args:
+        value: Wall-clock time, as produced by ``datetime.utcnow()``
+
+    Returns:
+        int: The corresponding monotonic time in nanoseconds
+    """
+    delta = value - _EPOCH
+    wall_ns = (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    return _MONOTONIC_ANCHOR_NS + (wall_ns - _WALL_ANCHOR_NS)
+
+
+class IdGenerator:
+    """
+    Generates unique string IDs from a random prefix and a counter.
+
+    The prefix is drawn once per generator (and again in a forked child), so IDs
+    stay unique across processes while each call costs only a counter increment.
+    """
+
+    __slots__ = ("_prefix", "_counter")
+
+    def __init__(self):
+        """Initialize the generator with a fresh random prefix."""
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Draw a new random prefix and restart the counter."""
+        self._prefix = uuid4().hex[:16]
+        self._counter = itertools.count()
+
+    def __call__(self) -> str:
+        """Return the next ID."""
+        return f"{self._prefix}-{next(self._counter):x}"
+
+
+class _Lazy:
+    """Slot-backed attribute whose default value is created on first access."""
+
+    __slots__ = ("_slot", "_factory")
+
+    def __init__(self, slot: str, factory: Callable[[], Any]):
+        self._slot = slot
+        self._factory = factory
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self._slot)
+        if value is None:
+            value = self._factory()
+            setattr(instance, self._slot, value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        setattr(instance, self._slot, value)
+
+
+class _Timestamp:
+    """Slot-backed datetime attribute stored as a monotonic integer."""
+
+    __slots__ = ("_slot",)
+
+    def __init__(self, slot: str):
+        self._slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return timestamp_to_datetime(getattr(instance, self._slot))
+
+    def __set__(self, instance, value: datetime) -> None:
+        setattr(instance, self._slot, datetime_to_timestamp(value))
+
+
+class _CompactModel:
+    """Shared conversion, comparison and repr for compact models."""
+
+    __slots__ = ()
+
+    _model: type = object
+    _fields: Tuple[str, ...] = ()
+
+    def to_model(self):
+        """
+        Convert to the regular dataclass without re-running validation.
+
+        Returns:
+            The equivalent instance of the dataclass in ``models``
+        """
+        instance = self._model.__new__(self._model)
+        for name in self._fields:
+            setattr(instance, name, getattr(self, name))
+        return instance
+
+    @classmethod
+    def from_model(cls, instance):
+        """
+        Create a compact copy of a dataclass instance without re-validating it.
+
+        Args:
+            instance: Instance of the corresponding dataclass in ``models``
+
+        Returns:
+            The compact equivalent
+        """
+        compact = cls.__new__(cls)
+        for slot in cls.__slots__:
+            setattr(compact, slot, None)
+        for name in cls._fields:
+            setattr(compact, name, getattr(instance, name))
+        return compact
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactTask(_CompactModel):
+    """Slotted equivalent of ``Task``."""
+
+    __slots__ = (
+        "id", "content", "intent", "complexity", "execution_mode", "_created_ns", "_metadata"
+    )
+    _model = Task
+    _fields = ("id", "content", "intent", "complexity", "execution_mode", "created_at", "metadata")
+
+    created_at = _Timestamp("_created_ns")
+    metadata = _Lazy("_metadata", dict)
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        content: str = "",
+        intent: Optional[TaskIntent] = None,
+        complexity: Optional[ComplexityLevel] = None,
+        execution_mode: ExecutionMode = ExecutionMode.BALANCED,
+        created_ns: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        validate: bool = True
+    ):
+        self.id = id if id is not None else next_id()
+        self.content = content
+        self.intent = intent
+        self.complexity = complexity
+        self.execution_mode = execution_mode
+        self._created_ns = created_ns if created_ns is not None else time.monotonic_ns()
+        self._metadata = metadata
+        if validate:
+            Task.__post_init__(self)
+
+
+class CompactSubtask(_CompactModel):
+    """Slotted equivalent of ``Subtask``."""
+
+    __slots__ = (
+        "id", "parent_task_id", "content", "task_type", "priority", "risk_level",
+        "accuracy_requirement", "estimated_cost", "_created_ns", "_metadata"
+    )
+    _model = Subtask
+    _fields = (
+        "id", "parent_task_id", "content", "task_type", "priority", "risk_level",
+        "accuracy_requirement", "estimated_cost", "created_at", "metadata"
+    )
+
+    created_at = _Timestamp("_created_ns")
+    metadata = _Lazy("_metadata", dict)
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        parent_task_id: str = "",
+        content: str = "",
+        task_type: Optional[TaskType] = None,
+        priority: Priority = Priority.MEDIUM,
+        risk_level: RiskLevel = RiskLevel.LOW,
+        accuracy_requirement: float = 0.8,
+        estimated_cost: float = 0.0,
+        created_ns: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        validate: bool = True
+    ):
+        self.id = id if id is not None else next_id()
+        self.parent_task_id = parent_task_id
+        self.content = content
+        self.task_type = task_type
+        self.priority = priority
+        self.risk_level = risk_level
+        self.accuracy_requirement = accuracy_requirement
+        self.estimated_cost = estimated_cost
+        self._created_ns = created_ns if created_ns is not None else time.monotonic_ns()
+        self._metadata = metadata
+        if validate:
+            Subtask.__post_init__(self)
+
+
+class CompactSelfAssessment(_CompactModel):
+    """Slotted equivalent of ``SelfAssessment``."""
+
+    __slots__ = (
+        "confidence_score", "_assumptions", "risk_level", "estimated_cost", "token_usage",
+        "execution_time", "model_used", "_timestamp_ns"
+    )
+    _model = SelfAssessment
+    _fields = (
+        "confidence_score", "assumptions", "risk_level", "estimated_cost", "token_usage",
+        "execution_time", "model_used", "timestamp"
+    )
+
+    assumptions = _Lazy("_assumptions", list)
+    timestamp = _Timestamp("_timestamp_ns")
+
+    def __init__(
+        self,
+        confidence_score: float = 0.0,
+        assumptions: Optional[List[str]] = None,
+        risk_level: RiskLevel = RiskLevel.LOW,
+        estimated_cost: float = 0.0,
+        token_usage: int = 0,
+        execution_time: float = 0.0,
+        model_used: str = "",
+        timestamp_ns: Optional[int] = None,
+        validate: bool = True
+    ):
+        self.confidence_score = confidence_score
+        self._assumptions = assumptions
+        self.risk_level = risk_level
+        self.estimated_cost = estimated_cost
+        self.token_usage = token_usage
+        self.execution_time = execution_time
+        self.model_used = model_used
+        self._timestamp_ns = timestamp_ns if timestamp_ns is not None else time.monotonic_ns()
+        if validate:
+            SelfAssessment.__post_init__(self)
+
+
+class CompactAgentResponse(_CompactModel):
+    """
+    Slotted equivalent of ``AgentResponse``.
+
+    The self-assessment may be a ``SelfAssessment`` or a
+    ``CompactSelfAssessment``; ``to_model()`` converts the latter.
+    """
+
+    __slots__ = (
+        "subtask_id", "model_used", "content", "self_assessment", "_timestamp_ns",
+        "success", "error_message", "_metadata"
+    )
+    _model = AgentResponse
+    _fields = (
+        "subtask_id", "model_used", "content", "self_assessment", "timestamp",
+        "success", "error_message", "metadata"
+    )
+
+    timestamp = _Timestamp("_timestamp_ns")
+    metadata = _Lazy("_metadata", dict)
+
+    def __init__(
+        self,
+        subtask_id: str = "",
+        model_used: str = "",
+        content: str = "",
+        self_assessment: Optional[Any] = None,
+        timestamp_ns: Optional[int] = None,
+        success: bool = True,
+        error_message: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        validate: bool = True
+    ):
+        self.subtask_id = subtask_id
+        self.model_used = model_used
+        self.content = content
+        self.self_assessment = self_assessment
+        self._timestamp_ns = timestamp_ns if timestamp_ns is not None else time.monotonic_ns()
+        self.success = success
+        self.error_message = error_message
+        self._metadata = metadata
+        if validate:
+            AgentResponse._validate(self)
+
+    def to_model(self) -> AgentResponse:
+        """Convert to an ``AgentResponse`` without re-running validation."""
+        response = super().to_model()
+        if isinstance(response.self_assessment, CompactSelfAssessment):
+            response.self_assessment = response.self_assessment.to_model()
+        response._text_view = None  # Not set by to_model(), which skips __post_init__
+        return response
+
+
+class CompactExecutionMetadata(_CompactModel):
+    """Slotted equivalent of ``ExecutionMetadata`` whose lists are created on first use."""
+
+    __slots__ = (
+        "_models_used", "_execution_path", "_arbitration_decisions", "_synthesis_notes",
+        "total_execution_time", "parallel_executions", "_escalation_paths", "_spans"
+    )
+    _model = ExecutionMetadata
+    _fields = (
+        "models_used", "execution_path", "arbitration_decisions", "synthesis_notes",
+        "total_execution_time", "parallel_executions", "escalation_paths", "spans"
+    )
+
+    models_used = _Lazy("_models_used", list)
+    execution_path = _Lazy("_execution_path", list)
+    arbitration_decisions = _Lazy("_arbitration_decisions", list)
+    synthesis_notes = _Lazy("_synthesis_notes", list)
+    escalation_paths = _Lazy("_escalation_paths", list)
+    spans = _Lazy("_spans", list)
+
+    def __init__(
+        self,
+        total_execution_time: float = 0.0,
+        parallel_executions: int = 0,
+        validate: bool = True
+    ):
+        self._models_used = None
+        self._execution_path = None
+        self._arbitration_decisions = None
+        self._synthesis_notes = None
+        self._escalation_paths = None
+        self._spans = None
+        self.total_execution_time = total_execution_time
+        self.parallel_executions = parallel_executions
+        if validate:
+            ExecutionMetadata.__post_init__(self)
+
+
+class CompactFinalResponse(_CompactModel):
+    """Slotted equivalent of ``FinalResponse``."""
+
+    __slots__ = (
+        "content", "overall_confidence", "execution_metadata", "cost_breakdown",
+        "_models_used", "_timestamp_ns", "success", "error_message", "error_type"
+    )
+    _model = FinalResponse
+    _fields = (
+        "content", "overall_confidence", "execution_metadata", "cost_breakdown",
+        "models_used", "timestamp", "success", "error_message", "error_type"
+    )
+
+    models_used = _Lazy("_models_used", list)
+    timestamp = _Timestamp("_timestamp_ns")
+
+    def __init__(
+        self,
+        content: str = "",
+        overall_confidence: float = 0.0,
+        execution_metadata: Optional[Any] = None,
+        cost_breakdown: Optional[CostBreakdown] = None,
+        models_used: Optional[List[str]] = None,
+        timestamp_ns: Optional[int] = None,
+        success: bool = True,
+        error_message: Optional[str] = None,
+        error_type: Optional[str] = None,
+        validate: bool = True
+    ):
+        self.content = content
+        self.overall_confidence = overall_confidence
+        self.execution_metadata = execution_metadata
+        self.cost_breakdown = cost_breakdown
+        self._models_used = models_used
+        self._timestamp_ns = timestamp_ns if timestamp_ns is not None else time.monotonic_ns()
+        self.success = success
+        self.error_message = error_message
+        self.error_type = error_type
+        if validate:
+            FinalResponse.__post_init__(self)
+
+    def to_model(self) -> FinalResponse:
+        """Convert to a ``FinalResponse`` without re-running validation."""
+        response = super().to_model()
+        if isinstance(response.execution_metadata, CompactExecutionMetadata):
+            response.execution_metadata = response.execution_metadata.to_model()
+        return response
+
+
+# Global ID generator for compact models
+next_id = IdGenerator()
+
+if hasattr(os, "register_at_fork"):
+    # A forked child would otherwise repeat the parent's IDs
+    os.register_at_fork(after_in_child=next_id.reseed)
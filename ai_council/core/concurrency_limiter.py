@@ -0,0 +1,229 @@
+"""Adaptive per-provider concurrency limits for AI Council model calls.
+
+Each provider gets a limiter that bounds the number of in-flight model calls.
+The limit is not configured statically: it grows while observed latency stays
+close to its long-term baseline, shrinks proportionally when latency rises
+(gradient), and backs off multiplicatively when the provider answers with
+rate limit or timeout failures (AIMD).
+"""
+
+import logging
+import math
+import threading
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceededError(Exception):
+    """Raised when no concurrency slot frees up before the acquire timeout."""
+
+    def __init__(self, message: str, resource: str, limit: int):
+        self.resource = resource
+        self.limit = limit
+        super().__init__(message)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Gradient/AIMD concurrency limiter for a single resource."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        baseline_window: int = 100
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Name of the limited resource (usually a provider)
+            initial_limit: Starting in-flight limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            backoff_ratio: Multiplier applied on rate limit or timeout failures
+            latency_tolerance: Latency growth over baseline tolerated before shrinking
+            smoothing: Weight given to each new limit estimate
+            baseline_window: Number of samples the long-term latency averages over
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_window = baseline_window
+
+        self._limit = float(max(min_limit, min(max_limit, initial_limit)))
+        self._in_flight = 0
+        self._baseline_latency: Optional[float] = None
+        self._last_latency: Optional[float] = None
+        self._overload_count = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if a slot was acquired, False on timeout
+        """
+        with self._condition:
+            acquired = self._condition.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            )
+            if acquired:
+                self._in_flight += 1
+            return acquired
+
+    def on_success(self, latency: float) -> None:
+        """Release a slot after a successful call and adapt the limit."""
+        with self._condition:
+            was_saturated = self._in_flight >= int(self._limit) / 2
+            self._in_flight = max(0, self._in_flight - 1)
+            self._last_latency = latency
+
+            if self._baseline_latency is None:
+                self._baseline_latency = latency
+            else:
+                weight = 1.0 / self.baseline_window
+                self._baseline_latency += (latency - self._baseline_latency) * weight
+
+            gradient = 1.0
+            if latency > 0:
+                gradient = max(0.5, min(1.0, self.latency_tolerance * self._baseline_latency / latency))
+
+            # Don't grow the limit while callers aren't using what they have
+            if gradient >= 1.0 and not was_saturated:
+                self._condition.notify()
+                return
+
+            estimate = self._limit * gradient + math.sqrt(self._limit)
+            self._set_limit(self._limit * (1 - self.smoothing) + estimate * self.smoothing)
+            self._condition.notify_all()
+
+    def on_failure(self, overload: bool = False) -> None:
+        """
+        Release a slot after a failed call.
+
+        Args:
+            overload: True if the failure signals provider overload (rate
+                limit or timeout), which backs the limit off multiplicatively
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if overload:
+                self._overload_count += 1
+                previous = self.limit
+                self._set_limit(self._limit * self.backoff_ratio)
+                if self.limit != previous:
+                    logger.info(f"Concurrency limit for {self.name} reduced to {self.limit}")
+            self._condition.notify()
+
+    def _set_limit(self, value: float) -> None:
+        self._limit = max(float(self.min_limit), min(float(self.max_limit), value))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the current limiter state."""
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "baseline_latency": self._baseline_latency,
+                "last_latency": self._last_latency,
+                "overload_count": self._overload_count
+            }
+
+
+class ConcurrencyLimiterManager:
+    """Creates and tracks one adaptive limiter per resource."""
+
+    def __init__(self):
+        self.enabled = True
+        self.acquire_timeout = 30.0
+        self.limiter_defaults: Dict[str, Any] = {
+            "initial_limit": 10,
+            "min_limit": 1,
+            "max_limit": 100
+        }
+        self.limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        enabled: bool = True,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        acquire_timeout: float = 30.0
+    ) -> None:
+        """Configure defaults for limiters created from now on."""
+        with self._lock:
+            self.enabled = enabled
+            self.acquire_timeout = acquire_timeout
+            self.limiter_defaults = {
+                "initial_limit": initial_limit,
+                "min_limit": min_limit,
+                "max_limit": max_limit
+            }
+
+    def get_limiter(self, resource: str) -> AdaptiveConcurrencyLimiter:
+        """Get the limiter for a resource, creating it on first use."""
+        with self._lock:
+            limiter = self.limiters.get(resource)
+            if limiter is None:
+                limiter = AdaptiveConcurrencyLimiter(resource, **self.limiter_defaults)
+                self.limiters[resource] = limiter
+            return limiter
+
+    def acquire(self, resource: str) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        Acquire a slot for a resource.
+
+        Returns:
+            The limiter holding the slot, or None when limiting is disabled
+
+        Raises:
+            ConcurrencyLimitExceededError: If no slot frees up in time
+        """
+        if not self.enabled:
+            return None
+
+        limiter = self.get_limiter(resource)
+        if not limiter.acquire(self.acquire_timeout):
+            raise ConcurrencyLimitExceededError(
+                f"No concurrency slot for {resource} within {self.acquire_timeout}s "
+                f"(limit {limiter.limit})",
+                resource,
+                limiter.limit
+            )
+        return limiter
+
+    def get_limits(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current state of every limiter."""
+        with self._lock:
+            limiters = dict(self.limiters)
+        return {name: limiter.get_status() for name, limiter in limiters.items()}
+
+
+# Global concurrency limiter manager instance
+concurrency_limiter_manager = ConcurrencyLimiterManager()
@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import time
 import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -11,8 +10,10 @@ from enum import Enum
 from typing import Dict, List, Optional, Callable, Any, Union
 from uuid import uuid4
 
+from .clock import Clock, get_clock
 from .models import AgentResponse, Subtask, FinalResponse, RiskLevel
 from .interfaces import AIModel, ModelError
+from .metrics import metrics_registry
 
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,14 @@ class CircuitBreakerConfig:
     monitoring_window: float = 300.0  # 5 minutes
 
 
+@dataclass
+class RetryBudgetConfig:
+    """Configuration for the per-provider retry budget."""
+    retry_ratio: float = 0.1  # Retries allowed as a fraction of first attempts
+    min_retries: int = 10  # Retries always allowed per window, for low traffic
+    window_seconds: float = 10.0
+
+
 class FailureHandler(ABC):
     """Abstract base class for handling specific types of failures."""
     
@@ -114,28 +123,72 @@ class RecoveryAction:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_BREAKER_STATE_VALUES = {
+    CircuitBreakerState.CLOSED: 0,
+    CircuitBreakerState.HALF_OPEN: 1,
+    CircuitBreakerState.OPEN: 2,
+}
+_breaker_state = metrics_registry.gauge(
+    "ai_council_circuit_breaker_state",
+    "Circuit breaker state: 0 closed, 1 half open, 2 open", ("breaker",)
+)
+_breaker_transitions = metrics_registry.counter(
+    "ai_council_circuit_breaker_transitions_total",
+    "Circuit breaker state changes by new state", ("breaker", "state")
+)
+_breaker_rejections = metrics_registry.counter(
+    "ai_council_circuit_breaker_rejections_total",
+    "Calls rejected by an open circuit breaker", ("breaker",)
+)
+
+
 class CircuitBreaker:
     """Circuit breaker implementation for preventing cascade failures."""
     
-    def __init__(self, name: str, config: CircuitBreakerConfig):
+    def __init__(self, name: str, config: CircuitBreakerConfig, clock: Optional[Clock] = None):
         self.name = name
         self.config = config
+        self._clock = clock
+        self._state_gauge = _breaker_state.labels(name)
+        self._state: Optional[CircuitBreakerState] = None
         self.state = CircuitBreakerState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: Optional[datetime] = None
         self.failure_times: List[datetime] = []
+        self.shared_state = None
         self._lock = threading.Lock()
     
+    @property
+    def clock(self) -> Clock:
+        """Clock that the recovery timeout and monitoring window are measured in."""
+        return self._clock or get_clock()
+    
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Current state, published to the metrics registry on change."""
+        return self._state
+    
+    @state.setter
+    def state(self, state: CircuitBreakerState) -> None:
+        if state is self._state:
+            return
+        if self._state is not None:
+            _breaker_transitions.labels(self.name, state.value).inc()
+        self._state = state
+        self._state_gauge.set(_BREAKER_STATE_VALUES[state])
+    
+    def attach_shared_state(self, backend) -> None:
+        """Share this breaker's state with other processes through a backend."""
+        self.shared_state = backend
+    
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function through the circuit breaker."""
-        with self._lock:
-            if self.state == CircuitBreakerState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitBreakerState.HALF_OPEN
-                    logger.info(f"Circuit breaker {self.name} moved to HALF_OPEN")
-                else:
-                    raise CircuitBreakerOpenError(f"Circuit breaker {self.name} is OPEN")
+        if self.shared_state is not None:
+            self._check_shared_state()
+        else:
+            with self._lock:
+                self._check_state()
         
         try:
             result = func(*args, **kwargs)
@@ -145,46 +198,127 @@ class CircuitBreaker:
             self._on_failure()
             raise e
     
+    def _check_state(self):
+        """Reject the call if open, or move to HALF_OPEN once recovery time passed."""
+        if self.state == CircuitBreakerState.OPEN:
+            if self._should_attempt_reset():
+                self.state = CircuitBreakerState.HALF_OPEN
+                logger.info(f"Circuit breaker {self.name} moved to HALF_OPEN")
+            else:
+                _breaker_rejections.labels(self.name).inc()
+                raise CircuitBreakerOpenError(f"Circuit breaker {self.name} is OPEN")
+    
+    def _check_shared_state(self):
+        """Check the shared state, only taking the write lock when it may change."""
+        snapshot = self.shared_state.load_breaker(self.name)
+        with self._lock:
+            if snapshot:
+                self._restore(snapshot)
+            if self.state != CircuitBreakerState.OPEN:
+                return
+        self._shared_transition(self._check_state)
+    
+    def refresh(self):
+        """Pull the latest state published by other processes, if shared."""
+        if self.shared_state is None:
+            return
+        snapshot = self.shared_state.load_breaker(self.name)
+        if snapshot:
+            with self._lock:
+                self._restore(snapshot)
+    
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
         if not self.last_failure_time:
             return True
         
-        time_since_failure = datetime.utcnow() - self.last_failure_time
+        time_since_failure = self.clock.utcnow() - self.last_failure_time
         return time_since_failure.total_seconds() >= self.config.recovery_timeout
     
     def _on_success(self):
         """Handle successful execution."""
-        with self._lock:
-            if self.state == CircuitBreakerState.HALF_OPEN:
-                self.success_count += 1
-                if self.success_count >= self.config.success_threshold:
-                    self.state = CircuitBreakerState.CLOSED
-                    self.failure_count = 0
-                    self.success_count = 0
-                    self.failure_times.clear()
-                    logger.info(f"Circuit breaker {self.name} reset to CLOSED")
+        if self.shared_state is not None:
+            self._shared_transition(self._record_success)
+        else:
+            with self._lock:
+                self._record_success()
     
     def _on_failure(self):
         """Handle failed execution."""
-        with self._lock:
-            self.failure_count += 1
-            self.last_failure_time = datetime.utcnow()
-            self.failure_times.append(self.last_failure_time)
-            
-            # Clean old failure times outside monitoring window
-            cutoff_time = self.last_failure_time - timedelta(seconds=self.config.monitoring_window)
-            self.failure_times = [t for t in self.failure_times if t > cutoff_time]
-            
-            if (self.state == CircuitBreakerState.CLOSED and 
-                len(self.failure_times) >= self.config.failure_threshold):
-                self.state = CircuitBreakerState.OPEN
-                self.success_count = 0
-                logger.warning(f"Circuit breaker {self.name} opened due to {len(self.failure_times)} failures")
-            elif self.state == CircuitBreakerState.HALF_OPEN:
-                self.state = CircuitBreakerState.OPEN
+        if self.shared_state is not None:
+            self._shared_transition(self._record_failure)
+        else:
+            with self._lock:
+                self._record_failure()
+    
+    def _record_success(self):
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            self.success_count += 1
+            if self.success_count >= self.config.success_threshold:
+                self.state = CircuitBreakerState.CLOSED
+                self.failure_count = 0
                 self.success_count = 0
-                logger.warning(f"Circuit breaker {self.name} reopened after failure in HALF_OPEN state")
+                self.failure_times.clear()
+                logger.info(f"Circuit breaker {self.name} reset to CLOSED")
+    
+    def _record_failure(self):
+        self.failure_count += 1
+        self.last_failure_time = self.clock.utcnow()
+        self.failure_times.append(self.last_failure_time)
+        
+        # Clean old failure times outside monitoring window
+        cutoff_time = self.last_failure_time - timedelta(seconds=self.config.monitoring_window)
+        self.failure_times = [t for t in self.failure_times if t > cutoff_time]
+        
+        if (self.state == CircuitBreakerState.CLOSED and 
+            len(self.failure_times) >= self.config.failure_threshold):
+            self.state = CircuitBreakerState.OPEN
+            self.success_count = 0
+            logger.warning(f"Circuit breaker {self.name} opened due to {len(self.failure_times)} failures")
+        elif self.state == CircuitBreakerState.HALF_OPEN:
+            self.state = CircuitBreakerState.OPEN
+            self.success_count = 0
+            logger.warning(f"Circuit breaker {self.name} reopened after failure in HALF_OPEN state")
+    
+    def _shared_transition(self, transition: Callable[[], None]):
+        """Apply a state transition atomically against the shared snapshot."""
+        def mutate(snapshot: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            with self._lock:
+                if snapshot:
+                    self._restore(snapshot)
+                transition()
+                return self._snapshot()
+        
+        self.shared_state.update_breaker(self.name, mutate)
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Serialize the breaker state for the shared backend."""
+        return {
+            "state": self.state.value,
+            "failure_count": self.failure_count,
+            "success_count": self.success_count,
+            "last_failure_time": _to_epoch(self.last_failure_time),
+            "failure_times": [_to_epoch(t) for t in self.failure_times]
+        }
+    
+    def _restore(self, snapshot: Dict[str, Any]):
+        """Load breaker state from a shared backend snapshot."""
+        self.state = CircuitBreakerState(snapshot["state"])
+        self.failure_count = snapshot["failure_count"]
+        self.success_count = snapshot["success_count"]
+        self.last_failure_time = _from_epoch(snapshot["last_failure_time"])
+        self.failure_times = [_from_epoch(t) for t in snapshot["failure_times"]]
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch(value: Optional[datetime]) -> Optional[float]:
+    return (value - _EPOCH).total_seconds() if value is not None else None
+
+
+def _from_epoch(value: Optional[float]) -> Optional[datetime]:
+    return _EPOCH + timedelta(seconds=value) if value is not None else None
 
 
 class CircuitBreakerOpenError(Exception):
@@ -261,12 +395,12 @@ class RateLimitHandler(FailureHandler):
         # Extract rate limit reset time from error context if available
         reset_time = failure.context.get('reset_time')
         if reset_time:
-            delay = max(0, reset_time - time.time())
+            delay = max(0, reset_time - get_clock().time())
         else:
             # Default exponential backoff for rate limits
             delay = min(60.0, 5.0 * (2 ** failure.retry_count))
         
-        self.rate_limit_windows[model_id] = datetime.utcnow() + timedelta(seconds=delay)
+        self.rate_limit_windows[model_id] = get_clock().utcnow() + timedelta(seconds=delay)
         
         return RecoveryAction(
             action_type="rate_limit_backoff",
@@ -361,6 +495,84 @@ class SystemOverloadHandler(FailureHandler):
         )
 
 
+class RetryBudget:
+    """Caps retries at a fraction of first attempts, per provider.
+    
+    Attempts and retries are counted over a sliding window. A retry is allowed
+    while the retries in the window stay below ``min_retries`` plus
+    ``retry_ratio`` times the first attempts in the window, so a brownout
+    cannot multiply the load sent to a failing provider. The window is kept in
+    the clock's monotonic time, so wall clock adjustments don't reset it.
+    """
+    
+    def __init__(self, config: Optional[RetryBudgetConfig] = None, clock: Optional[Clock] = None):
+        self.config = config or RetryBudgetConfig()
+        self.attempts: Dict[str, List[float]] = {}
+        self.retries: Dict[str, List[float]] = {}
+        self.rejected_counts: Dict[str, int] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+    
+    @property
+    def clock(self) -> Clock:
+        """Clock that the sliding window is kept in."""
+        return self._clock or get_clock()
+    
+    def configure(self, config: RetryBudgetConfig):
+        """Replace the budget configuration."""
+        with self._lock:
+            self.config = config
+    
+    def record_attempt(self, key: str):
+        """Record a first attempt, which earns retry budget for the key."""
+        now = self.clock.monotonic()
+        with self._lock:
+            self.attempts.setdefault(key, []).append(now)
+            self._expire(key, now)
+    
+    def try_acquire_retry(self, key: str) -> bool:
+        """Spend budget for a retry if any is left.
+        
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        now = self.clock.monotonic()
+        with self._lock:
+            self._expire(key, now)
+            attempts = len(self.attempts.get(key, []))
+            retries = self.retries.setdefault(key, [])
+            
+            if len(retries) < self.config.min_retries + self.config.retry_ratio * attempts:
+                retries.append(now)
+                return True
+            
+            self.rejected_counts[key] = self.rejected_counts.get(key, 0) + 1
+            return False
+    
+    def _expire(self, key: str, now: float):
+        cutoff = now - self.config.window_seconds
+        for history in (self.attempts, self.retries):
+            timestamps = history.get(key)
+            if timestamps and timestamps[0] <= cutoff:
+                history[key] = [t for t in timestamps if t > cutoff]
+    
+    def get_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Get attempts, retries and rejected retries per key."""
+        now = self.clock.monotonic()
+        with self._lock:
+            keys = set(self.attempts) | set(self.retries) | set(self.rejected_counts)
+            for key in keys:
+                self._expire(key, now)
+            return {
+                key: {
+                    "attempts": len(self.attempts.get(key, [])),
+                    "retries": len(self.retries.get(key, [])),
+                    "rejected_retries": self.rejected_counts.get(key, 0)
+                }
+                for key in sorted(keys)
+            }
+
+
 class FailureIsolator:
     """Isolates failures to prevent cascade effects."""
     
@@ -370,7 +582,7 @@ class FailureIsolator:
     
     def isolate_component(self, component: str, reason: str):
         """Isolate a component temporarily."""
-        self.isolated_components[component] = datetime.utcnow()
+        self.isolated_components[component] = get_clock().utcnow()
         logger.warning(f"Isolated component {component}: {reason}")
     
     def is_isolated(self, component: str) -> bool:
@@ -379,7 +591,7 @@ class FailureIsolator:
             return False
         
         isolation_time = self.isolated_components[component]
-        if datetime.utcnow() - isolation_time > self.isolation_duration:
+        if get_clock().utcnow() - isolation_time > self.isolation_duration:
             del self.isolated_components[component]
             logger.info(f"Component {component} isolation expired")
             return False
@@ -402,6 +614,8 @@ class ResilienceManager:
         self.failure_isolator = FailureIsolator()
         self.failure_history: List[FailureEvent] = []
         self.max_history_size = 1000
+        self.shared_state = None
+        self.retry_budget = RetryBudget()
         
         # Initialize default handlers
         self._initialize_default_handlers()
@@ -437,9 +651,16 @@ class ResilienceManager:
     def create_circuit_breaker(self, name: str, config: CircuitBreakerConfig) -> CircuitBreaker:
         """Create and register a circuit breaker."""
         circuit_breaker = CircuitBreaker(name, config)
+        circuit_breaker.attach_shared_state(self.shared_state)
         self.circuit_breakers[name] = circuit_breaker
         return circuit_breaker
     
+    def attach_shared_state(self, backend) -> None:
+        """Share circuit breaker state with other processes through a backend."""
+        self.shared_state = backend
+        for circuit_breaker in self.circuit_breakers.values():
+            circuit_breaker.attach_shared_state(backend)
+    
     def get_circuit_breaker(self, name: str) -> Optional[CircuitBreaker]:
         """Get a circuit breaker by name."""
         return self.circuit_breakers.get(name)
@@ -461,6 +682,7 @@ class ResilienceManager:
             if handler.can_handle(failure):
                 try:
                     recovery_action = handler.handle(failure)
+                    recovery_action = self._apply_retry_budget(failure, recovery_action)
                     
                     # Update failure event with resolution
                     failure.resolution_strategy = recovery_action.action_type
@@ -482,6 +704,32 @@ class ResilienceManager:
             error_message=f"No handler available for {failure.failure_type.value}"
         )
     
+    def _apply_retry_budget(self, failure: FailureEvent, recovery_action: RecoveryAction) -> RecoveryAction:
+        """Veto a retry when the provider's retry budget is exhausted.
+        
+        Failures reported without a provider in their context, or on the
+        caller's final attempt, are not budgeted.
+        """
+        provider = failure.context.get("provider")
+        if not recovery_action.should_retry or not provider or failure.context.get("final_attempt"):
+            return recovery_action
+        
+        if self.retry_budget.try_acquire_retry(provider):
+            return recovery_action
+        
+        logger.warning(f"Retry budget exhausted for {provider}, not retrying")
+        return RecoveryAction(
+            action_type="retry_budget_exhausted",
+            should_retry=False,
+            fallback_model=recovery_action.fallback_model,
+            skip_subtask=recovery_action.skip_subtask,
+            error_message=f"Retry budget exhausted for {provider}",
+            metadata={
+                "provider": provider,
+                "rejected_action": recovery_action.action_type
+            }
+        )
+    
     def update_fallback_registry(self, fallback_registry: Dict[str, List[str]]):
         """Update fallback model registry for model unavailable handler."""
         for handler in self.handlers:
@@ -491,6 +739,10 @@ class ResilienceManager:
     
     def get_failure_statistics(self) -> Dict[str, Any]:
         """Get statistics about recent failures."""
+        if self.shared_state is not None:
+            for circuit_breaker in self.circuit_breakers.values():
+                circuit_breaker.refresh()
+        
         if not self.failure_history:
             return {
                 "total_failures": 0,
@@ -501,7 +753,8 @@ class ResilienceManager:
                     name: cb.state.value 
                     for name, cb in self.circuit_breakers.items()
                 },
-                "isolated_components": list(self.failure_isolator.isolated_components.keys())
+                "isolated_components": list(self.failure_isolator.isolated_components.keys()),
+                "retry_budget": self.retry_budget.get_statistics()
             }
         
         # Count failures by type
@@ -537,7 +790,8 @@ class ResilienceManager:
             "failure_counts": failure_counts,
             "resolution_rate": resolution_rate,
             "circuit_breaker_states": circuit_breaker_states,
-            "isolated_components": list(self.failure_isolator.isolated_components.keys())
+            "isolated_components": list(self.failure_isolator.isolated_components.keys()),
+            "retry_budget": self.retry_budget.get_statistics()
         }
     
     def health_check(self) -> Dict[str, Any]:
@@ -549,6 +803,10 @@ class ResilienceManager:
         }
         
         # Check circuit breaker states
+        if self.shared_state is not None:
+            for circuit_breaker in self.circuit_breakers.values():
+                circuit_breaker.refresh()
+        
         open_breakers = []
         for name, cb in self.circuit_breakers.items():
             if cb.state == CircuitBreakerState.OPEN:
@@ -1,10 +1,11 @@
 """Abstract base classes and interfaces for AI Council system components."""
 
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union
 
 from .models import (
-    Task, Subtask, AgentResponse, FinalResponse, SelfAssessment,
+    Task, Subtask, AgentResponse, FinalResponse, SelfAssessment, SynthesisSection,
     TaskIntent, ComplexityLevel, TaskType, ExecutionMode,
     ModelCapabilities, CostProfile, PerformanceMetrics
 )
@@ -238,10 +239,18 @@ class ExecutionAgent(ABC):
 class Conflict:
     """Represents a conflict between multiple agent responses."""
     
-    def __init__(self, response_ids: List[str], conflict_type: str, description: str):
+    def __init__(
+        self,
+        response_ids: List[str],
+        conflict_type: str,
+        description: str,
+        candidates: Optional[Dict[str, Any]] = None
+    ):
         self.response_ids = response_ids
         self.conflict_type = conflict_type
         self.description = description
+        # Precomputed features of the conflicting responses, keyed by response ID
+        self.candidates = candidates or {}
 
 
 class Resolution:
@@ -299,6 +308,57 @@ class ArbitrationLayer(ABC):
             Resolution: The resolution decision
         """
         pass
+    
+    def arbitrate_groups(self, responses: List[AgentResponse]) -> Iterator[ArbitrationResult]:
+        """Arbitrate responses, yielding results for independent groups as they complete.
+        
+        The default implementation arbitrates all responses as one group.
+        
+        Args:
+            responses: List of agent responses to arbitrate
+            
+        Yields:
+            ArbitrationResult objects whose union covers all responses
+        """
+        yield self.arbitrate(responses)
+    
+    def score_response(self, response: AgentResponse) -> float:
+        """Score the quality of a single response between 0.0 and 1.0.
+        
+        Args:
+            response: The agent response to score
+            
+        Returns:
+            float: Quality score, defaulting to the self-assessed confidence
+        """
+        if not response.success or not response.self_assessment:
+            return 0.0
+        return response.self_assessment.confidence_score
+    
+    def response_similarity(self, first: AgentResponse, second: AgentResponse) -> float:
+        """Measure how closely two responses agree, between 0.0 and 1.0.
+        
+        Args:
+            first: The first agent response
+            second: The second agent response
+            
+        Returns:
+            float: Similarity score, defaulting to the Jaccard index of the
+                responses' word sets
+        """
+        if not first.success or not second.success:
+            return 0.0
+        first_words = set(re.findall(r"\w+", first.content.lower()))
+        second_words = set(re.findall(r"\w+", second.content.lower()))
+        if not first_words and not second_words:
+            return 1.0
+        return len(first_words & second_words) / len(first_words | second_words)
+    
+    def shutdown(self) -> None:
+        """Release worker pools or other resources held by the layer.
+        
+        The default implementation holds none.
+        """
 
 
 class ExecutionMetadata:
@@ -311,6 +371,8 @@ class ExecutionMetadata:
         self.synthesis_notes: List[str] = []
         self.total_execution_time: float = 0.0
         self.parallel_executions: int = 0
+        self.escalation_paths: List[str] = []
+        self.spans: List[Dict[str, Any]] = []
 
 
 class SynthesisLayer(ABC):
@@ -352,6 +414,57 @@ class SynthesisLayer(ABC):
             FinalResponse: Response with attached metadata
         """
         pass
+    
+    def create_incremental_synthesizer(
+        self, sequential_order: List[str]
+    ) -> Optional["IncrementalSynthesizer"]:
+        """Create a synthesizer that emits sections as subtask results arrive.
+        
+        Args:
+            sequential_order: Subtask IDs in the order sections should appear
+            
+        Returns:
+            Optional[IncrementalSynthesizer]: The synthesizer, or None if this
+                layer only supports whole-response synthesis
+        """
+        return None
+
+
+class IncrementalSynthesizer(ABC):
+    """Abstract base class for section-by-section synthesis of a response."""
+    
+    @abstractmethod
+    def add(self, response: AgentResponse) -> List[SynthesisSection]:
+        """Add the validated response for a subtask.
+        
+        Args:
+            response: The validated response for one subtask
+            
+        Returns:
+            List[SynthesisSection]: Sections finalized by this response, in order
+        """
+        pass
+    
+    @abstractmethod
+    def skip(self, subtask_id: str) -> List[SynthesisSection]:
+        """Mark a subtask as producing no section, e.g. because it failed.
+        
+        Args:
+            subtask_id: ID of the subtask to skip
+            
+        Returns:
+            List[SynthesisSection]: Sections unblocked by skipping the subtask
+        """
+        pass
+    
+    @abstractmethod
+    def finish(self) -> FinalResponse:
+        """Flush any remaining sections and build the final response.
+        
+        Returns:
+            FinalResponse: The complete response made of all emitted sections
+        """
+        pass
 
 
 # Additional supporting interfaces
@@ -448,6 +561,45 @@ class OrchestrationLayer(ABC):
         """
         pass
     
+    def process_request_stream(
+        self, user_input: str, execution_mode: ExecutionMode
+    ) -> Iterator[Union[SynthesisSection, FinalResponse]]:
+        """Process a user request, yielding response sections as they are finalized.
+        
+        The last item yielded is always the complete FinalResponse. The default
+        implementation yields only that.
+        
+        Args:
+            user_input: Raw user input
+            execution_mode: The execution mode to use
+            
+        Yields:
+            SynthesisSection objects, then the FinalResponse
+        """
+        yield self.process_request(user_input, execution_mode)
+    
+    def process_batch(
+        self,
+        inputs: Iterable[str],
+        execution_mode: ExecutionMode,
+        concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[int, FinalResponse]]:
+        """Process many user requests, yielding each result as it finishes.
+        
+        Results may arrive in any order and are tagged with the index of their
+        input. The default implementation processes inputs one at a time.
+        
+        Args:
+            inputs: Raw user inputs
+            execution_mode: The execution mode to use for every input
+            concurrency: Optional limit on requests in progress at once
+            
+        Yields:
+            Tuples of (input index, FinalResponse)
+        """
+        for index, user_input in enumerate(inputs):
+            yield index, self.process_request(user_input, execution_mode)
+    
     @abstractmethod
     def estimate_cost_and_time(self, task: Task) -> CostEstimate:
         """Estimate the cost and time for executing a task.
@@ -470,4 +622,10 @@ class OrchestrationLayer(ABC):
         Returns:
             FallbackStrategy: The recommended fallback strategy
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def shutdown(self) -> None:
+        """Release resources held by the layer and its components.
+        
+        The default implementation holds none.
+        """
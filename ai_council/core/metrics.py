@@ -0,0 +1,391 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Components record counters, gauges and histograms as they work: the
+orchestration layer times requests and stages, the execution agent times model
+calls and counts tokens and cost, the caches count hits and misses, and the
+resilience components report rate limiting and circuit breaker state. The web
+backend renders the registry at ``/metrics``.
+
+Recording is cheap enough for the hot path. Counters and histograms write to a
+per-thread cell without locking; cells are only summed, under a lock, when the
+registry is rendered. Cells of finished threads are folded into a retired
+total so short-lived worker threads don't accumulate.
+"""
+
+import math
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+class _CellOwner:
+    """Lives in a thread's local storage; its finalizer retires the thread's cell."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ShardedValues:
+    """Fixed-size vector of sums, written through per-thread cells."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells: List[List[float]] = []
+        self._retired = [0.0] * size
+
+    def cell(self) -> List[float]:
+        """The calling thread's cell; only this thread writes to it."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            return self._new_cell()
+
+    def _new_cell(self) -> List[float]:
+        cell = [0.0] * self._size
+        owner = _CellOwner()
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        self._local.owner = owner
+        weakref.finalize(owner, self._retire, cell)
+        return cell
+
+    def _retire(self, cell: List[float]) -> None:
+        with self._lock:
+            for index, value in enumerate(cell):
+                self._retired[index] += value
+            self._cells = [other for other in self._cells if other is not cell]
+
+    def totals(self) -> List[float]:
+        """Sum of every thread's cell."""
+        with self._lock:
+            totals = list(self._retired)
+            for cell in self._cells:
+                for index, value in enumerate(cell):
+                    totals[index] += value
+        return totals
+
+
+class CounterChild:
+    """A monotonically increasing value for one label set."""
+
+    def __init__(self):
+        self._values = _ShardedValues(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._values.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Current total."""
+        return self._values.totals()[0]
+
+    def _samples(self, name: str) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        return [(name, (), self.value)]
+
+
+class GaugeChild:
+    """A value that can go up and down for one label set."""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge's value with function whenever it is read."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+    def _samples(self, name: str) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        return [(name, (), self.value)]
+
+
+class HistogramChild:
+    """Observations counted into cumulative buckets for one label set."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._bounds = buckets
+        # One slot per bucket, one for +Inf, then the running sum
+        self._values = _ShardedValues(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        cell = self._values.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the enclosed block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return int(sum(self._values.totals()[:-1]))
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observed values."""
+        return self._values.totals()[-1]
+
+    def _samples(self, name: str) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        totals = self._values.totals()
+        samples = []
+        cumulative = 0.0
+        for bound, count in zip(self._bounds + (math.inf,), totals[:-1]):
+            cumulative += count
+            samples.append((name + "_bucket", (("le", _format_value(bound)),), cumulative))
+        samples.append((name + "_sum", (), totals[-1]))
+        samples.append((name + "_count", (), cumulative))
+        return samples
+
+
+class Metric:
+    """A named metric family whose children are selected by label values."""
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        child_factory: Callable[[], Any]
+    ):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._child_factory = child_factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = child_factory()
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """
+        Get the child for a label set, creating it on first use.
+
+        Callers on hot paths should keep the returned child.
+
+        Raises:
+            ValueError: If the labels don't match the metric's label names
+        """
+        if labels:
+            if values or set(labels) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            values = tuple(labels[name] for name in self.labelnames)
+        elif len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._child_factory())
+        return child
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Unlabelled metrics forward inc/set/observe/... to their only child
+        if attribute.startswith("_") or self.labelnames:
+            raise AttributeError(attribute)
+        return getattr(self._children[()], attribute)
+
+    def children(self) -> Dict[Tuple[str, ...], Any]:
+        """Snapshot of the children by label values."""
+        with self._lock:
+            return dict(self._children)
+
+    def render(self) -> List[str]:
+        """Render the family in text exposition format."""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for values, child in sorted(self.children().items()):
+            base_labels = tuple(zip(self.labelnames, values))
+            for sample_name, extra_labels, value in child._samples(self.name):
+                labels = base_labels + extra_labels
+                if labels:
+                    rendered = ",".join(f'{key}="{_escape_label(label)}"' for key, label in labels)
+                    lines.append(f"{sample_name}{{{rendered}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{sample_name} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families by name and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        """Get or create a counter family."""
+        return self._register("counter", name, documentation, labelnames, CounterChild)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Metric:
+        """Get or create a gauge family."""
+        return self._register("gauge", name, documentation, labelnames, GaugeChild)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Metric:
+        """Get or create a histogram family.
+
+        Raises:
+            ValueError: If the buckets are empty or not increasing
+        """
+        bounds = tuple(float(bound) for bound in buckets if bound != math.inf)
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("Histogram buckets must be non-empty and increasing")
+        if "le" in labelnames:
+            raise ValueError("Histograms cannot use the label name 'le'")
+        return self._register("histogram", name, documentation, labelnames, lambda: HistogramChild(bounds))
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered family by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every family in Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(
+        self,
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        child_factory: Callable[[], Any]
+    ) -> Metric:
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        for label in labelnames:
+            if not _LABEL_PATTERN.match(label) or label.startswith("__"):
+                raise ValueError(f"Invalid label name for {name}: {label}")
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if existing.kind != kind or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} is already registered differently")
+                return existing
+            metric = Metric(kind, name, documentation, labelnames, child_factory)
+            self._metrics[name] = metric
+            return metric
+
+
+class CacheMetrics:
+    """Hit and miss counters for one named cache, with a derived hit ratio."""
+
+    def __init__(self, cache: str, registry: Optional[MetricsRegistry] = None):
+        """
+        Initialize the cache's metrics.
+
+        Args:
+            cache: Value of the ``cache`` label
+            registry: Registry to record in (defaults to the global one)
+        """
+        registry = registry or metrics_registry
+        lookups = registry.counter(
+            "ai_council_cache_requests_total", "Cache lookups by result", ("cache", "result")
+        )
+        self._hits = lookups.labels(cache, "hit")
+        self._misses = lookups.labels(cache, "miss")
+        registry.gauge(
+            "ai_council_cache_hit_ratio", "Fraction of cache lookups that hit", ("cache",)
+        ).labels(cache).set_function(self.hit_ratio)
+
+    def hit(self) -> None:
+        """Record a lookup that found an entry."""
+        self._hits.inc()
+
+    def miss(self) -> None:
+        """Record a lookup that found nothing."""
+        self._misses.inc()
+
+    def hit_ratio(self) -> float:
+        """Fraction of all lookups so far that hit."""
+        hits = self._hits.value
+        total = hits + self._misses.value
+        return hits / total if total else 0.0
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Global metrics registry
+metrics_registry = MetricsRegistry()
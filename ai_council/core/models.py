@@ -1,11 +1,34 @@
 """Core data models and enumerations for AI Council."""
 
+import copy
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from uuid import uuid4
 
+from .text_view import TextView
+
+
+def replace_unvalidated(instance: Any, **changes: Any) -> Any:
+    """Return a shallow copy of a model with some fields replaced, skipping validation.
+    
+    ``dataclasses.replace`` re-runs ``__post_init__`` and every default factory.
+    Internal code copying an instance that was already validated can use this
+    instead, as long as the new values are known to be valid.
+    
+    Args:
+        instance: The dataclass instance to copy
+        **changes: Field values to replace
+        
+    Returns:
+        The copied instance
+    """
+    clone = copy.copy(instance)
+    for name, value in changes.items():
+        setattr(clone, name, value)
+    return clone
+
 
 class TaskType(Enum):
     """Types of tasks that can be processed by the system."""
@@ -24,6 +47,7 @@ class ExecutionMode(Enum):
     FAST = "fast"
     BALANCED = "balanced"
     BEST_QUALITY = "best_quality"
+    CASCADE = "cascade"
 
 
 class RiskLevel(Enum):
@@ -140,6 +164,12 @@ class AgentResponse:
 
     def __post_init__(self) -> None:
         """Validate agent response data after initialization."""
+        # Plain attribute rather than a field, so the model's fields stay unchanged
+        self._text_view: Optional[TextView] = None
+        self._validate()
+
+    def _validate(self) -> None:
+        """Check the response fields; shared with ``CompactAgentResponse``."""
         if not self.subtask_id:
             raise ValueError("Subtask ID cannot be empty")
         if not self.model_used:
@@ -149,6 +179,30 @@ class AgentResponse:
         if not self.success and not self.error_message:
             raise ValueError("Failed response must have error message")
 
+    @property
+    def text_view(self) -> TextView:
+        """Cached analysis view of the content, rebuilt if the content is replaced."""
+        view = getattr(self, "_text_view", None)  # Absent on instances built without __init__
+        if view is None or view.text is not self.content:
+            view = self._text_view = TextView(self.content)
+        return view
+
+    @text_view.setter
+    def text_view(self, view: TextView) -> None:
+        if view.text != self.content:
+            raise ValueError("Text view does not match response content")
+        view.text = self.content
+        self._text_view = view
+
+
+@dataclass
+class SynthesisSection:
+    """A finalized section of a response emitted during streaming synthesis."""
+    index: int = 0
+    subtask_id: str = ""
+    content: str = ""
+    model_used: str = ""
+
 
 @dataclass
 class CostBreakdown:
@@ -176,6 +230,8 @@ class ExecutionMetadata:
     synthesis_notes: List[str] = field(default_factory=list)
     total_execution_time: float = 0.0
     parallel_executions: int = 0
+    escalation_paths: List[str] = field(default_factory=list)
+    spans: List[Dict[str, Any]] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         """Validate execution metadata after initialization."""
@@ -0,0 +1,408 @@
+"""Opt-in CPU profiling of requests through the processing pipeline.
+
+The orchestration layer wraps each request in :meth:`RequestProfiler.profile`.
+When profiling is enabled, one request in ``sample_rate`` is profiled, as is
+any request run through :meth:`RequestProfiler.forced` (the web backend does
+this for requests carrying the ``X-AI-Council-Profile`` header, if allowed).
+Everything else pays for a single counter increment.
+
+Two modes are available:
+
+- ``sample``: a shared background thread reads the request thread's stack
+  every ``interval`` seconds. The overhead is low and independent of how
+  many calls the request makes, so it is safe to leave on in production.
+- ``cprofile``: :mod:`cProfile` instruments every call on the request thread.
+  It is exact but slows the request down, so keep it to 1-in-N requests.
+  The raw ``.prof`` file is kept next to the profile for ``pstats``.
+
+Only the thread that runs the request is profiled. That thread does the
+analysis, decomposition, arbitration and synthesis work; subtask workers
+mostly wait on model calls.
+
+Each profile is written to the profile directory as JSON holding the request
+(trace) ID, CPU and wall time, the request's span timings and its stacks in
+collapsed form (``frame;frame;frame`` -> microseconds), which
+:func:`aggregate_profiles` merges into input for flamegraph tools.
+"""
+
+import contextvars
+import cProfile
+import itertools
+import json
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROFILE_DIRNAME = "profiles"
+PROFILE_HEADER = "X-AI-Council-Profile"
+PROFILE_VERSION = 1
+PROFILE_MODES = ("sample", "cprofile")
+
+# Deepest call chain followed when turning a cProfile call graph into stacks
+_MAX_CALL_DEPTH = 64
+
+# Set while a request runs through RequestProfiler.forced
+_forced = contextvars.ContextVar("ai_council_profile_forced", default=False)
+
+
+def _code_label(filename: str, lineno: int, name: str) -> str:
+    """Frame label for collapsed stacks: function (module path:first line)."""
+    if filename in ("~", "") or filename.startswith("<"):
+        return name.replace(";", ":")
+    path = filename.replace("\\", "/")
+    package = path.rfind("/ai_council/")
+    short = path[package + 1:] if package >= 0 else path.rsplit("/", 1)[-1]
+    return f"{name} ({short}:{lineno})".replace(";", ":")
+
+
+class RequestProfile:
+    """The profile of one request, filled in while it runs."""
+
+    def __init__(self, mode: str, interval: float):
+        self.mode = mode
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.cpu_time = 0.0
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.request_id: Optional[str] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.path: Optional[Path] = None
+        self._labels: Dict[CodeType, str] = {}
+        self._perf_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def add_sample(self, frame: FrameType) -> None:
+        """Count one sample of the request thread's stack (called by the sampler)."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = _code_label(code.co_filename, code.co_firstlineno, code.co_name)
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        self.stacks[";".join(labels)] += 1
+        self.samples += 1
+
+    def finish(self) -> None:
+        """Fix the wall and CPU time; sample counts become microseconds."""
+        self.duration = time.perf_counter() - self._perf_start
+        self.cpu_time = time.thread_time() - self._cpu_start
+        if self.mode == "sample":
+            weight = self.interval * 1e6
+            self.stacks = Counter({stack: round(count * weight) for stack, count in self.stacks.items()})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Profile as plain JSON-compatible values."""
+        return {
+            "version": PROFILE_VERSION,
+            "request_id": self.request_id,
+            "mode": self.mode,
+            "interval": self.interval if self.mode == "sample" else None,
+            "samples": self.samples if self.mode == "sample" else None,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "cpu_time": self.cpu_time,
+            "spans": self.spans,
+            "stacks": dict(self.stacks),
+        }
+
+
+def collapse_pstats(stats: pstats.Stats) -> Counter:
+    """
+    Turn a cProfile call graph into collapsed stacks weighted in microseconds.
+
+    cProfile only records caller-callee pairs, so each function's self time is
+    split over the paths leading to it in proportion to the time spent on
+    each caller edge, as flamegraph converters for cProfile do.
+
+    Args:
+        stats: Loaded profile statistics
+
+    Returns:
+        Counter: Collapsed stack -> microseconds of self time
+    """
+    entries = stats.stats  # func -> (primitive calls, calls, self time, cumulative time, callers)
+    callees: Dict[Tuple, Dict[Tuple, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+    stacks: Counter = Counter()
+
+    def walk(func: Tuple, path: List[str], on_path: set, weight: float) -> None:
+        cumulative = entries[func][3]
+        # Paths under a microsecond are dropped, which also bounds the walk
+        if cumulative <= 0 or weight < 1e-6:
+            return
+        ratio = min(1.0, weight / cumulative)
+        path = path + [_code_label(*func)]
+        self_time = round(entries[func][2] * ratio * 1e6)
+        if self_time > 0:
+            stacks[";".join(path)] += self_time
+        if len(path) >= _MAX_CALL_DEPTH:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee not in on_path and callee in entries:
+                walk(callee, path, on_path | {callee}, edge_time * ratio)
+
+    for func, (_, _, _, cumulative, callers) in entries.items():
+        if not callers:
+            walk(func, [], {func}, cumulative)
+    return stacks
+
+
+class RequestProfiler:
+    """Decides which requests to profile, profiles them and writes the results."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        mode: str = "sample",
+        sample_rate: int = 100,
+        interval: float = 0.005,
+        directory: Optional[Union[str, Path]] = None,
+        allow_forced: bool = False
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Whether one request in sample_rate is profiled
+            mode: "sample" or "cprofile"
+            sample_rate: Profile one request in this many (0 profiles forced requests only)
+            interval: Seconds between stack samples in sample mode
+            directory: Where profiles are written, or None to keep them in memory only
+            allow_forced: Whether :meth:`forced` requests are profiled
+
+        Raises:
+            ValueError: If the mode, sample rate or interval is invalid
+        """
+        self._lock = threading.Lock()
+        self._active: Dict[int, RequestProfile] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._requests = itertools.count(1)
+        self.profiles_written = 0
+        self.configure(enabled, mode, sample_rate, interval, directory, allow_forced)
+
+    def configure(
+        self,
+        enabled: bool = False,
+        mode: str = "sample",
+        sample_rate: int = 100,
+        interval: float = 0.005,
+        directory: Optional[Union[str, Path]] = None,
+        allow_forced: bool = False
+    ) -> None:
+        """
+        Replace the profiler's settings; see :meth:`__init__` for the arguments.
+
+        Raises:
+            ValueError: If the mode, sample rate or interval is invalid
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Profiling mode must be one of: {', '.join(PROFILE_MODES)}")
+        if sample_rate < 0:
+            raise ValueError("sample_rate cannot be negative")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.enabled = enabled
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.directory = Path(directory) if directory else None
+        self.allow_forced = allow_forced
+
+    def forced(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap fn so that requests it processes are profiled regardless of sampling.
+
+        The flag is a context variable set in the thread that runs the
+        wrapper, so wrap the call that is handed to a worker pool.
+
+        Returns:
+            The wrapped function, or fn itself if forcing is not allowed
+        """
+        if not self.allow_forced:
+            return fn
+
+        def run_forced(*args: Any, **kwargs: Any) -> Any:
+            token = _forced.set(True)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _forced.reset(token)
+
+        return run_forced
+
+    def should_profile(self) -> bool:
+        """Whether the request starting now is to be profiled."""
+        if self.allow_forced and _forced.get():
+            return True
+        if not self.enabled or self.sample_rate == 0:
+            return False
+        return next(self._requests) % self.sample_rate == 0
+
+    @contextmanager
+    def profile(self, spans: Optional[List[Dict[str, Any]]] = None) -> Iterator[Optional[RequestProfile]]:
+        """
+        Profile the enclosed block on the calling thread if this request is chosen.
+
+        Args:
+            spans: List the request's spans end up in (typically
+                ``ExecutionMetadata.spans``); read when the block exits
+
+        Yields:
+            The profile, or None if the request is not profiled
+        """
+        if not self.should_profile():
+            yield None
+            return
+        profile = RequestProfile(self.mode, self.interval)
+        profiler = cProfile.Profile() if self.mode == "cprofile" else None
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Newer Pythons allow one cProfile at a time per process
+                logger.debug(f"Skipping request profile: {str(e)}")
+                yield None
+                return
+        else:
+            self._start_sampling(profile)
+        try:
+            yield profile
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            else:
+                self._stop_sampling(profile)
+            profile.finish()
+            self._complete(profile, spans, profiler)
+
+    def _complete(
+        self,
+        profile: RequestProfile,
+        spans: Optional[List[Dict[str, Any]]],
+        profiler: Optional[cProfile.Profile]
+    ) -> None:
+        try:
+            if profiler is not None:
+                profiler.create_stats()
+                profile.stacks = collapse_pstats(pstats.Stats(profiler))
+            profile.spans = list(spans or [])
+            profile.request_id = next(
+                (span.get("trace_id") for span in profile.spans if span.get("trace_id")), None
+            ) or uuid4().hex
+            if self.directory is None:
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.fromtimestamp(profile.started_at, timezone.utc).strftime("%Y%m%dT%H%M%S")
+            profile.path = self.directory / f"{stamp}-{profile.request_id}.json"
+            if profiler is not None:
+                profiler.dump_stats(str(profile.path.with_suffix(".prof")))
+            with open(profile.path, "w", encoding="utf-8") as f:
+                json.dump(profile.to_dict(), f)
+            self.profiles_written += 1
+            logger.info(f"Wrote {profile.mode} profile of request {profile.request_id} to {profile.path}")
+        except Exception as e:
+            # A failed profile must never fail the request
+            logger.warning(f"Failed to write request profile: {str(e)}")
+
+    def _start_sampling(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active[profile.thread_id] = profile
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample_loop, name="request-profiler", daemon=True
+                )
+                self._sampler.start()
+
+    def _stop_sampling(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.pop(profile.thread_id, None)
+
+    def _sample_loop(self) -> None:
+        """Sample every profiled request thread until none is left."""
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                active = list(self._active.values())
+                interval = min(profile.interval for profile in active)
+            frames = sys._current_frames()
+            for profile in active:
+                frame = frames.get(profile.thread_id)
+                if frame is not None:
+                    profile.add_sample(frame)
+            del frames
+            time.sleep(interval)
+
+
+def load_profiles(paths: Iterable[Union[str, Path]]) -> Iterator[Dict[str, Any]]:
+    """Yield the profiles in the given files and directories, skipping unreadable files."""
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                with open(file, "r", encoding="utf-8") as f:
+                    profile = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping profile {file}: {str(e)}")
+                continue
+            if isinstance(profile, dict) and isinstance(profile.get("stacks"), dict):
+                yield profile
+
+
+def aggregate_profiles(
+    profiles: Iterable[Dict[str, Any]],
+    since: Optional[float] = None,
+    frame: Optional[str] = None
+) -> Counter:
+    """
+    Merge the stacks of several profiles.
+
+    Args:
+        profiles: Profiles as loaded by :func:`load_profiles`
+        since: Only include profiles started at or after this epoch time
+        frame: Only include stacks passing through a frame whose label
+            contains this text (e.g. ``_synthesize_with_protection``)
+
+    Returns:
+        Counter: Collapsed stack -> total microseconds
+    """
+    totals: Counter = Counter()
+    for profile in profiles:
+        if since is not None and profile.get("started_at", 0) < since:
+            continue
+        for stack, weight in profile["stacks"].items():
+            if frame is None or frame in stack:
+                totals[stack] += weight
+    return totals
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Collapsed stacks, heaviest first, one ``stack weight`` line each."""
+    return "".join(f"{stack} {weight}\n" for stack, weight in stacks.most_common() if weight > 0)
+
+
+# Global profiler instance
+request_profiler = RequestProfiler()
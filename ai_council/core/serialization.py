@@ -0,0 +1,531 @@
+"""Versioned serialization for pipeline objects.
+
+Tasks, subtasks, agent responses and final responses are persisted for
+caching and checkpointing and shipped between processes. This module encodes
+them in two forms, both driven by a per-model schema (the ordered fields of
+each model and their types):
+
+* a compact, self-describing binary form in the spirit of msgpack. Fields are
+  written positionally, so adding fields at the end of a schema stays
+  compatible in both directions. The header records where the top-level
+  object's ``content`` string lies, so ``peek_content`` can return it as a
+  ``memoryview`` without decoding or copying anything;
+* a JSON form with enums as their values and datetimes as ISO 8601 strings.
+
+Both skip ``dataclasses.asdict``, which deep-copies every value before
+``json.dumps`` sees it, and decoded objects are built without re-running
+``__post_init__`` unless ``validate=True``.
+"""
+
+import dataclasses
+import json
+import struct
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from . import interfaces
+from .models import (
+    AgentResponse, ComplexityLevel, CostBreakdown, ExecutionMetadata, ExecutionMode,
+    FinalResponse, Priority, RiskLevel, SelfAssessment, Subtask, Task, TaskIntent, TaskType
+)
+
+
+CODEC_VERSION = 1
+
+_MAGIC = b"AIC"
+_HEADER = struct.Struct("<3sBII")  # magic, version, content offset, content length
+_UINT8 = struct.Struct("<B")
+_UINT32 = struct.Struct("<I")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_OBJECT = struct.Struct("<BB")  # type id, field count
+
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _LIST, _DICT, _ENUM, _DATETIME, _OBJ = range(11)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class SerializationError(ValueError):
+    """Raised when a value can't be encoded or data can't be decoded."""
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelSchema:
+    """Ordered, typed fields of a serializable model."""
+    type_id: int
+    name: str
+    cls: type
+    fields: Tuple[Tuple[str, Any], ...]  # (name, type); None means any JSON-like value
+    defaults: Dict[str, Callable[[], Any]]
+
+
+def _schema(type_id: int, cls: type, fields: Tuple[Tuple[str, Any], ...]) -> ModelSchema:
+    defaults: Dict[str, Callable[[], Any]] = {}
+    for model_field in dataclasses.fields(cls):
+        if model_field.default_factory is not dataclasses.MISSING:
+            defaults[model_field.name] = model_field.default_factory
+        else:
+            defaults[model_field.name] = (lambda value: lambda: value)(model_field.default)
+    return ModelSchema(type_id, cls.__name__, cls, fields, defaults)
+
+
+# Fields may only be appended, and type IDs never reused, so that data written
+# by other versions stays readable
+_SCHEMAS: Tuple[ModelSchema, ...] = (
+    _schema(1, Task, (
+        ("id", None), ("content", None), ("intent", TaskIntent), ("complexity", ComplexityLevel),
+        ("execution_mode", ExecutionMode), ("created_at", datetime), ("metadata", None)
+    )),
+    _schema(2, Subtask, (
+        ("id", None), ("parent_task_id", None), ("content", None), ("task_type", TaskType),
+        ("priority", Priority), ("risk_level", RiskLevel), ("accuracy_requirement", None),
+        ("estimated_cost", None), ("created_at", datetime), ("metadata", None)
+    )),
+    _schema(3, SelfAssessment, (
+        ("confidence_score", None), ("assumptions", None), ("risk_level", RiskLevel),
+        ("estimated_cost", None), ("token_usage", None), ("execution_time", None),
+        ("model_used", None), ("timestamp", datetime)
+    )),
+    _schema(4, AgentResponse, (
+        ("subtask_id", None), ("model_used", None), ("content", None),
+        ("self_assessment", SelfAssessment), ("timestamp", datetime), ("success", None),
+        ("error_message", None), ("metadata", None)
+    )),
+    _schema(5, CostBreakdown, (
+        ("total_cost", None), ("model_costs", None), ("token_usage", None),
+        ("execution_time", None), ("currency", None)
+    )),
+    _schema(6, ExecutionMetadata, (
+        ("models_used", None), ("execution_path", None), ("arbitration_decisions", None),
+        ("synthesis_notes", None), ("total_execution_time", None), ("parallel_executions", None),
+        ("escalation_paths", None), ("spans", None)
+    )),
+    _schema(7, FinalResponse, (
+        ("content", None), ("overall_confidence", None), ("execution_metadata", ExecutionMetadata),
+        ("cost_breakdown", CostBreakdown), ("models_used", None), ("timestamp", datetime),
+        ("success", None), ("error_message", None), ("error_type", None)
+    )),
+)
+
+_SCHEMAS_BY_CLASS: Dict[type, ModelSchema] = {schema.cls: schema for schema in _SCHEMAS}
+# The orchestration layer's metadata class has the same fields; it decodes as
+# the dataclass
+_SCHEMAS_BY_CLASS[interfaces.ExecutionMetadata] = _SCHEMAS_BY_CLASS[ExecutionMetadata]
+_SCHEMAS_BY_ID: Dict[int, ModelSchema] = {schema.type_id: schema for schema in _SCHEMAS}
+_SCHEMAS_BY_NAME: Dict[str, ModelSchema] = {schema.name: schema for schema in _SCHEMAS}
+
+_ENUMS: Tuple[Type[Enum], ...] = (
+    TaskType, ExecutionMode, RiskLevel, Priority, ComplexityLevel, TaskIntent
+)
+_ENUM_IDS: Dict[type, int] = {enum: enum_id for enum_id, enum in enumerate(_ENUMS)}
+
+
+def _datetime_to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = (value - value.utcoffset()).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _micros_to_datetime(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _build(schema: ModelSchema, values: Dict[str, Any], validate: bool):
+    instance = schema.cls.__new__(schema.cls)
+    state = instance.__dict__
+    for name, default in schema.defaults.items():
+        state[name] = values[name] if name in values else default()
+    if validate and hasattr(instance, "__post_init__"):
+        try:
+            instance.__post_init__()
+        except ValueError as e:
+            raise SerializationError(f"Invalid {schema.name}: {e}") from e
+    return instance
+
+
+# =============================================================================
+# Binary form
+# =============================================================================
+
+class _Encoder:
+    """Appends tagged values to a buffer."""
+
+    __slots__ = ("buffer", "content_span")
+
+    def __init__(self):
+        self.buffer = bytearray(_HEADER.size)
+        self.content_span = (0, 0)
+
+    def value(self, value: Any) -> None:
+        writer = _WRITERS.get(type(value))
+        if writer is not None:
+            writer(self, value)
+        elif isinstance(value, Enum):
+            self.enum(value)
+        elif type(value) in _SCHEMAS_BY_CLASS:
+            self.model(value)
+        else:
+            raise SerializationError(f"Cannot serialize value of type {type(value).__name__}")
+
+    def none(self, value: None) -> None:
+        self.buffer.append(_NONE)
+
+    def boolean(self, value: bool) -> None:
+        self.buffer.append(_TRUE if value else _FALSE)
+
+    def integer(self, value: int) -> None:
+        try:
+            self.buffer += _UINT8.pack(_INT) + _INT64.pack(value)
+        except struct.error as e:
+            raise SerializationError(f"Integer out of range: {value}") from e
+
+    def number(self, value: float) -> None:
+        self.buffer += _UINT8.pack(_FLOAT) + _FLOAT64.pack(value)
+
+    def string(self, value: str) -> None:
+        data = value.encode("utf-8")
+        self.buffer += _UINT8.pack(_STR) + _UINT32.pack(len(data))
+        self.buffer += data
+
+    def sequence(self, value) -> None:
+        self.buffer += _UINT8.pack(_LIST) + _UINT32.pack(len(value))
+        for item in value:
+            self.value(item)
+
+    def mapping(self, value: Dict) -> None:
+        self.buffer += _UINT8.pack(_DICT) + _UINT32.pack(len(value))
+        for key, item in value.items():
+            if type(key) is not str:
+                raise SerializationError(f"Dictionary keys must be strings, got {type(key).__name__}")
+            self.string(key)
+            self.value(item)
+
+    def enum(self, value: Enum) -> None:
+        enum_id = _ENUM_IDS.get(type(value))
+        if enum_id is None:
+            raise SerializationError(f"Cannot serialize enum {type(value).__name__}")
+        self.buffer += _UINT8.pack(_ENUM) + _UINT8.pack(enum_id)
+        self.string(value.value)
+
+    def timestamp(self, value: datetime) -> None:
+        self.buffer += _UINT8.pack(_DATETIME) + _INT64.pack(_datetime_to_micros(value))
+
+    def model(self, value: Any, root: bool = False) -> None:
+        schema = _SCHEMAS_BY_CLASS[type(value)]
+        self.buffer += _UINT8.pack(_OBJ) + _OBJECT.pack(schema.type_id, len(schema.fields))
+        for name, _ in schema.fields:
+            field_value = getattr(value, name)
+            if root and name == "content" and type(field_value) is str:
+                start = len(self.buffer) + 1 + _UINT32.size
+                self.string(field_value)
+                self.content_span = (start, len(self.buffer) - start)
+            else:
+                self.value(field_value)
+
+
+_WRITERS: Dict[type, Callable[[_Encoder, Any], None]] = {
+    type(None): _Encoder.none,
+    bool: _Encoder.boolean,
+    int: _Encoder.integer,
+    float: _Encoder.number,
+    str: _Encoder.string,
+    list: _Encoder.sequence,
+    tuple: _Encoder.sequence,
+    dict: _Encoder.mapping,
+    datetime: _Encoder.timestamp,
+}
+
+
+def encode(obj: Any) -> bytes:
+    """
+    Encode a model in the binary form.
+
+    Args:
+        obj: A Task, Subtask, SelfAssessment, AgentResponse, CostBreakdown,
+            ExecutionMetadata or FinalResponse
+
+    Returns:
+        bytes: The encoded object
+
+    Raises:
+        SerializationError: If the object or one of its values can't be encoded
+    """
+    if type(obj) not in _SCHEMAS_BY_CLASS:
+        raise SerializationError(f"Cannot serialize object of type {type(obj).__name__}")
+
+    encoder = _Encoder()
+    encoder.model(obj, root=True)
+    offset, length = encoder.content_span
+    _HEADER.pack_into(encoder.buffer, 0, _MAGIC, CODEC_VERSION, offset, length)
+    return bytes(encoder.buffer)
+
+
+def _read_header(view: memoryview) -> Tuple[int, int]:
+    if len(view) < _HEADER.size:
+        raise SerializationError("Data is too short to be an encoded object")
+    magic, version, offset, length = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC:
+        raise SerializationError("Data is not an encoded AI Council object")
+    if version > CODEC_VERSION:
+        raise SerializationError(f"Unsupported codec version {version}")
+    return offset, length
+
+
+class _Decoder:
+    """Reads tagged values from a buffer."""
+
+    __slots__ = ("view", "position", "validate")
+
+    def __init__(self, view: memoryview, validate: bool):
+        self.view = view
+        self.position = _HEADER.size
+        self.validate = validate
+
+    def value(self) -> Any:
+        view = self.view
+        tag = view[self.position]
+        self.position += 1
+        if tag == _STR:
+            return self._string()
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            (value,) = _INT64.unpack_from(view, self.position)
+            self.position += _INT64.size
+            return value
+        if tag == _FLOAT:
+            (value,) = _FLOAT64.unpack_from(view, self.position)
+            self.position += _FLOAT64.size
+            return value
+        if tag == _LIST:
+            count = self._length()
+            return [self.value() for _ in range(count)]
+        if tag == _DICT:
+            count = self._length()
+            result = {}
+            for _ in range(count):
+                key = self.value()
+                result[key] = self.value()
+            return result
+        if tag == _ENUM:
+            enum_id = view[self.position]
+            self.position += 1
+            value = self.value()
+            try:
+                return _ENUMS[enum_id](value)
+            except (IndexError, ValueError) as e:
+                raise SerializationError(f"Unknown enum value {value!r}") from e
+        if tag == _DATETIME:
+            (micros,) = _INT64.unpack_from(view, self.position)
+            self.position += _INT64.size
+            return _micros_to_datetime(micros)
+        if tag == _OBJ:
+            return self._model()
+        raise SerializationError(f"Unknown value tag {tag} at offset {self.position - 1}")
+
+    def _length(self) -> int:
+        (length,) = _UINT32.unpack_from(self.view, self.position)
+        self.position += _UINT32.size
+        return length
+
+    def _string(self) -> str:
+        length = self._length()
+        start = self.position
+        self.position += length
+        if self.position > len(self.view):
+            raise SerializationError("Truncated string")
+        return str(self.view[start:self.position], "utf-8")
+
+    def _model(self) -> Any:
+        type_id, count = _OBJECT.unpack_from(self.view, self.position)
+        self.position += _OBJECT.size
+        schema = _SCHEMAS_BY_ID.get(type_id)
+        if schema is None:
+            raise SerializationError(f"Unknown object type {type_id}")
+
+        values = {}
+        fields = schema.fields
+        for index in range(count):
+            value = self.value()
+            if index < len(fields):  # Fields added by newer versions are skipped
+                values[fields[index][0]] = value
+        return _build(schema, values, self.validate)
+
+
+def decode(data: bytes, validate: bool = False) -> Any:
+    """
+    Decode an object from the binary form.
+
+    Args:
+        data: Bytes produced by ``encode``
+        validate: Whether to run each model's validation; enable for data from
+            untrusted sources
+
+    Returns:
+        The decoded model
+
+    Raises:
+        SerializationError: If the data is malformed or of an unsupported version
+    """
+    view = memoryview(data)
+    _read_header(view)
+    try:
+        return _Decoder(view, validate).value()
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise SerializationError(f"Malformed data: {e}") from e
+
+
+def peek_content(data: bytes) -> Optional[memoryview]:
+    """
+    Return the top-level object's ``content`` as UTF-8 bytes without decoding.
+
+    The returned memoryview shares memory with ``data``, so large content can
+    be streamed or hashed without copying it.
+
+    Args:
+        data: Bytes produced by ``encode``
+
+    Returns:
+        Optional[memoryview]: The content bytes, or None if the object has no
+            string content
+    """
+    view = memoryview(data)
+    offset, length = _read_header(view)
+    if offset == 0:
+        return None
+    if offset + length > len(view):
+        raise SerializationError("Content span lies outside the data")
+    return view[offset:offset + length]
+
+
+# =============================================================================
+# JSON form
+# =============================================================================
+
+def _json_default(value: Any) -> Any:
+    # Values inside free-form dicts and lists, such as metadata
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if type(value) in _SCHEMAS_BY_CLASS:
+        return _to_dict(value)
+    raise TypeError(f"Cannot serialize value of type {type(value).__name__}")
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    result = {}
+    for name, kind in _SCHEMAS_BY_CLASS[type(obj)].fields:
+        value = getattr(obj, name)
+        if value is None or kind is None:
+            result[name] = value
+        elif kind is datetime:
+            result[name] = value.isoformat()
+        elif isinstance(value, Enum):
+            result[name] = value.value
+        else:
+            result[name] = _to_dict(value)
+    return result
+
+
+def _from_dict(schema: ModelSchema, data: Dict[str, Any], validate: bool) -> Any:
+    values = {}
+    for name, kind in schema.fields:
+        if name not in data:
+            continue
+        value = data[name]
+        if value is None or kind is None:
+            values[name] = value
+        elif kind is datetime:
+            values[name] = datetime.fromisoformat(value)
+        elif issubclass(kind, Enum):
+            values[name] = kind(value)
+        else:
+            values[name] = _from_dict(_SCHEMAS_BY_CLASS[kind], value, validate)
+    return _build(schema, values, validate)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a model to a JSON-compatible dict tagged with its type and version.
+
+    Args:
+        obj: A serializable model
+
+    Returns:
+        Dict[str, Any]: The model's fields, with enums as values and datetimes
+            as ISO 8601 strings
+    """
+    schema = _SCHEMAS_BY_CLASS.get(type(obj))
+    if schema is None:
+        raise SerializationError(f"Cannot serialize object of type {type(obj).__name__}")
+    result = {"__type__": schema.name, "__version__": CODEC_VERSION}
+    result.update(_to_dict(obj))
+    return result
+
+
+def from_dict(data: Dict[str, Any], validate: bool = False) -> Any:
+    """
+    Rebuild a model from a dict produced by ``to_dict``.
+
+    Args:
+        data: The tagged dict
+        validate: Whether to run each model's validation
+
+    Returns:
+        The decoded model
+    """
+    schema = _SCHEMAS_BY_NAME.get(data.get("__type__"))
+    if schema is None:
+        raise SerializationError(f"Unknown object type {data.get('__type__')!r}")
+    if data.get("__version__", CODEC_VERSION) > CODEC_VERSION:
+        raise SerializationError(f"Unsupported codec version {data['__version__']}")
+    try:
+        return _from_dict(schema, data, validate)
+    except (TypeError, ValueError, AttributeError) as e:
+        if isinstance(e, SerializationError):
+            raise
+        raise SerializationError(f"Malformed {schema.name}: {e}") from e
+
+
+def to_json(obj: Any) -> str:
+    """
+    Encode a model as JSON.
+
+    Free-form values such as metadata must be JSON-compatible; enums and
+    datetimes inside them are written as plain values and decode as such.
+
+    Args:
+        obj: A serializable model
+
+    Returns:
+        str: The JSON document
+    """
+    try:
+        return json.dumps(to_dict(obj), default=_json_default, separators=(",", ":"))
+    except TypeError as e:
+        raise SerializationError(str(e)) from e
+
+
+def from_json(text: str, validate: bool = False) -> Any:
+    """
+    Decode a model from JSON produced by ``to_json``.
+
+    Args:
+        text: The JSON document
+        validate: Whether to run each model's validation
+
+    Returns:
+        The decoded model
+    """
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise SerializationError(f"Invalid JSON: {e}") from e
+    return from_dict(data, validate)
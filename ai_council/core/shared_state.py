@@ -0,0 +1,320 @@
+"""Cross-process shared state for AI Council resilience components.
+
+The resilience singletons (``rate_limit_manager``, ``adaptive_timeout_manager``
+and the circuit breakers owned by ``resilience_manager``) keep their state in
+process memory by default. When the application runs with several worker
+processes, each worker would otherwise enforce its own copy of a provider rate
+limit and rediscover a dead provider on its own.
+
+This module provides an optional backend that keeps limiter windows, breaker
+state and recent latency samples in a SQLite database in WAL mode, so every
+local process sharing the same file sees the same state. No external service
+is required.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STATE_FILENAME = "resilience_state.db"
+
+
+class SharedStateBackend(ABC):
+    """Abstract storage for resilience state shared between processes."""
+
+    @abstractmethod
+    def acquire_rate_limit(
+        self,
+        resource: str,
+        requests_per_minute: int,
+        window_duration: float,
+        now: float
+    ) -> Tuple[bool, float]:
+        """Atomically count a request against a shared rate limit window.
+
+        Args:
+            resource: Name of the rate limited resource
+            requests_per_minute: Maximum requests allowed in one window
+            window_duration: Length of the window in seconds
+            now: Current wall clock time in seconds
+
+        Returns:
+            tuple: (is_allowed, wait_time_seconds)
+        """
+        pass
+
+    @abstractmethod
+    def get_rate_limit_window(self, resource: str) -> Optional[Tuple[float, int]]:
+        """Get the (window_start, request_count) pair for a resource, if any."""
+        pass
+
+    @abstractmethod
+    def load_breaker(self, name: str) -> Optional[Dict[str, Any]]:
+        """Load the last published snapshot of a circuit breaker."""
+        pass
+
+    @abstractmethod
+    def update_breaker(
+        self,
+        name: str,
+        mutator: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Atomically read, modify and write a circuit breaker snapshot.
+
+        Args:
+            name: Name of the circuit breaker
+            mutator: Callable receiving the stored snapshot (or None) and
+                returning the snapshot to store
+
+        Returns:
+            The stored snapshot
+        """
+        pass
+
+    @abstractmethod
+    def append_latency(self, operation: str, value: float, max_samples: int) -> None:
+        """Append a latency sample, keeping only the most recent samples."""
+        pass
+
+    @abstractmethod
+    def get_latencies(self, operation: str, max_samples: int) -> List[float]:
+        """Get the most recent latency samples in insertion order."""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+
+class SQLiteStateBackend(SharedStateBackend):
+    """Shared state stored in a SQLite database running in WAL mode.
+
+    Each thread gets its own connection. Read-modify-write operations run in
+    ``BEGIN IMMEDIATE`` transactions, so updates from concurrent processes are
+    serialized by SQLite's write lock.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS rate_limits ("
+        " resource TEXT PRIMARY KEY,"
+        " window_start REAL NOT NULL,"
+        " request_count INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS circuit_breakers ("
+        " name TEXT PRIMARY KEY,"
+        " snapshot TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS latency_samples ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " operation TEXT NOT NULL,"
+        " value REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_latency_operation"
+        " ON latency_samples (operation, id)",
+    )
+
+    def __init__(self, path: Union[str, Path], busy_timeout: float = 5.0):
+        """
+        Initialize the backend, creating the database if needed.
+
+        Args:
+            path: Location of the SQLite database file
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cursor:
+            for statement in self._SCHEMA:
+                cursor.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        return _ImmediateTransaction(self._connection())
+
+    def acquire_rate_limit(
+        self,
+        resource: str,
+        requests_per_minute: int,
+        window_duration: float,
+        now: float
+    ) -> Tuple[bool, float]:
+        with self._transaction() as cursor:
+            row = cursor.execute(
+                "SELECT window_start, request_count FROM rate_limits WHERE resource = ?",
+                (resource,)
+            ).fetchone()
+
+            if row is None or now - row[0] >= window_duration:
+                window_start, request_count = now, 0
+            else:
+                window_start, request_count = row
+
+            if request_count < requests_per_minute:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO rate_limits (resource, window_start, request_count)"
+                    " VALUES (?, ?, ?)",
+                    (resource, window_start, request_count + 1)
+                )
+                return True, 0.0
+
+            if row is None or window_start != row[0]:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO rate_limits (resource, window_start, request_count)"
+                    " VALUES (?, ?, ?)",
+                    (resource, window_start, request_count)
+                )
+            return False, max(0.0, window_duration - (now - window_start))
+
+    def get_rate_limit_window(self, resource: str) -> Optional[Tuple[float, int]]:
+        row = self._connection().execute(
+            "SELECT window_start, request_count FROM rate_limits WHERE resource = ?",
+            (resource,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def load_breaker(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT snapshot FROM circuit_breakers WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update_breaker(
+        self,
+        name: str,
+        mutator: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        with self._transaction() as cursor:
+            row = cursor.execute(
+                "SELECT snapshot FROM circuit_breakers WHERE name = ?", (name,)
+            ).fetchone()
+            snapshot = mutator(json.loads(row[0]) if row else None)
+            cursor.execute(
+                "INSERT OR REPLACE INTO circuit_breakers (name, snapshot) VALUES (?, ?)",
+                (name, json.dumps(snapshot))
+            )
+            return snapshot
+
+    def append_latency(self, operation: str, value: float, max_samples: int) -> None:
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT INTO latency_samples (operation, value) VALUES (?, ?)",
+                (operation, value)
+            )
+            cursor.execute(
+                "DELETE FROM latency_samples WHERE operation = ? AND id <= ("
+                " SELECT id FROM latency_samples WHERE operation = ?"
+                " ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (operation, operation, max_samples)
+            )
+
+    def get_latencies(self, operation: str, max_samples: int) -> List[float]:
+        rows = self._connection().execute(
+            "SELECT value FROM latency_samples WHERE operation = ?"
+            " ORDER BY id DESC LIMIT ?",
+            (operation, max_samples)
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class _ImmediateTransaction:
+    """Context manager running a block inside ``BEGIN IMMEDIATE``."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self.cursor = self.conn.cursor()
+        self.cursor.execute("BEGIN IMMEDIATE")
+        return self.cursor
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        self.cursor.close()
+
+
+def create_shared_state_backend(
+    backend: str,
+    data_dir: Union[str, Path],
+    path: Optional[str] = None
+) -> Optional[SharedStateBackend]:
+    """
+    Create a shared state backend from configuration values.
+
+    Args:
+        backend: Backend name, either "local" (no sharing) or "sqlite"
+        data_dir: Directory holding the state file when no path is given
+        path: Optional explicit database path
+
+    Returns:
+        The backend instance, or None for process-local state
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = (backend or "local").lower()
+    if backend == "local":
+        return None
+    if backend == "sqlite":
+        return SQLiteStateBackend(path or Path(data_dir) / DEFAULT_STATE_FILENAME)
+    raise ValueError(f"Unknown shared state backend: {backend}")
+
+
+def configure_shared_state(backend: Optional[SharedStateBackend]) -> None:
+    """
+    Attach a shared state backend to the global resilience managers.
+
+    Passing None detaches the backend and returns the managers to purely
+    process-local state.
+
+    Args:
+        backend: The backend to share, or None
+    """
+    from .failure_handling import resilience_manager
+    from .timeout_handler import adaptive_timeout_manager, rate_limit_manager
+
+    resilience_manager.attach_shared_state(backend)
+    rate_limit_manager.attach_shared_state(backend)
+    adaptive_timeout_manager.attach_shared_state(backend)
+
+    if backend is not None:
+        logger.info(f"Resilience state shared via {type(backend).__name__}")
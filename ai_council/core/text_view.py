@@ -0,0 +1,124 @@
+"""Cached analysis view of a piece of response text.
+
+Several pipeline stages inspect the same response text: the execution agent
+scores confidence and extracts assumptions, arbitration looks for
+contradictory keywords, and synthesis compares word sets. ``TextView`` computes
+the lowercase text, tokens, token set, sentence spans and keyword hit counts
+on first use and keeps them, so each derived form is built once per response
+instead of once per stage.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+
+class TextView:
+    """Lazily computed, cached derived forms of a text."""
+
+    __slots__ = (
+        "text", "_lower", "_stripped_length", "_tokens", "_token_set",
+        "_sentence_spans", "_sentences", "_lower_sentences", "_keyword_hits"
+    )
+
+    def __init__(self, text: str):
+        """
+        Initialize the view.
+
+        Args:
+            text: The text to analyze; it must not change afterwards
+        """
+        self.text = text
+        self._lower: Optional[str] = None
+        self._stripped_length: Optional[int] = None
+        self._tokens: Optional[List[str]] = None
+        self._token_set: Optional[FrozenSet[str]] = None
+        self._sentence_spans: Optional[List[Tuple[int, int]]] = None
+        self._sentences: Optional[List[str]] = None
+        self._lower_sentences: Optional[List[str]] = None
+        self._keyword_hits: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+    @property
+    def lower(self) -> str:
+        """The text in lowercase."""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def stripped_length(self) -> int:
+        """Length of the text without surrounding whitespace."""
+        if self._stripped_length is None:
+            self._stripped_length = len(self.text.strip())
+        return self._stripped_length
+
+    @property
+    def tokens(self) -> List[str]:
+        """Lowercase whitespace-separated words, in order."""
+        if self._tokens is None:
+            self._tokens = self.lower.split()
+        return self._tokens
+
+    @property
+    def token_set(self) -> FrozenSet[str]:
+        """Distinct lowercase words."""
+        if self._token_set is None:
+            self._token_set = frozenset(self.tokens)
+        return self._token_set
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) offsets of the pieces produced by ``text.split('.')``."""
+        if self._sentence_spans is None:
+            spans = []
+            start = 0
+            text = self.text
+            while True:
+                end = text.find('.', start)
+                if end == -1:
+                    spans.append((start, len(text)))
+                    break
+                spans.append((start, end))
+                start = end + 1
+            self._sentence_spans = spans
+        return self._sentence_spans
+
+    @property
+    def sentences(self) -> List[str]:
+        """The text split on periods, unstripped."""
+        if self._sentences is None:
+            self._sentences = [self.text[start:end] for start, end in self.sentence_spans]
+        return self._sentences
+
+    @property
+    def lower_sentences(self) -> List[str]:
+        """``sentences`` in lowercase."""
+        if self._lower_sentences is None:
+            self._lower_sentences = [sentence.lower() for sentence in self.sentences]
+        return self._lower_sentences
+
+    def keyword_hits(self, keywords: Sequence[str]) -> Dict[str, int]:
+        """
+        Count occurrences of lowercase keywords or phrases in the text.
+
+        Results are cached per keyword list.
+
+        Args:
+            keywords: Lowercase keywords or phrases to count
+
+        Returns:
+            Dict mapping each keyword to its number of occurrences
+        """
+        key = tuple(keywords)
+        hits = self._keyword_hits.get(key)
+        if hits is None:
+            lower = self.lower
+            hits = {keyword: lower.count(keyword) for keyword in key}
+            self._keyword_hits[key] = hits
+        return hits
+
+    def count_present(self, keywords: Sequence[str]) -> int:
+        """Number of distinct keywords that occur at least once."""
+        return sum(1 for count in self.keyword_hits(keywords).values() if count)
+
+    def contains_any(self, keywords: Sequence[str]) -> bool:
+        """Whether any of the keywords occurs in the text."""
+        return self.count_present(keywords) > 0
@@ -1,16 +1,19 @@
 """Timeout handling utilities for AI Council operations."""
 
 import asyncio
+import contextvars
 import functools
 import logging
 import signal
 import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Optional, TypeVar, Union
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
+from .clock import Clock, get_clock
 from .failure_handling import FailureEvent, FailureType, RiskLevel, resilience_manager
+from .metrics import metrics_registry
 
 
 logger = logging.getLogger(__name__)
@@ -30,11 +33,17 @@ class TimeoutError(Exception):
 class TimeoutHandler:
     """Handles various types of timeouts in the system."""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.active_operations: dict[str, float] = {}
         self.timeout_counts: dict[str, int] = {}
+        self._clock = clock
         self._lock = threading.Lock()
     
+    @property
+    def clock(self) -> Clock:
+        """Clock that timeouts are measured in (the process default unless injected)."""
+        return self._clock or get_clock()
+    
     def with_timeout(
         self,
         timeout_seconds: float,
@@ -66,10 +75,11 @@ class TimeoutHandler:
         **kwargs
     ) -> T:
         """Execute a function with timeout handling."""
-        operation_id = f"{component}:{operation_name}:{int(time.time())}"
+        now = self.clock.time()
+        operation_id = f"{component}:{operation_name}:{int(now)}"
         
         with self._lock:
-            self.active_operations[operation_id] = time.time()
+            self.active_operations[operation_id] = now
         
         try:
             if asyncio.iscoroutinefunction(func):
@@ -102,10 +112,11 @@ class TimeoutHandler:
     ) -> T:
         """Execute synchronous function with timeout."""
         with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(func, *args, **kwargs)
+            # Run in a copy of the caller's context so context variables follow the call
+            future = executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
             
             try:
-                result = future.result(timeout=timeout_seconds)
+                result = self.clock.wait_future(future, timeout_seconds)
                 return result
                 
             except FutureTimeoutError:
@@ -204,7 +215,7 @@ class TimeoutHandler:
 class AdaptiveTimeoutManager:
     """Manages adaptive timeouts based on historical performance."""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.performance_history: dict[str, list[float]] = {}
         self.default_timeouts: dict[str, float] = {
             "model_execution": 30.0,
@@ -214,10 +225,31 @@ class AdaptiveTimeoutManager:
             "synthesis": 15.0
         }
         self.max_history_size = 100
+        self.shared_state = None
+        self._clock = clock
         self._lock = threading.Lock()
     
+    @property
+    def clock(self) -> Clock:
+        """Clock that operation durations are measured in."""
+        return self._clock or get_clock()
+    
+    def attach_shared_state(self, backend) -> None:
+        """Share latency history with other processes through a backend."""
+        self.shared_state = backend
+    
+    def _get_history(self, operation: str) -> list[float]:
+        """Get the latency history for an operation from the active store."""
+        if self.shared_state is not None:
+            return self.shared_state.get_latencies(operation, self.max_history_size)
+        return self.performance_history.get(operation, [])
+    
     def record_execution_time(self, operation: str, execution_time: float):
         """Record execution time for an operation."""
+        if self.shared_state is not None:
+            self.shared_state.append_latency(operation, execution_time, self.max_history_size)
+            return
+        
         with self._lock:
             if operation not in self.performance_history:
                 self.performance_history[operation] = []
@@ -231,7 +263,7 @@ class AdaptiveTimeoutManager:
     def get_adaptive_timeout(self, operation: str, percentile: float = 95.0) -> float:
         """Get adaptive timeout based on historical performance."""
         with self._lock:
-            history = self.performance_history.get(operation, [])
+            history = self._get_history(operation)
             
             if not history:
                 # No history, use default
@@ -260,7 +292,7 @@ class AdaptiveTimeoutManager:
     def get_performance_stats(self, operation: str) -> dict[str, float]:
         """Get performance statistics for an operation."""
         with self._lock:
-            history = self.performance_history.get(operation, [])
+            history = self._get_history(operation)
             
             if not history:
                 return {"count": 0}
@@ -322,14 +354,65 @@ def timeout_context(
             signal.signal(signal.SIGALRM, old_handler)
 
 
+# Set by callers that may abandon an operation, such as ensemble fan-out
+_cancel_event = contextvars.ContextVar("ai_council_cancel_event", default=None)
+
+
+@contextmanager
+def cancel_on(event: threading.Event) -> Iterator[None]:
+    """
+    Mark operations started in this context as abandoned once ``event`` is set.
+
+    Synchronous model calls can't be interrupted, so a call already in flight
+    still runs to completion; retry loops check :func:`is_cancelled` and make
+    no further attempts.
+    """
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+
+def is_cancelled() -> bool:
+    """Whether the operation running in this context has been abandoned."""
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+_rate_limit_checks = metrics_registry.counter(
+    "ai_council_rate_limit_checks_total",
+    "Rate limit checks by resource and result", ("resource", "result")
+)
+_rate_limit_wait = metrics_registry.histogram(
+    "ai_council_rate_limit_wait_seconds",
+    "Wait imposed on requests that exceeded a rate limit", ("resource",)
+)
+_rate_limit_hits = metrics_registry.counter(
+    "ai_council_rate_limit_hits_total",
+    "Rate limit errors reported by external services", ("resource",)
+)
+
+
 class RateLimitManager:
     """Manages rate limiting and backoff strategies."""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.rate_limits: dict[str, dict[str, Any]] = {}
         self.request_history: dict[str, list[float]] = {}
+        self.shared_state = None
+        self._clock = clock
         self._lock = threading.Lock()
     
+    @property
+    def clock(self) -> Clock:
+        """Clock that rate limit windows are kept in."""
+        return self._clock or get_clock()
+    
+    def attach_shared_state(self, backend) -> None:
+        """Share rate limit windows with other processes through a backend."""
+        self.shared_state = backend
+    
     def set_rate_limit(
         self,
         resource: str,
@@ -341,7 +424,7 @@ class RateLimitManager:
             self.rate_limits[resource] = {
                 "requests_per_minute": requests_per_minute,
                 "burst_limit": burst_limit or requests_per_minute,
-                "window_start": time.time(),
+                "window_start": self.clock.time(),
                 "request_count": 0
             }
     
@@ -351,15 +434,30 @@ class RateLimitManager:
         Returns:
             tuple: (is_allowed, wait_time_seconds)
         """
+        allowed, wait_time = self._check_rate_limit(resource)
+        if allowed:
+            _rate_limit_checks.labels(resource, "allowed").inc()
+        else:
+            _rate_limit_checks.labels(resource, "limited").inc()
+            _rate_limit_wait.labels(resource).observe(wait_time)
+        return allowed, wait_time
+    
+    def _check_rate_limit(self, resource: str) -> tuple[bool, float]:
         with self._lock:
             if resource not in self.rate_limits:
                 return True, 0.0
             
             limit_info = self.rate_limits[resource]
-            current_time = time.time()
+            current_time = self.clock.time()
             
             # Reset window if needed (sliding window)
             window_duration = 60.0  # 1 minute
+            
+            if self.shared_state is not None:
+                return self.shared_state.acquire_rate_limit(
+                    resource, limit_info["requests_per_minute"],
+                    window_duration, current_time
+                )
             if current_time - limit_info["window_start"] >= window_duration:
                 limit_info["window_start"] = current_time
                 limit_info["request_count"] = 0
@@ -382,6 +480,7 @@ class RateLimitManager:
         model_id: Optional[str] = None
     ):
         """Record a rate limit hit from external service."""
+        _rate_limit_hits.labels(resource).inc()
         failure_event = FailureEvent(
             failure_type=FailureType.RATE_LIMIT,
             component=component,
@@ -404,7 +503,12 @@ class RateLimitManager:
                 return {"configured": False}
             
             limit_info = self.rate_limits[resource]
-            current_time = time.time()
+            current_time = self.clock.time()
+            
+            if self.shared_state is not None:
+                window = self.shared_state.get_rate_limit_window(resource)
+                if window is not None:
+                    limit_info = dict(limit_info, window_start=window[0], request_count=window[1])
             
             return {
                 "configured": True,
@@ -429,7 +533,7 @@ def with_adaptive_timeout(operation: str, component: str = ""):
             # Get adaptive timeout
             timeout_seconds = adaptive_timeout_manager.get_adaptive_timeout(operation)
             
-            start_time = time.time()
+            start_time = adaptive_timeout_manager.clock.time()
             try:
                 result = timeout_handler.execute_with_timeout(
                     func, timeout_seconds, operation, component,
@@ -437,7 +541,7 @@ def with_adaptive_timeout(operation: str, component: str = ""):
                 )
                 
                 # Record successful execution time
-                execution_time = time.time() - start_time
+                execution_time = adaptive_timeout_manager.clock.time() - start_time
                 adaptive_timeout_manager.record_execution_time(operation, execution_time)
                 
                 return result
@@ -461,7 +565,7 @@ def with_rate_limit(resource: str, component: str = ""):
             
             if not allowed:
                 logger.warning(f"Rate limit exceeded for {resource}, waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
+                rate_limit_manager.clock.sleep(wait_time)
             
             return func(*args, **kwargs)
         
@@ -0,0 +1,597 @@
+"""Lightweight per-request tracing for the processing pipeline.
+
+A trace is a tree of spans, each recording when a stage started, how long it
+took, its parent and a few attributes. The orchestration layer opens one trace
+per request and a span per stage (analysis, decomposition, planning, each
+subtask, each model attempt, arbitration and synthesis), so the finished
+response shows whether a slow request spent its time queued, retrying, in the
+model or in synthesis. Finished traces are copied into
+``ExecutionMetadata.spans`` and handed to any configured exporters.
+
+Span times are read from the process clock (:func:`get_clock`) when the trace
+starts, so a run on a virtual clock records simulated times throughout.
+
+The active span is kept in a context variable. Work handed to another thread
+must be wrapped with :meth:`Tracer.bind` to stay in the same trace. Outside a
+trace every call is a cheap no-op.
+"""
+
+import contextvars
+import json
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from .clock import Clock, get_clock
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TRACE_FILENAME = "traces.jsonl"
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318/v1/traces"
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = 0.0  # Seconds since the epoch
+    duration: Optional[float] = None  # Seconds; None while the span is open
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"  # "ok" or "error"
+    _perf_start: float = field(default=0.0, repr=False, compare=False)  # Clock.monotonic() at start
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Seconds since the epoch when the span ended, if it has."""
+        if self.duration is None:
+            return None
+        return self.start_time + self.duration
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span to a JSON-compatible dictionary."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+            "status": self.status,
+        }
+
+
+class Trace:
+    """The spans recorded for one request, safe to extend from several threads."""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None, clock: Optional[Clock] = None):
+        self.trace_id = uuid4().hex
+        self.clock = clock or get_clock()
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+        self.finished = False
+        self.root = self.start_span(name, None, attributes)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Snapshot of the spans recorded so far, in start order."""
+        with self._lock:
+            return list(self._spans)
+
+    def start_span(
+        self,
+        name: str,
+        parent_id: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """Open a span in this trace."""
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=uuid4().hex[:16],
+            parent_id=parent_id,
+            start_time=self.clock.time(),
+            attributes=dict(attributes or {}),
+            _perf_start=self.clock.monotonic()
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def end_span(self, span: Span) -> None:
+        """Close a span, fixing its duration."""
+        if span.duration is None:
+            span.duration = self.clock.monotonic() - span._perf_start
+
+    def add_span(
+        self,
+        name: str,
+        parent_id: Optional[str],
+        start_time: float,
+        duration: float,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """Record a span that has already finished."""
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=uuid4().hex[:16],
+            parent_id=parent_id,
+            start_time=start_time,
+            duration=max(0.0, duration),
+            attributes=dict(attributes or {})
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert every span to a dictionary."""
+        return [span.to_dict() for span in self.spans]
+
+
+# The trace and span new spans are attached to
+_active: "contextvars.ContextVar[Optional[Tuple[Trace, Span]]]" = contextvars.ContextVar(
+    "ai_council_active_span", default=None
+)
+
+
+def _reset(token: contextvars.Token) -> None:
+    try:
+        _active.reset(token)
+    except ValueError:
+        # A generator finished in a different context than it started in
+        _active.set(None)
+
+
+class SpanExporter(ABC):
+    """Destination for the spans of finished traces."""
+
+    @abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        """Export the spans of one finished trace.
+
+        Args:
+            spans: The trace's spans, root first
+        """
+        pass
+
+    def shutdown(self) -> None:
+        """Flush pending spans and release resources."""
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps exported spans in memory, mainly for tests and debugging."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    @property
+    def spans(self) -> List[Span]:
+        """All spans exported so far."""
+        with self._lock:
+            return list(self._spans)
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def clear(self) -> None:
+        """Forget the exported spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends each span as one JSON line to a file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File to append to; parent directories are created
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+class OtlpJsonSpanExporter(SpanExporter):
+    """
+    Sends spans to an OpenTelemetry collector using OTLP over HTTP with JSON.
+
+    Requests are posted from a background thread so a slow or missing
+    collector never delays responses. Traces arriving while ``max_queue``
+    are already waiting are dropped.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_OTLP_ENDPOINT,
+        service_name: str = "ai-council",
+        timeout: float = 2.0,
+        max_queue: int = 1000
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            endpoint: Collector traces URL, e.g. http://localhost:4318/v1/traces
+            service_name: Value of the ``service.name`` resource attribute
+            timeout: Seconds to wait for the collector per request
+            max_queue: Traces that may wait to be sent
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+                self._worker.start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout=self.timeout * 2)
+
+    def encode(self, spans: List[Span]) -> Dict[str, Any]:
+        """Build the OTLP ExportTraceServiceRequest body for spans."""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "ai_council"},
+                    "spans": [_otlp_span(span) for span in spans],
+                }],
+            }]
+        }
+
+    def _run(self) -> None:
+        # Imported here so the default no-export setup never loads the HTTP stack
+        import urllib.request
+
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            request = urllib.request.Request(
+                self.endpoint,
+                data=json.dumps(self.encode(spans)).encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST"
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    response.read()
+            except Exception as e:
+                logger.warning(f"Failed to export {len(spans)} spans to {self.endpoint}: {str(e)}")
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    start_ns = int(span.start_time * 1e9)
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(start_ns + int((span.duration or 0.0) * 1e9)),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2 if span.status == "error" else 1},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+class Tracer:
+    """Creates traces and spans and hands finished traces to exporters."""
+
+    def __init__(self, enabled: bool = True, exporters: Optional[List[SpanExporter]] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Whether requests are traced at all
+            exporters: Destinations for finished traces
+        """
+        self.enabled = enabled
+        self._exporters: List[SpanExporter] = list(exporters or [])
+
+    @property
+    def exporters(self) -> List[SpanExporter]:
+        """The configured exporters."""
+        return list(self._exporters)
+
+    def configure(self, enabled: bool = True, exporters: Optional[List[SpanExporter]] = None) -> None:
+        """
+        Replace the tracer's settings, shutting down the previous exporters.
+
+        Args:
+            enabled: Whether requests are traced at all
+            exporters: Destinations for finished traces
+        """
+        previous, self._exporters = self._exporters, list(exporters or [])
+        self.enabled = enabled
+        for exporter in previous:
+            if exporter not in self._exporters:
+                exporter.shutdown()
+
+    def current_span(self) -> Optional[Span]:
+        """The span new spans would be attached to, if any."""
+        active = _active.get()
+        return active[1] if active else None
+
+    def start_trace(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Optional[Trace]:
+        """
+        Start a trace without activating it, for work spread over several jobs.
+
+        Returns:
+            The new trace, or None if tracing is disabled
+        """
+        if not self.enabled:
+            return None
+        return Trace(name, attributes)
+
+    def finish_trace(
+        self,
+        trace: Optional[Trace],
+        sink: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Close a trace's root span, copy its spans into sink and export them.
+
+        Only the first call for a trace has any effect.
+
+        Args:
+            trace: The trace from start_trace; None is ignored
+            sink: Optional list to extend with the span dictionaries,
+                typically ``ExecutionMetadata.spans``
+        """
+        if trace is None:
+            return
+        with trace._lock:
+            if trace.finished:
+                return
+            trace.finished = True
+        trace.end_span(trace.root)
+        spans = trace.spans
+        if sink is not None:
+            sink.extend(span.to_dict() for span in spans)
+        for exporter in self._exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(f"Span exporter {type(exporter).__name__} failed: {str(e)}")
+
+    @contextmanager
+    def trace(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        sink: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[Optional[Trace]]:
+        """
+        Trace the enclosed block as the root span of a new trace.
+
+        Args:
+            name: Root span name
+            attributes: Root span attributes
+            sink: Optional list to extend with the finished spans
+
+        Yields:
+            The trace, or None if tracing is disabled
+        """
+        trace = self.start_trace(name, attributes)
+        if trace is None:
+            yield None
+            return
+        token = _active.set((trace, trace.root))
+        try:
+            yield trace
+        except BaseException as e:
+            _mark_error(trace.root, e)
+            raise
+        finally:
+            _reset(token)
+            self.finish_trace(trace, sink)
+
+    @contextmanager
+    def activate(self, trace: Optional[Trace]) -> Iterator[Optional[Trace]]:
+        """
+        Make new spans in the enclosed block children of a trace's root.
+
+        Unlike :meth:`trace`, leaving the block does not finish the trace.
+
+        Args:
+            trace: The trace from start_trace; None leaves tracing off
+
+        Yields:
+            The trace
+        """
+        if trace is None:
+            yield None
+            return
+        token = _active.set((trace, trace.root))
+        try:
+            yield trace
+        finally:
+            _reset(token)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Record the enclosed block as a child of the current span.
+
+        Args:
+            name: Span name
+            **attributes: Span attributes
+
+        Yields:
+            The span, or None outside a trace
+        """
+        active = _active.get()
+        if active is None:
+            yield None
+            return
+        trace, parent = active
+        span = trace.start_span(name, parent.span_id, attributes)
+        token = _active.set((trace, span))
+        try:
+            yield span
+        except BaseException as e:
+            _mark_error(span, e)
+            raise
+        finally:
+            _reset(token)
+            trace.end_span(span)
+
+    def record_span(self, name: str, start_time: float, duration: float, **attributes: Any) -> Optional[Span]:
+        """
+        Record an already finished child of the current span, such as a wait.
+
+        Args:
+            name: Span name
+            start_time: Seconds since the epoch when it started
+            duration: Seconds it took
+            **attributes: Span attributes
+
+        Returns:
+            The span, or None outside a trace
+        """
+        active = _active.get()
+        if active is None:
+            return None
+        trace, parent = active
+        return trace.add_span(name, parent.span_id, start_time, duration, attributes)
+
+    def bind(
+        self,
+        fn: Callable[..., Any],
+        queue_span: Optional[str] = None,
+        trace: Optional[Trace] = None,
+        **attributes: Any
+    ) -> Callable[..., Any]:
+        """
+        Wrap fn to run in the current span, or a trace's root, on another thread.
+
+        Args:
+            fn: The function to hand to a pool or thread
+            queue_span: If given, a span of this name records the time from
+                binding until fn starts running
+            trace: Run under this trace's root instead of the current span
+            **attributes: Attributes of the queue span
+
+        Returns:
+            The wrapped function, or fn itself outside a trace
+        """
+        active = (trace, trace.root) if trace is not None else _active.get()
+        if active is None:
+            return fn
+        bound_trace, parent = active
+        clock = bound_trace.clock
+        queued_at = clock.time()
+        queued_perf = clock.monotonic()
+
+        def run_bound(*args: Any, **kwargs: Any) -> Any:
+            if queue_span:
+                bound_trace.add_span(
+                    queue_span, parent.span_id, queued_at, clock.monotonic() - queued_perf, attributes
+                )
+            token = _active.set(active)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _reset(token)
+
+        return run_bound
+
+
+def _mark_error(span: Span, error: BaseException) -> None:
+    span.status = "error"
+    span.attributes["error"] = type(error).__name__
+
+
+def create_span_exporter(
+    exporter: str,
+    data_dir: Union[str, Path],
+    path: Optional[str] = None,
+    endpoint: Optional[str] = None,
+    service_name: str = "ai-council"
+) -> Optional[SpanExporter]:
+    """
+    Create a span exporter from configuration values.
+
+    Args:
+        exporter: Exporter name: "none", "jsonl" or "otlp"
+        data_dir: Directory holding the trace file when no path is given
+        path: Optional explicit JSONL file path
+        endpoint: Optional OTLP collector traces URL
+        service_name: Service name reported to the collector
+
+    Returns:
+        The exporter, or None when spans are only attached to responses
+
+    Raises:
+        ValueError: If the exporter name is unknown
+    """
+    exporter = (exporter or "none").lower()
+    if exporter == "none":
+        return None
+    if exporter == "jsonl":
+        return JsonlSpanExporter(path or Path(data_dir) / DEFAULT_TRACE_FILENAME)
+    if exporter == "otlp":
+        return OtlpJsonSpanExporter(endpoint or DEFAULT_OTLP_ENDPOINT, service_name=service_name)
+    raise ValueError(f"Unknown span exporter: {exporter}")
+
+
+# Global tracer instance
+tracer = Tracer()
@@ -1,10 +1,33 @@
 """Execution agents and model interface components."""
 
-from .agent import BaseExecutionAgent
-from .mock_models import (
-    MockAIModel, MockModelBehavior, MockModelFactory,
-    create_test_models, create_failure_test_models
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .agent import BaseExecutionAgent
+    from .mock_models import (
+        MockAIModel, MockModelBehavior, MockModelFactory,
+        create_test_models, create_failure_test_models
+    )
+    from .replay import (
+        CapturedCall, CaptureReader, CaptureWriter, RecordingModel, ReplayModel, build_index
+    )
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "BaseExecutionAgent": ".agent",
+    "MockAIModel": ".mock_models",
+    "MockModelBehavior": ".mock_models",
+    "MockModelFactory": ".mock_models",
+    "create_test_models": ".mock_models",
+    "create_failure_test_models": ".mock_models",
+    "CapturedCall": ".replay",
+    "CaptureReader": ".replay",
+    "CaptureWriter": ".replay",
+    "RecordingModel": ".replay",
+    "ReplayModel": ".replay",
+    "build_index": ".replay",
+})
 
 __all__ = [
     "BaseExecutionAgent",
@@ -12,5 +35,11 @@ __all__ = [
     "MockModelBehavior", 
     "MockModelFactory",
     "create_test_models", 
-    "create_failure_test_models"
-]
\ No newline at end of file
+    "create_failure_test_models",
+    "CapturedCall",
+    "CaptureReader",
+    "CaptureWriter",
+    "RecordingModel",
+    "ReplayModel",
+    "build_index"
+]
@@ -1,27 +1,47 @@
 """Execution agent implementation for AI Council."""
 
-import time
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from ..core.interfaces import ExecutionAgent, AIModel, ModelError, FailureResponse
 from ..core.models import Subtask, AgentResponse, SelfAssessment, RiskLevel
+from ..core.text_view import TextView
+from ..core.clock import get_clock
 from ..core.failure_handling import (
     FailureEvent, FailureType, resilience_manager, create_failure_event
 )
+from ..core.concurrency_limiter import concurrency_limiter_manager
 from ..core.timeout_handler import (
     timeout_handler, adaptive_timeout_manager, rate_limit_manager,
-    with_adaptive_timeout, with_rate_limit, TimeoutError
+    with_adaptive_timeout, with_rate_limit, is_cancelled, TimeoutError
 )
+from ..core.metrics import metrics_registry
+from ..core.tracing import tracer
 
 
 logger = logging.getLogger(__name__)
 
+_model_calls = metrics_registry.counter(
+    "ai_council_model_calls_total", "Model call attempts by model and outcome", ("model", "outcome")
+)
+_model_call_seconds = metrics_registry.histogram(
+    "ai_council_model_call_duration_seconds", "Latency of model call attempts", ("model",)
+)
+_model_tokens = metrics_registry.counter(
+    "ai_council_model_tokens_total", "Tokens used by successful model calls", ("model",)
+)
+_model_cost = metrics_registry.counter(
+    "ai_council_model_cost_total", "Estimated cost of successful model calls", ("model",)
+)
+
 
 class BaseExecutionAgent(ExecutionAgent):
     """Base implementation of ExecutionAgent with comprehensive failure handling."""
     
+    # Failures that indicate the provider is overloaded and should see less concurrency
+    OVERLOAD_FAILURE_TYPES = (FailureType.RATE_LIMIT, FailureType.TIMEOUT)
+    
     def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
         """Initialize the execution agent.
         
@@ -61,7 +81,8 @@ class BaseExecutionAgent(ExecutionAgent):
         Returns:
             AgentResponse: The response including content and self-assessment
         """
-        start_time = time.time()
+        clock = get_clock()
+        start_time = clock.time()
         model_id = model.get_model_id()
         
         logger.info(f"Executing subtask {subtask.id} with model {model_id}")
@@ -82,10 +103,19 @@ class BaseExecutionAgent(ExecutionAgent):
                 subtask, model_id, "Model is temporarily isolated", start_time
             )
         
+        if is_cancelled():
+            logger.info(f"Execution of subtask {subtask.id} on {model_id} cancelled before starting")
+            return self._create_failure_response(subtask, model_id, "Execution cancelled", start_time)
+        
         last_error = None
         recovery_action = None
         
+        # First attempts earn retry budget for the provider
+        resilience_manager.retry_budget.record_attempt(self._get_model_provider(model_id))
+        
         for attempt in range(self.max_retries + 1):
+            limiter = None
+            call_start = call_time = None
             try:
                 self._execution_history[execution_key]["attempts"] = attempt + 1
                 
@@ -94,18 +124,36 @@ class BaseExecutionAgent(ExecutionAgent):
                 allowed, wait_time = rate_limit_manager.check_rate_limit(provider)
                 if not allowed:
                     logger.info(f"Rate limit hit for {provider}, waiting {wait_time:.1f}s")
-                    time.sleep(wait_time)
+                    wait_start = clock.time()
+                    clock.sleep(wait_time)
+                    tracer.record_span("rate_limit_wait", wait_start, clock.time() - wait_start, provider=provider)
+                
+                # Hold an adaptive concurrency slot for the provider
+                wait_start = clock.time()
+                limiter = concurrency_limiter_manager.acquire(provider)
+                tracer.record_span("concurrency_wait", wait_start, clock.time() - wait_start, provider=provider)
+                call_start = clock.time()
                 
                 # Execute with circuit breaker and timeout
-                response_content = self._execute_with_protection(subtask, model)
+                with tracer.span("model_call", model_id=model_id, attempt=attempt + 1):
+                    response_content = self._execute_with_protection(subtask, model)
                 
-                # Generate self-assessment
-                self_assessment = self.generate_self_assessment(response_content, subtask)
+                call_time = clock.time() - call_start
+                if limiter is not None:
+                    limiter.on_success(call_time)
+                    limiter = None
+                
+                # Generate self-assessment, keeping the text view for later stages
+                text_view = TextView(response_content)
+                self_assessment = self.generate_self_assessment(
+                    response_content, subtask, text_view=text_view
+                )
                 self_assessment.model_used = model_id
-                self_assessment.execution_time = time.time() - start_time
+                self_assessment.execution_time = clock.time() - start_time
+                self._record_model_call(model_id, "success", call_time, self_assessment)
                 
                 # Record successful execution time for adaptive timeouts
-                execution_time = time.time() - start_time
+                execution_time = clock.time() - start_time
                 adaptive_timeout_manager.record_execution_time("model_execution", execution_time)
                 
                 # Create successful response
@@ -123,16 +171,24 @@ class BaseExecutionAgent(ExecutionAgent):
                         "recovery_action": recovery_action.action_type if recovery_action else None
                     }
                 )
+                agent_response.text_view = text_view
                 
                 logger.info(f"Successfully executed subtask {subtask.id} on attempt {attempt + 1}")
                 return agent_response
                 
             except Exception as e:
                 last_error = e
+                if call_start is not None and call_time is None:
+                    self._record_model_call(model_id, "failure", clock.time() - call_start)
                 
                 # Create failure event
                 failure_event = self._create_failure_event(e, subtask, model_id, attempt)
                 
+                if limiter is not None:
+                    limiter.on_failure(
+                        overload=failure_event.failure_type in self.OVERLOAD_FAILURE_TYPES
+                    )
+                
                 # Get recovery action from resilience manager
                 recovery_action = resilience_manager.handle_failure(failure_event)
                 
@@ -141,6 +197,10 @@ class BaseExecutionAgent(ExecutionAgent):
                     f"with model {model_id}: {str(e)} - Recovery: {recovery_action.action_type}"
                 )
                 
+                if is_cancelled():
+                    logger.info(f"Execution of subtask {subtask.id} on {model_id} cancelled, not retrying")
+                    break
+                
                 # Handle recovery action
                 if not recovery_action.should_retry or attempt >= self.max_retries:
                     if recovery_action.fallback_model:
@@ -161,11 +221,29 @@ class BaseExecutionAgent(ExecutionAgent):
                     jitter = random.uniform(0.8, 1.2)  # ±20% jitter
                     delay = recovery_action.retry_delay * jitter
                     logger.info(f"Waiting {delay:.1f}s before retry")
-                    time.sleep(delay)
+                    wait_start = clock.time()
+                    clock.sleep(delay)
+                    tracer.record_span("retry_backoff", wait_start, clock.time() - wait_start, attempt=attempt + 1)
         
         # All attempts failed, return failure response
         return self._create_failure_response(subtask, model_id, str(last_error), start_time)
     
+    def _record_model_call(
+        self,
+        model_id: str,
+        outcome: str,
+        duration: float,
+        self_assessment: Optional[SelfAssessment] = None
+    ) -> None:
+        """Record one call attempt, and its token usage and cost if it succeeded."""
+        _model_calls.labels(model_id, outcome).inc()
+        _model_call_seconds.labels(model_id).observe(duration)
+        if self_assessment is not None:
+            if self_assessment.token_usage > 0:
+                _model_tokens.labels(model_id).inc(self_assessment.token_usage)
+            if self_assessment.estimated_cost > 0:
+                _model_cost.labels(model_id).inc(self_assessment.estimated_cost)
+    
     def _execute_with_protection(self, subtask: Subtask, model: AIModel) -> str:
         """Execute model call with circuit breaker and timeout protection."""
         def protected_call():
@@ -234,7 +312,9 @@ class BaseExecutionAgent(ExecutionAgent):
             severity=severity,
             context={
                 "error_type": error_type_name,
+                "provider": self._get_model_provider(model_id),
                 "attempt": attempt + 1,
+                "final_attempt": attempt >= self.max_retries,
                 "subtask_content_length": len(subtask.content),
                 "task_type": subtask.task_type.value if subtask.task_type else None
             }
@@ -252,7 +332,7 @@ class BaseExecutionAgent(ExecutionAgent):
         # This is a simplified implementation - in practice, you'd need to
         # get the actual fallback model instance from a registry
         # For now, return a degraded response
-        execution_time = time.time() - original_start_time
+        execution_time = get_clock().time() - original_start_time
         
         return AgentResponse(
             subtask_id=subtask.id,
@@ -281,7 +361,7 @@ class BaseExecutionAgent(ExecutionAgent):
         start_time: float
     ) -> AgentResponse:
         """Create response for skipped subtask."""
-        execution_time = time.time() - start_time
+        execution_time = get_clock().time() - start_time
         
         return AgentResponse(
             subtask_id=subtask.id,
@@ -311,7 +391,7 @@ class BaseExecutionAgent(ExecutionAgent):
         start_time: float
     ) -> AgentResponse:
         """Create failure response."""
-        execution_time = time.time() - start_time
+        execution_time = get_clock().time() - start_time
         
         return AgentResponse(
             subtask_id=subtask.id,
@@ -346,24 +426,33 @@ class BaseExecutionAgent(ExecutionAgent):
         else:
             return "default"
     
-    def generate_self_assessment(self, response: str, subtask: Subtask) -> SelfAssessment:
+    def generate_self_assessment(
+        self,
+        response: str,
+        subtask: Subtask,
+        text_view: Optional[TextView] = None
+    ) -> SelfAssessment:
         """Generate a self-assessment of the agent's performance.
         
         Args:
             response: The generated response content
             subtask: The subtask that was executed
+            text_view: Optional cached view of the response to analyze
             
         Returns:
             SelfAssessment: Structured self-assessment metadata
         """
+        if text_view is None:
+            text_view = TextView(response)
+        
         # Calculate confidence based on response quality indicators
-        confidence_score = self._calculate_confidence(response, subtask)
+        confidence_score = self._calculate_confidence(response, subtask, text_view)
         
         # Determine risk level based on task characteristics and confidence
         risk_level = self._assess_risk_level(confidence_score, subtask)
         
         # Extract assumptions from the response
-        assumptions = self._extract_assumptions(response, subtask)
+        assumptions = self._extract_assumptions(response, subtask, text_view)
         
         # Estimate cost (simplified - would integrate with actual model pricing)
         estimated_cost = self._estimate_cost(response, subtask)
@@ -535,20 +624,29 @@ class BaseExecutionAgent(ExecutionAgent):
         
         return temperature
     
-    def _calculate_confidence(self, response: str, subtask: Subtask) -> float:
+    def _calculate_confidence(
+        self,
+        response: str,
+        subtask: Subtask,
+        text_view: Optional[TextView] = None
+    ) -> float:
         """Calculate confidence score based on response characteristics.
         
         Args:
-            response: The generated response
+            response: The generated response content
             subtask: The subtask that was executed
+            text_view: Optional cached view of the response, built if omitted
             
         Returns:
             float: Confidence score between 0.0 and 1.0
         """
+        if text_view is None:
+            text_view = TextView(response)
+        
         confidence = 0.5  # Base confidence
         
         # Adjust based on response length (too short or too long may indicate issues)
-        response_length = len(response.strip())
+        response_length = text_view.stripped_length
         if 50 <= response_length <= 2000:
             confidence += 0.2
         elif response_length < 10:
@@ -560,8 +658,7 @@ class BaseExecutionAgent(ExecutionAgent):
             "i don't know", "unclear", "uncertain", "not confident"
         ]
         
-        response_lower = response.lower()
-        uncertainty_count = sum(1 for phrase in uncertainty_phrases if phrase in response_lower)
+        uncertainty_count = text_view.count_present(uncertainty_phrases)
         confidence -= min(0.3, uncertainty_count * 0.1)
         
         # Check for confidence indicators
@@ -570,7 +667,7 @@ class BaseExecutionAgent(ExecutionAgent):
             "confirmed", "verified", "established"
         ]
         
-        confidence_count = sum(1 for phrase in confidence_phrases if phrase in response_lower)
+        confidence_count = text_view.count_present(confidence_phrases)
         confidence += min(0.2, confidence_count * 0.05)
         
         # Ensure confidence is within bounds
@@ -606,16 +703,25 @@ class BaseExecutionAgent(ExecutionAgent):
         # High confidence - maintain or reduce risk
         return base_risk
     
-    def _extract_assumptions(self, response: str, subtask: Subtask) -> list[str]:
+    def _extract_assumptions(
+        self,
+        response: str,
+        subtask: Subtask,
+        text_view: Optional[TextView] = None
+    ) -> list[str]:
         """Extract assumptions made in the response.
         
         Args:
-            response: The generated response
+            response: The generated response content
             subtask: The subtask that was executed
+            text_view: Optional cached view of the response, built if omitted
             
         Returns:
             List[str]: List of identified assumptions
         """
+        if text_view is None:
+            text_view = TextView(response)
+        
         assumptions = []
         
         # Look for assumption indicators
@@ -624,11 +730,12 @@ class BaseExecutionAgent(ExecutionAgent):
             "taking for granted", "based on the assumption"
         ]
         
-        response_lower = response.lower()
-        sentences = response.split('.')
+        if not text_view.contains_any(assumption_patterns):
+            sentences = []
+        else:
+            sentences = zip(text_view.sentences, text_view.lower_sentences)
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower().strip()
+        for sentence, sentence_lower in sentences:
             for pattern in assumption_patterns:
                 if pattern in sentence_lower:
                     # Clean up the assumption text
@@ -1,10 +1,10 @@
 """Mock AI model implementations for testing and development."""
 
-import time
 import random
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
+from ..core.clock import Clock, get_clock
 from ..core.interfaces import AIModel, ModelError
 
 
@@ -31,7 +31,8 @@ class MockAIModel(AIModel):
         response_template: Optional[str] = None,
         failure_rate: float = 0.0,
         response_delay: float = 0.1,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        clock: Optional[Clock] = None
     ):
         """Initialize mock AI model.
         
@@ -42,6 +43,7 @@ class MockAIModel(AIModel):
             failure_rate: Probability of failure (0.0 to 1.0)
             response_delay: Delay in seconds before responding
             max_tokens: Maximum tokens the model can generate
+            clock: Clock to wait and measure in (defaults to the process clock)
         """
         self.model_id = model_id
         self.behavior = behavior
@@ -49,6 +51,7 @@ class MockAIModel(AIModel):
         self.failure_rate = max(0.0, min(1.0, failure_rate))
         self.response_delay = max(0.0, response_delay)
         self.max_tokens = max_tokens
+        self._clock = clock
         
         # Track usage statistics
         self.request_count = 0
@@ -62,6 +65,11 @@ class MockAIModel(AIModel):
         self._rate_limit_window = 60.0  # 1 minute window
         self._max_requests_per_window = 100
     
+    @property
+    def clock(self) -> Clock:
+        """Clock the model's delays and rate limit window use."""
+        return self._clock or get_clock()
+    
     def generate_response(self, prompt: str, **kwargs) -> str:
         """Generate a response from the mock AI model.
         
@@ -75,7 +83,7 @@ class MockAIModel(AIModel):
         Raises:
             ModelError: When the model fails based on its behavior configuration
         """
-        start_time = time.time()
+        start_time = self.clock.time()
         self.request_count += 1
         
         try:
@@ -87,20 +95,20 @@ class MockAIModel(AIModel):
             
             # Simulate processing delay
             if self.response_delay > 0:
-                time.sleep(self.response_delay)
+                self.clock.sleep(self.response_delay)
             
             # Generate response based on template and parameters
             response = self._generate_mock_response(prompt, **kwargs)
             
             # Track success
             self.success_count += 1
-            self.total_response_time += time.time() - start_time
+            self.total_response_time += self.clock.time() - start_time
             
             return response
             
         except Exception as e:
             self.failure_count += 1
-            self.total_response_time += time.time() - start_time
+            self.total_response_time += self.clock.time() - start_time
             raise e
     
     def get_model_id(self) -> str:
@@ -141,7 +149,7 @@ class MockAIModel(AIModel):
     
     def _check_rate_limit(self) -> None:
         """Check if request should be rate limited."""
-        current_time = time.time()
+        current_time = self.clock.time()
         
         # Reset window if needed
         if current_time - self._last_request_time > self._rate_limit_window:
@@ -215,7 +223,7 @@ class MockAIModel(AIModel):
         
         elif self.behavior == MockModelBehavior.SLOW:
             # Add extra delay for slow behavior
-            time.sleep(2.0)
+            self.clock.sleep(2.0)
         
         elif self.behavior == MockModelBehavior.FAST:
             # Reduce delay for fast behavior
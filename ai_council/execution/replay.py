@@ -0,0 +1,439 @@
+"""Record provider traffic from real runs and replay it without network access.
+
+:class:`RecordingModel` wraps any :class:`AIModel` and appends each call's
+prompt, parameters, response or error, estimated token usage and latency to
+a capture file. :class:`ReplayModel` serves those calls back with their
+recorded latency, so load tests and profiles of the orchestration layer see
+realistic, repeatable model behavior.
+
+A capture file is a magic header followed by length-prefixed records, each
+holding compact JSON (zlib-compressed when that pays off) behind the 64-bit
+hash of its model and prompt. Replay memory-maps the capture together with
+an open-addressing hash table over those hashes, kept next to it as
+``<capture>.idx`` and rebuilt whenever the capture has grown. A lookup reads
+a few index slots and one record, so captures of several gigabytes replay
+without being loaded into memory.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..core.clock import Clock, get_clock
+from ..core.interfaces import AIModel, ModelError
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CAPTURE_FILENAME = "provider_traffic.cap"
+INDEX_SUFFIX = ".idx"
+
+_CAPTURE_MAGIC = b"AICCAP1\n"
+_INDEX_MAGIC = b"AICIDX1\n"
+# Payload length, flags and key hash of each record
+_RECORD_HEADER = struct.Struct("<IBQ")
+# Magic, capture size covered, slot count and record count
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+# Key hash and record offset; a zero key marks an empty slot
+_SLOT = struct.Struct("<QQ")
+_FLAG_ZLIB = 1
+_COMPRESS_MIN_BYTES = 256
+
+
+def prompt_key(model_id: str, prompt: str) -> int:
+    """Non-zero 64-bit hash of a model and prompt, the key replay looks calls up by."""
+    digest = hashlib.blake2b(f"{model_id}\0{prompt}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text (about four characters per token)."""
+    return len(text) // 4
+
+
+@dataclass
+class CapturedCall:
+    """One recorded model call."""
+    model_id: str
+    prompt: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    response: Optional[str] = None  # None when the call failed
+    latency: float = 0.0  # Seconds
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+    recorded_at: float = 0.0  # Seconds since the epoch
+
+    @property
+    def failed(self) -> bool:
+        """Whether the call raised instead of responding."""
+        return self.error_type is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Call as plain JSON-compatible values."""
+        return {
+            "model_id": self.model_id,
+            "prompt": self.prompt,
+            "params": self.params,
+            "response": self.response,
+            "latency": self.latency,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "error_type": self.error_type,
+            "error_message": self.error_message,
+            "recorded_at": self.recorded_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CapturedCall":
+        """Rebuild a call from :meth:`to_dict` output."""
+        return cls(**data)
+
+
+class CaptureWriter:
+    """Appends recorded calls to a capture file; safe to share between threads."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a capture file for appending, creating it if needed.
+
+        Args:
+            path: Capture file path
+
+        Raises:
+            ValueError: If the file exists but is not a capture file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with open(self.path, "rb") as f:
+                if f.read(len(_CAPTURE_MAGIC)) != _CAPTURE_MAGIC:
+                    raise ValueError(f"{self.path} is not a capture file")
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_CAPTURE_MAGIC)
+        self._lock = threading.Lock()
+        self.records_written = 0
+
+    def write(self, call: CapturedCall) -> int:
+        """
+        Append a call and flush it to disk.
+
+        Returns:
+            int: Offset of the record in the file
+        """
+        payload = json.dumps(call.to_dict(), separators=(",", ":"), default=str).encode("utf-8")
+        flags = 0
+        if len(payload) >= _COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                payload, flags = compressed, _FLAG_ZLIB
+        header = _RECORD_HEADER.pack(len(payload), flags, prompt_key(call.model_id, call.prompt))
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(header + payload)
+            self._file.flush()
+            self.records_written += 1
+        return offset
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _scan_headers(data: Union[bytes, mmap.mmap], size: int) -> Iterator[Tuple[int, int, int, int]]:
+    """Yield (offset, payload length, flags, key) for each complete record."""
+    offset = len(_CAPTURE_MAGIC)
+    while offset + _RECORD_HEADER.size <= size:
+        length, flags, key = _RECORD_HEADER.unpack_from(data, offset)
+        if offset + _RECORD_HEADER.size + length > size:
+            logger.warning(f"Ignoring truncated capture record at offset {offset}")
+            return
+        yield offset, length, flags, key
+        offset += _RECORD_HEADER.size + length
+
+
+def build_index(capture_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Build the hash index of a capture file.
+
+    The index is written through a memory map in two streaming passes over
+    the record headers, so neither file is loaded into memory.
+
+    Args:
+        capture_path: Capture file to index
+        index_path: Index file (defaults to the capture path plus ``.idx``)
+
+    Returns:
+        Path: The index file
+
+    Raises:
+        ValueError: If the file is not a capture file
+    """
+    capture_path = Path(capture_path)
+    index_path = Path(index_path) if index_path else capture_path.with_name(capture_path.name + INDEX_SUFFIX)
+    with open(capture_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        if data[:len(_CAPTURE_MAGIC)] != _CAPTURE_MAGIC:
+            raise ValueError(f"{capture_path} is not a capture file")
+        count = sum(1 for _ in _scan_headers(data, size))
+        # Keep the table at most half full so probe runs stay short
+        slots = 8
+        while slots < count * 2:
+            slots *= 2
+
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        with open(tmp_path, "w+b") as out:
+            out.truncate(_INDEX_HEADER.size + slots * _SLOT.size)
+            with mmap.mmap(out.fileno(), 0) as index:
+                _INDEX_HEADER.pack_into(index, 0, _INDEX_MAGIC, size, slots, count)
+                for offset, _, _, key in _scan_headers(data, size):
+                    slot = key & (slots - 1)
+                    while _SLOT.unpack_from(index, _INDEX_HEADER.size + slot * _SLOT.size)[0]:
+                        slot = (slot + 1) & (slots - 1)
+                    _SLOT.pack_into(index, _INDEX_HEADER.size + slot * _SLOT.size, key, offset)
+                index.flush()
+    tmp_path.replace(index_path)
+    logger.info(f"Indexed {count} recorded calls in {capture_path}")
+    return index_path
+
+
+class CaptureReader:
+    """Memory-mapped, indexed read access to a capture file."""
+
+    def __init__(self, path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Open a capture file, building or refreshing its index if needed.
+
+        Args:
+            path: Capture file path
+            index_path: Index file (defaults to the capture path plus ``.idx``)
+
+        Raises:
+            FileNotFoundError: If the capture file does not exist
+            ValueError: If the file is not a capture file
+        """
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self._file = open(self.path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(_CAPTURE_MAGIC)] != _CAPTURE_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a capture file")
+
+        if not self._index_is_current():
+            build_index(self.path, self.index_path)
+        self._index_file = open(self.index_path, "rb")
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self._size, self._slots, self._count = _INDEX_HEADER.unpack_from(self._index, 0)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def offsets(self, model_id: str, prompt: str) -> List[int]:
+        """Offsets of the records stored under a model and prompt's key, in recording order."""
+        key = prompt_key(model_id, prompt)
+        found = []
+        slot = key & (self._slots - 1)
+        while True:
+            slot_key, offset = _SLOT.unpack_from(self._index, _INDEX_HEADER.size + slot * _SLOT.size)
+            if slot_key == 0:
+                return found
+            if slot_key == key:
+                found.append(offset)
+            slot = (slot + 1) & (self._slots - 1)
+
+    def read(self, offset: int) -> CapturedCall:
+        """Decode the record at an offset."""
+        length, flags, _ = _RECORD_HEADER.unpack_from(self._data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = self._data[start:start + length]
+        if flags & _FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return CapturedCall.from_dict(json.loads(payload))
+
+    def lookup(self, model_id: str, prompt: str) -> List[CapturedCall]:
+        """All recorded calls of a model with exactly this prompt, in recording order."""
+        calls = [self.read(offset) for offset in self.offsets(model_id, prompt)]
+        return [call for call in calls if call.model_id == model_id and call.prompt == prompt]
+
+    def __iter__(self) -> Iterator[CapturedCall]:
+        """Every indexed call in recording order."""
+        for offset, _, _, _ in _scan_headers(self._data, self._size):
+            yield self.read(offset)
+
+    def model_ids(self) -> List[str]:
+        """Models that appear in the capture, in order of first appearance."""
+        return list(dict.fromkeys(call.model_id for call in self))
+
+    def close(self) -> None:
+        """Unmap and close both files."""
+        for name in ("_index", "_index_file", "_data", "_file"):
+            handle = getattr(self, name, None)
+            if handle is not None:
+                handle.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _index_is_current(self) -> bool:
+        if not self.index_path.exists() or self.index_path.stat().st_size < _INDEX_HEADER.size:
+            return False
+        with open(self.index_path, "rb") as f:
+            magic, size, _, _ = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+        return magic == _INDEX_MAGIC and size == len(self._data)
+
+
+class RecordingModel(AIModel):
+    """Wraps a model and records every call it makes to a capture file."""
+
+    def __init__(self, model: AIModel, writer: CaptureWriter, clock: Optional[Clock] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            model: Model whose traffic is recorded
+            writer: Capture file to record to
+            clock: Clock latencies are measured on (defaults to the process clock)
+        """
+        self.model = model
+        self.writer = writer
+        self._clock = clock
+
+    @property
+    def clock(self) -> Clock:
+        """Clock latencies are measured on."""
+        return self._clock or get_clock()
+
+    def generate_response(self, prompt: str, **kwargs) -> str:
+        """Call the wrapped model and record the outcome, re-raising any error."""
+        start = self.clock.monotonic()
+        try:
+            response = self.model.generate_response(prompt, **kwargs)
+        except Exception as e:
+            self._record(prompt, kwargs, start, None, e)
+            raise
+        self._record(prompt, kwargs, start, response, None)
+        return response
+
+    def get_model_id(self) -> str:
+        return self.model.get_model_id()
+
+    def _record(
+        self,
+        prompt: str,
+        params: Dict[str, Any],
+        start: float,
+        response: Optional[str],
+        error: Optional[Exception]
+    ) -> None:
+        call = CapturedCall(
+            model_id=self.get_model_id(),
+            prompt=prompt,
+            params=params,
+            response=response,
+            latency=self.clock.monotonic() - start,
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(response or ""),
+            recorded_at=self.clock.time()
+        )
+        if error is not None:
+            call.error_type = error.error_type if isinstance(error, ModelError) else type(error).__name__
+            call.error_message = error.error_message if isinstance(error, ModelError) else str(error)
+        try:
+            self.writer.write(call)
+        except Exception as e:
+            # Losing a recording must never fail the call itself
+            logger.warning(f"Failed to record call to {call.model_id}: {str(e)}")
+
+
+class ReplayModel(AIModel):
+    """Serves recorded calls of one model from a capture file, without network access."""
+
+    def __init__(
+        self,
+        model_id: str,
+        reader: CaptureReader,
+        timing: bool = True,
+        clock: Optional[Clock] = None
+    ):
+        """
+        Initialize the replay model.
+
+        Args:
+            model_id: Recorded model to serve
+            reader: Capture file to serve from
+            timing: Whether to wait out each call's recorded latency
+            clock: Clock to wait on (defaults to the process clock)
+        """
+        self.model_id = model_id
+        self.reader = reader
+        self.timing = timing
+        self._clock = clock
+        # Prompts recorded more than once are served in recording order, cycling
+        self._served: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def clock(self) -> Clock:
+        """Clock recorded latencies are waited out on."""
+        return self._clock or get_clock()
+
+    def generate_response(self, prompt: str, **kwargs) -> str:
+        """Return the recorded response to prompt, or re-raise its recorded error.
+
+        Raises:
+            ModelError: The recorded error, or error type "ReplayMiss" if the
+                prompt was never recorded for this model
+        """
+        call = self._next_call(prompt)
+        if call is None:
+            with self._lock:
+                self.misses += 1
+            raise ModelError(self.model_id, "No recorded response for prompt", "ReplayMiss")
+        with self._lock:
+            self.hits += 1
+        if self.timing:
+            self.clock.sleep(call.latency)
+        if call.failed:
+            raise ModelError(self.model_id, call.error_message or "", call.error_type)
+        return call.response or ""
+
+    def get_model_id(self) -> str:
+        return self.model_id
+
+    def _next_call(self, prompt: str) -> Optional[CapturedCall]:
+        offsets = self.reader.offsets(self.model_id, prompt)
+        if not offsets:
+            return None
+        key = prompt_key(self.model_id, prompt)
+        with self._lock:
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        call = self.reader.read(offsets[served % len(offsets)])
+        if call.model_id == self.model_id and call.prompt == prompt:
+            return call
+        # A 64-bit hash collision: fall back to comparing every candidate
+        calls = self.reader.lookup(self.model_id, prompt)
+        return calls[served % len(calls)] if calls else None
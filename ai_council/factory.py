@@ -6,6 +6,7 @@ AI Council components based on the provided configuration.
 """
 
 import logging
+from pathlib import Path
 from typing import Dict, List, Optional
 
 from .core.interfaces import (
@@ -16,24 +17,14 @@ from .core.models import ModelCapabilities, CostProfile, PerformanceMetrics, Tas
 from .utils.config import AICouncilConfig, ModelConfig
 from .utils.logging import get_logger
 
-# Import concrete implementations
-from .orchestration.layer import ConcreteOrchestrationLayer
-from .analysis.engine import BasicAnalysisEngine
-from .analysis.decomposer import BasicTaskDecomposer
-from .routing.registry import ModelRegistryImpl
-from .routing.context_protocol import ModelContextProtocolImpl
-from .execution.agent import BaseExecutionAgent
-from .execution.mock_models import MockModelFactory
-from .arbitration.layer import ConcreteArbitrationLayer
-from .synthesis.layer import SynthesisLayerImpl
-
 
 class AICouncilFactory:
     """
     Factory class for creating and wiring AI Council components.
     
     This factory handles dependency injection and component configuration
-    based on the provided configuration.
+    based on the provided configuration. Concrete implementations are imported
+    and built on first use, so creating a factory stays cheap.
     """
     
     def __init__(self, config: AICouncilConfig):
@@ -55,6 +46,10 @@ class AICouncilFactory:
         self._arbitration_layer: Optional[ArbitrationLayer] = None
         self._synthesis_layer: Optional[SynthesisLayer] = None
         
+        # Capture file shared by every recording or replaying model
+        self._capture_writer = None
+        self._capture_reader = None
+        
         self.logger.info("AI Council factory initialized")
     
     @property
@@ -113,6 +108,8 @@ class AICouncilFactory:
         Returns:
             OrchestrationLayer: Fully configured orchestration layer
         """
+        from .orchestration.layer import ConcreteOrchestrationLayer
+        
         self.logger.info("Creating orchestration layer with all dependencies")
         
         # Create orchestration layer with all dependencies
@@ -125,7 +122,13 @@ class AICouncilFactory:
             synthesis_layer=self.synthesis_layer,
             model_registry=self.model_registry,
             max_retries=self.config.execution.max_retries,
-            timeout_seconds=self.config.execution.default_timeout_seconds
+            timeout_seconds=self.config.execution.default_timeout_seconds,
+            quality_thresholds={
+                mode_config.mode: mode_config.quality_threshold
+                for mode_config in self.config.execution_modes.values()
+                if mode_config.quality_threshold is not None
+            },
+            max_parallel_executions=self.config.execution.max_parallel_executions
         )
         
         self.logger.info("Orchestration layer created successfully")
@@ -133,6 +136,8 @@ class AICouncilFactory:
     
     def _create_model_registry(self) -> ModelRegistry:
         """Create and configure the model registry."""
+        from .routing.registry import ModelRegistryImpl
+        
         self.logger.info("Creating model registry")
         
         registry = ModelRegistryImpl()
@@ -144,8 +149,8 @@ class AICouncilFactory:
                 continue
             
             try:
-                # Create model instance
-                model = self._create_model_instance(model_name, model_config)
+                # Create model instance, recording or replaying its traffic if configured
+                model = self._create_captured_model(model_name, model_config)
                 
                 # Create capabilities
                 capabilities = self._create_model_capabilities(model_config)
@@ -189,9 +194,32 @@ class AICouncilFactory:
         self.logger.info("Model registry created successfully")
         return registry
     
+    def _create_captured_model(self, model_name: str, model_config: ModelConfig) -> AIModel:
+        """Create a model instance, wrapped for recording or replaced by a replay."""
+        mode = self.config.replay.mode
+        if mode == "off":
+            return self._create_model_instance(model_name, model_config)
+        
+        from .execution.replay import (
+            DEFAULT_CAPTURE_FILENAME, CaptureReader, CaptureWriter, RecordingModel, ReplayModel
+        )
+        path = self.config.replay.path or Path(self.config.data_dir) / DEFAULT_CAPTURE_FILENAME
+        
+        if mode == "replay":
+            if self._capture_reader is None:
+                self._capture_reader = CaptureReader(path)
+                self.logger.info(f"Replaying {len(self._capture_reader)} recorded calls from {path}")
+            return ReplayModel(model_name, self._capture_reader, timing=self.config.replay.timing)
+        
+        if self._capture_writer is None:
+            self._capture_writer = CaptureWriter(path)
+            self.logger.info(f"Recording provider traffic to {path}")
+        return RecordingModel(self._create_model_instance(model_name, model_config), self._capture_writer)
+    
     def _create_model_instance(self, model_name: str, model_config: ModelConfig) -> AIModel:
         """Create a model instance based on configuration."""
         import os
+        from .execution.mock_models import MockModelFactory
         
         # Try to import real adapters
         try:
@@ -203,7 +231,9 @@ class AICouncilFactory:
             if api_key:
                 # Create real model adapter
                 self.logger.info(f"Creating real {model_config.provider} adapter for {model_name}")
-                return create_model_adapter(model_config.provider, model_name, api_key)
+                return create_model_adapter(
+                    model_config.provider, model_name, api_key, model_config.base_url
+                )
             else:
                 self.logger.warning(f"No API key found for {model_name}, using mock model")
         except ImportError:
@@ -269,6 +299,8 @@ class AICouncilFactory:
     
     def _register_default_mock_models(self, registry: ModelRegistry):
         """Register default mock models for testing."""
+        from .execution.mock_models import MockModelFactory
+        
         default_models = [
             (MockModelFactory.create_specialized_model("mock-gpt-4", "reasoning", "high"),
              ModelCapabilities(
@@ -327,46 +359,59 @@ class AICouncilFactory:
     
     def _create_analysis_engine(self) -> AnalysisEngine:
         """Create the analysis engine."""
+        from .analysis.engine import BasicAnalysisEngine
+        
         self.logger.info("Creating analysis engine")
         return BasicAnalysisEngine()
     
     def _create_task_decomposer(self) -> TaskDecomposer:
         """Create the task decomposer."""
+        from .analysis.decomposer import BasicTaskDecomposer
+        
         self.logger.info("Creating task decomposer")
         return BasicTaskDecomposer()
     
     def _create_model_context_protocol(self) -> ModelContextProtocol:
         """Create the model context protocol."""
+        from .routing.context_protocol import ModelContextProtocolImpl
+        
         self.logger.info("Creating model context protocol")
         return ModelContextProtocolImpl(self.model_registry)
     
     def _create_execution_agent(self) -> ExecutionAgent:
         """Create the execution agent."""
+        from .execution.agent import BaseExecutionAgent
+        
         self.logger.info("Creating execution agent")
         return BaseExecutionAgent()
     
     def _create_arbitration_layer(self) -> ArbitrationLayer:
         """Create the arbitration layer."""
+        from .arbitration.layer import ConcreteArbitrationLayer, NoOpArbitrationLayer
+        
         self.logger.info("Creating arbitration layer")
         
         # Check if arbitration is enabled in config
         if not self.config.execution.enable_arbitration:
             self.logger.info("Arbitration disabled in configuration")
             # Return a no-op arbitration layer that just passes through responses
-            from .arbitration.layer import NoOpArbitrationLayer
             return NoOpArbitrationLayer()
         
-        return ConcreteArbitrationLayer()
+        return ConcreteArbitrationLayer(
+            max_workers=self.config.execution.max_parallel_executions,
+            use_processes=self.config.execution.arbitration_use_processes
+        )
     
     def _create_synthesis_layer(self) -> SynthesisLayer:
         """Create the synthesis layer."""
+        from .synthesis.layer import NoOpSynthesisLayer, SynthesisLayerImpl
+        
         self.logger.info("Creating synthesis layer")
         
         # Check if synthesis is enabled in config
         if not self.config.execution.enable_synthesis:
             self.logger.info("Synthesis disabled in configuration")
             # Return a no-op synthesis layer that just returns the first response
-            from .synthesis.layer import NoOpSynthesisLayer
             return NoOpSynthesisLayer()
         
         return SynthesisLayerImpl()
@@ -410,9 +455,9 @@ class AICouncilFactory:
         if not enabled_models:
             issues.append("No models are enabled in configuration")
         
-        # Check for required environment variables
+        # Check for required environment variables; replayed models make no API calls
         for model_name, model_config in self.config.models.items():
-            if model_config.enabled and model_config.api_key_env:
+            if model_config.enabled and model_config.api_key_env and self.config.replay.mode != "replay":
                 import os
                 if not os.getenv(model_config.api_key_env):
                     issues.append(f"Environment variable {model_config.api_key_env} not set for model {model_name}")
@@ -10,9 +10,9 @@ for processing user requests.
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union
 
-from .core.models import ExecutionMode, FinalResponse
+from .core.models import ExecutionMode, FinalResponse, SynthesisSection
 from .core.exceptions import (
     AICouncilError, ConfigurationError, ModelTimeoutError, 
     AuthenticationError, RateLimitError, ProviderError, 
@@ -20,8 +20,10 @@ from .core.exceptions import (
 )
 from .core.interfaces import OrchestrationLayer
 from .utils.config import AICouncilConfig, load_config
-from .utils.logging import configure_logging, get_logger
-from .factory import AICouncilFactory
+
+# Logging, the factory, resilience, shared state, tracing and profiling modules
+# are imported where they are first used, so importing this module (the CLI
+# and web entry point) stays cheap
 
 
 class AICouncil:
@@ -39,6 +41,8 @@ class AICouncil:
         Args:
             config_path: Optional path to configuration file
         """
+        from .utils.logging import configure_logging, get_logger
+        
         # Load configuration
         self.config = load_config(config_path)
         
@@ -53,6 +57,13 @@ class AICouncil:
         self.logger = get_logger(__name__)
         self.logger.info("Initializing AI Council application")
         
+        from .core.concurrency_limiter import concurrency_limiter_manager
+        from .core.failure_handling import RetryBudgetConfig, resilience_manager
+        from .core.profiling import DEFAULT_PROFILE_DIRNAME, request_profiler
+        from .core.shared_state import configure_shared_state, create_shared_state_backend
+        from .core.tracing import create_span_exporter, tracer
+        from .factory import AICouncilFactory
+        
         # Create factory for dependency injection
         self.factory = AICouncilFactory(self.config)
         
@@ -63,11 +74,63 @@ class AICouncil:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg)
         
-        # Initialize orchestration layer
-        self.orchestration_layer: OrchestrationLayer = self.factory.create_orchestration_layer()
+        # Share resilience state across worker processes if configured
+        self.shared_state = create_shared_state_backend(
+            self.config.resilience.shared_state_backend,
+            self.config.data_dir,
+            self.config.resilience.shared_state_path
+        )
+        if self.shared_state is not None:
+            configure_shared_state(self.shared_state)
+        
+        concurrency_limiter_manager.configure(
+            enabled=self.config.resilience.adaptive_concurrency,
+            initial_limit=self.config.resilience.initial_concurrency,
+            min_limit=self.config.resilience.min_concurrency,
+            max_limit=self.config.resilience.max_concurrency
+        )
+        resilience_manager.retry_budget.configure(RetryBudgetConfig(
+            retry_ratio=self.config.resilience.retry_budget_ratio,
+            min_retries=self.config.resilience.retry_budget_min_retries,
+            window_seconds=self.config.resilience.retry_budget_window_seconds
+        ))
+        
+        span_exporter = create_span_exporter(
+            self.config.tracing.exporter,
+            self.config.data_dir,
+            self.config.tracing.jsonl_path,
+            self.config.tracing.otlp_endpoint,
+            self.config.tracing.service_name
+        )
+        tracer.configure(
+            enabled=self.config.tracing.enabled,
+            exporters=[span_exporter] if span_exporter else []
+        )
+        request_profiler.configure(
+            enabled=self.config.profiling.enabled,
+            mode=self.config.profiling.mode,
+            sample_rate=self.config.profiling.sample_rate,
+            interval=self.config.profiling.interval_ms / 1000,
+            directory=self.config.profiling.path or Path(self.config.data_dir) / DEFAULT_PROFILE_DIRNAME,
+            allow_forced=self.config.profiling.allow_header
+        )
+        
+        # The orchestration layer is built on first use to keep startup fast
+        self._orchestration_layer: Optional[OrchestrationLayer] = None
         
         self.logger.info("AI Council application initialized successfully")
     
+    @property
+    def orchestration_layer(self) -> OrchestrationLayer:
+        """Get or create the orchestration layer and its components."""
+        if self._orchestration_layer is None:
+            self._orchestration_layer = self.factory.create_orchestration_layer()
+        return self._orchestration_layer
+    
+    @orchestration_layer.setter
+    def orchestration_layer(self, layer: OrchestrationLayer) -> None:
+        self._orchestration_layer = layer
+    
     def process_request(
         self, 
         user_input: str, 
@@ -187,6 +250,81 @@ class AICouncil:
                 models_used=[]
             )
     
+    def process_request_stream(
+        self,
+        user_input: str,
+        execution_mode: ExecutionMode = ExecutionMode.BALANCED
+    ) -> Iterator[Union[SynthesisSection, FinalResponse]]:
+        """
+        Process a user request, yielding response sections as soon as they are ready.
+        
+        Args:
+            user_input: The user's request as a string
+            execution_mode: The execution mode to use
+            
+        Yields:
+            SynthesisSection objects in order, then the FinalResponse. Errors are
+            reported as a failed FinalResponse, as in process_request.
+        """
+        self.logger.info(f"Streaming request in {execution_mode.value} mode")
+        
+        try:
+            for item in self.orchestration_layer.process_request_stream(user_input, execution_mode):
+                if isinstance(item, FinalResponse) and not item.success:
+                    self.logger.warning(f"Request processing failed: {item.error_message}")
+                yield item
+        except AICouncilError as e:
+            known_errors = (
+                ConfigurationError, ValidationError, AuthenticationError, ModelTimeoutError,
+                RateLimitError, ProviderError, OrchestrationError
+            )
+            error_type = type(e).__name__ if isinstance(e, known_errors) else "AICouncilError"
+            self.logger.error(f"{error_type} while streaming request: {str(e)}")
+            yield FinalResponse(
+                content="",
+                overall_confidence=0.0,
+                success=False,
+                error_message=str(e),
+                error_type=error_type,
+                models_used=[]
+            )
+        except Exception as e:
+            self.logger.error(f"Unexpected error streaming request: {str(e)}")
+            yield FinalResponse(
+                content="",
+                overall_confidence=0.0,
+                success=False,
+                error_message=f"System error: {str(e)}",
+                error_type="SystemError",
+                models_used=[]
+            )
+    
+    def process_batch(
+        self,
+        inputs: Iterable[str],
+        execution_mode: ExecutionMode = ExecutionMode.BALANCED,
+        concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[int, FinalResponse]]:
+        """
+        Process many user requests concurrently, yielding results as they finish.
+        
+        Args:
+            inputs: The users' requests, read lazily
+            execution_mode: The execution mode for every request
+            concurrency: Requests in progress at once (defaults to the configured
+                max_parallel_executions)
+            
+        Yields:
+            Tuples of (input index, FinalResponse) in completion order. Failed
+            requests are reported as failed FinalResponses.
+        """
+        self.logger.info(f"Processing batch in {execution_mode.value} mode")
+        
+        for index, response in self.orchestration_layer.process_batch(inputs, execution_mode, concurrency):
+            if not response.success:
+                self.logger.warning(f"Batch request {index} failed: {response.error_message}")
+            yield index, response
+    
     def estimate_cost(self, user_input: str, execution_mode: ExecutionMode = ExecutionMode.BALANCED) -> Dict[str, Any]:
         """
         Estimate the cost and time for processing a request.
@@ -271,14 +409,18 @@ class AICouncil:
                                 if task_type not in m["capabilities"]:
                                     m["capabilities"].append(task_type)
             
-            # Get resilience manager status
+            from .core.concurrency_limiter import concurrency_limiter_manager
             from .core.failure_handling import resilience_manager
+            
+            # Get resilience manager status
             health_status = resilience_manager.health_check()
             
             return {
                 "status": "operational",
                 "available_models": available_models,
                 "health": health_status,
+                "concurrency_limits": concurrency_limiter_manager.get_limits(),
+                "retry_budget": resilience_manager.retry_budget.get_statistics(),
                 "configuration": {
                     "default_execution_mode": self.config.execution.default_mode.value,
                     "max_parallel_executions": self.config.execution.max_parallel_executions,
@@ -302,8 +444,18 @@ class AICouncil:
         # Perform any cleanup operations
         try:
             # Close any open resources
-            # Note: ResilienceManager doesn't have reset_all_circuit_breakers method
-            # Just log successful shutdown
+            if self.shared_state is not None:
+                from .core.shared_state import configure_shared_state
+                configure_shared_state(None)
+                self.shared_state.close()
+            
+            if self._orchestration_layer is not None:
+                self._orchestration_layer.shutdown()
+            
+            # Flush spans still waiting to be exported
+            from .core.tracing import tracer
+            tracer.configure(enabled=tracer.enabled, exporters=[])
+            
             self.logger.info("AI Council application shutdown complete")
             
         except Exception as e:
@@ -323,9 +475,24 @@ def main():
     args = cli_handler.parse_args()
     
     try:
+        # Handle profiles subcommand, which only reads profile files
+        if args.command == "profiles":
+            from .core.profiling import DEFAULT_PROFILE_DIRNAME
+            config = load_config(args.config)
+            inputs = args.input or [
+                Path(config.profiling.path or Path(config.data_dir) / DEFAULT_PROFILE_DIRNAME)
+            ]
+            cli_handler.handle_profiles(inputs, args.output, args.since_minutes, args.frame)
+            return
+        
         # Initialize AI Council
         ai_council = AICouncil(args.config)
         
+        # Handle batch subcommand
+        if args.command == "batch":
+            cli_handler.handle_batch(ai_council, args.input, args.output, args.mode, args.concurrency)
+            return
+        
         # Handle status request
         if args.status:
             cli_handler.print_system_status(ai_council)
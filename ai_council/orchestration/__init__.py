@@ -1,6 +1,16 @@
 """Orchestration layer components."""
 
-from .layer import ConcreteOrchestrationLayer
-from .cost_optimizer import CostOptimizer
+from typing import TYPE_CHECKING
 
-__all__ = ['ConcreteOrchestrationLayer', 'CostOptimizer']
\ No newline at end of file
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .layer import ConcreteOrchestrationLayer
+    from .cost_optimizer import CostOptimizer
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ConcreteOrchestrationLayer": ".layer",
+    "CostOptimizer": ".cost_optimizer",
+})
+
+__all__ = ['ConcreteOrchestrationLayer', 'CostOptimizer']
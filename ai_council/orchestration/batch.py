@@ -0,0 +1,250 @@
+"""Batch scheduling of many requests through one bounded worker pool."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.exceptions import AICouncilError, ModelTimeoutError
+from ..core.models import (
+    AgentResponse, CostBreakdown, ExecutionMetadata, ExecutionMode, FinalResponse, Subtask,
+    replace_unvalidated
+)
+from ..core.timeout_handler import TimeoutError
+from ..core.tracing import Trace, tracer
+
+if TYPE_CHECKING:
+    from .layer import ConcreteOrchestrationLayer
+
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchItem:
+    """Progress of one distinct input through planning, execution and synthesis."""
+
+    def __init__(self, user_input: str, index: int, trace: Optional[Trace]):
+        self.user_input = user_input
+        self.indices = [index]
+        self.trace = trace
+        self.metadata = ExecutionMetadata()
+        self.start_time = time.time()
+        self.groups: List[List[Subtask]] = []
+        self.group_index = -1
+        self.pending = 0
+        self.group_responses: List[AgentResponse] = []
+        self.failed_groups = 0
+        self.responses: List[AgentResponse] = []
+
+
+class BatchScheduler:
+    """
+    Runs many requests through one pool, sharing work between them.
+
+    Identical inputs are analyzed, planned and executed once and share their
+    result. Subtasks with the same content and routing attributes, from any
+    item, run once and their responses are copied to every waiting subtask.
+    Planning, subtask execution and synthesis of all items are jobs on a single
+    pool of ``max_workers`` threads, so items overlap instead of running back
+    to back. Each item still runs its plan's parallel groups in order.
+    
+    Every item gets its own trace, including the time each job waited for a
+    worker. A shared subtask is traced under the item that first needed it.
+    """
+
+    def __init__(
+        self,
+        orchestration_layer: "ConcreteOrchestrationLayer",
+        execution_mode: ExecutionMode,
+        max_workers: int = 4,
+        max_in_flight: Optional[int] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            orchestration_layer: Layer whose stages run the items
+            execution_mode: The execution mode for every item
+            max_workers: Jobs run concurrently across all items
+            max_in_flight: Distinct inputs held in progress at once; further
+                inputs are only read as earlier ones finish (defaults to
+                four per worker)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.layer = orchestration_layer
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or max_workers * 4
+
+    def run(self, inputs: Iterable[str]) -> Iterator[Tuple[int, FinalResponse]]:
+        """
+        Process the inputs, yielding results in completion order.
+
+        Args:
+            inputs: Raw user inputs, read lazily
+
+        Yields:
+            Tuples of (input index, FinalResponse)
+        """
+        source = enumerate(inputs)
+        items: Dict[str, _BatchItem] = {}
+        waiters: Dict[Hashable, List[Tuple[_BatchItem, Subtask]]] = {}
+        jobs: Dict[Future, Tuple[str, Any]] = {}
+        exhausted = False
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch")
+
+        def submit(kind: str, payload: Any, trace: Optional[Trace], fn, *args) -> None:
+            job = tracer.bind(fn, "queue_wait", trace=trace, job=kind) if trace is not None else fn
+            jobs[pool.submit(job, *args)] = (kind, payload)
+
+        def advance(item: _BatchItem) -> None:
+            """Start the item's next parallel group, or its synthesis once all are done."""
+            while True:
+                if item.group_index >= 0:
+                    if item.group_responses:
+                        success_rate = sum(1 for resp in item.group_responses if resp.success) / len(item.group_responses)
+                        if success_rate < 0.5:
+                            item.failed_groups += 1
+                            logger.warning(f"Group {item.group_index} had low success rate: {success_rate:.1%}")
+                    if (item.failed_groups / (item.group_index + 1) > 0.5
+                            and self.execution_mode == ExecutionMode.FAST):
+                        logger.warning("Too many group failures in FAST mode, stopping execution")
+                        break
+                item.group_index += 1
+                item.group_responses = []
+                if item.group_index >= len(item.groups):
+                    break
+                group = item.groups[item.group_index]
+                if not group:
+                    continue
+                item.pending = len(group)
+                for subtask in group:
+                    key = self._subtask_key(subtask)
+                    if key in waiters:
+                        waiters[key].append((item, subtask))
+                    else:
+                        waiters[key] = [(item, subtask)]
+                        submit("subtask", key, item.trace, self._execute_subtask, subtask)
+                return
+            submit("finalize", item, item.trace, self._finalize, item)
+
+        try:
+            while True:
+                while not exhausted and len(items) < self.max_in_flight:
+                    try:
+                        index, user_input = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if user_input in items:
+                        items[user_input].indices.append(index)
+                        continue
+                    trace = tracer.start_trace(
+                        "request", {"execution_mode": self.execution_mode.value, "batch_index": index}
+                    )
+                    item = items[user_input] = _BatchItem(user_input, index, trace)
+                    submit("plan", item, trace, self.layer._plan_request,
+                           user_input, self.execution_mode, item.metadata)
+
+                if not jobs:
+                    return
+
+                done, _ = wait(list(jobs), return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, payload = jobs.pop(future)
+
+                    if kind == "plan":
+                        item = payload
+                        try:
+                            subtasks, plan = future.result()
+                        except Exception as e:
+                            submit("finalize", item, item.trace, self._failed_response, item, e)
+                            continue
+                        item.groups = list(plan.parallel_groups)
+                        # Subtasks missing from the plan still run, in a final group
+                        planned = set(subtask.id for group in item.groups for subtask in group)
+                        missing = [subtask for subtask in subtasks if subtask.id not in planned]
+                        if missing:
+                            item.groups.append(missing)
+                        advance(item)
+
+                    elif kind == "subtask":
+                        responses = future.result()
+                        for position, (item, subtask) in enumerate(waiters.pop(payload)):
+                            if position:
+                                copies = [replace_unvalidated(resp, subtask_id=subtask.id) for resp in responses]
+                            else:
+                                copies = responses
+                            item.responses.extend(copies)
+                            item.group_responses.extend(copies)
+                            item.pending -= 1
+                            if item.pending == 0:
+                                advance(item)
+
+                    else:
+                        item = payload
+                        del items[item.user_input]
+                        response = future.result()
+                        self.layer._record_request(self.execution_mode, item.start_time, response)
+                        tracer.finish_trace(item.trace, item.metadata.spans)
+                        for index in item.indices:
+                            yield index, response
+        finally:
+            for future in jobs:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _subtask_key(self, subtask: Subtask) -> Hashable:
+        """Attributes that decide how a subtask is routed and executed."""
+        return (
+            subtask.content, subtask.task_type, subtask.priority,
+            subtask.risk_level, subtask.accuracy_requirement
+        )
+
+    def _execute_subtask(self, subtask: Subtask) -> List[AgentResponse]:
+        """Execute one subtask with the layer's resilience handling, never raising."""
+        try:
+            return self.layer._execute_parallel_group_resilient([subtask], self.execution_mode)
+        except Exception as e:
+            logger.error(f"Subtask {subtask.id} execution failed: {str(e)}")
+            return [AgentResponse(
+                subtask_id=subtask.id,
+                model_used="unknown",
+                content="",
+                success=False,
+                error_message=f"Group execution failed: {str(e)}"
+            )]
+
+    def _finalize(self, item: _BatchItem) -> FinalResponse:
+        """Arbitrate and synthesize an item's responses, never raising."""
+        if not item.responses:
+            return self._failed_response(item, ValueError("No subtasks were executed"))
+        try:
+            return self.layer._finalize_request(item.responses, item.metadata, item.start_time)
+        except Exception as e:
+            return self._failed_response(item, e)
+
+    def _failed_response(self, item: _BatchItem, error: Exception) -> FinalResponse:
+        """Build the failure response for an item, as AICouncil does for single requests."""
+        if isinstance(error, TimeoutError):
+            error = ModelTimeoutError(f"Request processing timed out: {str(error)}", original_error=error)
+        logger.error(f"Batch item failed: {str(error)}")
+        if isinstance(error, AICouncilError):
+            error_message, error_type = str(error), type(error).__name__
+        else:
+            error_message, error_type = f"Processing failed: {str(error)}", None
+        execution_time = time.time() - item.start_time
+        return FinalResponse(
+            content="",
+            overall_confidence=0.0,
+            execution_metadata=item.metadata,
+            success=False,
+            error_message=error_message,
+            error_type=error_type,
+            cost_breakdown=CostBreakdown(execution_time=execution_time),
+            models_used=[]
+        )
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from ..core.interfaces import ModelRegistry, ModelSelection
+from ..core.metrics import CacheMetrics, metrics_registry
 from ..core.models import (
     Subtask, ExecutionMode, TaskType, RiskLevel, Priority,
     ModelCapabilities, CostProfile, PerformanceMetrics
@@ -14,6 +15,11 @@ from ..core.models import (
 
 logger = logging.getLogger(__name__)
 
+_cache_metrics = CacheMetrics("cost_optimization")
+_model_selections = metrics_registry.counter(
+    "ai_council_model_selections_total", "Models chosen by the cost optimizer", ("model", "mode")
+)
+
 
 @dataclass
 class CostOptimizationResult:
@@ -83,9 +89,13 @@ class CostOptimizer:
         cache_key = self._create_cache_key(subtask, execution_mode, available_models)
         
         # Check cache first
-        if cache_key in self._optimization_cache:
+        cached = self._optimization_cache.get(cache_key)
+        if cached is not None:
+            _cache_metrics.hit()
+            _model_selections.labels(cached.recommended_model, execution_mode.value).inc()
             logger.debug(f"Using cached optimization result for {cache_key}")
-            return self._optimization_cache[cache_key]
+            return cached
+        _cache_metrics.miss()
         
         # Get optimization strategy based on execution mode
         strategy = self._get_optimization_strategy(execution_mode)
@@ -124,6 +134,7 @@ class CostOptimizer:
         
         # Cache the result
         self._optimization_cache[cache_key] = result
+        _model_selections.labels(best_model_id, execution_mode.value).inc()
         
         logger.info(f"Optimized model selection: {best_model_id} for {strategy.value}")
         return result
@@ -237,6 +248,63 @@ class CostOptimizer:
         
         return tradeoff_analysis
     
+    def rank_models_by_cost(self, subtask: Subtask, available_models: List[str]) -> List[str]:
+        """
+        Rank capable models from cheapest to most expensive for cascade execution.
+        
+        Models with equal estimated cost are ordered by descending quality.
+        
+        Args:
+            subtask: The subtask to rank models for
+            available_models: List of available model IDs
+            
+        Returns:
+            List[str]: Model IDs, cheapest first
+        """
+        ranked = []
+        for model_id in available_models:
+            try:
+                score = self._score_model_for_optimization(
+                    model_id, subtask, OptimizationStrategy.MINIMIZE_COST
+                )
+                ranked.append((score['cost'], -score['quality'], model_id))
+            except Exception as e:
+                logger.warning(f"Failed to score model {model_id}: {str(e)}")
+                continue
+        
+        ranked.sort()
+        return [model_id for _, _, model_id in ranked]
+    
+    def rank_models_by_score(
+        self,
+        subtask: Subtask,
+        execution_mode: ExecutionMode,
+        available_models: List[str]
+    ) -> List[str]:
+        """
+        Rank capable models from best to worst composite score for an execution mode.
+        
+        Args:
+            subtask: The subtask to rank models for
+            execution_mode: Current execution mode
+            available_models: List of available model IDs
+            
+        Returns:
+            List[str]: Model IDs, best first
+        """
+        strategy = self._get_optimization_strategy(execution_mode)
+        ranked = []
+        for model_id in available_models:
+            try:
+                score = self._score_model_for_optimization(model_id, subtask, strategy)
+                ranked.append((-score['composite_score'], model_id))
+            except Exception as e:
+                logger.warning(f"Failed to score model {model_id}: {str(e)}")
+                continue
+        
+        ranked.sort()
+        return [model_id for _, model_id in ranked]
+    
     def update_performance_history(self, model_id: str, actual_cost: float, quality_score: float):
         """
         Update performance history for model cost optimization.
@@ -264,7 +332,8 @@ class CostOptimizer:
         strategy_map = {
             ExecutionMode.FAST: OptimizationStrategy.MINIMIZE_TIME,
             ExecutionMode.BALANCED: OptimizationStrategy.BALANCED,
-            ExecutionMode.BEST_QUALITY: OptimizationStrategy.MAXIMIZE_QUALITY
+            ExecutionMode.BEST_QUALITY: OptimizationStrategy.MAXIMIZE_QUALITY,
+            ExecutionMode.CASCADE: OptimizationStrategy.MINIMIZE_COST
         }
         return strategy_map.get(execution_mode, OptimizationStrategy.BALANCED)
     
@@ -1,36 +1,64 @@
 """Implementation of the OrchestrationLayer for main request processing pipeline."""
 
 import logging
+import threading
 import time
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
 from ..core.interfaces import (
     OrchestrationLayer, AnalysisEngine, TaskDecomposer, ModelContextProtocol,
     ExecutionAgent, ArbitrationLayer, SynthesisLayer, ModelRegistry,
-    CostEstimate, ExecutionFailure, FallbackStrategy
+    CostEstimate, ExecutionFailure, ExecutionPlan, FallbackStrategy
 )
 from ..core.models import (
     Task, Subtask, AgentResponse, FinalResponse, ExecutionMode, 
-    ComplexityLevel, ExecutionMetadata, CostBreakdown
+    ComplexityLevel, ExecutionMetadata, CostBreakdown, RiskLevel, SynthesisSection
 )
 from ..core.failure_handling import (
     FailureEvent, FailureType, resilience_manager, create_failure_event,
     CircuitBreakerConfig
 )
 from ..core.timeout_handler import (
-    timeout_handler, adaptive_timeout_manager, with_adaptive_timeout, TimeoutError
+    timeout_handler, adaptive_timeout_manager, with_adaptive_timeout, cancel_on, TimeoutError
 )
+from ..core.metrics import metrics_registry
+from ..core.profiling import request_profiler
+from ..core.tracing import tracer
 from ..core.exceptions import (
     AICouncilError, ConfigurationError, ModelTimeoutError, 
     AuthenticationError, RateLimitError, ProviderError, 
     ValidationError, OrchestrationError
 )
+from .batch import BatchScheduler
 from .cost_optimizer import CostOptimizer
 
 
 logger = logging.getLogger(__name__)
 
+_requests = metrics_registry.counter(
+    "ai_council_requests_total", "Processed requests by execution mode and outcome", ("mode", "outcome")
+)
+_request_seconds = metrics_registry.histogram(
+    "ai_council_request_duration_seconds", "End-to-end request latency", ("mode",)
+)
+_stage_seconds = metrics_registry.histogram(
+    "ai_council_stage_duration_seconds", "Latency of pipeline stages", ("stage",)
+)
+
+
+@contextmanager
+def _stage(name: str, **attributes: Any):
+    """Trace a pipeline stage as a span and time it in the stage histogram."""
+    start = time.perf_counter()
+    try:
+        with tracer.span(name, **attributes) as span:
+            yield span
+    finally:
+        _stage_seconds.labels(name).observe(time.perf_counter() - start)
+
 
 class ConcreteOrchestrationLayer(OrchestrationLayer):
     """
@@ -54,7 +82,9 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
         synthesis_layer: SynthesisLayer,
         model_registry: ModelRegistry,
         max_retries: int = 3,
-        timeout_seconds: float = 300.0
+        timeout_seconds: float = 300.0,
+        quality_thresholds: Optional[Dict[ExecutionMode, float]] = None,
+        max_parallel_executions: int = 5
     ):
         """
         Initialize the orchestration layer with all required components.
@@ -69,6 +99,8 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
             model_registry: Registry of available AI models
             max_retries: Maximum retry attempts for failed operations
             timeout_seconds: Maximum time allowed for request processing
+            quality_thresholds: Optional per-mode overrides of the quality threshold
+            max_parallel_executions: Worker threads shared by all items of a batch
         """
         self.analysis_engine = analysis_engine
         self.task_decomposer = task_decomposer
@@ -79,12 +111,15 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
         self.model_registry = model_registry
         self.max_retries = max_retries
         self.timeout_seconds = timeout_seconds
+        self.max_parallel_executions = max_parallel_executions
         
         # Initialize cost optimizer
         self.cost_optimizer = CostOptimizer(model_registry)
         
         # Execution mode configurations
         self._execution_configs = self._build_execution_configs()
+        for mode, threshold in (quality_thresholds or {}).items():
+            self._execution_configs[mode]['quality_threshold'] = threshold
         
         # Initialize circuit breakers for orchestration components
         self._initialize_circuit_breakers()
@@ -158,155 +193,290 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
         start_time = time.time()
         execution_metadata = ExecutionMetadata()
         
-        try:
-            logger.info(f"Processing request in {execution_mode.value} mode: {user_input[:100]}...")
-            
-            # Stage 1: Analysis and Task Creation (with circuit breaker protection)
+        # The trace fills execution_metadata.spans before the profile, if any, is written
+        spans = execution_metadata.spans
+        with request_profiler.profile(spans), \
+                tracer.trace("request", {"execution_mode": execution_mode.value}, sink=spans):
             try:
-                task = self._create_task_from_input_protected(user_input, execution_mode)
-                execution_metadata.execution_path.append("task_creation")
+                logger.info(f"Processing request in {execution_mode.value} mode: {user_input[:100]}...")
+                
+                # Stages 1-4: Analysis, cost estimation, decomposition and planning
+                subtasks, execution_plan = self._plan_request(
+                    user_input, execution_mode, execution_metadata
+                )
+                
+                # Stage 5: Execute Subtasks (with partial failure handling)
+                with _stage("execution", subtasks=len(subtasks)):
+                    agent_responses = self._execute_subtasks_with_resilience(
+                        subtasks, execution_plan, execution_mode
+                    )
+                final_response = self._finalize_request(agent_responses, execution_metadata, start_time)
+                self._record_request(execution_mode, start_time, final_response)
+                return final_response
+                
+            except TimeoutError as e:
+                logger.error(f"Request processing timed out: {str(e)}")
+                self._record_request(execution_mode, start_time)
+                raise ModelTimeoutError(f"Request processing timed out: {str(e)}", original_error=e)
+                
             except Exception as e:
-                logger.error(f"Task creation failed: {str(e)}")
                 if isinstance(e, AICouncilError):
+                    self._record_request(execution_mode, start_time)
                     raise
-                raise ValidationError(f"Failed to analyze input: {str(e)}", original_error=e)
-            
-            # Stage 2: Cost Estimation (if required by execution mode)
-            if execution_mode != ExecutionMode.FAST:
-                try:
-                    cost_estimate = self.estimate_cost_and_time(task)
-                    logger.info(f"Estimated cost: ${cost_estimate.estimated_cost:.4f}, time: {cost_estimate.estimated_time:.1f}s")
-                except Exception as e:
-                    logger.warning(f"Cost estimation failed: {str(e)}")
-                    # Continue without cost estimation
-            
-            # Stage 3: Task Decomposition (with circuit breaker protection)
-            try:
-                subtasks = self._decompose_task_protected(task)
-                execution_metadata.execution_path.append("task_decomposition")
-                logger.info(f"Decomposed into {len(subtasks)} subtasks")
-            except Exception as e:
-                logger.error(f"Task decomposition failed: {str(e)}")
-                # Fallback to single subtask
-                subtasks = [self._create_fallback_subtask(task)]
-                execution_metadata.execution_path.append("fallback_decomposition")
-            
-            # Stage 4: Execution Planning
-            try:
-                execution_plan = self.model_context_protocol.determine_parallelism(subtasks)
-                execution_metadata.parallel_executions = len(execution_plan.parallel_groups)
-                execution_metadata.execution_path.append("execution_planning")
-            except Exception as e:
-                logger.warning(f"Execution planning failed: {str(e)}")
-                # Fallback to sequential execution
-                execution_plan = self._create_sequential_plan(subtasks)
-                execution_metadata.execution_path.append("sequential_fallback")
-            
-            # Stage 5: Execute Subtasks (with partial failure handling)
-            agent_responses = self._execute_subtasks_with_resilience(
-                subtasks, execution_plan, execution_mode
-            )
-            execution_metadata.execution_path.append("subtask_execution")
-            execution_metadata.models_used = list(set(resp.model_used for resp in agent_responses if resp.success))
-            
-            # Check for partial failure
-            success_rate = sum(1 for resp in agent_responses if resp.success) / len(agent_responses)
-            if success_rate < self.partial_failure_threshold:
-                logger.warning(f"Partial failure detected: {success_rate:.1%} success rate")
                 
-                # Record partial failure event
+                logger.error(f"Request processing failed: {str(e)}")
+                execution_time = time.time() - start_time
+                
+                # Record system failure
                 failure_event = create_failure_event(
-                    failure_type=FailureType.PARTIAL_FAILURE,
+                    failure_type=FailureType.SYSTEM_OVERLOAD,
                     component="orchestration_layer",
-                    error_message=f"Only {success_rate:.1%} of subtasks succeeded",
-                    context={
-                        "success_rate": success_rate,
-                        "total_subtasks": len(agent_responses),
-                        "successful_subtasks": sum(1 for resp in agent_responses if resp.success)
-                    }
+                    error_message=str(e),
+                    context={"execution_time": execution_time}
                 )
+                resilience_manager.handle_failure(failure_event)
                 
-                recovery_action = resilience_manager.handle_failure(failure_event)
-                if recovery_action.action_type == "continue_degraded":
-                    execution_metadata.execution_path.append("partial_failure_degraded")
-                else:
-                    # Too many failures, return error response
-                    return self._create_degraded_response(
-                        "Too many subtask failures", execution_metadata, start_time,
-                        f"Success rate {success_rate:.1%} below threshold"
-                    )
-            
-            # Filter successful responses
-            successful_responses = [resp for resp in agent_responses if resp.success]
-            if not successful_responses:
-                return self._create_degraded_response(
-                    "All subtasks failed", execution_metadata, start_time,
-                    "No successful subtask executions"
+                failure_response = FinalResponse(
+                    content="",
+                    overall_confidence=0.0,
+                    execution_metadata=execution_metadata,
+                    success=False,
+                    error_message=f"Processing failed: {str(e)}",
+                    cost_breakdown=CostBreakdown(execution_time=execution_time)
                 )
+                self._record_request(execution_mode, start_time, failure_response)
+                return failure_response
+    
+    def _finalize_request(
+        self,
+        agent_responses: List[AgentResponse],
+        execution_metadata: ExecutionMetadata,
+        start_time: float
+    ) -> FinalResponse:
+        """Check partial failure, arbitrate and synthesize executed subtask responses."""
+        execution_metadata.execution_path.append("subtask_execution")
+        execution_metadata.models_used = list(set(resp.model_used for resp in agent_responses if resp.success))
+        execution_metadata.escalation_paths = [
+            f"{resp.subtask_id}: {' -> '.join(resp.metadata['cascade_path'])}"
+            for resp in agent_responses
+            if len(resp.metadata.get('cascade_path', [])) > 1
+        ]
+        
+        # Check for partial failure
+        success_rate = sum(1 for resp in agent_responses if resp.success) / len(agent_responses)
+        if success_rate < self.partial_failure_threshold:
+            logger.warning(f"Partial failure detected: {success_rate:.1%} success rate")
             
-            # Stage 6: Arbitration (if multiple responses, with circuit breaker)
-            if len(successful_responses) > 1:
-                try:
-                    arbitration_result = self._arbitrate_with_protection(successful_responses)
-                    validated_responses = arbitration_result.validated_responses
-                    execution_metadata.arbitration_decisions = [
-                        f"{res.chosen_response_id}: {res.reasoning}" 
-                        for res in arbitration_result.conflicts_resolved
-                    ]
-                    execution_metadata.execution_path.append("arbitration")
-                    logger.info(f"Arbitration resolved {len(arbitration_result.conflicts_resolved)} conflicts")
-                except Exception as e:
-                    logger.warning(f"Arbitration failed: {str(e)}")
-                    # Fallback: use first successful response
-                    validated_responses = successful_responses[:1]
-                    execution_metadata.execution_path.append("arbitration_fallback")
-            else:
-                validated_responses = successful_responses
+            # Record partial failure event
+            failure_event = create_failure_event(
+                failure_type=FailureType.PARTIAL_FAILURE,
+                component="orchestration_layer",
+                error_message=f"Only {success_rate:.1%} of subtasks succeeded",
+                context={
+                    "success_rate": success_rate,
+                    "total_subtasks": len(agent_responses),
+                    "successful_subtasks": sum(1 for resp in agent_responses if resp.success)
+                }
+            )
             
-            # Stage 7: Synthesis (with circuit breaker protection)
+            recovery_action = resilience_manager.handle_failure(failure_event)
+            if recovery_action.action_type == "continue_degraded":
+                execution_metadata.execution_path.append("partial_failure_degraded")
+            else:
+                # Too many failures, return error response
+                return self._create_degraded_response(
+                    "Too many subtask failures", execution_metadata, start_time,
+                    f"Success rate {success_rate:.1%} below threshold"
+                )
+        
+        # Filter successful responses
+        successful_responses = [resp for resp in agent_responses if resp.success]
+        if not successful_responses:
+            return self._create_degraded_response(
+                "All subtasks failed", execution_metadata, start_time,
+                "No successful subtask executions"
+            )
+        
+        # Stage 6: Arbitration (if multiple responses, with circuit breaker)
+        if len(successful_responses) > 1:
             try:
-                final_response = self._synthesize_with_protection(validated_responses)
-                execution_metadata.execution_path.append("synthesis")
+                arbitration_result = self._arbitrate_with_protection(successful_responses)
+                validated_responses = arbitration_result.validated_responses
+                execution_metadata.arbitration_decisions = [
+                    f"{res.chosen_response_id}: {res.reasoning}" 
+                    for res in arbitration_result.conflicts_resolved
+                ]
+                execution_metadata.execution_path.append("arbitration")
+                logger.info(f"Arbitration resolved {len(arbitration_result.conflicts_resolved)} conflicts")
             except Exception as e:
-                logger.error(f"Synthesis failed: {str(e)}")
-                # Fallback: return first validated response as final response
-                first_response = validated_responses[0]
-                final_response = FinalResponse(
-                    content=first_response.content,
-                    overall_confidence=first_response.self_assessment.confidence_score if first_response.self_assessment else 0.5,
-                    models_used=[first_response.model_used],
-                    success=True
+                logger.warning(f"Arbitration failed: {str(e)}")
+                # Fallback: use first successful response
+                validated_responses = successful_responses[:1]
+                execution_metadata.execution_path.append("arbitration_fallback")
+        else:
+            validated_responses = successful_responses
+        
+        # Stage 7: Synthesis (with circuit breaker protection)
+        try:
+            final_response = self._synthesize_with_protection(validated_responses)
+            execution_metadata.execution_path.append("synthesis")
+        except Exception as e:
+            logger.error(f"Synthesis failed: {str(e)}")
+            # Fallback: return first validated response as final response
+            first_response = validated_responses[0]
+            final_response = FinalResponse(
+                content=first_response.content,
+                overall_confidence=first_response.self_assessment.confidence_score if first_response.self_assessment else 0.5,
+                models_used=[first_response.model_used],
+                success=True
+            )
+            execution_metadata.execution_path.append("synthesis_fallback")
+        
+        # Stage 8: Attach Metadata
+        execution_metadata.total_execution_time = time.time() - start_time
+        final_response = self.synthesis_layer.attach_metadata(final_response, execution_metadata)
+        
+        logger.info(f"Request processed successfully in {execution_metadata.total_execution_time:.2f}s")
+        return final_response
+    
+    def process_request_stream(
+        self, user_input: str, execution_mode: ExecutionMode
+    ) -> Iterator[Union[SynthesisSection, FinalResponse]]:
+        """
+        Process a user request, yielding response sections as subtasks complete.
+        
+        Subtasks within a parallel group run concurrently. Each finished subtask
+        is handed to the synthesis layer's incremental synthesizer, which emits
+        its section once every earlier subtask in the plan's sequential order is
+        done. Arbitration only compares responses for the same subtask (e.g. an
+        ensemble), since later subtasks aren't known when a section is emitted.
+        If the synthesis layer has no incremental mode, the whole response is
+        produced by ``process_request``.
+        
+        Args:
+            user_input: Raw user input to process
+            execution_mode: The execution mode to use
+            
+        Yields:
+            SynthesisSection objects in order, then the FinalResponse
+        """
+        start_time = time.time()
+        execution_metadata = ExecutionMetadata()
+        
+        # The trace is finished before the final response is yielded, so its spans go with it
+        trace = tracer.start_trace("request", {"execution_mode": execution_mode.value, "streaming": True})
+        
+        try:
+            logger.info(f"Streaming request in {execution_mode.value} mode: {user_input[:100]}...")
+            
+            # The trace is only active around work, never across a yield, so the
+            # consumer's own spans don't attach to it between sections
+            with tracer.activate(trace):
+                subtasks, execution_plan = self._plan_request(
+                    user_input, execution_mode, execution_metadata
                 )
-                execution_metadata.execution_path.append("synthesis_fallback")
+                
+                # Subtasks missing from the plan's order go last
+                order = list(execution_plan.sequential_order)
+                planned = set(order)
+                order.extend(subtask.id for subtask in subtasks if subtask.id not in planned)
+                synthesizer = self.synthesis_layer.create_incremental_synthesizer(order)
+            if synthesizer is None:
+                logger.info("Synthesis layer has no incremental mode, processing whole request")
+                tracer.finish_trace(trace)
+                yield self.process_request(user_input, execution_mode)
+                return
+            
+            agent_responses: List[AgentResponse] = []
+            failed_groups = 0
             
-            # Stage 8: Attach Metadata
+            for group_index, group in enumerate(execution_plan.parallel_groups):
+                group_successes = 0
+                with ThreadPoolExecutor(max_workers=max(1, len(group))) as executor:
+                    # Each worker also arbitrates its subtask, overlapping with synthesis
+                    futures = {
+                        executor.submit(
+                            tracer.bind(
+                                self._execute_and_arbitrate, "queue_wait", trace=trace, subtask_id=subtask.id
+                            ),
+                            subtask, execution_mode, execution_metadata
+                        ): subtask
+                        for subtask in group
+                    }
+                    for future in as_completed(futures):
+                        subtask = futures[future]
+                        responses, validated = future.result()
+                        agent_responses.extend(responses)
+                        
+                        with tracer.activate(trace):
+                            if validated is None:
+                                sections = synthesizer.skip(subtask.id)
+                            else:
+                                group_successes += 1
+                                sections = synthesizer.add(validated)
+                        for section in sections:
+                            yield section
+                
+                if group and group_successes / len(group) < 0.5:
+                    failed_groups += 1
+                    logger.warning(f"Group {group_index} had low success rate: {group_successes / len(group):.1%}")
+                if failed_groups / (group_index + 1) > 0.5 and execution_mode == ExecutionMode.FAST:
+                    logger.warning("Too many group failures in FAST mode, stopping execution")
+                    break
+            
+            execution_metadata.execution_path.append("subtask_execution")
+            execution_metadata.models_used = list(set(resp.model_used for resp in agent_responses if resp.success))
+            execution_metadata.escalation_paths = [
+                f"{resp.subtask_id}: {' -> '.join(resp.metadata['cascade_path'])}"
+                for resp in agent_responses
+                if len(resp.metadata.get('cascade_path', [])) > 1
+            ]
+            
+            if not any(resp.success for resp in agent_responses):
+                with tracer.activate(trace):
+                    degraded_response = self._create_degraded_response(
+                        "All subtasks failed", execution_metadata, start_time,
+                        "No successful subtask executions"
+                    )
+                self._record_request(execution_mode, start_time, degraded_response)
+                tracer.finish_trace(trace, execution_metadata.spans)
+                yield degraded_response
+                return
+            
+            # Subtasks never run (e.g. after a FAST mode early stop) can't hold back later sections
+            settled = set(resp.subtask_id for resp in agent_responses)
+            with tracer.activate(trace):
+                sections = [
+                    section
+                    for subtask_id in order if subtask_id not in settled
+                    for section in synthesizer.skip(subtask_id)
+                ]
+            for section in sections:
+                yield section
+            with tracer.activate(trace), _stage("synthesis", responses=len(settled)):
+                final_response = synthesizer.finish()
+            execution_metadata.execution_path.append("incremental_synthesis")
             execution_metadata.total_execution_time = time.time() - start_time
             final_response = self.synthesis_layer.attach_metadata(final_response, execution_metadata)
+            self._record_request(execution_mode, start_time, final_response)
+            tracer.finish_trace(trace, execution_metadata.spans)
+            yield final_response
             
-            logger.info(f"Request processed successfully in {execution_metadata.total_execution_time:.2f}s")
-            return final_response
+            logger.info(f"Request streamed successfully in {execution_metadata.total_execution_time:.2f}s")
             
         except TimeoutError as e:
             logger.error(f"Request processing timed out: {str(e)}")
+            self._record_request(execution_mode, start_time)
             raise ModelTimeoutError(f"Request processing timed out: {str(e)}", original_error=e)
             
         except Exception as e:
             if isinstance(e, AICouncilError):
+                self._record_request(execution_mode, start_time)
                 raise
             
-            logger.error(f"Request processing failed: {str(e)}")
+            logger.error(f"Request streaming failed: {str(e)}")
             execution_time = time.time() - start_time
-            
-            # Record system failure
-            failure_event = create_failure_event(
-                failure_type=FailureType.SYSTEM_OVERLOAD,
-                component="orchestration_layer",
-                error_message=str(e),
-                context={"execution_time": execution_time}
-            )
-            resilience_manager.handle_failure(failure_event)
-            
-            return FinalResponse(
+            failure_response = FinalResponse(
                 content="",
                 overall_confidence=0.0,
                 execution_metadata=execution_metadata,
@@ -314,6 +484,159 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
                 error_message=f"Processing failed: {str(e)}",
                 cost_breakdown=CostBreakdown(execution_time=execution_time)
             )
+            self._record_request(execution_mode, start_time, failure_response)
+            tracer.finish_trace(trace, execution_metadata.spans)
+            yield failure_response
+        
+        finally:
+            # Raised errors and consumers that stop early still end the trace
+            tracer.finish_trace(trace)
+    
+    def process_batch(
+        self,
+        inputs: Iterable[str],
+        execution_mode: ExecutionMode,
+        concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[int, FinalResponse]]:
+        """
+        Process many user requests through one shared pool, yielding results as they finish.
+        
+        Identical inputs are planned and executed once, identical subtasks across
+        items run once, and all items' subtasks share ``max_parallel_executions``
+        workers, or ``concurrency`` workers if given. Failures are reported per
+        item as unsuccessful responses.
+        
+        Args:
+            inputs: Raw user inputs, read lazily
+            execution_mode: The execution mode for every input
+            concurrency: Worker threads and distinct inputs in progress at once
+            
+        Yields:
+            Tuples of (input index, FinalResponse) in completion order
+        """
+        scheduler = BatchScheduler(
+            self, execution_mode,
+            max_workers=concurrency or self.max_parallel_executions,
+            max_in_flight=concurrency
+        )
+        return scheduler.run(inputs)
+    
+    def _record_request(
+        self,
+        execution_mode: ExecutionMode,
+        start_time: float,
+        response: Optional[FinalResponse] = None
+    ) -> None:
+        """Count a finished request and its latency; no response means it raised."""
+        if response is None:
+            outcome = "error"
+        else:
+            outcome = "success" if response.success else "failure"
+        _requests.labels(execution_mode.value, outcome).inc()
+        _request_seconds.labels(execution_mode.value).observe(time.time() - start_time)
+    
+    def _execute_and_arbitrate(
+        self,
+        subtask: Subtask,
+        execution_mode: ExecutionMode,
+        execution_metadata: ExecutionMetadata
+    ) -> Tuple[List[AgentResponse], Optional[AgentResponse]]:
+        """Execute one subtask and pick its validated response, never raising."""
+        try:
+            responses = self._execute_parallel_group_resilient([subtask], execution_mode)
+        except Exception as e:
+            logger.error(f"Subtask {subtask.id} execution failed: {str(e)}")
+            responses = [AgentResponse(
+                subtask_id=subtask.id,
+                model_used="unknown",
+                content="",
+                success=False,
+                error_message=str(e)
+            )]
+        
+        validated = self._validate_subtask_responses(
+            [resp for resp in responses if resp.success], execution_metadata
+        )
+        return responses, validated
+    
+    def _validate_subtask_responses(
+        self,
+        successful_responses: List[AgentResponse],
+        execution_metadata: ExecutionMetadata
+    ) -> Optional[AgentResponse]:
+        """Pick the response to synthesize for one subtask, arbitrating between several."""
+        if not successful_responses:
+            return None
+        if len(successful_responses) == 1:
+            return successful_responses[0]
+        
+        try:
+            arbitration_result = self._arbitrate_with_protection(successful_responses)
+            execution_metadata.arbitration_decisions.extend(
+                f"{res.chosen_response_id}: {res.reasoning}"
+                for res in arbitration_result.conflicts_resolved
+            )
+            if arbitration_result.validated_responses:
+                return arbitration_result.validated_responses[0]
+        except Exception as e:
+            logger.warning(f"Arbitration failed: {str(e)}")
+        return successful_responses[0]
+    
+    def _plan_request(
+        self,
+        user_input: str,
+        execution_mode: ExecutionMode,
+        execution_metadata: ExecutionMetadata
+    ) -> Tuple[List[Subtask], ExecutionPlan]:
+        """Analyze, decompose and plan a request, recording the path taken in the metadata."""
+        # Stage 1: Analysis and Task Creation (with circuit breaker protection)
+        try:
+            with _stage("analysis"):
+                task = self._create_task_from_input_protected(user_input, execution_mode)
+            execution_metadata.execution_path.append("task_creation")
+        except Exception as e:
+            logger.error(f"Task creation failed: {str(e)}")
+            if isinstance(e, AICouncilError):
+                raise
+            raise ValidationError(f"Failed to analyze input: {str(e)}", original_error=e)
+        
+        # Stage 2: Cost Estimation (if required by execution mode)
+        if execution_mode != ExecutionMode.FAST:
+            try:
+                with _stage("cost_estimation"):
+                    cost_estimate = self.estimate_cost_and_time(task)
+                logger.info(f"Estimated cost: ${cost_estimate.estimated_cost:.4f}, time: {cost_estimate.estimated_time:.1f}s")
+            except Exception as e:
+                logger.warning(f"Cost estimation failed: {str(e)}")
+                # Continue without cost estimation
+        
+        # Stage 3: Task Decomposition (with circuit breaker protection)
+        try:
+            with _stage("decomposition") as span:
+                subtasks = self._decompose_task_protected(task)
+                if span is not None:
+                    span.set_attribute("subtasks", len(subtasks))
+            execution_metadata.execution_path.append("task_decomposition")
+            logger.info(f"Decomposed into {len(subtasks)} subtasks")
+        except Exception as e:
+            logger.error(f"Task decomposition failed: {str(e)}")
+            # Fallback to single subtask
+            subtasks = [self._create_fallback_subtask(task)]
+            execution_metadata.execution_path.append("fallback_decomposition")
+        
+        # Stage 4: Execution Planning
+        try:
+            with _stage("planning"):
+                execution_plan = self.model_context_protocol.determine_parallelism(subtasks)
+            execution_metadata.parallel_executions = len(execution_plan.parallel_groups)
+            execution_metadata.execution_path.append("execution_planning")
+        except Exception as e:
+            logger.warning(f"Execution planning failed: {str(e)}")
+            # Fallback to sequential execution
+            execution_plan = self._create_sequential_plan(subtasks)
+            execution_metadata.execution_path.append("sequential_fallback")
+        
+        return subtasks, execution_plan
     
     def estimate_cost_and_time(self, task: Task) -> CostEstimate:
         """
@@ -385,6 +708,10 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
                 confidence=0.3
             )
     
+    def shutdown(self) -> None:
+        """Release the arbitration layer's worker pool."""
+        self.arbitration_layer.shutdown()
+    
     def handle_failure(self, failure: ExecutionFailure) -> FallbackStrategy:
         """
         Handle execution failures with appropriate fallback strategies.
@@ -489,7 +816,8 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
             return self.arbitration_layer.arbitrate(responses)
         
         try:
-            return self.arbitration_cb.call(protected_arbitration)
+            with _stage("arbitration", responses=len(responses)):
+                return self.arbitration_cb.call(protected_arbitration)
         except Exception as e:
             if isinstance(e, AICouncilError):
                 raise
@@ -501,7 +829,8 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
             return self.synthesis_layer.synthesize(validated_responses)
         
         try:
-            return self.synthesis_cb.call(protected_synthesis)
+            with _stage("synthesis", responses=len(validated_responses)):
+                return self.synthesis_cb.call(protected_synthesis)
         except Exception as e:
             if isinstance(e, AICouncilError):
                 raise
@@ -524,8 +853,6 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
     
     def _create_sequential_plan(self, subtasks: List[Subtask]):
         """Create a sequential execution plan as fallback."""
-        from ..core.interfaces import ExecutionPlan
-        
         # Simple sequential plan - each subtask in its own group
         parallel_groups = [[subtask] for subtask in subtasks]
         sequential_order = [subtask.id for subtask in subtasks]
@@ -586,115 +913,329 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
         responses = []
         
         for subtask in subtasks:
-            try:
-                # Check system health before execution
-                health = resilience_manager.health_check()
-                if health["overall_health"] == "degraded" and execution_mode == ExecutionMode.FAST:
-                    # Skip non-critical subtasks in degraded mode
-                    if subtask.priority.value in ["low", "medium"]:
-                        logger.info(f"Skipping subtask {subtask.id} due to degraded system health")
-                        skip_response = AgentResponse(
+            with tracer.span("subtask", subtask_id=subtask.id, task_type=getattr(subtask.task_type, "value", None)):
+                try:
+                    # Check system health before execution
+                    health = resilience_manager.health_check()
+                    if health["overall_health"] == "degraded" and execution_mode == ExecutionMode.FAST:
+                        # Skip non-critical subtasks in degraded mode
+                        if subtask.priority.value in ["low", "medium"]:
+                            logger.info(f"Skipping subtask {subtask.id} due to degraded system health")
+                            skip_response = AgentResponse(
+                                subtask_id=subtask.id,
+                                model_used="skipped",
+                                content="",
+                                success=False,
+                                error_message="Skipped due to system degradation",
+                                metadata={"skipped": True, "reason": "system_degraded"}
+                            )
+                            responses.append(skip_response)
+                            continue
+                    
+                    # Get available models for this task type
+                    available_models = [
+                        m.get_model_id() 
+                        for m in self.model_registry.get_models_for_task_type(subtask.task_type)
+                    ]
+                    
+                    if not available_models:
+                        logger.error(f"No models available for task type {subtask.task_type}")
+                        failure_response = AgentResponse(
                             subtask_id=subtask.id,
-                            model_used="skipped",
+                            model_used="none_available",
                             content="",
                             success=False,
-                            error_message="Skipped due to system degradation",
-                            metadata={"skipped": True, "reason": "system_degraded"}
+                            error_message=f"No models available for task type {subtask.task_type}"
                         )
-                        responses.append(skip_response)
+                        responses.append(failure_response)
                         continue
-                
-                # Get available models for this task type
-                available_models = [
-                    m.get_model_id() 
-                    for m in self.model_registry.get_models_for_task_type(subtask.task_type)
-                ]
-                
-                if not available_models:
-                    logger.error(f"No models available for task type {subtask.task_type}")
-                    failure_response = AgentResponse(
+                    
+                    if execution_mode == ExecutionMode.CASCADE:
+                        responses.append(self._execute_cascade(subtask, available_models))
+                        continue
+                    
+                    ensemble_size = int(self._execution_configs[execution_mode]['ensemble_size'])
+                    if (subtask.risk_level == RiskLevel.CRITICAL
+                            and ensemble_size > 1 and len(available_models) > 1):
+                        responses.extend(
+                            self._execute_ensemble(subtask, execution_mode, available_models)
+                        )
+                        continue
+                    
+                    # Use cost optimizer for model selection
+                    optimization = self.cost_optimizer.optimize_model_selection(
+                        subtask, execution_mode, available_models
+                    )
+                    
+                    logger.info(f"Cost-optimized selection: {optimization.reasoning}")
+                    
+                    # Get the actual model instance
+                    models = self.model_registry.get_models_for_task_type(subtask.task_type)
+                    selected_model = next(
+                        (m for m in models if m.get_model_id() == optimization.recommended_model),
+                        None
+                    )
+                    
+                    if not selected_model:
+                        logger.error(f"Optimized model {optimization.recommended_model} not found")
+                        failure_response = AgentResponse(
+                            subtask_id=subtask.id,
+                            model_used=optimization.recommended_model,
+                            content="",
+                            success=False,
+                            error_message=f"Selected model {optimization.recommended_model} not available"
+                        )
+                        responses.append(failure_response)
+                        continue
+                    
+                    # Execute subtask with timeout protection
+                    response = self._execute_on_model(subtask, selected_model)
+                    responses.append(response)
+                    
+                except TimeoutError as e:
+                    logger.warning(f"Subtask {subtask.id} timed out: {str(e)}")
+                    timeout_response = AgentResponse(
                         subtask_id=subtask.id,
-                        model_used="none_available",
+                        model_used="timeout",
                         content="",
                         success=False,
-                        error_message=f"No models available for task type {subtask.task_type}"
+                        error_message=f"Execution timed out: {str(e)}",
+                        metadata={"timeout": True, "timeout_duration": e.timeout_duration}
                     )
-                    responses.append(failure_response)
-                    continue
-                
-                # Use cost optimizer for model selection
-                optimization = self.cost_optimizer.optimize_model_selection(
-                    subtask, execution_mode, available_models
-                )
-                
-                logger.info(f"Cost-optimized selection: {optimization.reasoning}")
-                
-                # Get the actual model instance
-                models = self.model_registry.get_models_for_task_type(subtask.task_type)
-                selected_model = next(
-                    (m for m in models if m.get_model_id() == optimization.recommended_model),
-                    None
-                )
-                
-                if not selected_model:
-                    logger.error(f"Optimized model {optimization.recommended_model} not found")
+                    responses.append(timeout_response)
+                    
+                except Exception as e:
+                    logger.error(f"Failed to execute subtask {subtask.id}: {str(e)}")
+                    # Create failure response
                     failure_response = AgentResponse(
                         subtask_id=subtask.id,
-                        model_used=optimization.recommended_model,
+                        model_used="unknown",
                         content="",
                         success=False,
-                        error_message=f"Selected model {optimization.recommended_model} not available"
+                        error_message=str(e)
                     )
                     responses.append(failure_response)
-                    continue
-                
-                # Execute subtask with timeout protection
-                response = timeout_handler.execute_with_timeout(
-                    self.execution_agent.execute,
-                    adaptive_timeout_manager.get_adaptive_timeout("subtask_execution"),
-                    "subtask_execution",
-                    "orchestration_layer",
-                    subtask.id,
-                    selected_model.get_model_id(),
-                    subtask,
-                    selected_model
-                )
-                
-                # Update cost optimizer with actual performance
-                if response.success and response.self_assessment:
-                    actual_cost = response.self_assessment.estimated_cost
-                    quality_score = response.self_assessment.confidence_score
-                    self.cost_optimizer.update_performance_history(
-                        optimization.recommended_model, actual_cost, quality_score
-                    )
-                
-                responses.append(response)
-                
+        
+        return responses
+    
+    def _execute_on_model(self, subtask: Subtask, model) -> AgentResponse:
+        """Execute a subtask on one model with timeout protection and record its performance."""
+        with tracer.span("model_execution", model_id=model.get_model_id()):
+            # The agent runs on the timeout handler's thread, inside this span
+            response = timeout_handler.execute_with_timeout(
+                tracer.bind(self.execution_agent.execute),
+                adaptive_timeout_manager.get_adaptive_timeout("subtask_execution"),
+                "subtask_execution",
+                "orchestration_layer",
+                subtask.id,
+                model.get_model_id(),
+                subtask,
+                model
+            )
+        
+        # Update cost optimizer with actual performance
+        if response.success and response.self_assessment:
+            actual_cost = response.self_assessment.estimated_cost
+            quality_score = response.self_assessment.confidence_score
+            self.cost_optimizer.update_performance_history(
+                model.get_model_id(), actual_cost, quality_score
+            )
+        
+        return response
+    
+    def _execute_member(self, subtask: Subtask, model, cancel: threading.Event) -> AgentResponse:
+        """Execute one ensemble member, giving up on retries once ``cancel`` is set."""
+        with cancel_on(cancel):
+            return self._execute_on_model(subtask, model)
+    
+    def _execute_cascade(self, subtask: Subtask, available_models: List[str]) -> AgentResponse:
+        """
+        Execute a subtask on the cheapest capable model, escalating to pricier tiers.
+        
+        A tier's response is accepted once both its self-assessed confidence and
+        its arbitration quality score reach the cascade quality threshold. If no
+        tier is accepted, the best-scoring successful response is returned.
+        
+        Args:
+            subtask: The subtask to execute
+            available_models: IDs of models capable of the subtask
+            
+        Returns:
+            AgentResponse: The accepted response, with the tiers tried recorded
+                under metadata["cascade_path"]
+        """
+        threshold = self._execution_configs[ExecutionMode.CASCADE]['quality_threshold']
+        models = {
+            m.get_model_id(): m
+            for m in self.model_registry.get_models_for_task_type(subtask.task_type)
+        }
+        
+        cascade_path = []
+        best_response = None
+        best_quality = -1.0
+        last_response = None
+        
+        for model_id in self.cost_optimizer.rank_models_by_cost(subtask, available_models):
+            model = models.get(model_id)
+            if model is None:
+                continue
+            
+            try:
+                response = self._execute_on_model(subtask, model)
             except TimeoutError as e:
-                logger.warning(f"Subtask {subtask.id} timed out: {str(e)}")
-                timeout_response = AgentResponse(
+                logger.warning(f"Cascade tier {model_id} timed out for subtask {subtask.id}")
+                cascade_path.append(f"{model_id} (timeout)")
+                last_response = AgentResponse(
                     subtask_id=subtask.id,
-                    model_used="timeout",
+                    model_used=model_id,
                     content="",
                     success=False,
                     error_message=f"Execution timed out: {str(e)}",
                     metadata={"timeout": True, "timeout_duration": e.timeout_duration}
                 )
-                responses.append(timeout_response)
-                
-            except Exception as e:
-                logger.error(f"Failed to execute subtask {subtask.id}: {str(e)}")
-                # Create failure response
-                failure_response = AgentResponse(
-                    subtask_id=subtask.id,
-                    model_used="unknown",
-                    content="",
-                    success=False,
-                    error_message=str(e)
-                )
-                responses.append(failure_response)
+                continue
+            
+            last_response = response
+            if not response.success:
+                cascade_path.append(f"{model_id} (failed)")
+                continue
+            
+            confidence = response.self_assessment.confidence_score if response.self_assessment else 0.0
+            quality = self.arbitration_layer.score_response(response)
+            cascade_path.append(f"{model_id} (confidence {confidence:.2f}, quality {quality:.2f})")
+            
+            if quality > best_quality:
+                best_response, best_quality = response, quality
+            
+            if confidence >= threshold and quality >= threshold:
+                break
+            
+            logger.info(
+                f"Escalating subtask {subtask.id} past {model_id}: "
+                f"confidence {confidence:.2f}, quality {quality:.2f} below {threshold:.2f}"
+            )
         
-        return responses
+        result = best_response or last_response
+        if result is None:
+            return AgentResponse(
+                subtask_id=subtask.id,
+                model_used="none_available",
+                content="",
+                success=False,
+                error_message=f"No cascade models available for task type {subtask.task_type}"
+            )
+        
+        result.metadata["cascade_path"] = cascade_path
+        return result
+    
+    def _execute_ensemble(
+        self,
+        subtask: Subtask,
+        execution_mode: ExecutionMode,
+        available_models: List[str]
+    ) -> List[AgentResponse]:
+        """
+        Execute a subtask on several models concurrently until a quorum agrees.
+        
+        The best-scoring models for the execution mode run in parallel. As each
+        response arrives it is compared with the earlier ones using the
+        arbitration layer's similarity measure; once enough responses agree,
+        models that haven't finished are abandoned and the agreeing responses
+        are returned for arbitration. Abandoned members finish their current
+        call but don't retry, and are listed under metadata["ensemble"]["cancelled"].
+        
+        Args:
+            subtask: The subtask to execute
+            execution_mode: Current execution mode
+            available_models: IDs of models capable of the subtask
+            
+        Returns:
+            List[AgentResponse]: The agreeing responses, or every response
+                received if no quorum was reached
+        """
+        config = self._execution_configs[execution_mode]
+        models = {
+            m.get_model_id(): m
+            for m in self.model_registry.get_models_for_task_type(subtask.task_type)
+        }
+        ranked = [
+            model_id
+            for model_id in self.cost_optimizer.rank_models_by_score(
+                subtask, execution_mode, available_models
+            )
+            if model_id in models
+        ]
+        selected = ranked[:int(config['ensemble_size'])]
+        quorum = min(int(config['ensemble_quorum']), len(selected))
+        agreement = config['ensemble_agreement']
+        
+        executor = ThreadPoolExecutor(
+            max_workers=max(len(selected), 1), thread_name_prefix=f"ensemble-{subtask.id[:8]}"
+        )
+        cancel = threading.Event()
+        pending = {
+            executor.submit(
+                tracer.bind(self._execute_member, "queue_wait", model_id=model_id),
+                subtask, models[model_id], cancel
+            ): model_id
+            for model_id in selected
+        }
+        received: List[AgentResponse] = []
+        agreeing: List[AgentResponse] = []
+        
+        try:
+            while pending and not agreeing:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    model_id = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except TimeoutError as e:
+                        logger.warning(f"Ensemble member {model_id} timed out for subtask {subtask.id}")
+                        response = AgentResponse(
+                            subtask_id=subtask.id,
+                            model_used=model_id,
+                            content="",
+                            success=False,
+                            error_message=f"Execution timed out: {str(e)}",
+                            metadata={"timeout": True, "timeout_duration": e.timeout_duration}
+                        )
+                    received.append(response)
+                    if not response.success:
+                        continue
+                    
+                    matches = [response] + [
+                        other for other in received[:-1]
+                        if self.arbitration_layer.response_similarity(response, other) >= agreement
+                    ]
+                    if len(matches) >= quorum:
+                        agreeing = matches
+                        break
+        finally:
+            # Model calls are synchronous, so running stragglers can't be
+            # interrupted: they finish their current call, releasing its
+            # concurrency slot, but make no further attempts.
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        ensemble_info = {
+            "models": selected,
+            "quorum": quorum,
+            "quorum_reached": bool(agreeing),
+            "cancelled": list(pending.values())
+        }
+        if agreeing:
+            logger.info(
+                f"Ensemble quorum reached for subtask {subtask.id}: "
+                f"{[r.model_used for r in agreeing]} agree, cancelled {ensemble_info['cancelled']}"
+            )
+        else:
+            logger.warning(f"Ensemble for subtask {subtask.id} finished without a quorum")
+        
+        results = agreeing or received
+        for response in results:
+            response.metadata["ensemble"] = ensemble_info
+        return results
     
     def _create_degraded_response(
         self, 
@@ -976,18 +1517,36 @@ class ConcreteOrchestrationLayer(OrchestrationLayer):
                 'cost_multiplier': 0.7,  # Use cheaper models
                 'time_multiplier': 0.5,  # Prioritize speed
                 'quality_threshold': 0.6,  # Lower quality threshold
-                'parallelism_factor': 1.5  # More aggressive parallelism
+                'parallelism_factor': 1.5,  # More aggressive parallelism
+                'ensemble_size': 1,  # Never fan out critical subtasks
+                'ensemble_quorum': 1,
+                'ensemble_agreement': 0.5
             },
             ExecutionMode.BALANCED: {
                 'cost_multiplier': 1.0,  # Standard cost
                 'time_multiplier': 1.0,  # Standard time
                 'quality_threshold': 0.8,  # Standard quality
-                'parallelism_factor': 1.0  # Standard parallelism
+                'parallelism_factor': 1.0,  # Standard parallelism
+                'ensemble_size': 3,  # Models run concurrently for critical subtasks
+                'ensemble_quorum': 2,  # Agreeing responses needed to stop early
+                'ensemble_agreement': 0.5  # Similarity at which two responses agree
             },
             ExecutionMode.BEST_QUALITY: {
                 'cost_multiplier': 1.5,  # Use premium models
                 'time_multiplier': 1.8,  # Allow more time
                 'quality_threshold': 0.95,  # High quality threshold
-                'parallelism_factor': 0.8  # Less parallelism for quality
+                'parallelism_factor': 0.8,  # Less parallelism for quality
+                'ensemble_size': 3,
+                'ensemble_quorum': 2,
+                'ensemble_agreement': 0.5
+            },
+            ExecutionMode.CASCADE: {
+                'cost_multiplier': 0.8,  # Cheap tier first, occasional escalation
+                'time_multiplier': 1.2,  # Escalations add latency
+                'quality_threshold': 0.7,  # Escalate below this confidence/quality
+                'parallelism_factor': 1.0,  # Standard parallelism
+                'ensemble_size': 1,  # Escalation replaces fan-out
+                'ensemble_quorum': 1,
+                'ensemble_agreement': 0.5
             }
         }
\ No newline at end of file
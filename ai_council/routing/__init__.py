@@ -1,10 +1,21 @@
 """Model routing and context protocol components."""
 
-from .registry import ModelRegistryImpl
-from .context_protocol import ModelContextProtocolImpl, RoutingDecision
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .registry import ModelRegistryImpl
+    from .context_protocol import ModelContextProtocolImpl, RoutingDecision
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "ModelRegistryImpl": ".registry",
+    "ModelContextProtocolImpl": ".context_protocol",
+    "RoutingDecision": ".context_protocol",
+})
 
 __all__ = [
     "ModelRegistryImpl",
     "ModelContextProtocolImpl", 
     "RoutingDecision"
-]
\ No newline at end of file
+]
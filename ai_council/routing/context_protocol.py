@@ -4,11 +4,15 @@ from typing import List, Dict, Set, Optional
 from dataclasses import dataclass
 
 from ..core.interfaces import ModelContextProtocol, ModelSelection, ExecutionPlan, ModelRegistry
+from ..core.metrics import CacheMetrics
 from ..core.models import (
     Subtask, TaskType, ExecutionMode, RiskLevel, Priority
 )
 
 
+_cache_metrics = CacheMetrics("routing")
+
+
 @dataclass
 class RoutingDecision:
     """Represents a routing decision with reasoning."""
@@ -45,13 +49,15 @@ class ModelContextProtocolImpl(ModelContextProtocol):
         cache_key = self._create_cache_key(subtask)
         
         # Check cache first
-        if cache_key in self._routing_cache:
-            cached_decision = self._routing_cache[cache_key]
+        cached_decision = self._routing_cache.get(cache_key)
+        if cached_decision is not None:
+            _cache_metrics.hit()
             return ModelSelection(
                 model_id=cached_decision.model_id,
                 confidence=cached_decision.confidence,
                 reasoning=cached_decision.reasoning
             )
+        _cache_metrics.miss()
         
         # Get candidate models for the task type
         if not subtask.task_type:
@@ -1,5 +1,14 @@
 """Synthesis layer for final output generation."""
 
-from .layer import SynthesisLayerImpl
+from typing import TYPE_CHECKING
 
-__all__ = ['SynthesisLayerImpl']
\ No newline at end of file
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .layer import SynthesisLayerImpl
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "SynthesisLayerImpl": ".layer",
+})
+
+__all__ = ['SynthesisLayerImpl']
@@ -0,0 +1,186 @@
+"""Incremental synthesis that emits response sections as subtasks complete.
+
+``SynthesisLayerImpl.synthesize`` needs every validated response before it
+produces any text. ``IncrementalSynthesizerImpl`` instead receives responses one
+at a time, in whatever order they finish, and emits a section per subtask as
+soon as every subtask before it in the plan's sequential order is settled
+(answered or skipped). Sentences that repeat text already emitted are dropped,
+and the sections share the synthesis layer's output length budget.
+"""
+
+import logging
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
+
+from ..core.interfaces import IncrementalSynthesizer
+from ..core.models import AgentResponse, FinalResponse, SynthesisSection
+from .normalizer import normalize_text
+from .similarity import SimilarityIndex, tokenize
+
+if TYPE_CHECKING:
+    from .layer import SynthesisLayerImpl
+
+
+logger = logging.getLogger(__name__)
+
+SECTION_SEPARATOR = "\n\n"
+
+
+class IncrementalSynthesizerImpl(IncrementalSynthesizer):
+    """Builds a final response section by section in sequential order."""
+
+    def __init__(
+        self,
+        synthesis_layer: "SynthesisLayerImpl",
+        sequential_order: List[str],
+        max_length: Optional[int] = None
+    ):
+        """
+        Initialize the synthesizer.
+
+        Args:
+            synthesis_layer: Layer providing redundancy threshold, confidence
+                and cost calculations
+            sequential_order: Subtask IDs in the order sections should appear
+            max_length: Maximum total length of the sections; defaults to the
+                layer's maximum response length
+        """
+        if len(set(sequential_order)) != len(sequential_order):
+            raise ValueError("sequential_order must not contain duplicate subtask IDs")
+
+        self._layer = synthesis_layer
+        self._order = list(sequential_order)
+        self._positions = {subtask_id: position for position, subtask_id in enumerate(self._order)}
+        self._max_length = max_length if max_length is not None else synthesis_layer._max_response_length
+
+        self._buffered: Dict[str, AgentResponse] = {}
+        self._settled: Set[str] = set()
+        self._next = 0  # Position of the first subtask not yet released
+        self._sections: List[SynthesisSection] = []
+        self._responses: List[AgentResponse] = []
+        self._emitted = SimilarityIndex(synthesis_layer._redundancy_threshold)
+        self._length = 0
+
+    @property
+    def sections(self) -> List[SynthesisSection]:
+        """Sections emitted so far, in order."""
+        return list(self._sections)
+
+    def add(self, response: AgentResponse) -> List[SynthesisSection]:
+        """
+        Add the validated response for a subtask.
+
+        Args:
+            response: The validated response for one subtask
+
+        Returns:
+            List[SynthesisSection]: Sections finalized by this response, in order
+
+        Raises:
+            ValueError: If the subtask is unknown or was already settled
+        """
+        self._check_pending(response.subtask_id)
+        self._settled.add(response.subtask_id)
+        self._responses.append(response)
+        if response.success and response.content:
+            self._buffered[response.subtask_id] = response
+        return self._release()
+
+    def skip(self, subtask_id: str) -> List[SynthesisSection]:
+        """
+        Mark a subtask as producing no section, e.g. because it failed.
+
+        Args:
+            subtask_id: ID of the subtask to skip
+
+        Returns:
+            List[SynthesisSection]: Sections unblocked by skipping the subtask
+
+        Raises:
+            ValueError: If the subtask is unknown or was already settled
+        """
+        self._check_pending(subtask_id)
+        self._settled.add(subtask_id)
+        return self._release()
+
+    def finish(self) -> FinalResponse:
+        """
+        Flush sections for every answered subtask and build the final response.
+
+        Subtasks that were never settled are skipped.
+
+        Returns:
+            FinalResponse: The complete response made of all emitted sections
+        """
+        self._settled.update(self._order)
+        self._release()
+
+        if not self._sections:
+            return FinalResponse(
+                content="",
+                overall_confidence=0.0,
+                success=False,
+                error_message="No successful responses available for synthesis"
+            )
+
+        used = [resp for resp in self._responses if resp.success]
+        return FinalResponse(
+            content=SECTION_SEPARATOR.join(section.content for section in self._sections),
+            overall_confidence=self._layer._calculate_overall_confidence(used),
+            cost_breakdown=self._layer._create_cost_breakdown(self._responses),
+            models_used=list(dict.fromkeys(section.model_used for section in self._sections)),
+            success=True
+        )
+
+    def _check_pending(self, subtask_id: str) -> None:
+        if subtask_id not in self._positions:
+            raise ValueError(f"Subtask {subtask_id} is not in the sequential order")
+        if subtask_id in self._settled:
+            raise ValueError(f"Subtask {subtask_id} was already added or skipped")
+
+    def _release(self) -> List[SynthesisSection]:
+        released = []
+        while self._next < len(self._order) and self._order[self._next] in self._settled:
+            response = self._buffered.pop(self._order[self._next], None)
+            self._next += 1
+            if response is None:
+                continue
+            section = self._build_section(response)
+            if section is not None:
+                self._sections.append(section)
+                released.append(section)
+        return released
+
+    def _build_section(self, response: AgentResponse) -> Optional[SynthesisSection]:
+        budget = self._max_length - self._length
+        if self._sections:
+            budget -= len(SECTION_SEPARATOR)
+        if budget <= 3:
+            logger.debug(f"Output budget exhausted, dropping section for subtask {response.subtask_id}")
+            return None
+
+        content = normalize_text(self._unique_text(response), budget)
+        if not content:
+            return None
+
+        if self._sections:
+            self._length += len(SECTION_SEPARATOR)
+        self._length += len(content)
+        return SynthesisSection(
+            index=len(self._sections),
+            subtask_id=response.subtask_id,
+            content=content,
+            model_used=response.model_used
+        )
+
+    def _unique_text(self, response: AgentResponse) -> str:
+        """Keep the sentences of a response that don't repeat emitted text."""
+        text = response.content
+        kept = []
+        for start, end in response.text_view.sentence_spans:
+            sentence = text[start:end]
+            if len(sentence.strip()) > 10:  # Very short sentences are never redundant
+                words = tokenize(sentence)
+                if self._emitted.find_or_add(words) is not None:
+                    continue
+            kept.append(text[start:end + 1])
+        return "".join(kept)
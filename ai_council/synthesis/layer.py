@@ -1,11 +1,13 @@
 """Implementation of the SynthesisLayer for final output generation."""
 
-import re
 from typing import List, Dict, Set, Optional
 from datetime import datetime
 
 from ..core.interfaces import SynthesisLayer, ExecutionMetadata
-from ..core.models import AgentResponse, FinalResponse, CostBreakdown
+from ..core.models import AgentResponse, FinalResponse, CostBreakdown, replace_unvalidated
+from .incremental import IncrementalSynthesizerImpl
+from .normalizer import normalize_text, normalize_tone
+from .similarity import SimilarityIndex, tokenize
 
 
 class SynthesisLayerImpl(SynthesisLayer):
@@ -42,7 +44,8 @@ class SynthesisLayerImpl(SynthesisLayer):
         
         try:
             # Extract content from all responses
-            response_contents = [resp.content for resp in validated_responses if resp.success]
+            successful = [resp for resp in validated_responses if resp.success]
+            response_contents = [resp.content for resp in successful]
             
             if not response_contents:
                 return FinalResponse(
@@ -53,7 +56,9 @@ class SynthesisLayerImpl(SynthesisLayer):
                 )
             
             # Remove redundant content
-            deduplicated_content = self._remove_redundancy(response_contents)
+            deduplicated_content = self._remove_redundancy(
+                response_contents, [resp.text_view.token_set for resp in successful]
+            )
             
             # Synthesize into coherent response
             synthesized_content = self._synthesize_content(deduplicated_content)
@@ -101,32 +106,8 @@ class SynthesisLayerImpl(SynthesisLayer):
         if not content:
             return ""
         
-        # Remove excessive whitespace and normalize line breaks
-        normalized = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-        normalized = re.sub(r'[ \t]+', ' ', normalized)
-        normalized = normalized.strip()
-        
-        # Ensure sentences end with proper punctuation
-        sentences = normalized.split('. ')
-        normalized_sentences = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and not sentence.endswith(('.', '!', '?', ':')):
-                sentence += '.'
-            if sentence:
-                normalized_sentences.append(sentence)
-        
-        normalized = '. '.join(normalized_sentences)
-        
-        # Remove redundant phrases and normalize tone
-        normalized = self._normalize_tone(normalized)
-        
-        # Truncate if too long
-        if len(normalized) > self._max_response_length:
-            normalized = normalized[:self._max_response_length - 3] + "..."
-        
-        return normalized
+        # Normalize incrementally so oversized output stops at the length budget
+        return normalize_text(content, self._max_response_length)
     
     def attach_metadata(self, response: FinalResponse, metadata: ExecutionMetadata) -> FinalResponse:
         """Attach execution metadata to the final response for explainability.
@@ -141,23 +122,30 @@ class SynthesisLayerImpl(SynthesisLayer):
         Returns:
             FinalResponse: Response with attached execution metadata
         """
-        # Create a new response with the metadata attached
-        return FinalResponse(
-            content=response.content,
-            overall_confidence=response.overall_confidence,
-            execution_metadata=metadata,
-            cost_breakdown=response.cost_breakdown,
-            models_used=response.models_used,
-            timestamp=response.timestamp,
-            success=response.success,
-            error_message=response.error_message
-        )
+        # Copy the already validated response with the metadata attached
+        return replace_unvalidated(response, execution_metadata=metadata)
+    
+    def create_incremental_synthesizer(self, sequential_order: List[str]) -> IncrementalSynthesizerImpl:
+        """Create a synthesizer that emits sections as subtask results arrive.
+        
+        Args:
+            sequential_order: Subtask IDs in the order sections should appear
+            
+        Returns:
+            IncrementalSynthesizerImpl: Synthesizer sharing this layer's settings
+        """
+        return IncrementalSynthesizerImpl(self, sequential_order)
     
-    def _remove_redundancy(self, contents: List[str]) -> List[str]:
+    def _remove_redundancy(
+        self,
+        contents: List[str],
+        token_sets: Optional[List[Set[str]]] = None
+    ) -> List[str]:
         """Remove redundant content from multiple responses.
         
         Args:
             contents: List of response contents
+            token_sets: Optional precomputed word sets, one per content
             
         Returns:
             List[str]: Deduplicated content list
@@ -168,28 +156,16 @@ class SynthesisLayerImpl(SynthesisLayer):
         if len(contents) == 1:
             return contents
         
-        # Simple redundancy removal based on content similarity
+        # Each content is tokenized once; the index only verifies likely duplicates
         deduplicated = []
+        index = SimilarityIndex(self._redundancy_threshold)
         
-        for content in contents:
-            is_redundant = False
-            content_words = set(content.lower().split())
+        for position, content in enumerate(contents):
+            content_words = token_sets[position] if token_sets else tokenize(content)
+            if index.find_or_add(content_words) is not None:
+                continue
             
-            for existing in deduplicated:
-                existing_words = set(existing.lower().split())
-                
-                # Calculate Jaccard similarity
-                intersection = len(content_words & existing_words)
-                union = len(content_words | existing_words)
-                
-                if union > 0:
-                    similarity = intersection / union
-                    if similarity > self._redundancy_threshold:
-                        is_redundant = True
-                        break
-            
-            if not is_redundant:
-                deduplicated.append(content)
+            deduplicated.append(content)
         
         return deduplicated
     
@@ -240,26 +216,19 @@ class SynthesisLayerImpl(SynthesisLayer):
         new_sentences = [s.strip() for s in new_content.split('.') if s.strip()]
         existing_sentences = [s.strip() for s in existing_content.split('.') if s.strip()]
         
+        existing_index = SimilarityIndex(0.6)  # Lower threshold for unique info
+        for existing_sentence in existing_sentences:
+            existing_index.add(tokenize(existing_sentence))
+        
         unique_sentences = []
         for sentence in new_sentences:
-            sentence_words = set(sentence.lower().split())
-            is_unique = True
+            if len(sentence) <= 10:  # Ignore very short sentences
+                continue
             
-            for existing_sentence in existing_sentences:
-                existing_words = set(existing_sentence.lower().split())
-                
-                # Check if sentence is substantially different
-                if sentence_words and existing_words:
-                    intersection = len(sentence_words & existing_words)
-                    union = len(sentence_words | existing_words)
-                    similarity = intersection / union if union > 0 else 0
-                    
-                    if similarity > 0.6:  # Lower threshold for unique info
-                        is_unique = False
-                        break
-            
-            if is_unique and len(sentence) > 10:  # Ignore very short sentences
+            if existing_index.find_similar(tokenize(sentence)) is None:
                 unique_sentences.append(sentence)
+                if len(unique_sentences) == 3:
+                    break
         
         return '. '.join(unique_sentences[:3])  # Limit to 3 unique sentences
     
@@ -272,22 +241,7 @@ class SynthesisLayerImpl(SynthesisLayer):
         Returns:
             str: Content with normalized tone
         """
-        # Remove common redundant phrases
-        redundant_phrases = [
-            r'\b(in conclusion|to conclude|in summary|to summarize)\b,?\s*',
-            r'\b(as mentioned|as stated|as discussed)\s+(earlier|before|above)\b,?\s*',
-            r'\b(it is important to note that|it should be noted that)\b,?\s*',
-            r'\b(please note that|note that)\b,?\s*'
-        ]
-        
-        normalized = content
-        for phrase_pattern in redundant_phrases:
-            normalized = re.sub(phrase_pattern, '', normalized, flags=re.IGNORECASE)
-        
-        # Clean up any double spaces created by removals
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        return normalized.strip()
+        return normalize_tone(content)
     
     def _calculate_overall_confidence(self, responses: List[AgentResponse]) -> float:
         """Calculate overall confidence from multiple agent responses.
@@ -466,13 +420,4 @@ class NoOpSynthesisLayer(SynthesisLayer):
         Returns:
             FinalResponse: Response with attached metadata
         """
-        return FinalResponse(
-            content=response.content,
-            overall_confidence=response.overall_confidence,
-            execution_metadata=metadata,
-            cost_breakdown=response.cost_breakdown,
-            models_used=response.models_used,
-            timestamp=response.timestamp,
-            success=response.success,
-            error_message=response.error_message
-        )
\ No newline at end of file
+        return replace_unvalidated(response, execution_metadata=metadata)
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Streaming output normalization for the synthesis layer.
+
+``SynthesisLayerImpl.normalize_output`` used to run every whitespace,
+punctuation and tone rule over the whole synthesized text before truncating
+it to the response budget. ``StreamingNormalizer`` applies the same rules
+incrementally and stops consuming input once the budget is exceeded, producing
+identical output.
+
+The rules can be applied piecewise because none of them reaches across the
+points where the text is cut:
+
+* whitespace rules only match inside runs of whitespace, and input is only cut
+  right after a non-whitespace character;
+* sentences are split on ``'. '`` exactly as before, with the unfinished
+  last sentence carried over to the next chunk;
+* tone phrases contain only letters, commas and whitespace, so they never
+  span a period. Finished sentences end in punctuation, and long unfinished
+  sentences are flushed up to their last period.
+"""
+
+import re
+from typing import List
+
+
+_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
+_HORIZONTAL_SPACE = re.compile(r'[ \t]+')
+_WHITESPACE = re.compile(r'\s+')
+_SENTENCE_ENDINGS = ('.', '!', '?', ':')
+
+# Applied one after another, as a removal can expose a later phrase
+REDUNDANT_PHRASES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\b(in conclusion|to conclude|in summary|to summarize)\b,?\s*',
+        r'\b(as mentioned|as stated|as discussed)\s+(earlier|before|above)\b,?\s*',
+        r'\b(it is important to note that|it should be noted that)\b,?\s*',
+        r'\b(please note that|note that)\b,?\s*'
+    )
+]
+
+
+def _remove_phrases(content: str) -> str:
+    for phrase in REDUNDANT_PHRASES:
+        content = phrase.sub('', content)
+    return _WHITESPACE.sub(' ', content)
+
+
+def normalize_tone(content: str) -> str:
+    """Remove redundant phrases and collapse whitespace."""
+    return _remove_phrases(content).strip()
+
+
+class StreamingNormalizer:
+    """Normalizes text fed in arbitrary chunks, stopping at an output budget."""
+
+    def __init__(self, max_length: int = 5000):
+        """
+        Initialize the normalizer.
+
+        Args:
+            max_length: Maximum length of the normalized output; longer output
+                is cut to ``max_length - 3`` characters followed by "..."
+        """
+        self.max_length = max_length
+        self._pending = ""  # Raw trailing whitespace not yet safe to normalize
+        self._carry: List[str] = []  # Unfinished sentence, in fragments
+        self._in_sentence = False  # Part of the unfinished sentence was emitted
+        self._parts: List[str] = []
+        self._length = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the output already exceeds the budget."""
+        return self._length > self.max_length
+
+    def feed(self, text: str) -> None:
+        """
+        Add the next chunk of input.
+
+        Args:
+            text: Raw text continuing the previous chunks
+        """
+        if self.done or not text:
+            return
+
+        self._pending += text
+        end = len(self._pending.rstrip())
+        if end == 0:
+            return
+
+        ready, self._pending = self._pending[:end], self._pending[end:]
+        ready = _HORIZONTAL_SPACE.sub(' ', _BLANK_LINES.sub('\n\n', ready))
+
+        # A separator may straddle the carry and the new text, so the last
+        # carried character is split together with it
+        joint = self._carry[-1][-1:] if self._carry else ""
+        pieces = (joint + ready).split('. ')
+        output: List[str] = []
+
+        if len(pieces) > 1:
+            carried = ''.join(self._carry)
+            self._close_sentence(carried[:len(carried) - len(joint)] + pieces[0], output)
+            for sentence in pieces[1:-1]:
+                self._close_sentence(sentence, output)
+            self._carry = [pieces[-1]]
+            tail = pieces[-1]
+        else:
+            self._carry.append(ready)
+            tail = joint + ready
+
+        # Flush a long unfinished sentence up to its last period
+        cut = tail.rfind('.', 0, len(tail) - 1)
+        if cut != -1:
+            carried = ''.join(self._carry)
+            cut += len(carried) - len(tail) + 1
+            self._open_sentence(carried[:cut], output)
+            self._carry = [carried[cut:]]
+
+        self._write(output)
+
+    def finish(self) -> str:
+        """
+        Flush the remaining input and return the normalized text.
+
+        Returns:
+            str: The normalized, possibly truncated, text
+        """
+        if not self.done:
+            # Trailing whitespace is stripped, so the last sentence is complete
+            output: List[str] = []
+            self._close_sentence(''.join(self._carry), output)
+            self._write(output)
+            self._carry = []
+            self._pending = ""
+
+        normalized = ''.join(self._parts)
+        if len(normalized) > self.max_length:
+            normalized = normalized[:self.max_length - 3] + "..."
+        return normalized
+
+    def _separator(self, output: List[str]) -> str:
+        return '. ' if self._parts or output else ''
+
+    def _close_sentence(self, sentence: str, output: List[str]) -> None:
+        if self._in_sentence:
+            self._in_sentence = False
+            sentence = sentence.rstrip()
+            if not sentence:
+                return
+        else:
+            sentence = sentence.strip()
+            if not sentence:
+                return
+            sentence = self._separator(output) + sentence
+        if not sentence.endswith(_SENTENCE_ENDINGS):
+            sentence += '.'
+        output.append(sentence)
+
+    def _open_sentence(self, fragment: str, output: List[str]) -> None:
+        if not self._in_sentence:
+            self._in_sentence = True
+            fragment = self._separator(output) + fragment.lstrip()
+        output.append(fragment)
+
+    def _write(self, output: List[str]) -> None:
+        if not output:
+            return
+        batch = _remove_phrases(''.join(output))
+        self._parts.append(batch)
+        self._length += len(batch)
+
+
+def normalize_text(content: str, max_length: int = 5000, chunk_size: int = 4096) -> str:
+    """
+    Normalize whitespace, sentence punctuation and tone, then truncate.
+
+    Args:
+        content: Raw content to normalize
+        max_length: Maximum length of the normalized output
+        chunk_size: Number of input characters processed per step
+
+    Returns:
+        str: The normalized content
+    """
+    normalizer = StreamingNormalizer(max_length)
+    for start in range(0, len(content), chunk_size):
+        normalizer.feed(content[start:start + chunk_size])
+        if normalizer.done:
+            break
+    return normalizer.finish()
@@ -0,0 +1,201 @@
+"""Sketch-based near-duplicate detection for the synthesis layer.
+
+Redundancy checks in synthesis compare every new piece of text against
+everything kept so far, which is quadratic in the number of responses or
+sentences. ``SimilarityIndex`` keeps each text's token set and, once the index
+grows past a small size, a MinHash signature split into LSH bands. A lookup
+then only computes exact Jaccard similarity for candidates that share a band,
+so the result matches the exact check with high probability at a fraction of
+the cost. Small inputs are always compared exactly.
+"""
+
+import random
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def tokenize(text: str) -> Set[str]:
+    """Get the set of lowercase whitespace-separated words in a text."""
+    return set(text.lower().split())
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Jaccard similarity of two token sets, 0.0 if either is empty."""
+    if not first or not second:
+        return 0.0
+    intersection = len(first & second)
+    return intersection / (len(first) + len(second) - intersection)
+
+
+def lsh_parameters(threshold: float, num_perm: int, target_recall: float = 0.99) -> Tuple[int, int]:
+    """
+    Choose an LSH banding for a similarity threshold.
+
+    Picks the largest number of rows per band for which a pair at the
+    threshold still becomes a candidate with at least ``target_recall``
+    probability. More rows mean fewer false candidates to verify.
+
+    Args:
+        threshold: Jaccard similarity that must be detected
+        num_perm: Number of MinHash permutations in a signature
+        target_recall: Minimum candidate probability at the threshold
+
+    Returns:
+        tuple: (bands, rows_per_band)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        recall = 1.0 - (1.0 - threshold ** rows) ** bands
+        if recall < target_recall:
+            break
+        best = (bands, rows)
+    return best
+
+
+class MinHasher:
+    """Computes MinHash signatures of token sets."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Initialize the hash family.
+
+        Args:
+            num_perm: Number of hash permutations per signature
+            seed: Seed for the permutation coefficients
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a token set."""
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        # (a * h + b) mod p for every token, built from bound int methods so
+        # the per-token work stays out of the interpreter loop
+        modulo = _MERSENNE_PRIME.__rmod__
+        return tuple(
+            min(map(modulo, map(b.__add__, map(a.__mul__, hashes)))) & _MAX_HASH
+            for a, b in self._permutations
+        )
+
+
+class SimilarityIndex:
+    """Index of token sets answering "is anything already here similar?".
+
+    Similarity means Jaccard similarity strictly greater than the threshold.
+    Below ``exact_limit`` stored items every lookup compares exactly; past it,
+    lookups only verify LSH candidates.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int = 64,
+        exact_limit: int = 32,
+        seed: int = 1
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Jaccard similarity above which two texts are similar
+            num_perm: Number of MinHash permutations per signature
+            exact_limit: Item count below which lookups skip LSH
+            seed: Seed for the MinHash permutations
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between 0.0 and 1.0")
+
+        self.threshold = threshold
+        self.exact_limit = exact_limit
+        self._hasher = MinHasher(num_perm, seed)
+        self._bands, self._rows = lsh_parameters(max(threshold, 0.01), num_perm)
+        self._items: List[Set[str]] = []
+        self._buckets: Optional[List[Dict[Tuple[int, ...], List[int]]]] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, tokens: Set[str]) -> int:
+        """
+        Add a token set to the index.
+
+        Returns:
+            The id of the stored item
+        """
+        return self._add(tokens, None)
+
+    def find_similar(self, tokens: Set[str]) -> Optional[int]:
+        """
+        Find a stored item similar to a token set.
+
+        Returns:
+            The id of a similar item, or None
+        """
+        if not tokens:
+            return None
+        keys = self._band_keys(tokens) if self._buckets is not None else None
+        return self._find(tokens, keys)
+
+    def find_or_add(self, tokens: Set[str]) -> Optional[int]:
+        """
+        Find a stored item similar to a token set, adding the set if there is none.
+
+        Equivalent to :meth:`find_similar` followed by :meth:`add` on a miss,
+        but the set's MinHash signature is computed once for both.
+
+        Returns:
+            The id of a similar item, or None if the set was added
+        """
+        keys = self._band_keys(tokens) if tokens and self._buckets is not None else None
+        if tokens:
+            similar = self._find(tokens, keys)
+            if similar is not None:
+                return similar
+        self._add(tokens, keys)
+        return None
+
+    def _find(self, tokens: Set[str], keys: Optional[List[Tuple[int, ...]]]) -> Optional[int]:
+        if keys is None:
+            candidates: Iterable[int] = range(len(self._items))
+        else:
+            found: Set[int] = set()
+            for band, key in enumerate(keys):
+                found.update(self._buckets[band].get(key, ()))
+            candidates = sorted(found)
+
+        for item_id in candidates:
+            if jaccard(tokens, self._items[item_id]) > self.threshold:
+                return item_id
+        return None
+
+    def _add(self, tokens: Set[str], keys: Optional[List[Tuple[int, ...]]]) -> int:
+        item_id = len(self._items)
+        self._items.append(tokens)
+        if self._buckets is not None:
+            self._index(item_id, keys if keys is not None else self._band_keys(tokens))
+        elif len(self._items) >= self.exact_limit:
+            self._buckets = [defaultdict(list) for _ in range(self._bands)]
+            for existing_id, existing in enumerate(self._items):
+                self._index(existing_id, self._band_keys(existing))
+        return item_id
+
+    def _band_keys(self, tokens: Set[str]) -> List[Tuple[int, ...]]:
+        signature = self._hasher.signature(tokens)
+        rows = self._rows
+        return [signature[band * rows:(band + 1) * rows] for band in range(self._bands)]
+
+    def _index(self, item_id: int, keys: List[Tuple[int, ...]]) -> None:
+        for band, key in enumerate(keys):
+            self._buckets[band][key].append(item_id)
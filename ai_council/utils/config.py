@@ -1,12 +1,9 @@
 """Configuration management for AI Council."""
 
 import os
-import importlib
-import inspect
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Type, Callable, Union
-import yaml
 from ai_council.core.models import ExecutionMode, RiskLevel, TaskType, Priority
 
 
@@ -52,6 +49,7 @@ class ExecutionModeConfig:
     cost_limit: Optional[float] = None
     preferred_model_types: List[str] = field(default_factory=list)
     fallback_strategy: str = "automatic"
+    quality_threshold: Optional[float] = None  # Minimum confidence/quality before cascade escalation
 
 
 @dataclass
@@ -94,6 +92,7 @@ class ExecutionConfig:
     default_timeout_seconds: float = 60.0
     max_retries: int = 3
     enable_arbitration: bool = True
+    arbitration_use_processes: bool = False  # Arbitrate subtask groups in a process pool, not threads
     enable_synthesis: bool = True
     default_accuracy_requirement: float = 0.8
 
@@ -107,12 +106,61 @@ class CostConfig:
     cost_alert_threshold: float = 5.0
 
 
+@dataclass
+class ResilienceConfig:
+    """Configuration for resilience state handling."""
+    shared_state_backend: str = "local"  # "local" or "sqlite"
+    shared_state_path: Optional[str] = None  # Defaults to <data_dir>/resilience_state.db
+    adaptive_concurrency: bool = True
+    initial_concurrency: int = 10
+    min_concurrency: int = 1
+    max_concurrency: int = 100
+    retry_budget_ratio: float = 0.1  # Retries may not exceed this fraction of first attempts
+    retry_budget_min_retries: int = 10
+    retry_budget_window_seconds: float = 10.0
+    request_workers: int = 4  # Requests the web backend runs concurrently
+    request_queue_size: int = 16  # Requests that may wait; more are rejected with 429
+
+
+@dataclass
+class TracingConfig:
+    """Configuration for per-request tracing spans."""
+    enabled: bool = True
+    exporter: str = "none"  # "none", "jsonl" or "otlp"; spans are always attached to responses
+    jsonl_path: Optional[str] = None  # Defaults to <data_dir>/traces.jsonl
+    otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    service_name: str = "ai-council"
+
+
+@dataclass
+class ReplayConfig:
+    """Configuration for recording and replaying provider traffic."""
+    mode: str = "off"  # "off", "record" or "replay"
+    path: Optional[str] = None  # Defaults to <data_dir>/provider_traffic.cap
+    timing: bool = True  # Replay waits out each call's recorded latency
+
+
+@dataclass
+class ProfilingConfig:
+    """Configuration for profiling requests through the pipeline."""
+    enabled: bool = False
+    mode: str = "sample"  # "sample" (stack sampling) or "cprofile"
+    sample_rate: int = 100  # Profile one request in this many
+    interval_ms: float = 5.0  # Time between stack samples
+    path: Optional[str] = None  # Defaults to <data_dir>/profiles
+    allow_header: bool = False  # Profile /api/process requests sent with X-AI-Council-Profile: 1
+
+
 @dataclass
 class AICouncilConfig:
     """Main configuration class for AI Council."""
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     execution: ExecutionConfig = field(default_factory=ExecutionConfig)
     cost: CostConfig = field(default_factory=CostConfig)
+    resilience: ResilienceConfig = field(default_factory=ResilienceConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
+    replay: ReplayConfig = field(default_factory=ReplayConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
     models: Dict[str, ModelConfig] = field(default_factory=dict)
     
     # Extended configuration
@@ -146,6 +194,8 @@ class AICouncilConfig:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
+        import yaml  # Only needed when a config file is read
+        
         with open(config_path, 'r', encoding='utf-8') as f:
             config_data = yaml.safe_load(f)
         
@@ -166,6 +216,10 @@ class AICouncilConfig:
         logging_data = config_data.get('logging', {})
         execution_data = config_data.get('execution', {})
         cost_data = config_data.get('cost', {})
+        resilience_data = config_data.get('resilience', {})
+        tracing_data = config_data.get('tracing', {})
+        replay_data = config_data.get('replay', {})
+        profiling_data = config_data.get('profiling', {})
         models_data = config_data.get('models', {})
         routing_rules_data = config_data.get('routing_rules', [])
         execution_modes_data = config_data.get('execution_modes', {})
@@ -261,6 +315,10 @@ class AICouncilConfig:
             logging=LoggingConfig(**logging_data),
             execution=ExecutionConfig(**execution_data),
             cost=CostConfig(**cost_data),
+            resilience=ResilienceConfig(**resilience_data),
+            tracing=TracingConfig(**tracing_data),
+            replay=ReplayConfig(**replay_data),
+            profiling=ProfilingConfig(**profiling_data),
             models=models,
             routing_rules=routing_rules,
             execution_modes=execution_modes,
@@ -292,6 +350,7 @@ class AICouncilConfig:
                 'default_timeout_seconds': self.execution.default_timeout_seconds,
                 'max_retries': self.execution.max_retries,
                 'enable_arbitration': self.execution.enable_arbitration,
+                'arbitration_use_processes': self.execution.arbitration_use_processes,
                 'enable_synthesis': self.execution.enable_synthesis,
                 'default_accuracy_requirement': self.execution.default_accuracy_requirement,
             },
@@ -301,6 +360,39 @@ class AICouncilConfig:
                 'enable_cost_tracking': self.cost.enable_cost_tracking,
                 'cost_alert_threshold': self.cost.cost_alert_threshold,
             },
+            'resilience': {
+                'shared_state_backend': self.resilience.shared_state_backend,
+                'shared_state_path': self.resilience.shared_state_path,
+                'adaptive_concurrency': self.resilience.adaptive_concurrency,
+                'initial_concurrency': self.resilience.initial_concurrency,
+                'min_concurrency': self.resilience.min_concurrency,
+                'max_concurrency': self.resilience.max_concurrency,
+                'retry_budget_ratio': self.resilience.retry_budget_ratio,
+                'retry_budget_min_retries': self.resilience.retry_budget_min_retries,
+                'retry_budget_window_seconds': self.resilience.retry_budget_window_seconds,
+                'request_workers': self.resilience.request_workers,
+                'request_queue_size': self.resilience.request_queue_size,
+            },
+            'tracing': {
+                'enabled': self.tracing.enabled,
+                'exporter': self.tracing.exporter,
+                'jsonl_path': self.tracing.jsonl_path,
+                'otlp_endpoint': self.tracing.otlp_endpoint,
+                'service_name': self.tracing.service_name,
+            },
+            'replay': {
+                'mode': self.replay.mode,
+                'path': self.replay.path,
+                'timing': self.replay.timing,
+            },
+            'profiling': {
+                'enabled': self.profiling.enabled,
+                'mode': self.profiling.mode,
+                'sample_rate': self.profiling.sample_rate,
+                'interval_ms': self.profiling.interval_ms,
+                'path': self.profiling.path,
+                'allow_header': self.profiling.allow_header,
+            },
             'models': {
                 name: {
                     'provider': config.provider,
@@ -351,6 +443,7 @@ class AICouncilConfig:
                     'cost_limit': config.cost_limit,
                     'preferred_model_types': config.preferred_model_types,
                     'fallback_strategy': config.fallback_strategy,
+                    'quality_threshold': config.quality_threshold,
                 }
                 for name, config in self.execution_modes.items()
             },
@@ -381,6 +474,8 @@ class AICouncilConfig:
         Args:
             config_path: Path where to save the configuration
         """
+        import yaml
+        
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(config_path, 'w', encoding='utf-8') as f:
@@ -505,6 +600,38 @@ class AICouncilConfig:
         if self.cost.max_cost_per_request <= 0:
             raise ValueError("max_cost_per_request must be positive")
         
+        # Validate resilience config
+        if self.resilience.shared_state_backend not in ("local", "sqlite"):
+            raise ValueError("shared_state_backend must be 'local' or 'sqlite'")
+        
+        if not (0 < self.resilience.min_concurrency <= self.resilience.initial_concurrency
+                <= self.resilience.max_concurrency):
+            raise ValueError("concurrency limits must satisfy 0 < min <= initial <= max")
+        
+        if self.resilience.retry_budget_ratio < 0 or self.resilience.retry_budget_min_retries < 0:
+            raise ValueError("retry budget ratio and minimum retries cannot be negative")
+        
+        if self.resilience.retry_budget_window_seconds <= 0:
+            raise ValueError("retry_budget_window_seconds must be positive")
+        
+        if self.resilience.request_workers < 1 or self.resilience.request_queue_size < 0:
+            raise ValueError("request_workers must be at least 1 and request_queue_size non-negative")
+        
+        # Validate tracing config
+        if self.tracing.exporter not in ("none", "jsonl", "otlp"):
+            raise ValueError("tracing exporter must be 'none', 'jsonl' or 'otlp'")
+        
+        # Validate replay config
+        if self.replay.mode not in ("off", "record", "replay"):
+            raise ValueError("replay mode must be 'off', 'record' or 'replay'")
+        
+        # Validate profiling config
+        if self.profiling.mode not in ("sample", "cprofile"):
+            raise ValueError("profiling mode must be 'sample' or 'cprofile'")
+        
+        if self.profiling.sample_rate < 0 or self.profiling.interval_ms <= 0:
+            raise ValueError("profiling sample_rate cannot be negative and interval_ms must be positive")
+        
         # Validate model configs
         for model_name, model_config in self.models.items():
             if not model_config.name:
@@ -555,6 +682,9 @@ class AICouncilConfig:
             
             if mode_config.cost_limit is not None and mode_config.cost_limit <= 0:
                 raise ValueError(f"Execution mode {mode_name}: cost_limit must be positive")
+            
+            if mode_config.quality_threshold is not None and not (0.0 <= mode_config.quality_threshold <= 1.0):
+                raise ValueError(f"Execution mode {mode_name}: quality_threshold must be between 0.0 and 1.0")
         
         # Validate plugin configs
         for plugin_name, plugin_config in self.plugins.items():
@@ -734,6 +864,18 @@ def create_default_config() -> AICouncilConfig:
             preferred_model_types=["gpt-4", "claude-3"],
             fallback_strategy="highest_quality",
         ),
+        "cascade": ExecutionModeConfig(
+            mode=ExecutionMode.CASCADE,
+            max_parallel_executions=5,
+            timeout_seconds=90.0,
+            max_retries=3,
+            enable_arbitration=True,
+            enable_synthesis=True,
+            accuracy_requirement=0.8,
+            preferred_model_types=["gpt-3.5-turbo", "claude-3", "gpt-4"],
+            fallback_strategy="escalate",
+            quality_threshold=0.7,
+        ),
     }
     
     return config
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Lazy module attributes for fast package imports.
+
+Package ``__init__`` modules use :func:`lazy_attributes` to expose their
+public API without importing the implementing submodules up front. The
+submodule is imported on first attribute access (PEP 562) and the value is
+cached in the package namespace, so later lookups are plain dict hits.
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package: str,
+    attributes: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package: The package's ``__name__``
+        attributes: Maps each public name to the module defining it, relative
+            to the package (e.g. ``".core.models"``)
+
+    Returns:
+        Tuple of the ``__getattr__`` and ``__dir__`` functions to assign at
+        module level
+    """
+    def __getattr__(name: str) -> object:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        namespace = vars(importlib.import_module(package))
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,8 +1,10 @@
 """Plugin management system for AI Council."""
 
+import ast
+import hashlib
 import importlib
-import importlib.util
-import inspect
+import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Type, Any, Optional, Callable
@@ -14,6 +16,8 @@ from .config import PluginConfig, AICouncilConfig
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_VERSION = 1
+
 
 class PluginError(Exception):
     """Exception raised when plugin operations fail."""
@@ -206,6 +210,11 @@ class PluginManager:
     def discover_plugins(self, plugin_dir: Optional[str] = None) -> List[str]:
         """Discover available plugins in the plugin directory.
         
+        Plugin files are inspected with ``ast`` rather than imported, so
+        discovery never runs plugin code. The result of each inspection is
+        kept in a manifest under ``config.cache_dir`` and reused until the
+        file's size, mtime and content hash change.
+        
         Args:
             plugin_dir: Directory to search for plugins (defaults to config.plugin_dir)
             
@@ -219,31 +228,33 @@ class PluginManager:
         if not plugin_path.exists():
             return []
         
-        discovered_plugins = []
+        manifest_path = self._manifest_path(plugin_path)
+        cached = self._load_manifest(manifest_path)
+        files: Dict[str, Dict[str, Any]] = {}
+        changed = False
         
         # Look for Python files in the plugin directory
-        for py_file in plugin_path.rglob("*.py"):
+        for py_file in sorted(plugin_path.rglob("*.py")):
             if py_file.name.startswith("__"):
                 continue
             
             # Convert file path to module path
             relative_path = py_file.relative_to(plugin_path)
-            module_path = str(relative_path.with_suffix("")).replace("/", ".").replace("\\", ".")
+            module_path = ".".join(relative_path.with_suffix("").parts)
             
-            # Try to import and inspect the module
             try:
-                spec = importlib.util.spec_from_file_location(module_path, py_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    # Look for classes that implement our interfaces
-                    for name, obj in inspect.getmembers(module, inspect.isclass):
-                        if self._is_plugin_class(obj):
-                            discovered_plugins.append(f"{module_path}.{name}")
-                            
-            except Exception as e:
+                entry = self._inspect_plugin_file(py_file, module_path, cached.get(relative_path.as_posix()))
+            except OSError as e:
                 logger.debug(f"Could not inspect {py_file}: {e}")
+                continue
+            
+            changed = changed or entry is not cached.get(relative_path.as_posix())
+            files[relative_path.as_posix()] = entry
+        
+        discovered_plugins = self._resolve_plugin_classes(files.values())
+        
+        if changed or set(files) != set(cached):
+            self._save_manifest(manifest_path, plugin_path, files, discovered_plugins)
         
         return discovered_plugins
     
@@ -308,24 +319,132 @@ class PluginManager:
         
         raise PluginError(f"Plugin class {plugin_class.__name__} does not implement any supported interface")
     
-    def _is_plugin_class(self, cls: Type) -> bool:
-        """Check if a class is a valid plugin class.
+    def _manifest_path(self, plugin_path: Path) -> Path:
+        """Get the manifest file for a plugin directory.
+        
+        Args:
+            plugin_path: The plugin directory
+            
+        Returns:
+            Path of the manifest under the cache directory
+        """
+        digest = hashlib.sha1(str(plugin_path.resolve()).encode("utf-8")).hexdigest()[:12]
+        return Path(self.config.cache_dir) / f"plugin_manifest_{digest}.json"
+    
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Load cached file entries, ignoring missing or outdated manifests.
+        
+        Args:
+            manifest_path: Path of the manifest file
+            
+        Returns:
+            Dictionary mapping relative file paths to their cached entries
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+    
+    def _save_manifest(self, manifest_path: Path, plugin_path: Path,
+                       files: Dict[str, Dict[str, Any]], plugins: List[str]) -> None:
+        """Write the manifest atomically; failures only cost a rescan.
+        
+        Args:
+            manifest_path: Path of the manifest file
+            plugin_path: The plugin directory the manifest describes
+            files: Entries keyed by relative file path
+            plugins: The discovered plugin class paths
+        """
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "plugin_dir": str(plugin_path.resolve()),
+            "files": files,
+            "plugins": plugins,
+        }
+        temp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            logger.debug(f"Could not write plugin manifest {manifest_path}: {e}")
+    
+    def _inspect_plugin_file(self, py_file: Path, module_path: str,
+                             cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get the manifest entry for a plugin file, reusing the cached one if unchanged.
         
         Args:
-            cls: The class to check
+            py_file: The plugin file
+            module_path: Module path of the file relative to the plugin directory
+            cached: The file's entry from the previous manifest, if any
             
         Returns:
-            True if the class is a valid plugin
+            The cached entry if still valid, otherwise a new entry
         """
-        if not inspect.isclass(cls):
-            return False
+        stat = py_file.stat()
+        if (cached is not None and cached.get("module") == module_path
+                and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size):
+            return cached
+        
+        source = py_file.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        if cached is not None and cached.get("module") == module_path and cached.get("sha256") == digest:
+            classes = cached.get("classes", {})
+        else:
+            try:
+                classes = _collect_class_bases(ast.parse(source, filename=str(py_file)), module_path)
+            except (SyntaxError, ValueError) as e:
+                logger.debug(f"Could not inspect {py_file}: {e}")
+                classes = {}
+        
+        return {
+            "module": module_path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "classes": classes,
+        }
+    
+    def _resolve_plugin_classes(self, entries) -> List[str]:
+        """Find classes that derive from a supported interface.
         
-        # Check if it implements any of our interfaces
-        for interface_type in self.supported_interfaces.values():
-            if issubclass(cls, interface_type) and cls != interface_type:
-                return True
+        A base counts when its name is a supported interface or when it is a
+        plugin class from the scanned files, so plugins may build on each other
+        across modules.
         
-        return False
+        Args:
+            entries: Manifest entries of the scanned files
+            
+        Returns:
+            Plugin class paths in file and definition order
+        """
+        entries = list(entries)
+        plugins = set()
+        changed = True
+        while changed:
+            changed = False
+            for entry in entries:
+                for class_name, bases in entry["classes"].items():
+                    class_path = f"{entry['module']}.{class_name}"
+                    if class_path in plugins:
+                        continue
+                    if any(base in plugins or base.rsplit(".", 1)[-1] in self.supported_interfaces
+                           for base in bases):
+                        plugins.add(class_path)
+                        changed = True
+        
+        return [
+            f"{entry['module']}.{class_name}"
+            for entry in entries
+            for class_name in entry["classes"]
+            if f"{entry['module']}.{class_name}" in plugins
+        ]
     
     def get_plugin_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all loaded plugins.
@@ -349,6 +468,72 @@ class PluginManager:
         return info
 
 
+def _collect_class_bases(tree: ast.Module, module_path: str) -> Dict[str, List[str]]:
+    """Map each module-level class to its base classes as dotted paths.
+    
+    Names are resolved through the module's imports, so ``from .base import
+    MyModel`` in ``pkg.mod`` gives ``pkg.base.MyModel``. Classes defined in the
+    module resolve to ``module_path.Name``.
+    
+    Args:
+        tree: The parsed module
+        module_path: Module path used to resolve relative imports and local classes
+        
+    Returns:
+        Dictionary mapping class names to their base paths, in definition order
+    """
+    statements = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        statements.append(node)
+        # Definitions guarded by if/try blocks still sit at module level
+        if isinstance(node, (ast.If, ast.Try)):
+            nested = node.body + node.orelse + getattr(node, "finalbody", [])
+            for handler in getattr(node, "handlers", []):
+                nested.extend(handler.body)
+            pending = nested + pending
+    
+    package_parts = module_path.split(".")[:-1]
+    aliases: Dict[str, str] = {}
+    local_classes = {node.name for node in statements if isinstance(node, ast.ClassDef)}
+    for node in statements:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top_level = alias.name.split(".", 1)[0]
+                    aliases[top_level] = top_level
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package_parts[:len(package_parts) - (node.level - 1)] if node.level > 1 else package_parts
+                base_module = ".".join(parts + ([node.module] if node.module else []))
+            else:
+                base_module = node.module or ""
+            for alias in node.names:
+                aliases[alias.asname or alias.name] = f"{base_module}.{alias.name}" if base_module else alias.name
+    
+    def dotted_name(expr: ast.expr) -> Optional[str]:
+        if isinstance(expr, ast.Subscript):
+            return dotted_name(expr.value)
+        if isinstance(expr, ast.Attribute):
+            owner = dotted_name(expr.value)
+            return f"{owner}.{expr.attr}" if owner else None
+        if isinstance(expr, ast.Name):
+            if expr.id in local_classes:
+                return f"{module_path}.{expr.id}"
+            return aliases.get(expr.id, expr.id)
+        return None
+    
+    classes: Dict[str, List[str]] = {}
+    for node in statements:
+        if isinstance(node, ast.ClassDef):
+            bases = [dotted_name(base) for base in node.bases]
+            classes[node.name] = [base for base in bases if base]
+    return classes
+
+
 def create_plugin_manager(config: AICouncilConfig) -> PluginManager:
     """Create and initialize a plugin manager.
     
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for AI Council cold starts.
+
+Runs the CLI and web entry import (``from ai_council.main import AICouncil``)
+in fresh interpreters, reports the median wall time and the number of
+ai_council modules loaded, and exits with status 1 when the median exceeds
+the threshold so CI can catch startup regressions.
+
+Usage:
+    python scripts/benchmark_import.py [--runs 15] [--threshold-ms 100] \
+        [--statement "from ai_council.main import AICouncil"]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+ENTRY_STATEMENT = "from ai_council.main import AICouncil"
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+loaded = [name for name in sys.modules if name == "ai_council" or name.startswith("ai_council.")]
+print(json.dumps({{"elapsed": elapsed, "modules": len(loaded)}}))
+"""
+
+
+def measure(statement):
+    """Run the statement in a fresh interpreter and return (seconds, modules loaded)."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=project_root, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["elapsed"], result["modules"]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=15, help="Fresh interpreters to start")
+    parser.add_argument("--threshold-ms", type=float, default=100.0, help="Maximum allowed median")
+    parser.add_argument("--statement", default=ENTRY_STATEMENT, help="Code to time")
+    args = parser.parse_args()
+
+    samples = [measure(args.statement) for _ in range(args.runs)]
+    median_ms = statistics.median(elapsed for elapsed, _ in samples) * 1000
+    modules = samples[-1][1]
+
+    print(f"{args.statement!r}: median {median_ms:.1f} ms over {args.runs} runs, "
+          f"{modules} ai_council modules loaded")
+    if median_ms > args.threshold_ms:
+        print(f"FAIL: median exceeds threshold of {args.threshold_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Allocation benchmark for AI Council core models.
+
+Builds the objects created for one request (a task, its subtasks, one agent
+response with a self-assessment per subtask, and the final response) many
+times, comparing the regular dataclasses with the compact slotted variants.
+Reports build time, peak traced memory and garbage collector runs.
+
+Usage:
+    python scripts/benchmark_models.py [--requests 2000] [--subtasks 8]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ai_council.core.compact import (
+    CompactAgentResponse, CompactExecutionMetadata, CompactFinalResponse,
+    CompactSelfAssessment, CompactSubtask, CompactTask
+)
+from ai_council.core.models import (
+    AgentResponse, ExecutionMetadata, FinalResponse, SelfAssessment, Subtask, Task, TaskType,
+    replace_unvalidated
+)
+
+
+def build_dataclasses(subtask_count):
+    """Build one request's objects with the regular dataclasses."""
+    task = Task(content="Explain caching")
+    responses = []
+    for _ in range(subtask_count):
+        subtask = Subtask(parent_task_id=task.id, content="Explain caching", task_type=TaskType.REASONING)
+        assessment = SelfAssessment(confidence_score=0.8, model_used="model")
+        responses.append(AgentResponse(
+            subtask_id=subtask.id, model_used="model", content="Answer", self_assessment=assessment
+        ))
+    final = FinalResponse(content="Answer", overall_confidence=0.8, models_used=["model"])
+    return replace_unvalidated(final, execution_metadata=ExecutionMetadata()), responses
+
+
+def build_compact(subtask_count, validate=True):
+    """Build one request's objects with the compact slotted variants."""
+    task = CompactTask(content="Explain caching", validate=validate)
+    responses = []
+    for _ in range(subtask_count):
+        subtask = CompactSubtask(
+            parent_task_id=task.id, content="Explain caching",
+            task_type=TaskType.REASONING, validate=validate
+        )
+        assessment = CompactSelfAssessment(confidence_score=0.8, model_used="model", validate=validate)
+        responses.append(CompactAgentResponse(
+            subtask_id=subtask.id, model_used="model", content="Answer",
+            self_assessment=assessment, validate=validate
+        ))
+    final = CompactFinalResponse(
+        content="Answer", overall_confidence=0.8, models_used=["model"],
+        execution_metadata=CompactExecutionMetadata(validate=validate), validate=validate
+    )
+    return final, responses
+
+
+def run(name, build, requests, subtasks, retained=100):
+    """Time a builder and measure memory and GC activity, keeping recent requests alive."""
+    gc.collect()
+    collections_before = sum(stats["collections"] for stats in gc.get_stats())
+    live = []
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        live.append(build(subtasks))
+        if len(live) > retained:
+            live.pop(0)
+    elapsed = time.perf_counter() - start
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+
+    live.clear()
+    gc.collect()
+    tracemalloc.start()
+    for _ in range(retained):
+        live.append(build(subtasks))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<28} {elapsed * 1000:>9.1f} ms {peak / retained / 1024:>10.1f} KiB/req {collections:>8} GC runs")
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests to simulate")
+    parser.add_argument("--subtasks", type=int, default=8, help="Subtasks per request")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests x {args.subtasks} subtasks")
+    print(f"{'variant':<28} {'build time':>12} {'peak memory':>18} {'collections':>15}")
+    run("dataclasses", build_dataclasses, args.requests, args.subtasks)
+    run("compact", build_compact, args.requests, args.subtasks)
+    run("compact, validate=False", lambda n: build_compact(n, validate=False), args.requests, args.subtasks)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
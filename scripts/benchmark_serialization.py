@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for AI Council core models.
+
+Compares the binary and JSON forms of ai_council.core.serialization with
+``dataclasses.asdict`` followed by ``json.dumps``.
+
+Usage:
+    python scripts/benchmark_serialization.py [--iterations 20000] [--content-size 5000]
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ai_council.core.models import AgentResponse, SelfAssessment
+from ai_council.core.serialization import decode, encode, from_json, to_json
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per measurement")
+    parser.add_argument("--content-size", type=int, default=5000, help="Characters of response content")
+    args = parser.parse_args()
+
+    response = AgentResponse(
+        subtask_id="subtask-1",
+        model_used="model-a",
+        content="x" * args.content_size,
+        self_assessment=SelfAssessment(confidence_score=0.8, assumptions=["warm cache"]),
+        metadata={"cascade_path": ["model-a", "model-b"]}
+    )
+    binary = encode(response)
+    text = to_json(response)
+
+    cases = [
+        ("asdict + json.dumps", lambda: json.dumps(dataclasses.asdict(response), default=str)),
+        ("encode (binary)", lambda: encode(response)),
+        ("to_json", lambda: to_json(response)),
+        ("decode (binary)", lambda: decode(binary)),
+        ("from_json", lambda: from_json(text)),
+    ]
+    print(f"AgentResponse with {args.content_size} characters of content")
+    for name, call in cases:
+        elapsed = timeit.timeit(call, number=args.iterations)
+        print(f"{name:<22} {elapsed / args.iterations * 1e6:>8.1f} us/call")
+    print(f"binary size {len(binary)} bytes, JSON size {len(text)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Unit tests for off-loop execution with admission control.
+
+Tests cover ai_council/core/admission.py.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ai_council.core.admission import AdmissionRejectedError, BoundedExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create a small executor and release its threads afterwards."""
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+# =============================================================================
+# Admission Tests
+# =============================================================================
+
+class TestAdmission:
+    """Tests for the bounded backlog."""
+
+    def test_rejects_beyond_workers_and_queue(self, executor):
+        """Test that the third concurrent call is rejected with a retry estimate."""
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: "queued")
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            executor.submit(lambda: "rejected")
+
+        assert excinfo.value.retry_after >= 1
+        assert executor.get_status()["rejected"] == 1
+        release.set()
+        assert running.result(timeout=5) is True
+        assert queued.result(timeout=5) == "queued"
+        assert executor.in_flight == 0
+
+    def test_slot_freed_after_failure(self, executor):
+        """Test that a failing call releases its slot and surfaces the error."""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            executor.submit(fail).result(timeout=5)
+        assert executor.in_flight == 0
+
+    def test_retry_after_scales_with_service_time(self):
+        """Test that retry estimates follow observed service times."""
+        executor = BoundedExecutor(max_workers=2, max_queue=0, smoothing=1.0)
+        executor.submit(time.sleep, 0.05).result(timeout=5)
+
+        assert executor.retry_after() == 1
+        executor._average_service_time = 4.0
+        assert executor.retry_after() == 2
+        executor.shutdown()
+
+    def test_invalid_limits(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError):
+            BoundedExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            BoundedExecutor(max_queue=-1)
+
+
+# =============================================================================
+# Event Loop Tests
+# =============================================================================
+
+class TestEventLoop:
+    """Tests for awaiting work without blocking the loop."""
+
+    def test_slow_call_does_not_block_loop(self, executor):
+        """Test that other coroutines keep running during a slow call."""
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.ensure_future(ticker())
+            result = await executor.run(time.sleep, 0.2)
+            task.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(scenario())
+
+        assert result is None
+        assert ticks >= 5
+
+    def test_stream_relays_items_and_errors(self, executor):
+        """Test that generator items arrive in order and errors propagate."""
+        def produce(count):
+            for index in range(count):
+                yield index
+            raise RuntimeError("done badly")
+
+        async def scenario():
+            received = []
+            with pytest.raises(RuntimeError):
+                async for item in executor.stream(produce, 3):
+                    received.append(item)
+            return received
+
+        assert asyncio.run(scenario()) == [0, 1, 2]
+        assert executor.in_flight == 0
+
+    def test_closed_stream_stops_producer(self, executor):
+        """Test that closing the relay stops the worker and frees its slot."""
+        closed = threading.Event()
+
+        def produce():
+            try:
+                for index in range(500):
+                    yield index
+                    time.sleep(0.01)
+            finally:
+                closed.set()
+
+        async def scenario():
+            stream = executor.stream(produce)
+            received = [await stream.__anext__() for _ in range(2)]
+            await stream.aclose()
+            return received
+
+        assert asyncio.run(scenario()) == [0, 1]
+        assert closed.wait(2.0)
+        deadline = time.monotonic() + 2.0
+        while executor.in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert executor.in_flight == 0
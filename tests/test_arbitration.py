@@ -0,0 +1,192 @@
+"""
+Unit tests for score-based conflict resolution.
+
+Tests cover ai_council/arbitration/layer.py: responses are scored once per
+arbitration and conflicts are resolved by the highest score, with ties
+broken by latency and then cost.
+"""
+
+import os
+import time
+
+import pytest
+
+from ai_council.arbitration.layer import ConcreteArbitrationLayer
+from ai_council.core.interfaces import Conflict
+from ai_council.core.models import AgentResponse, RiskLevel, SelfAssessment
+from ai_council.factory import AICouncilFactory
+from ai_council.utils.config import create_default_config
+
+
+def _response(model, confidence, content="Caching keeps hot data close to the caller.",
+              risk=RiskLevel.LOW, execution_time=1.0, cost=0.01):
+    return AgentResponse(
+        subtask_id="s1",
+        model_used=model,
+        content=content,
+        self_assessment=SelfAssessment(
+            confidence_score=confidence, risk_level=risk,
+            estimated_cost=cost, execution_time=execution_time
+        )
+    )
+
+
+@pytest.fixture
+def layer():
+    return ConcreteArbitrationLayer()
+
+
+# =============================================================================
+# Resolution Tests
+# =============================================================================
+
+class TestScoreBasedResolution:
+    """Tests that conflicts are resolved by the best-scoring response."""
+
+    def test_confidence_conflict_picks_most_confident(self, layer):
+        """Test that the most confident response wins regardless of order."""
+        result = layer.arbitrate([_response("unsure", 0.3), _response("sure", 0.9)])
+
+        assert [r.model_used for r in result.validated_responses] == ["sure"]
+        assert {res.chosen_response_id for res in result.conflicts_resolved} == {"s1_sure"}
+
+    def test_ties_broken_by_latency_then_cost(self, layer):
+        """Test tie-breaking between equally scored responses."""
+        responses = [
+            _response("slow", 0.9, execution_time=3.0),
+            _response("fast-pricey", 0.9, execution_time=1.0, cost=0.05),
+            _response("fast-cheap", 0.9, execution_time=1.0, cost=0.01),
+        ]
+        conflict = layer._create_conflict(
+            layer._compute_features(responses), "quality_conflict", "tie"
+        )
+
+        assert layer.resolve_contradiction(conflict).chosen_response_id == "s1_fast-cheap"
+
+    def test_conflict_without_features_falls_back_to_first(self, layer):
+        """Test resolving a conflict created outside arbitration."""
+        conflict = Conflict(["s1_a", "s1_b"], "content_contradiction", "external")
+
+        assert layer.resolve_contradiction(conflict).chosen_response_id == "s1_a"
+
+    def test_each_response_scored_once(self, layer, monkeypatch):
+        """Test that the composite score is computed once per response."""
+        calls = []
+        original = layer._calculate_quality_score
+
+        def counting(response):
+            calls.append(response.model_used)
+            return original(response)
+
+        monkeypatch.setattr(layer, "_calculate_quality_score", counting)
+        layer.arbitrate([
+            _response("a", 0.2, content="No."),
+            _response("b", 0.9, content="Yes, caching is correct here. " * 10),
+        ])
+
+        assert sorted(calls) == ["a", "b"]
+
+
+# =============================================================================
+# Parallel Group Tests
+# =============================================================================
+
+def _grouped_responses():
+    responses = []
+    for subtask_id in ("s1", "s2", "s3"):
+        for model, confidence in (("low", 0.3), ("high", 0.9)):
+            response = _response(model, confidence)
+            response.subtask_id = subtask_id
+            responses.append(response)
+    return responses
+
+
+class _CPUBoundArbitrationLayer(ConcreteArbitrationLayer):
+    """Arbitration layer whose conflict detection holds the GIL for a while."""
+
+    def __init__(self, pid_dir=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pid_dir = pid_dir
+
+    def _detect_conflicts(self, features):
+        sum(i * i for i in range(2_000_000))
+        if self.pid_dir is not None:
+            (self.pid_dir / str(os.getpid())).touch()
+        return super()._detect_conflicts(features)
+
+
+class TestParallelGroups:
+    """Tests for arbitrating independent subtask groups concurrently."""
+
+    def test_parallel_matches_sequential(self):
+        """Test that fanning out gives the same validated responses, in input order."""
+        responses = _grouped_responses()
+
+        parallel = ConcreteArbitrationLayer(max_workers=3).arbitrate(responses)
+        sequential = ConcreteArbitrationLayer(max_workers=1).arbitrate(responses)
+
+        assert parallel.validated_responses == sequential.validated_responses
+        assert [(r.subtask_id, r.model_used) for r in parallel.validated_responses] == [
+            ("s1", "high"), ("s2", "high"), ("s3", "high")
+        ]
+        assert len(parallel.conflicts_resolved) == len(sequential.conflicts_resolved)
+
+    @pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs more than one CPU")
+    def test_cpu_bound_groups_arbitrated_in_parallel(self):
+        """Test that CPU-bound conflict detection for each group runs in parallel processes."""
+        responses = _grouped_responses()
+        sequential = _CPUBoundArbitrationLayer(max_workers=1)
+        parallel = _CPUBoundArbitrationLayer(max_workers=3, use_processes=True)
+        try:
+            parallel.arbitrate(responses)  # Start the worker processes
+
+            start = time.perf_counter()
+            sequential.arbitrate(responses)
+            sequential_time = time.perf_counter() - start
+            start = time.perf_counter()
+            parallel.arbitrate(responses)
+            parallel_time = time.perf_counter() - start
+        finally:
+            parallel.shutdown()
+
+        assert parallel_time < sequential_time * 0.75
+
+    def test_process_pool_created_once_and_shut_down(self, tmp_path):
+        """Test that groups run in worker processes of one pool reused until shutdown."""
+        layer = _CPUBoundArbitrationLayer(max_workers=2, use_processes=True, pid_dir=tmp_path)
+
+        layer.arbitrate(_grouped_responses())
+        executor = layer._executor
+        layer.arbitrate(_grouped_responses())
+
+        assert layer._executor is executor
+        worker_pids = {int(path.name) for path in tmp_path.iterdir()}
+        assert worker_pids and os.getpid() not in worker_pids
+        layer.shutdown()
+        assert layer._executor is None
+
+    def test_factory_applies_process_pool_setting(self):
+        """Test that the execution config chooses the arbitration process pool."""
+        config = create_default_config()
+        config.execution.arbitration_use_processes = True
+
+        layer = AICouncilFactory(config).arbitration_layer
+
+        assert layer.use_processes
+        assert layer.max_workers == config.execution.max_parallel_executions
+
+    def test_process_pool_returns_original_responses(self):
+        """Test that results from worker processes refer to the caller's objects."""
+        responses = _grouped_responses()
+        layer = ConcreteArbitrationLayer(max_workers=2, use_processes=True)
+
+        validated = layer.arbitrate(responses).validated_responses
+        layer.shutdown()
+
+        assert [r.subtask_id for r in validated] == ["s1", "s2", "s3"]
+        assert all(any(r is original for original in responses) for r in validated)
+
+    def test_invalid_worker_count(self):
+        """Test that at least one worker is required."""
+        with pytest.raises(ValueError):
+            ConcreteArbitrationLayer(max_workers=0)
@@ -0,0 +1,228 @@
+"""
+Unit tests for the benchmark suite.
+
+Tests cover the latency-distribution mock models, the percentile and
+regression helpers, a small run of every scenario in ai_council/bench and
+the local provider stub server.
+"""
+
+import http.client
+import json
+import random
+
+import pytest
+
+from ai_council.bench import (
+    SCENARIOS, BenchmarkConfig, DistributionMockModel, LatencyDistribution,
+    compare_reports, percentile, run_benchmark
+)
+from ai_council.bench.__main__ import main
+from ai_council.bench.stub_server import StubProviderServer, StubServerConfig
+from ai_council.core.clock import VirtualClock
+from ai_council.core.interfaces import ModelError
+
+
+# =============================================================================
+# Mock Model Tests
+# =============================================================================
+
+class TestDistributionMockModel:
+    """Tests for sampled latency and failure injection."""
+
+    def test_latency_samples_are_seeded_and_spiky(self):
+        """Test repeatable samples, a median near the configured one and tail spikes."""
+        distribution = LatencyDistribution(median=0.1, sigma=0.3, spike_probability=0.05, spike_multiplier=20)
+
+        first = [distribution.sample(random.Random(7)) for _ in range(3)]
+        rng = random.Random(7)
+        samples = sorted(distribution.sample(rng) for _ in range(2000))
+
+        assert first == [first[0]] * 3
+        assert 0.08 < samples[1000] < 0.12
+        assert samples[-1] > 1.0
+        assert LatencyDistribution(median=0.0).sample(random.Random(1)) == 0.0
+        with pytest.raises(ValueError):
+            LatencyDistribution(spike_probability=1.5)
+
+    def test_model_sleeps_sampled_latency_and_injects_failures(self):
+        """Test that calls wait the sampled latency and fail at the configured rate."""
+        clock = VirtualClock()
+        model = DistributionMockModel(
+            "bench", latency=LatencyDistribution(median=0.2, sigma=0.0), seed=1, clock=clock
+        )
+        failing = DistributionMockModel("failing", failure_rate=1.0, clock=clock)
+
+        assert model.generate_response("Explain caching").startswith("Mock response to: Explain caching")
+        assert clock.time() == pytest.approx(0.2)
+        with pytest.raises(ModelError) as excinfo:
+            failing.generate_response("Explain caching")
+        assert excinfo.value.error_type == "ConnectionError"
+        assert failing.get_statistics()["failure_count"] == 1
+
+
+# =============================================================================
+# Runner Tests
+# =============================================================================
+
+class TestRunner:
+    """Tests for running scenarios and reporting results."""
+
+    def test_percentile_interpolates(self):
+        """Test linear interpolation between ranks."""
+        values = [4.0, 1.0, 3.0, 2.0]
+
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 95) == 0.0
+
+    def test_every_scenario_reports(self):
+        """Test that a small run of every scenario fills in the report."""
+        config = BenchmarkConfig(requests=4, concurrency=2, models=2, latency=LatencyDistribution(median=0.0))
+
+        report = run_benchmark(config=config)
+        data = json.loads(report.to_json())
+
+        assert list(data["results"]) == list(SCENARIOS)
+        for result in data["results"].values():
+            assert result["requests"] == result["successes"] == 4
+            assert result["throughput"] > 0
+            assert 0 < result["latency"]["p50"] <= result["latency"]["p95"] <= result["latency"]["p99"]
+            assert result["cpu_time_per_request"] > 0
+            assert result["peak_memory_bytes"] > 0
+        assert data["config"]["requests"] == 4
+        with pytest.raises(ValueError):
+            run_benchmark(["missing"], config)
+
+    def test_virtual_time_simulates_waits(self):
+        """Test that model latency passes on a virtual clock instead of in real time."""
+        config = BenchmarkConfig(
+            requests=20, concurrency=4, arrival_rate=2.0,
+            latency=LatencyDistribution(median=1.0, sigma=0.2), virtual_time=True
+        )
+
+        result = run_benchmark(["open_loop"], config, measure_memory=False).results[0]
+
+        assert result.successes == 20
+        assert result.wall_time > 5.0
+        assert result.real_time < result.wall_time / 5
+        assert result.latency["p50"] > 0.5
+
+    def test_compare_reports_flags_regressions(self):
+        """Test that only changes for the worse beyond the tolerance are reported."""
+        baseline = {"results": {"single": {"throughput": 100.0, "latency": {"p95": 0.10}}}}
+        current = {"results": {
+            "single": {"throughput": 95.0, "latency": {"p95": 0.15}},
+            "batch": {"throughput": 1.0},
+        }}
+
+        assert compare_reports(baseline, current, max_regression=0.1) == [
+            "single: latency.p95 0.1 -> 0.15 (+50.0%)"
+        ]
+        assert compare_reports(baseline, current, max_regression=0.6) == []
+
+    def test_cli_writes_report_and_checks_baseline(self, tmp_path, capsys):
+        """Test JSON output and a failing baseline comparison."""
+        output = tmp_path / "report.json"
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": {"single": {"throughput": 1e9}}}))
+        args = ["--scenario", "single", "--requests", "2", "--median-ms", "0", "--no-memory"]
+
+        assert main(args + ["--output", str(output)]) == 0
+        assert main(args + ["--baseline", str(baseline)]) == 1
+
+        assert json.loads(output.read_text())["results"]["single"]["peak_memory_bytes"] is None
+        assert "REGRESSION single: throughput" in capsys.readouterr().out
+
+
+# =============================================================================
+# Stub Server Tests
+# =============================================================================
+
+def _post(connection, path, body):
+    """POST JSON on a kept-alive connection and return (status, headers, body text)."""
+    connection.request("POST", path, json.dumps(body), {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, response.headers, response.read().decode("utf-8")
+
+
+def _sse_data(text):
+    """Decoded data payloads of a server-sent event stream."""
+    return [line[len("data: "):] for line in text.splitlines() if line.startswith("data: ")]
+
+
+class TestStubProviderServer:
+    """Tests for the local provider emulator."""
+
+    def test_serves_every_api_shape_over_one_connection(self):
+        """Test OpenAI, Anthropic and Gemini responses on a single reused connection."""
+        instant = StubServerConfig(latency=LatencyDistribution(median=0.0), response_tokens=8)
+        with StubProviderServer(instant) as server:
+            connection = http.client.HTTPConnection(server.url[len("http://"):])
+            messages = [{"role": "user", "content": "Explain caching"}]
+
+            _, _, openai = _post(connection, "/openai/v1/chat/completions",
+                                 {"model": "llama", "messages": messages})
+            _, _, anthropic = _post(connection, "/v1/messages", {"model": "claude", "messages": messages})
+            _, _, gemini = _post(connection, "/v1beta/models/gemini-pro:generateContent?key=k",
+                                 {"contents": [{"parts": [{"text": "Explain caching"}]}]})
+            status, _, _ = _post(connection, "/v1/unknown", {})
+            connection.close()
+            stats = server.get_statistics()
+
+        text = json.loads(openai)["choices"][0]["message"]["content"]
+        assert text.startswith("Stub response from llama to: Explain caching")
+        assert len(text.split()) == 8
+        assert json.loads(openai)["usage"]["completion_tokens"] == 8
+        assert json.loads(anthropic)["content"][0]["text"].startswith("Stub response from claude")
+        assert json.loads(gemini)["candidates"][0]["content"]["parts"][0]["text"].startswith("Stub")
+        assert status == 404
+        assert stats["connections"] == 1
+        assert stats["requests"] == 3
+        assert server.base_url("groq").endswith("/openai/v1")
+
+    def test_streams_server_sent_events(self):
+        """Test that OpenAI and Anthropic streams carry the tokens of a full response."""
+        config = StubServerConfig(
+            latency=LatencyDistribution(median=0.0), response_tokens=5, tokens_per_second=500
+        )
+        body = {"model": "m", "messages": [{"role": "user", "content": "Hi"}], "stream": True}
+        with StubProviderServer(config) as server:
+            connection = http.client.HTTPConnection(server.url[len("http://"):])
+            _, headers, openai = _post(connection, "/v1/chat/completions", body)
+            _, _, anthropic = _post(connection, "/v1/messages", body)
+            connection.close()
+
+        chunks = _sse_data(openai)
+        assert headers["Content-Type"] == "text/event-stream"
+        assert chunks[-1] == "[DONE]"
+        assert "".join(
+            json.loads(chunk)["choices"][0]["delta"].get("content", "") for chunk in chunks[:-1]
+        ) == "Stub response from m to:"
+        events = [json.loads(data) for data in _sse_data(anthropic)]
+        assert [event["type"] for event in events][-2:] == ["message_delta", "message_stop"]
+        assert sum(event["type"] == "content_block_delta" for event in events) == 5
+
+    def test_rate_limits_and_injected_errors(self):
+        """Test 429s with provider rate limit headers and injected 500s."""
+        limited = StubServerConfig(latency=LatencyDistribution(median=0.0), requests_per_minute=1)
+        failing = StubServerConfig(latency=LatencyDistribution(median=0.0), error_rate=1.0)
+        body = {"model": "m", "messages": [{"role": "user", "content": "Hi"}]}
+
+        with StubProviderServer(limited) as server:
+            connection = http.client.HTTPConnection(server.url[len("http://"):])
+            first, first_headers, _ = _post(connection, "/v1/chat/completions", body)
+            second, headers, error = _post(connection, "/v1/chat/completions", body)
+            _, anthropic_headers, _ = _post(connection, "/v1/messages", body)
+            connection.close()
+        with StubProviderServer(failing) as server:
+            connection = http.client.HTTPConnection(server.url[len("http://"):])
+            status, _, _ = _post(connection, "/v1/messages", body)
+            connection.close()
+
+        assert (first, second) == (200, 429)
+        assert first_headers["x-ratelimit-remaining-requests"] == "0"
+        assert int(headers["retry-after"]) >= 1
+        assert json.loads(error)["error"]["code"] == "rate_limit_exceeded"
+        assert anthropic_headers["anthropic-ratelimit-requests-remaining"] == "0"
+        assert status == 500
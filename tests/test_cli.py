@@ -1,3 +1,5 @@
+import json
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call
 import sys
@@ -7,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ai_council.cli_utils import CLIHandler
-from ai_council.core.models import ExecutionMode
+from ai_council.core.models import ExecutionMode, FinalResponse
 
 class TestCLIHandler(unittest.TestCase):
     def setUp(self):
@@ -65,5 +67,77 @@ class TestCLIHandler(unittest.TestCase):
         self.cli_handler.process_single_request(self.mock_ai_council, "test request", "fast")
         self.mock_ai_council.process_request.assert_called_once_with("test request", ExecutionMode.FAST)
 
+
+class TestCLIBatch(unittest.TestCase):
+    def setUp(self):
+        self.cli_handler = CLIHandler()
+        self.mock_ai_council = MagicMock()
+        self.mock_ai_council.process_batch.side_effect = self._fake_batch
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_path = Path(self.tmp.name) / "requests.jsonl"
+        self.output_path = Path(self.tmp.name) / "results.jsonl"
+        self.seen_queries = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fake_batch(self, queries, mode, concurrency):
+        # Answer in reverse order to mimic completion order
+        queries = list(queries)
+        self.seen_queries.extend(queries)
+        for index in reversed(range(len(queries))):
+            if queries[index] == "fail":
+                yield index, FinalResponse(content="", overall_confidence=0.0, success=False,
+                                           error_message="boom", error_type="ValidationError")
+            else:
+                yield index, FinalResponse(content=f"answer to {queries[index]}", overall_confidence=0.9)
+
+    def _write_input(self, lines):
+        self.input_path.write_text("\n".join(lines) + "\n")
+
+    def _read_output(self):
+        return [json.loads(line) for line in self.output_path.read_text().splitlines()]
+
+    def test_parse_batch_args(self):
+        args = self.cli_handler.parse_args(
+            ["batch", "--input", "in.jsonl", "--output", "out.jsonl", "--concurrency", "8"]
+        )
+        self.assertEqual(args.command, "batch")
+        self.assertEqual(args.concurrency, 8)
+        self.assertIsNone(self.cli_handler.parse_args(["my request"]).command)
+
+    def test_results_written_with_record_ids(self):
+        self._write_input([
+            json.dumps({"id": "a", "query": "first"}),
+            json.dumps({"request_id": "b", "body": "second"}),
+            json.dumps({"query": "fail"}),
+            "not json",
+        ])
+
+        counts = self.cli_handler.handle_batch(
+            self.mock_ai_council, self.input_path, self.output_path, "fast", 2
+        )
+
+        results = {record["id"]: record for record in self._read_output()}
+        self.assertEqual(results["a"]["content"], "answer to first")
+        self.assertEqual(results["b"]["content"], "answer to second")
+        self.assertEqual(results["3"]["error_type"], "ValidationError")
+        self.assertEqual(counts, {"processed": 3, "failed": 1, "skipped": 0, "invalid": 1})
+        self.assertEqual(self.mock_ai_council.process_batch.call_args[0][1:], (ExecutionMode.FAST, 2))
+
+    def test_resume_skips_completed_ids(self):
+        self._write_input([json.dumps({"id": str(i), "query": f"q{i}"}) for i in range(3)])
+        self.output_path.write_text(json.dumps({"id": "0", "success": True}) + "\n" + '{"id": "1", "succ')
+
+        counts = self.cli_handler.handle_batch(
+            self.mock_ai_council, self.input_path, self.output_path, "balanced"
+        )
+
+        self.assertEqual(self.seen_queries, ["q1", "q2"])
+        self.assertEqual(counts["skipped"], 1)
+        lines = self.output_path.read_text().splitlines()
+        self.assertEqual(lines[1], '{"id": "1", "succ')
+        self.assertEqual([json.loads(line)["id"] for line in lines[2:]], ["2", "1"])
+
 if __name__ == '__main__':
     unittest.main()
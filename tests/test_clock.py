@@ -0,0 +1,185 @@
+"""
+Unit tests for injectable clocks.
+
+Tests cover ai_council/core/clock.py and the components that take a clock:
+timeouts, rate limits, circuit breakers, retry budgets and mock models.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import pytest
+
+from ai_council.core.clock import SystemClock, VirtualClock, get_clock, system_clock, use_clock
+from ai_council.core.failure_handling import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError, CircuitBreakerState,
+    RetryBudget, RetryBudgetConfig
+)
+from ai_council.core.models import Subtask, TaskType
+from ai_council.core.timeout_handler import RateLimitManager, TimeoutError, TimeoutHandler
+from ai_council.core.tracing import tracer
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel, MockModelBehavior
+
+
+# =============================================================================
+# Virtual Clock Tests
+# =============================================================================
+
+class TestVirtualClock:
+    """Tests for simulated time."""
+
+    def test_autojump_skips_idle_time(self):
+        """Test that an hour of sleep returns at once and moves the clock by an hour."""
+        clock = VirtualClock(start=100.0)
+
+        start = time.perf_counter()
+        clock.sleep(3600)
+
+        assert clock.time() == 3700.0
+        assert time.perf_counter() - start < 1.0
+        assert clock.jumps == 1
+
+    def test_sleepers_wake_in_deadline_order(self):
+        """Test that concurrent sleepers wake at their own deadlines."""
+        clock = VirtualClock()
+        woken = []
+
+        def sleeper(seconds):
+            clock.sleep(seconds)
+            woken.append((seconds, clock.time()))
+
+        threads = [threading.Thread(target=sleeper, args=(seconds,)) for seconds in (30, 10, 20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert woken == [(10, 10.0), (20, 20.0), (30, 30.0)]
+
+    def test_manual_advance(self):
+        """Test that without autojump only advance moves time."""
+        clock = VirtualClock(autojump_threshold=None)
+        thread = threading.Thread(target=clock.sleep, args=(5,))
+        thread.start()
+        while clock.pending == 0:
+            time.sleep(0.001)
+
+        clock.advance(4)
+        thread.join(0.05)
+        assert thread.is_alive()
+        clock.advance(1)
+        thread.join(1.0)
+        assert not thread.is_alive()
+        with pytest.raises(ValueError):
+            clock.advance(-1)
+
+    def test_wait_future_times_out_in_virtual_time(self):
+        """Test that a future that never finishes times out after simulated seconds."""
+        clock = VirtualClock()
+        done = Future()
+        done.set_result("ok")
+
+        with pytest.raises(FutureTimeoutError):
+            clock.wait_future(Future(), timeout=30)
+        assert clock.time() == 30.0
+        assert clock.wait_future(done, timeout=30) == "ok"
+
+    def test_use_clock_restores_default(self):
+        """Test installing and restoring the process default clock."""
+        clock = VirtualClock()
+
+        with use_clock(clock):
+            assert get_clock() is clock
+        assert get_clock() is system_clock
+        assert isinstance(system_clock, SystemClock)
+
+
+# =============================================================================
+# Injection Tests
+# =============================================================================
+
+class TestClockInjection:
+    """Tests for components measuring time on an injected clock."""
+
+    def test_timeout_handler_times_out_virtual_sleep(self):
+        """Test that a simulated minute-long call hits a five second timeout at once."""
+        clock = VirtualClock()
+        handler = TimeoutHandler(clock=clock)
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            handler.execute_with_timeout(clock.sleep, 5.0, "slow_call", "test", None, None, 60)
+        assert handler.get_timeout_statistics() == {"test:slow_call": 1}
+        assert time.perf_counter() - start < 1.0
+        assert handler.execute_with_timeout(lambda: "fast", 5.0, "fast_call", "test") == "fast"
+
+    def test_rate_limit_window_resets_with_clock(self):
+        """Test that the rate limit window follows the injected clock."""
+        clock = VirtualClock(autojump_threshold=None)
+        manager = RateLimitManager(clock=clock)
+        manager.set_rate_limit("clocked", requests_per_minute=1)
+
+        assert manager.check_rate_limit("clocked") == (True, 0.0)
+        assert manager.check_rate_limit("clocked") == (False, 60.0)
+        clock.advance(60)
+        assert manager.check_rate_limit("clocked")[0]
+
+    def test_circuit_breaker_recovers_with_clock(self):
+        """Test that the recovery timeout is measured on the injected clock."""
+        clock = VirtualClock(autojump_threshold=None)
+        breaker = CircuitBreaker(
+            "clock-test", CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60, success_threshold=1),
+            clock=clock
+        )
+
+        def fail():
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(lambda: "ok")
+        clock.advance(60)
+
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitBreakerState.CLOSED
+
+    def test_retry_budget_window_follows_clock(self):
+        """Test that retries earned by attempts expire on the injected clock."""
+        clock = VirtualClock(autojump_threshold=None)
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=1.0, min_retries=0, window_seconds=10), clock=clock)
+        budget.record_attempt("provider")
+
+        clock.advance(11)
+
+        assert not budget.try_acquire_retry("provider")
+
+    def test_mock_model_delays_on_clock(self):
+        """Test that mock model delays, including slow behavior, are simulated."""
+        with use_clock(VirtualClock()) as clock:
+            model = MockAIModel("slow", behavior=MockModelBehavior.SLOW, response_delay=1.0)
+
+            start = time.perf_counter()
+            model.generate_response("Explain caching")
+
+            assert clock.time() == 3.0
+            assert model.get_statistics()["total_response_time"] == 3.0
+            assert time.perf_counter() - start < 1.0
+
+    def test_agent_wait_spans_use_clock(self):
+        """Test that retry backoff is traced in simulated time, on the same timeline as the request."""
+        with use_clock(VirtualClock(start=1000.0)) as clock:
+            agent = BaseExecutionAgent(max_retries=1)
+            model = MockAIModel("clocked-retry", behavior=MockModelBehavior.ALWAYS_FAIL, response_delay=0.0)
+            subtask = Subtask(parent_task_id="task", content="Explain caching", task_type=TaskType.REASONING)
+            with tracer.trace("request") as trace:
+                agent.execute(subtask, model)
+
+        spans = trace.spans
+        backoff = next(span for span in spans if span.name == "retry_backoff")
+        assert backoff.duration > 0
+        assert backoff.duration == pytest.approx(clock.time() - 1000.0)
+        assert all(1000.0 <= span.start_time <= clock.time() for span in spans)
+        assert trace.root.duration == pytest.approx(clock.time() - 1000.0)
@@ -0,0 +1,134 @@
+"""
+Unit tests for the compact slotted model variants.
+
+Tests cover ai_council/core/compact.py and models.replace_unvalidated.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_council.core.compact import (
+    CompactAgentResponse, CompactExecutionMetadata, CompactFinalResponse,
+    CompactSelfAssessment, CompactSubtask, CompactTask, IdGenerator,
+    datetime_to_timestamp, timestamp_to_datetime
+)
+from ai_council.core.models import (
+    AgentResponse, ExecutionMetadata, FinalResponse, RiskLevel, Subtask, TaskType,
+    replace_unvalidated
+)
+
+
+# =============================================================================
+# Compact Model Tests
+# =============================================================================
+
+class TestCompactModels:
+    """Tests for slotted models and their conversions."""
+
+    def test_no_instance_dict(self):
+        """Test that compact models don't carry a __dict__."""
+        task = CompactTask(content="Explain caching")
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+
+    def test_validation_matches_dataclasses(self):
+        """Test that the dataclass rules apply unless validation is disabled."""
+        with pytest.raises(ValueError):
+            CompactSubtask(content="Explain caching", accuracy_requirement=1.5)
+        with pytest.raises(ValueError):
+            CompactAgentResponse(subtask_id="s1", model_used="m", content="")
+
+        trusted = CompactSubtask(content="Explain caching", accuracy_requirement=1.5, validate=False)
+        assert trusted.accuracy_requirement == 1.5
+
+    def test_metadata_and_lists_created_lazily(self):
+        """Test that empty containers are only allocated on first access."""
+        response = CompactAgentResponse(subtask_id="s1", model_used="m", content="Answer")
+        metadata = CompactExecutionMetadata()
+
+        assert response._metadata is None
+        response.metadata["cached"] = True
+        assert response.metadata == {"cached": True}
+        assert metadata._execution_path is None
+        metadata.execution_path.append("synthesis")
+        assert metadata.execution_path == ["synthesis"]
+
+    def test_round_trip_through_dataclasses(self):
+        """Test conversion to and from the regular dataclasses."""
+        subtask = Subtask(parent_task_id="t1", content="Explain caching", task_type=TaskType.RESEARCH)
+
+        compact = CompactSubtask.from_model(subtask)
+        restored = compact.to_model()
+
+        assert isinstance(restored, Subtask)
+        assert restored == subtask
+
+    def test_nested_compact_values_converted(self):
+        """Test that nested compact assessment and metadata become dataclasses."""
+        response = CompactAgentResponse(
+            subtask_id="s1", model_used="m", content="Answer",
+            self_assessment=CompactSelfAssessment(confidence_score=0.9, risk_level=RiskLevel.MEDIUM)
+        ).to_model()
+        final = CompactFinalResponse(
+            content="Answer", overall_confidence=0.9, execution_metadata=CompactExecutionMetadata()
+        ).to_model()
+
+        assert isinstance(response, AgentResponse)
+        assert response.self_assessment.risk_level == RiskLevel.MEDIUM
+        assert response.text_view.lower == "answer"
+        assert isinstance(final.execution_metadata, ExecutionMetadata)
+
+
+# =============================================================================
+# Timestamp and ID Tests
+# =============================================================================
+
+class TestTimestampsAndIds:
+    """Tests for monotonic timestamps and the ID generator."""
+
+    def test_timestamp_matches_wall_clock(self):
+        """Test that a new timestamp converts to the current UTC time."""
+        created = CompactTask(content="Explain caching").created_at
+
+        assert abs(created - datetime.utcnow()) < timedelta(seconds=1)
+
+    def test_datetime_round_trip(self):
+        """Test that conversion keeps microsecond precision."""
+        value = datetime(2024, 5, 17, 12, 30, 45, 123456)
+
+        assert timestamp_to_datetime(datetime_to_timestamp(value)) == value
+
+    def test_ids_unique_and_reseeded(self):
+        """Test that IDs don't repeat, including after reseeding."""
+        generator = IdGenerator()
+        first = [generator() for _ in range(1000)]
+        generator.reseed()
+
+        assert len(set(first + [generator() for _ in range(1000)])) == 2000
+
+
+# =============================================================================
+# Unvalidated Copy Tests
+# =============================================================================
+
+class TestReplaceUnvalidated:
+    """Tests for copying validated dataclasses without re-validation."""
+
+    def test_copy_with_changes(self, monkeypatch):
+        """Test that the copy has the changes and skips __post_init__."""
+        response = FinalResponse(content="Answer", overall_confidence=0.5)
+        metadata = ExecutionMetadata()
+
+        def fail(self):
+            raise AssertionError("validation should be skipped")
+
+        monkeypatch.setattr(FinalResponse, "__post_init__", fail)
+        copied = replace_unvalidated(response, execution_metadata=metadata)
+
+        assert copied is not response
+        assert copied.execution_metadata is metadata
+        assert response.execution_metadata is None
+        assert copied.timestamp == response.timestamp
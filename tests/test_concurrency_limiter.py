@@ -0,0 +1,152 @@
+"""
+Unit tests for adaptive per-provider concurrency limits.
+
+Tests cover ai_council/core/concurrency_limiter.py and its use by
+BaseExecutionAgent.
+"""
+
+import threading
+
+import pytest
+
+from ai_council.core.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter, ConcurrencyLimiterManager,
+    ConcurrencyLimitExceededError, concurrency_limiter_manager
+)
+from ai_council.core.models import Subtask, TaskType
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel
+
+
+def _run_saturated(limiter: AdaptiveConcurrencyLimiter, latency: float, rounds: int) -> None:
+    """Fill every slot and complete each call with the given latency."""
+    for _ in range(rounds):
+        slots = limiter.limit
+        for _ in range(slots):
+            assert limiter.acquire(timeout=0)
+        for _ in range(slots):
+            limiter.on_success(latency)
+
+
+# =============================================================================
+# AdaptiveConcurrencyLimiter Tests
+# =============================================================================
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the gradient/AIMD limiter."""
+
+    def test_acquire_blocks_at_limit(self):
+        """Test that no more than `limit` calls hold a slot."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=2)
+
+        assert limiter.acquire(timeout=0)
+        assert limiter.acquire(timeout=0)
+        assert not limiter.acquire(timeout=0.01)
+        assert limiter.in_flight == 2
+
+    def test_limit_grows_while_latency_flat(self):
+        """Test that a saturated limiter grows while latency stays flat."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=4, max_limit=50)
+
+        _run_saturated(limiter, latency=1.0, rounds=10)
+
+        assert limiter.limit > 4
+
+    def test_limit_does_not_grow_when_underused(self):
+        """Test that an app-limited caller doesn't inflate the limit."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=10)
+
+        for _ in range(50):
+            limiter.acquire(timeout=0)
+            limiter.on_success(1.0)
+
+        assert limiter.limit == 10
+
+    def test_limit_shrinks_when_latency_rises(self):
+        """Test that latency well above baseline reduces the limit."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=40, max_limit=50)
+        _run_saturated(limiter, latency=1.0, rounds=1)
+        before = limiter.limit
+
+        _run_saturated(limiter, latency=5.0, rounds=3)
+
+        assert limiter.limit < before
+
+    def test_overload_failures_back_off(self):
+        """Test multiplicative decrease on rate limit and timeout failures."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=20, min_limit=2)
+
+        for _ in range(30):
+            limiter.acquire(timeout=0)
+            limiter.on_failure(overload=True)
+
+        assert limiter.limit == 2
+        assert limiter.get_status()["overload_count"] == 30
+
+    def test_other_failures_keep_limit(self):
+        """Test that non-overload failures only release the slot."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=5)
+        limiter.acquire(timeout=0)
+        limiter.on_failure(overload=False)
+
+        assert limiter.limit == 5
+        assert limiter.in_flight == 0
+
+    def test_release_wakes_waiter(self):
+        """Test that a blocked caller proceeds once a slot is released."""
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=1)
+        limiter.acquire(timeout=0)
+        results = []
+
+        waiter = threading.Thread(target=lambda: results.append(limiter.acquire(timeout=5)))
+        waiter.start()
+        limiter.on_success(0.1)
+        waiter.join(timeout=5)
+
+        assert results == [True]
+
+
+# =============================================================================
+# ConcurrencyLimiterManager Tests
+# =============================================================================
+
+class TestConcurrencyLimiterManager:
+    """Tests for per-provider limiter bookkeeping."""
+
+    def test_disabled_manager_returns_none(self):
+        """Test that disabling adaptive concurrency skips limiting."""
+        manager = ConcurrencyLimiterManager()
+        manager.configure(enabled=False)
+
+        assert manager.acquire("openai") is None
+        assert manager.get_limits() == {}
+
+    def test_acquire_timeout_raises(self):
+        """Test that waiting past the acquire timeout raises."""
+        manager = ConcurrencyLimiterManager()
+        manager.configure(initial_limit=1, min_limit=1, acquire_timeout=0.01)
+        manager.acquire("anthropic")
+
+        with pytest.raises(ConcurrencyLimitExceededError):
+            manager.acquire("anthropic")
+        assert manager.get_limits()["anthropic"]["in_flight"] == 1
+
+
+# =============================================================================
+# Execution Agent Integration Tests
+# =============================================================================
+
+class TestAgentConcurrencyLimits:
+    """Tests for the limiter in front of model calls."""
+
+    def test_successful_call_releases_slot(self):
+        """Test that the agent holds and releases a provider slot."""
+        agent = BaseExecutionAgent(max_retries=0)
+        subtask = Subtask(parent_task_id="t1", content="Explain caching", task_type=TaskType.REASONING)
+
+        response = agent.execute(subtask, MockAIModel("gpt-mock"))
+
+        assert response.success
+        status = concurrency_limiter_manager.get_limits()["openai"]
+        assert status["in_flight"] == 0
+        assert status["last_latency"] is not None
@@ -0,0 +1,124 @@
+"""
+Unit tests for failure handling and the retry budget.
+
+Tests cover RetryBudget and its use by ResilienceManager.handle_failure in
+ai_council/core/failure_handling.py.
+"""
+
+import time
+
+import pytest
+
+from ai_council.core.clock import VirtualClock
+from ai_council.core.failure_handling import (
+    FailureType, ResilienceManager, RetryBudget, RetryBudgetConfig,
+    create_failure_event
+)
+
+
+def _api_failure(provider=None, final_attempt=False):
+    context = {"final_attempt": final_attempt}
+    if provider:
+        context["provider"] = provider
+    return create_failure_event(
+        failure_type=FailureType.API_FAILURE,
+        component="execution_agent",
+        error_message="503 Service Unavailable",
+        model_id="gpt-4",
+        context=context
+    )
+
+
+# =============================================================================
+# RetryBudget Tests
+# =============================================================================
+
+class TestRetryBudget:
+    """Tests for the sliding-window retry budget."""
+
+    def test_minimum_retries_always_allowed(self):
+        """Test the floor that lets low-traffic providers retry."""
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=0.1, min_retries=2))
+
+        assert budget.try_acquire_retry("openai")
+        assert budget.try_acquire_retry("openai")
+        assert not budget.try_acquire_retry("openai")
+
+    def test_ratio_of_first_attempts(self):
+        """Test that retries are capped at the configured ratio."""
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=0.1, min_retries=0))
+        for _ in range(100):
+            budget.record_attempt("openai")
+
+        allowed = sum(budget.try_acquire_retry("openai") for _ in range(50))
+
+        assert allowed == 10
+        assert budget.get_statistics()["openai"] == {
+            "attempts": 100, "retries": 10, "rejected_retries": 40
+        }
+
+    def test_budgets_are_per_provider(self):
+        """Test that one provider's brownout doesn't spend another's budget."""
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=0.0, min_retries=1))
+
+        assert budget.try_acquire_retry("openai")
+        assert not budget.try_acquire_retry("openai")
+        assert budget.try_acquire_retry("anthropic")
+
+    def test_window_expiry(self):
+        """Test that old retries stop counting against the budget."""
+        clock = VirtualClock(start=1000.0, autojump_threshold=None)
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=0.0, min_retries=1, window_seconds=10.0), clock=clock)
+
+        assert budget.try_acquire_retry("openai")
+        assert not budget.try_acquire_retry("openai")
+        clock.advance(11.0)
+        assert budget.try_acquire_retry("openai")
+
+    def test_wall_clock_jump_keeps_window(self, monkeypatch):
+        """Test that setting the wall clock forward doesn't refill the budget."""
+        budget = RetryBudget(RetryBudgetConfig(retry_ratio=0.0, min_retries=1, window_seconds=10.0))
+
+        assert budget.try_acquire_retry("openai")
+        wall_time = time.time
+        monkeypatch.setattr(time, "time", lambda: wall_time() + 3600.0)
+        assert not budget.try_acquire_retry("openai")
+
+
+# =============================================================================
+# ResilienceManager Retry Budget Tests
+# =============================================================================
+
+class TestResilienceManagerRetryBudget:
+    """Tests for retry vetoes in handle_failure."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = ResilienceManager()
+        manager.retry_budget.configure(RetryBudgetConfig(retry_ratio=0.0, min_retries=1))
+        return manager
+
+    def test_exhausted_budget_vetoes_retry(self, manager):
+        """Test that handle_failure stops retrying once the budget is spent."""
+        first = manager.handle_failure(_api_failure("openai"))
+        second = manager.handle_failure(_api_failure("openai"))
+
+        assert first.should_retry
+        assert not second.should_retry
+        assert second.action_type == "retry_budget_exhausted"
+        assert second.metadata["rejected_action"] == "retry_with_backoff"
+
+    def test_rejections_reported_in_statistics(self, manager):
+        """Test that rejected retries show up in failure statistics."""
+        for _ in range(3):
+            manager.handle_failure(_api_failure("openai"))
+
+        stats = manager.get_failure_statistics()["retry_budget"]
+        assert stats["openai"]["rejected_retries"] == 2
+
+    def test_unscoped_and_final_failures_not_budgeted(self, manager):
+        """Test that failures without a provider or on the last attempt don't spend budget."""
+        manager.handle_failure(_api_failure())
+        manager.handle_failure(_api_failure("openai", final_attempt=True))
+
+        assert manager.handle_failure(_api_failure("openai")).should_retry
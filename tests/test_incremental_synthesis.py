@@ -0,0 +1,137 @@
+"""
+Unit tests for incremental synthesis.
+
+Tests cover ai_council/synthesis/incremental.py: sections are released in
+sequential order as responses arrive, repeated text is dropped, and the
+sections share the response length budget.
+"""
+
+import pytest
+
+from ai_council.core.models import AgentResponse, RiskLevel, SelfAssessment
+from ai_council.synthesis.incremental import IncrementalSynthesizerImpl
+from ai_council.synthesis.layer import NoOpSynthesisLayer, SynthesisLayerImpl
+
+
+def _response(subtask_id, content, model="model-a", success=True):
+    return AgentResponse(
+        subtask_id=subtask_id,
+        model_used=model,
+        content=content,
+        success=success,
+        self_assessment=SelfAssessment(
+            confidence_score=0.8, risk_level=RiskLevel.LOW, estimated_cost=0.01, token_usage=10
+        )
+    )
+
+
+@pytest.fixture
+def synthesizer():
+    return SynthesisLayerImpl().create_incremental_synthesizer(["s1", "s2", "s3"])
+
+
+# =============================================================================
+# Ordering Tests
+# =============================================================================
+
+class TestOrdering:
+    """Tests that sections are released in sequential order."""
+
+    def test_in_order_responses_emit_immediately(self, synthesizer):
+        """Test that a response whose predecessors are done is emitted at once."""
+        sections = synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+
+        assert [section.subtask_id for section in sections] == ["s1"]
+        assert sections[0].index == 0
+
+    def test_out_of_order_responses_are_buffered(self, synthesizer):
+        """Test that later sections wait for earlier subtasks."""
+        assert synthesizer.add(_response("s3", "Eviction policies decide what to drop first.")) == []
+        assert synthesizer.add(_response("s2", "Invalidation keeps cached values consistent.")) == []
+
+        sections = synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+
+        assert [section.subtask_id for section in sections] == ["s1", "s2", "s3"]
+        assert [section.index for section in sections] == [0, 1, 2]
+
+    def test_skip_unblocks_later_sections(self, synthesizer):
+        """Test that skipping a failed subtask releases the sections after it."""
+        synthesizer.add(_response("s2", "Invalidation keeps cached values consistent."))
+
+        sections = synthesizer.skip("s1")
+
+        assert [section.subtask_id for section in sections] == ["s2"]
+        assert sections[0].index == 0
+
+    def test_unknown_and_repeated_subtasks_rejected(self, synthesizer):
+        """Test validation of subtask IDs."""
+        synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+
+        with pytest.raises(ValueError):
+            synthesizer.add(_response("s1", "A second answer for the same subtask."))
+        with pytest.raises(ValueError):
+            synthesizer.skip("unknown")
+        with pytest.raises(ValueError):
+            SynthesisLayerImpl().create_incremental_synthesizer(["s1", "s1"])
+
+
+# =============================================================================
+# Content Tests
+# =============================================================================
+
+class TestContent:
+    """Tests for deduplication, budget and the final response."""
+
+    def test_repeated_sentences_dropped(self, synthesizer):
+        """Test that sentences already emitted aren't repeated in later sections."""
+        synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+        sections = synthesizer.add(_response(
+            "s2", "Caching stores results close to the caller. Invalidation keeps values fresh."
+        ))
+
+        assert sections[0].content == "Invalidation keeps values fresh."
+
+    def test_fully_redundant_section_omitted(self, synthesizer):
+        """Test that a response adding nothing new produces no section."""
+        synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+
+        assert synthesizer.add(_response("s2", "Caching stores results close to the caller.")) == []
+        assert synthesizer.add(_response("s3", "Eviction drops the least recently used keys."))[0].index == 1
+
+    def test_sections_share_length_budget(self):
+        """Test that the total output never exceeds the budget."""
+        synthesizer = IncrementalSynthesizerImpl(SynthesisLayerImpl(), ["s1", "s2", "s3"], max_length=60)
+        synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+        synthesizer.add(_response("s2", "Invalidation keeps cached values consistent everywhere."))
+        synthesizer.add(_response("s3", "Eviction drops the least recently used keys."))
+
+        final = synthesizer.finish()
+
+        assert len(final.content) <= 60
+        assert final.content.endswith("...")
+        assert len(synthesizer.sections) == 2
+
+    def test_finish_builds_final_response(self, synthesizer):
+        """Test that finish joins sections and flushes unsettled subtasks."""
+        synthesizer.add(_response("s1", "Caching stores results close to the caller."))
+        synthesizer.add(_response("s3", "Eviction drops the least recently used keys.", model="model-b"))
+
+        final = synthesizer.finish()
+
+        assert final.success
+        assert final.content == (
+            "Caching stores results close to the caller.\n\n"
+            "Eviction drops the least recently used keys."
+        )
+        assert final.models_used == ["model-a", "model-b"]
+        assert final.cost_breakdown.total_cost == pytest.approx(0.02)
+
+    def test_finish_without_sections_fails(self, synthesizer):
+        """Test the final response when nothing could be synthesized."""
+        synthesizer.skip("s1")
+
+        assert not synthesizer.finish().success
+
+    def test_noop_layer_has_no_incremental_mode(self):
+        """Test that layers without an incremental mode return None."""
+        assert NoOpSynthesisLayer().create_incremental_synthesizer(["s1"]) is None
@@ -0,0 +1,108 @@
+"""
+Unit tests for lazy package imports and deferred component construction.
+
+Tests cover ai_council/utils/lazy.py, the package __init__ modules,
+AICouncilFactory and AICouncil.orchestration_layer.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import ai_council
+from ai_council import AICouncil
+from ai_council.factory import AICouncilFactory
+from ai_council.utils.config import create_default_config
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _loaded_modules(statement, prefixes=("ai_council",)):
+    """Return the modules under prefixes loaded by a statement in a fresh interpreter."""
+    probe = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps(sorted(m for m in sys.modules if m.startswith({tuple(prefixes)!r}))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(output))
+
+
+# =============================================================================
+# Lazy Attribute Tests
+# =============================================================================
+
+class TestLazyAttributes:
+    """Tests for PEP 562 package attributes."""
+
+    def test_package_import_loads_no_pipeline(self):
+        """Test that importing the package doesn't import its implementations."""
+        assert _loaded_modules("import ai_council") == {
+            "ai_council", "ai_council.utils", "ai_council.utils.lazy"
+        }
+
+    def test_entry_import_defers_pipeline_and_dependencies(self):
+        """Test that the CLI and web entry import leaves the pipeline and heavy dependencies unloaded."""
+        loaded = _loaded_modules(
+            "from ai_council.main import AICouncil",
+            prefixes=("ai_council", "yaml", "structlog", "asyncio", "urllib.request")
+        )
+
+        for module in ("ai_council.factory", "ai_council.core.failure_handling",
+                       "ai_council.core.concurrency_limiter", "ai_council.core.shared_state",
+                       "ai_council.core.tracing", "ai_council.core.profiling",
+                       "ai_council.orchestration.layer", "yaml", "structlog", "asyncio", "urllib.request"):
+            assert module not in loaded
+
+    def test_models_import_skips_interfaces(self):
+        """Test that importing the models doesn't pull in the rest of core."""
+        loaded = _loaded_modules("from ai_council.core.models import Task")
+
+        assert "ai_council.core.interfaces" not in loaded
+        assert "ai_council.orchestration.layer" not in loaded
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ resolves and lists in dir()."""
+        for name in ai_council.__all__:
+            assert getattr(ai_council, name) is not None
+            assert name in dir(ai_council)
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            ai_council.NotAName
+
+
+# =============================================================================
+# Deferred Construction Tests
+# =============================================================================
+
+class TestDeferredConstruction:
+    """Tests for building components on first use."""
+
+    def test_factory_builds_components_on_access(self):
+        """Test that a new factory holds no components until asked."""
+        factory = AICouncilFactory(create_default_config())
+
+        assert factory._analysis_engine is None
+        engine = factory.analysis_engine
+        assert factory.analysis_engine is engine
+        assert factory._synthesis_layer is None
+
+    def test_council_builds_orchestration_on_first_use(self):
+        """Test that AICouncil defers the orchestration layer."""
+        with patch("ai_council.main.load_config", return_value=create_default_config()), \
+                patch.object(AICouncilFactory, "validate_configuration", return_value=[]):
+            with patch.object(AICouncilFactory, "create_orchestration_layer") as create:
+                council = AICouncil()
+
+                create.assert_not_called()
+                layer = council.orchestration_layer
+                assert council.orchestration_layer is layer
+                create.assert_called_once()
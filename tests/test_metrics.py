@@ -0,0 +1,183 @@
+"""
+Unit tests for the in-process metrics registry.
+
+Tests cover ai_council/core/metrics.py and the metrics recorded by the
+orchestration layer, execution agent, caches and resilience components.
+"""
+
+import gc
+import threading
+
+import pytest
+
+from ai_council.analysis.decomposer import BasicTaskDecomposer
+from ai_council.analysis.engine import BasicAnalysisEngine
+from ai_council.arbitration.layer import ConcreteArbitrationLayer
+from ai_council.core.failure_handling import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
+)
+from ai_council.core.metrics import CacheMetrics, MetricsRegistry, metrics_registry
+from ai_council.core.models import ExecutionMode, ModelCapabilities, TaskType
+from ai_council.core.timeout_handler import RateLimitManager
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel
+from ai_council.orchestration.layer import ConcreteOrchestrationLayer
+from ai_council.routing.context_protocol import ModelContextProtocolImpl
+from ai_council.routing.registry import ModelRegistryImpl
+from ai_council.synthesis.layer import SynthesisLayerImpl
+
+
+@pytest.fixture
+def registry():
+    """Create an empty registry."""
+    return MetricsRegistry()
+
+
+def _value(name, *labels):
+    return metrics_registry.get(name).labels(*labels).value
+
+
+# =============================================================================
+# Registry Tests
+# =============================================================================
+
+class TestRegistry:
+    """Tests for recording and rendering metrics."""
+
+    def test_counter_sums_across_threads(self, registry):
+        """Test that concurrent increments, including from finished threads, all count."""
+        requests = registry.counter("requests_total", "Requests", ("mode",))
+
+        def work():
+            child = requests.labels("fast")
+            for _ in range(1000):
+                child.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        gc.collect()
+
+        assert requests.labels(mode="fast").value == 8000
+        with pytest.raises(ValueError):
+            requests.labels("fast").inc(-1)
+
+    def test_render_text_exposition(self, registry):
+        """Test HELP/TYPE lines, label escaping and cumulative histogram buckets."""
+        registry.counter("calls_total", "Calls", ("model",)).labels('a"b').inc(2)
+        registry.gauge("up", "Whether the service is up").set(1)
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+
+        assert registry.render().splitlines() == [
+            "# HELP calls_total Calls",
+            "# TYPE calls_total counter",
+            'calls_total{model="a\\"b"} 2',
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+            "# HELP up Whether the service is up",
+            "# TYPE up gauge",
+            "up 1",
+        ]
+
+    def test_registration_is_idempotent_and_checked(self, registry):
+        """Test get-or-create semantics and validation."""
+        first = registry.counter("hits_total", "Hits", ("cache",))
+
+        assert registry.counter("hits_total", "Hits", ("cache",)) is first
+        with pytest.raises(ValueError):
+            registry.gauge("hits_total", "Hits", ("cache",))
+        with pytest.raises(ValueError):
+            registry.counter("bad-name", "Bad")
+        with pytest.raises(ValueError):
+            first.labels("a", "b")
+        with pytest.raises(ValueError):
+            registry.histogram("sizes", "Sizes", buckets=(2.0, 1.0))
+
+    def test_cache_hit_ratio(self, registry):
+        """Test the derived hit ratio gauge."""
+        cache = CacheMetrics("routing", registry)
+        cache.hit()
+        cache.hit()
+        cache.hit()
+        cache.miss()
+
+        assert 'ai_council_cache_hit_ratio{cache="routing"} 0.75' in registry.render()
+
+
+# =============================================================================
+# Instrumentation Tests
+# =============================================================================
+
+class TestInstrumentation:
+    """Tests for the metrics recorded by pipeline components."""
+
+    def test_request_records_stage_model_and_cache_metrics(self):
+        """Test that one request feeds request, stage, model and cache metrics."""
+        model_registry = ModelRegistryImpl()
+        model_registry.register_model(
+            MockAIModel("metrics-model", response_template="Caching keeps hot data close to the caller.",
+                        failure_rate=0.0, response_delay=0.0),
+            ModelCapabilities(task_types=list(TaskType), cost_per_token=0.001, average_latency=1.0,
+                              max_context_length=8192, reliability_score=0.9)
+        )
+        layer = ConcreteOrchestrationLayer(
+            analysis_engine=BasicAnalysisEngine(),
+            task_decomposer=BasicTaskDecomposer(),
+            model_context_protocol=ModelContextProtocolImpl(model_registry),
+            execution_agent=BaseExecutionAgent(max_retries=0),
+            arbitration_layer=ConcreteArbitrationLayer(),
+            synthesis_layer=SynthesisLayerImpl(),
+            model_registry=model_registry
+        )
+        requests_before = _value("ai_council_requests_total", "fast", "success")
+        analysis_before = metrics_registry.get("ai_council_stage_duration_seconds").labels("analysis").count
+        hits_before = _value("ai_council_cache_requests_total", "cost_optimization", "hit")
+
+        for _ in range(2):
+            assert layer.process_request("Explain caching", ExecutionMode.FAST).success
+
+        assert _value("ai_council_requests_total", "fast", "success") == requests_before + 2
+        assert metrics_registry.get("ai_council_stage_duration_seconds").labels("analysis").count == analysis_before + 2
+        assert metrics_registry.get("ai_council_model_call_duration_seconds").labels("metrics-model").count == 2
+        assert _value("ai_council_model_calls_total", "metrics-model", "success") == 2
+        assert _value("ai_council_model_tokens_total", "metrics-model") > 0
+        assert _value("ai_council_model_cost_total", "metrics-model") > 0
+        assert _value("ai_council_cache_requests_total", "cost_optimization", "hit") == hits_before + 1
+
+    def test_circuit_breaker_state_and_rejections(self):
+        """Test that breaker state changes and rejections are published."""
+        breaker = CircuitBreaker("metrics-test", CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60))
+
+        def fail():
+            raise RuntimeError("down")
+
+        assert _value("ai_council_circuit_breaker_state", "metrics-test") == 0
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(fail)
+
+        assert _value("ai_council_circuit_breaker_state", "metrics-test") == 2
+        assert _value("ai_council_circuit_breaker_transitions_total", "metrics-test", "open") == 1
+        assert _value("ai_council_circuit_breaker_rejections_total", "metrics-test") == 1
+
+    def test_rate_limit_checks(self):
+        """Test allowed and limited checks and the imposed wait."""
+        manager = RateLimitManager()
+        manager.set_rate_limit("metrics-provider", requests_per_minute=1)
+
+        assert manager.check_rate_limit("metrics-provider")[0]
+        assert not manager.check_rate_limit("metrics-provider")[0]
+
+        assert _value("ai_council_rate_limit_checks_total", "metrics-provider", "allowed") == 1
+        assert _value("ai_council_rate_limit_checks_total", "metrics-provider", "limited") == 1
+        assert metrics_registry.get("ai_council_rate_limit_wait_seconds").labels("metrics-provider").sum > 0
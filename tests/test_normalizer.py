@@ -0,0 +1,130 @@
+"""
+Unit tests for streaming output normalization.
+
+Tests cover ai_council/synthesis/normalizer.py. The reference below is the
+previous whole-text SynthesisLayerImpl.normalize_output pipeline; the
+streaming normalizer must reproduce it exactly.
+"""
+
+import re
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from ai_council.synthesis.layer import SynthesisLayerImpl
+from ai_council.synthesis.normalizer import StreamingNormalizer, normalize_text
+
+
+def _reference_normalize(content, max_length):
+    if not content:
+        return ""
+
+    normalized = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+    normalized = re.sub(r'[ \t]+', ' ', normalized)
+    normalized = normalized.strip()
+
+    sentences = []
+    for sentence in normalized.split('. '):
+        sentence = sentence.strip()
+        if sentence and not sentence.endswith(('.', '!', '?', ':')):
+            sentence += '.'
+        if sentence:
+            sentences.append(sentence)
+    normalized = '. '.join(sentences)
+
+    for pattern in (
+        r'\b(in conclusion|to conclude|in summary|to summarize)\b,?\s*',
+        r'\b(as mentioned|as stated|as discussed)\s+(earlier|before|above)\b,?\s*',
+        r'\b(it is important to note that|it should be noted that)\b,?\s*',
+        r'\b(please note that|note that)\b,?\s*'
+    ):
+        normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
+    normalized = re.sub(r'\s+', ' ', normalized).strip()
+
+    if len(normalized) > max_length:
+        normalized = normalized[:max_length - 3] + "..."
+    return normalized
+
+
+GOLDEN_CORPUS = [
+    "",
+    "   ",
+    "Plain sentence without a period",
+    "First point. Second point. Third point",
+    "A. B",
+    "Ends with a question?. ",
+    "Trailing spaces after a period.   \n\n",
+    "Line one.\n\n\n\n\nLine two.\t\tTabs  and   spaces",
+    "In conclusion, caching helps. As mentioned earlier, invalidate on write.",
+    "Please note that it is important to note that keys expire. Note that, TTLs matter.",
+    "To summarize:\n\n\nuse a cache. IN SUMMARY the cache is warm!",
+    "Mixed. . Empty. pieces..  and. odd spacing .",
+    "Unicode whitespace here. Then 　 more.",
+    "As discussed\n\nabove, the data is stale. as stated before",
+]
+
+_ALPHABET = [" ", "  ", "\t", "\n", "\n\n\n", ".", ". ", "!", "?", ":", ",", "a", "Word",
+             "in summary", "note that", "as mentioned ", "earlier", " "]
+
+
+# =============================================================================
+# Golden Equivalence Tests
+# =============================================================================
+
+class TestGoldenEquivalence:
+    """Tests that streaming output matches the whole-text pipeline."""
+
+    @pytest.mark.parametrize("content", GOLDEN_CORPUS)
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_golden_corpus(self, content, chunk_size):
+        """Test the golden corpus at several chunk sizes."""
+        assert normalize_text(content, 5000, chunk_size) == _reference_normalize(content, 5000)
+
+    @pytest.mark.parametrize("max_length", [5, 20, 40])
+    def test_golden_corpus_truncated(self, max_length):
+        """Test that early truncation matches truncating the full output."""
+        for content in GOLDEN_CORPUS:
+            assert normalize_text(content, max_length, 4) == _reference_normalize(content, max_length)
+
+    @settings(max_examples=300, deadline=None)
+    @given(
+        parts=st.lists(st.sampled_from(_ALPHABET), max_size=40),
+        chunk_size=st.integers(min_value=1, max_value=16),
+        max_length=st.integers(min_value=3, max_value=80)
+    )
+    def test_random_inputs(self, parts, chunk_size, max_length):
+        """Test generated text built from the characters the rules react to."""
+        content = "".join(parts)
+        assert normalize_text(content, max_length, chunk_size) == _reference_normalize(content, max_length)
+
+    def test_synthesis_layer_uses_streaming_normalizer(self):
+        """Test normalize_output against the reference on a large input."""
+        content = "In summary, the cache is warm. " * 2000
+        assert SynthesisLayerImpl().normalize_output(content) == _reference_normalize(content, 5000)
+
+
+# =============================================================================
+# Early Termination Tests
+# =============================================================================
+
+class TestEarlyTermination:
+    """Tests that input past the budget isn't processed."""
+
+    def test_stops_consuming_after_budget(self):
+        """Test that the normalizer ignores input once the budget is exceeded."""
+        normalizer = StreamingNormalizer(max_length=50)
+        normalizer.feed("Sentence number one is here. " * 10)
+
+        assert normalizer.done
+        normalizer.feed("This chunk is never normalized. ")
+        assert normalizer.finish().endswith("...")
+        assert len(normalizer.finish()) == 50
+
+    def test_long_sentence_flushed_at_periods(self):
+        """Test that text without sentence separators still stops early."""
+        content = "In summary, line one.\n\n\nLine two.\n" * 10
+        normalizer = StreamingNormalizer(max_length=50)
+        normalizer.feed(content)
+
+        assert normalizer.done
+        assert normalizer.finish() == _reference_normalize(content, 50)
@@ -0,0 +1,427 @@
+"""
+Unit tests for orchestration execution modes.
+
+Tests cover the cascade and ensemble modes of ConcreteOrchestrationLayer in
+ai_council/orchestration/layer.py and the rankings they rely on, streaming,
+and batch scheduling in ai_council/orchestration/batch.py.
+"""
+
+import threading
+import time
+
+import pytest
+
+from ai_council.analysis.decomposer import BasicTaskDecomposer
+from ai_council.analysis.engine import BasicAnalysisEngine
+from ai_council.arbitration.layer import ConcreteArbitrationLayer
+from ai_council.core.concurrency_limiter import concurrency_limiter_manager
+from ai_council.core.exceptions import ValidationError
+from ai_council.core.interfaces import ExecutionPlan
+from ai_council.core.models import (
+    AgentResponse, ExecutionMode, FinalResponse, ModelCapabilities, RiskLevel,
+    Subtask, SynthesisSection, TaskType
+)
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel
+from ai_council.orchestration.layer import ConcreteOrchestrationLayer
+from ai_council.routing.context_protocol import ModelContextProtocolImpl
+from ai_council.routing.registry import ModelRegistryImpl
+from ai_council.synthesis.layer import SynthesisLayerImpl
+
+
+HEDGING_TEMPLATE = "Maybe, I think this could possibly work, but I am not sure about it at all."
+CONFIDENT_TEMPLATE = (
+    "This is clearly and definitely the right approach: cache hot keys close "
+    "to the caller and invalidate them on write."
+)
+
+
+def _register(registry, model_id, template, cost_per_token, delay=0.0):
+    registry.register_model(
+        MockAIModel(model_id, response_template=template, failure_rate=0.0, response_delay=delay),
+        ModelCapabilities(
+            task_types=list(TaskType),
+            cost_per_token=cost_per_token,
+            average_latency=1.0,
+            max_context_length=8192,
+            reliability_score=0.9
+        )
+    )
+
+
+def _build_layer(registry, quality_thresholds=None):
+    return ConcreteOrchestrationLayer(
+        analysis_engine=BasicAnalysisEngine(),
+        task_decomposer=BasicTaskDecomposer(),
+        model_context_protocol=ModelContextProtocolImpl(registry),
+        execution_agent=BaseExecutionAgent(max_retries=0),
+        arbitration_layer=ConcreteArbitrationLayer(),
+        synthesis_layer=SynthesisLayerImpl(),
+        model_registry=registry,
+        quality_thresholds=quality_thresholds
+    )
+
+
+@pytest.fixture
+def subtask():
+    return Subtask(parent_task_id="t1", content="Explain caching", task_type=TaskType.REASONING)
+
+
+# =============================================================================
+# Cascade Mode Tests
+# =============================================================================
+
+class TestCascadeMode:
+    """Tests for cheapest-first execution with quality-gated escalation."""
+
+    def test_models_ranked_cheapest_first(self, subtask):
+        """Test that the cost optimizer orders cascade tiers by cost."""
+        registry = ModelRegistryImpl()
+        _register(registry, "premium", CONFIDENT_TEMPLATE, 0.01)
+        _register(registry, "cheap", CONFIDENT_TEMPLATE, 0.0001)
+        layer = _build_layer(registry)
+
+        ranked = layer.cost_optimizer.rank_models_by_cost(subtask, ["premium", "cheap"])
+
+        assert ranked == ["cheap", "premium"]
+
+    def test_confident_cheap_model_is_accepted(self, subtask):
+        """Test that the cheapest tier is kept when it clears the threshold."""
+        registry = ModelRegistryImpl()
+        _register(registry, "cheap", CONFIDENT_TEMPLATE, 0.0001)
+        _register(registry, "premium", CONFIDENT_TEMPLATE, 0.01)
+        layer = _build_layer(registry)
+
+        response = layer._execute_cascade(subtask, ["cheap", "premium"])
+
+        assert response.model_used == "cheap"
+        assert len(response.metadata["cascade_path"]) == 1
+
+    def test_low_confidence_escalates(self, subtask):
+        """Test that a hedging cheap response escalates to the next tier."""
+        registry = ModelRegistryImpl()
+        _register(registry, "cheap", HEDGING_TEMPLATE, 0.0001)
+        _register(registry, "premium", CONFIDENT_TEMPLATE, 0.01)
+        layer = _build_layer(registry)
+
+        response = layer._execute_cascade(subtask, ["cheap", "premium"])
+
+        assert response.model_used == "premium"
+        path = response.metadata["cascade_path"]
+        assert [entry.split(" ")[0] for entry in path] == ["cheap", "premium"]
+
+    def test_quality_threshold_override(self, subtask):
+        """Test that a configured threshold changes when escalation happens."""
+        registry = ModelRegistryImpl()
+        _register(registry, "cheap", HEDGING_TEMPLATE, 0.0001)
+        _register(registry, "premium", CONFIDENT_TEMPLATE, 0.01)
+        layer = _build_layer(registry, quality_thresholds={ExecutionMode.CASCADE: 0.0})
+
+        response = layer._execute_cascade(subtask, ["cheap", "premium"])
+
+        assert response.model_used == "cheap"
+
+    def test_escalation_paths_recorded(self):
+        """Test that process_request reports escalations in execution metadata."""
+        registry = ModelRegistryImpl()
+        _register(registry, "cheap", HEDGING_TEMPLATE, 0.0001)
+        _register(registry, "premium", CONFIDENT_TEMPLATE, 0.01)
+        layer = _build_layer(registry)
+
+        result = layer.process_request("Explain how caching works", ExecutionMode.CASCADE)
+
+        assert result.execution_metadata.escalation_paths
+        assert all("cheap" in path and "premium" in path
+                   for path in result.execution_metadata.escalation_paths)
+
+
+# =============================================================================
+# Ensemble Mode Tests
+# =============================================================================
+
+class TestEnsembleMode:
+    """Tests for concurrent execution of critical subtasks with a quorum."""
+
+    @pytest.fixture
+    def critical_subtask(self):
+        return Subtask(
+            parent_task_id="t1", content="Explain caching",
+            task_type=TaskType.REASONING, risk_level=RiskLevel.CRITICAL
+        )
+
+    def test_quorum_returns_without_waiting_for_stragglers(self, critical_subtask):
+        """Test that agreeing responses return before the slowest model finishes."""
+        registry = ModelRegistryImpl()
+        _register(registry, "fast-a", CONFIDENT_TEMPLATE, 0.001)
+        _register(registry, "fast-b", CONFIDENT_TEMPLATE, 0.001)
+        _register(registry, "slow", CONFIDENT_TEMPLATE, 0.001, delay=2.0)
+        layer = _build_layer(registry)
+
+        start = time.time()
+        responses = layer._execute_ensemble(
+            critical_subtask, ExecutionMode.BALANCED, ["fast-a", "fast-b", "slow"]
+        )
+
+        assert time.time() - start < 1.5
+        assert sorted(r.model_used for r in responses) == ["fast-a", "fast-b"]
+        assert responses[0].metadata["ensemble"]["quorum_reached"]
+        assert responses[0].metadata["ensemble"]["cancelled"] == ["slow"]
+
+    def test_cancelled_stragglers_release_limiter_slots(self, critical_subtask):
+        """Test that a member abandoned at quorum frees its slot and makes no retry."""
+        gate = threading.Event()
+        calls = []
+
+        class FlakyModel(MockAIModel):
+            def generate_response(self, prompt, **kwargs):
+                calls.append(prompt)
+                gate.wait(5.0)
+                raise ConnectionError("connection reset")
+
+        registry = ModelRegistryImpl()
+        _register(registry, "fast-a", CONFIDENT_TEMPLATE, 0.001)
+        _register(registry, "fast-b", CONFIDENT_TEMPLATE, 0.001)
+        registry.register_model(
+            FlakyModel("flaky", failure_rate=0.0, response_delay=0.0),
+            ModelCapabilities(
+                task_types=list(TaskType), cost_per_token=0.001, average_latency=1.0,
+                max_context_length=8192, reliability_score=0.9
+            )
+        )
+        layer = _build_layer(registry)
+        layer.execution_agent.max_retries = 2
+        limiter = concurrency_limiter_manager.get_limiter("default")
+        in_flight = limiter.in_flight
+
+        responses = layer._execute_ensemble(
+            critical_subtask, ExecutionMode.BALANCED, ["fast-a", "fast-b", "flaky"]
+        )
+        assert responses[0].metadata["ensemble"]["cancelled"] == ["flaky"]
+        assert limiter.in_flight == in_flight + 1
+
+        gate.set()
+        for thread in threading.enumerate():
+            if thread.name.startswith(f"ensemble-{critical_subtask.id[:8]}"):
+                thread.join(5.0)
+
+        assert limiter.in_flight == in_flight
+        assert len(calls) == 1
+
+    def test_disagreement_returns_all_responses(self, critical_subtask):
+        """Test that every response goes to arbitration when no quorum forms."""
+        registry = ModelRegistryImpl()
+        _register(registry, "confident", CONFIDENT_TEMPLATE, 0.001)
+        _register(registry, "hedging", HEDGING_TEMPLATE, 0.001)
+        layer = _build_layer(registry)
+
+        responses = layer._execute_ensemble(
+            critical_subtask, ExecutionMode.BEST_QUALITY, ["confident", "hedging"]
+        )
+
+        assert len(responses) == 2
+        assert not responses[0].metadata["ensemble"]["quorum_reached"]
+
+    def test_only_critical_subtasks_fan_out(self, subtask, critical_subtask):
+        """Test that the ensemble is limited to critical subtasks in enabled modes."""
+        registry = ModelRegistryImpl()
+        _register(registry, "fast-a", CONFIDENT_TEMPLATE, 0.001)
+        _register(registry, "fast-b", CONFIDENT_TEMPLATE, 0.001)
+        layer = _build_layer(registry)
+        plan = layer._create_sequential_plan([subtask, critical_subtask])
+
+        balanced = layer._execute_subtasks_with_resilience(
+            [subtask, critical_subtask], plan, ExecutionMode.BALANCED
+        )
+        fast = layer._execute_subtasks_with_resilience(
+            [subtask, critical_subtask], plan, ExecutionMode.FAST
+        )
+
+        assert [r.subtask_id for r in balanced].count(critical_subtask.id) == 2
+        assert [r.subtask_id for r in balanced].count(subtask.id) == 1
+        assert len(fast) == 2
+
+    def test_similarity_measure(self):
+        """Test the default word-overlap similarity used for agreement."""
+        layer = ConcreteArbitrationLayer()
+        first = AgentResponse(subtask_id="s", model_used="a", content="Cache hot keys")
+        second = AgentResponse(subtask_id="s", model_used="b", content="cache HOT data")
+
+        assert layer.response_similarity(first, second) == pytest.approx(0.5)
+
+
+# =============================================================================
+# Streaming Tests
+# =============================================================================
+
+class TestStreaming:
+    """Tests for emitting synthesized sections as subtasks complete."""
+
+    @pytest.fixture
+    def subtasks(self):
+        return [
+            Subtask(id=f"s{i}", parent_task_id="t1", content=f"Part {i}", task_type=TaskType.REASONING)
+            for i in range(1, 4)
+        ]
+
+    @staticmethod
+    def _stub_execution(layer, plan, subtasks, delays, events, failing=()):
+        answers = {
+            "s1": "Caching stores results close to the caller.",
+            "s2": "Invalidation keeps cached values consistent.",
+            "s3": "Eviction drops the least recently used keys."
+        }
+
+        def execute(group, execution_mode):
+            subtask = group[0]
+            time.sleep(delays.get(subtask.id, 0.0))
+            events.append(f"done {subtask.id}")
+            if subtask.id in failing:
+                return [AgentResponse(subtask_id=subtask.id, model_used="m", content="",
+                                      success=False, error_message="boom")]
+            return [AgentResponse(subtask_id=subtask.id, model_used="m", content=answers[subtask.id])]
+
+        layer._plan_request = lambda user_input, mode, metadata: (subtasks, plan)
+        layer._execute_parallel_group_resilient = execute
+
+    def test_sections_follow_sequential_order(self, subtasks):
+        """Test that a subtask finishing early waits for its predecessor."""
+        layer = _build_layer(ModelRegistryImpl())
+        plan = ExecutionPlan([subtasks], ["s1", "s2", "s3"])
+        events = []
+        self._stub_execution(layer, plan, subtasks, {"s1": 0.3}, events)
+
+        items = list(layer.process_request_stream("Explain caching", ExecutionMode.BALANCED))
+
+        assert events[-1] == "done s1"
+        assert [item.subtask_id for item in items[:-1]] == ["s1", "s2", "s3"]
+        assert isinstance(items[-1], FinalResponse)
+        assert items[-1].content.count("\n\n") == 2
+        assert "incremental_synthesis" in items[-1].execution_metadata.execution_path
+
+    def test_first_section_emitted_before_later_groups_run(self, subtasks):
+        """Test that sections are yielded while later groups are still pending."""
+        layer = _build_layer(ModelRegistryImpl())
+        plan = ExecutionPlan([[task] for task in subtasks], ["s1", "s2", "s3"])
+        events = []
+        self._stub_execution(layer, plan, subtasks, {}, events)
+
+        for item in layer.process_request_stream("Explain caching", ExecutionMode.BALANCED):
+            if isinstance(item, SynthesisSection):
+                events.append(f"section {item.subtask_id}")
+
+        assert events == [
+            "done s1", "section s1", "done s2", "section s2", "done s3", "section s3"
+        ]
+
+    def test_failed_subtask_is_skipped(self, subtasks):
+        """Test that a failed subtask doesn't block or appear in the output."""
+        layer = _build_layer(ModelRegistryImpl())
+        plan = ExecutionPlan([subtasks], ["s1", "s2", "s3"])
+        self._stub_execution(layer, plan, subtasks, {}, [], failing={"s1"})
+
+        items = list(layer.process_request_stream("Explain caching", ExecutionMode.BALANCED))
+
+        assert [item.subtask_id for item in items[:-1]] == ["s2", "s3"]
+        assert items[-1].success
+
+
+# =============================================================================
+# Batch Processing Tests
+# =============================================================================
+
+class TestBatchProcessing:
+    """Tests for scheduling many requests through one pool."""
+
+    @staticmethod
+    def _stub_pipeline(layer, delays=None):
+        """Plan each input as its own subtask plus a shared one and record calls."""
+        calls = {"plans": [], "executions": []}
+        lock = threading.Lock()
+
+        def plan(user_input, mode, metadata):
+            with lock:
+                calls["plans"].append(user_input)
+            if user_input == "invalid":
+                raise ValidationError("Failed to analyze input")
+            subtasks = [
+                Subtask(parent_task_id="t", content=f"Explain {user_input}", task_type=TaskType.REASONING),
+                Subtask(parent_task_id="t", content="Define caching", task_type=TaskType.REASONING)
+            ]
+            return subtasks, ExecutionPlan([subtasks], [subtask.id for subtask in subtasks])
+
+        def execute(group, execution_mode):
+            subtask = group[0]
+            with lock:
+                calls["executions"].append(subtask.content)
+            time.sleep((delays or {}).get(subtask.content, 0.05))
+            return [AgentResponse(subtask_id=subtask.id, model_used="m",
+                                  content=f"The answer to '{subtask.content}' is well known.")]
+
+        layer._plan_request = plan
+        layer._execute_parallel_group_resilient = execute
+        return calls
+
+    def test_results_in_completion_order(self):
+        """Test that a fast item is returned before an earlier slow one."""
+        layer = _build_layer(ModelRegistryImpl())
+        self._stub_pipeline(layer, delays={"Explain eviction": 0.4})
+
+        results = list(layer.process_batch(["eviction", "invalidation"], ExecutionMode.BALANCED))
+
+        assert [index for index, _ in results] == [1, 0]
+        assert all(response.success for _, response in results)
+        assert "eviction" in results[1][1].content
+
+    def test_shares_identical_inputs_and_subtasks(self):
+        """Test that duplicates are planned and executed once."""
+        layer = _build_layer(ModelRegistryImpl())
+        calls = self._stub_pipeline(layer)
+
+        results = dict(layer.process_batch(["eviction", "eviction", "invalidation"], ExecutionMode.BALANCED))
+
+        assert sorted(results) == [0, 1, 2]
+        assert results[0] is results[1]
+        assert sorted(calls["plans"]) == ["eviction", "invalidation"]
+        assert calls["executions"].count("Define caching") == 1
+        assert "caching" in results[2].content
+
+    def test_items_overlap_in_one_pool(self):
+        """Test that items run concurrently instead of back to back."""
+        layer = _build_layer(ModelRegistryImpl())
+        layer.max_parallel_executions = 8
+        self._stub_pipeline(layer, delays={f"Explain topic {i}": 0.2 for i in range(4)})
+
+        start = time.time()
+        results = list(layer.process_batch([f"topic {i}" for i in range(4)], ExecutionMode.BALANCED))
+
+        assert len(results) == 4
+        assert time.time() - start < 0.6
+
+    def test_failures_reported_per_item(self):
+        """Test that one failing item doesn't affect the others."""
+        layer = _build_layer(ModelRegistryImpl())
+        self._stub_pipeline(layer)
+
+        results = dict(layer.process_batch(["invalid", "eviction"], ExecutionMode.BALANCED))
+
+        assert not results[0].success
+        assert results[0].error_type == "ValidationError"
+        assert results[1].success
+
+    def test_inputs_read_lazily(self):
+        """Test that inputs are only read as earlier items finish."""
+        layer = _build_layer(ModelRegistryImpl())
+        self._stub_pipeline(layer)
+        read = []
+
+        def inputs():
+            for i in range(5):
+                read.append(i)
+                yield f"topic {i}"
+
+        batch = layer.process_batch(inputs(), ExecutionMode.BALANCED, concurrency=1)
+        first_index, _ = next(batch)
+
+        assert first_index == 0
+        assert len(read) <= 2
+        assert len(list(batch)) == 4
@@ -0,0 +1,150 @@
+"""
+Unit tests for AST-based plugin discovery and its manifest cache.
+
+Tests cover PluginManager.discover_plugins in ai_council/utils/plugin_manager.py.
+"""
+
+import json
+import os
+
+import pytest
+
+from ai_council.utils import plugin_manager
+from ai_council.utils.config import create_default_config
+from ai_council.utils.plugin_manager import PluginManager
+
+MODEL_PLUGIN = """
+from ai_council.core.interfaces import AIModel
+
+class FastModel(AIModel):
+    pass
+
+class Helper:
+    pass
+"""
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """Create a plugin directory with one model plugin."""
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    (directory / "fast.py").write_text(MODEL_PLUGIN)
+    return directory
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a plugin manager caching under a temporary directory."""
+    config = create_default_config()
+    config.cache_dir = str(tmp_path / "cache")
+    return PluginManager(config)
+
+
+def _forbid_parsing(monkeypatch):
+    def fail(tree, module_path):
+        raise AssertionError(f"{module_path} should not be re-inspected")
+
+    monkeypatch.setattr(plugin_manager, "_collect_class_bases", fail)
+
+
+# =============================================================================
+# AST Discovery Tests
+# =============================================================================
+
+class TestAstDiscovery:
+    """Tests for finding plugin classes without importing them."""
+
+    def test_discovers_without_executing(self, manager, plugin_dir, tmp_path):
+        """Test that plugin files are inspected but never run."""
+        marker = tmp_path / "executed"
+        (plugin_dir / "side_effect.py").write_text(
+            f"open({str(marker)!r}, 'w').close()\n"
+            "from ai_council.core import interfaces\n"
+            "class Arbiter(interfaces.ArbitrationLayer):\n"
+            "    pass\n"
+        )
+
+        assert manager.discover_plugins(str(plugin_dir)) == ["fast.FastModel", "side_effect.Arbiter"]
+        assert not marker.exists()
+
+    def test_resolves_aliases_and_cross_module_bases(self, manager, plugin_dir):
+        """Test aliased imports, relative imports and subclasses of other plugins."""
+        package = plugin_dir / "extra"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "base.py").write_text(
+            "from ai_council.core.interfaces import SynthesisLayer as Base\n"
+            "class BaseSynth(Base):\n"
+            "    pass\n"
+        )
+        (package / "custom.py").write_text(
+            "from .base import BaseSynth\n"
+            "from ..fast import FastModel\n"
+            "class CustomSynth(BaseSynth):\n"
+            "    pass\n"
+            "class TunedModel(FastModel):\n"
+            "    pass\n"
+        )
+
+        discovered = manager.discover_plugins(str(plugin_dir))
+
+        assert discovered == [
+            "extra.base.BaseSynth", "extra.custom.CustomSynth", "extra.custom.TunedModel", "fast.FastModel"
+        ]
+
+    def test_skips_invalid_files(self, manager, plugin_dir):
+        """Test that files with syntax errors are skipped."""
+        (plugin_dir / "broken.py").write_text("class Broken(AIModel:\n")
+
+        assert manager.discover_plugins(str(plugin_dir)) == ["fast.FastModel"]
+
+
+# =============================================================================
+# Manifest Cache Tests
+# =============================================================================
+
+class TestManifestCache:
+    """Tests for reusing inspections across calls and restarts."""
+
+    def test_manifest_written_and_reused(self, manager, plugin_dir, monkeypatch):
+        """Test that a second manager reuses the manifest without parsing."""
+        manager.discover_plugins(str(plugin_dir))
+        manifest_path = manager._manifest_path(plugin_dir)
+        manifest = json.loads(manifest_path.read_text())
+
+        assert manifest["plugins"] == ["fast.FastModel"]
+        assert set(manifest["files"]["fast.py"]) == {"module", "mtime_ns", "size", "sha256", "classes"}
+
+        _forbid_parsing(monkeypatch)
+        assert PluginManager(manager.config).discover_plugins(str(plugin_dir)) == ["fast.FastModel"]
+
+    def test_touched_file_matched_by_hash(self, manager, plugin_dir, monkeypatch):
+        """Test that a new mtime with the same content only re-hashes the file."""
+        manager.discover_plugins(str(plugin_dir))
+        stat = (plugin_dir / "fast.py").stat()
+        os.utime(plugin_dir / "fast.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        _forbid_parsing(monkeypatch)
+        assert manager.discover_plugins(str(plugin_dir)) == ["fast.FastModel"]
+
+    def test_changed_and_removed_files_refreshed(self, manager, plugin_dir):
+        """Test that edits are re-inspected and deleted files dropped."""
+        (plugin_dir / "other.py").write_text(MODEL_PLUGIN.replace("FastModel", "OtherModel"))
+        manager.discover_plugins(str(plugin_dir))
+
+        (plugin_dir / "fast.py").write_text(MODEL_PLUGIN.replace("FastModel", "RenamedModel") + "\n")
+        (plugin_dir / "other.py").unlink()
+
+        assert manager.discover_plugins(str(plugin_dir)) == ["fast.RenamedModel"]
+        manifest = json.loads(manager._manifest_path(plugin_dir).read_text())
+        assert list(manifest["files"]) == ["fast.py"]
+
+    def test_corrupt_manifest_ignored(self, manager, plugin_dir):
+        """Test that an unreadable manifest just triggers a full scan."""
+        manifest_path = manager._manifest_path(plugin_dir)
+        manifest_path.parent.mkdir(parents=True)
+        manifest_path.write_text("{not json")
+
+        assert manager.discover_plugins(str(plugin_dir)) == ["fast.FastModel"]
+        assert json.loads(manifest_path.read_text())["version"] == plugin_manager.MANIFEST_VERSION
@@ -0,0 +1,122 @@
+"""
+Unit tests for request profiling.
+
+Tests cover ai_council/core/profiling.py, its hook around
+ConcreteOrchestrationLayer.process_request and the profiles CLI subcommand.
+"""
+
+import cProfile
+import json
+import pstats
+import time
+
+import pytest
+
+from ai_council.cli_utils import CLIHandler
+from ai_council.core.models import ExecutionMode
+from ai_council.core.profiling import (
+    RequestProfiler, aggregate_profiles, collapse_pstats, format_collapsed, load_profiles,
+    request_profiler
+)
+from ai_council.factory import AICouncilFactory
+from ai_council.utils.config import create_default_config
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _outer():
+    _inner()
+    _inner()
+
+
+def _inner():
+    _busy(0.01)
+
+
+@pytest.fixture
+def global_profiler():
+    """The global profiler, restored to its defaults afterwards."""
+    yield request_profiler
+    request_profiler.configure()
+
+
+# =============================================================================
+# Profiler Tests
+# =============================================================================
+
+class TestRequestProfiler:
+    """Tests for choosing, sampling and writing request profiles."""
+
+    def test_one_in_n_and_forced_requests_are_profiled(self):
+        """Test that sampling picks every Nth request and forced requests always."""
+        profiler = RequestProfiler(enabled=True, sample_rate=3)
+        chosen = [profiler.should_profile() for _ in range(6)]
+        assert chosen == [False, False, True, False, False, True]
+
+        profiler.configure(enabled=False, allow_forced=True)
+        assert not profiler.should_profile()
+        assert profiler.forced(profiler.should_profile)()
+
+        profiler.configure(enabled=False, allow_forced=False)
+        assert not profiler.forced(profiler.should_profile)()
+
+    def test_sample_mode_writes_stacks_and_spans(self, tmp_path):
+        """Test that a sampled profile records the request's stacks, ID and span timings."""
+        profiler = RequestProfiler(enabled=True, sample_rate=1, interval=0.001, directory=tmp_path)
+        spans = [{"trace_id": "abc123", "name": "request", "duration": 0.2}]
+        with profiler.profile(spans) as profile:
+            _busy(0.2)
+
+        assert profile.samples > 0
+        data = json.loads(profile.path.read_text())
+        assert profile.path.name.endswith("-abc123.json")
+        assert data["request_id"] == "abc123"
+        assert data["spans"] == spans
+        assert any("_busy (" in stack for stack in data["stacks"])
+
+    def test_cprofile_call_graph_collapses_to_stacks(self):
+        """Test that a cProfile call graph becomes stacks weighted along caller edges."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _outer()
+        profiler.disable()
+        profiler.create_stats()
+
+        stacks = collapse_pstats(pstats.Stats(profiler))
+        inner = [stack for stack in stacks if stack.split(";")[-1].startswith("_inner (")]
+        assert inner and all("_outer (" in stack for stack in inner)
+        assert sum(stacks[stack] for stack in inner) > 0
+
+
+# =============================================================================
+# Pipeline and CLI Tests
+# =============================================================================
+
+class TestProfiledPipeline:
+    """Tests for profiling requests through the orchestration layer and aggregating them."""
+
+    def test_profiled_request_aggregates_through_cli(self, tmp_path, global_profiler, capsys):
+        """Test that a profiled request is written with its trace and aggregated by the CLI."""
+        global_profiler.configure(enabled=True, sample_rate=1, interval=0.001, directory=tmp_path)
+        layer = AICouncilFactory(create_default_config()).create_orchestration_layer()
+        response = layer.process_request("Explain how caching works", ExecutionMode.FAST)
+
+        profiles = list(load_profiles([tmp_path]))
+        assert len(profiles) == 1
+        trace_ids = {span["trace_id"] for span in response.execution_metadata.spans}
+        assert trace_ids == {profiles[0]["request_id"]}
+        assert profiles[0]["spans"] == response.execution_metadata.spans
+
+        capsys.readouterr()
+        handler = CLIHandler()
+        args = handler.parse_args(["profiles", "--input", str(tmp_path), "--frame", "process_request"])
+        assert args.command == "profiles"
+        assert handler.handle_profiles(args.input, args.output, args.since_minutes, args.frame) == 1
+        lines = capsys.readouterr().out.splitlines()
+        assert lines and all("process_request (" in line for line in lines)
+        assert aggregate_profiles(profiles, since=time.time() + 60) == {}
+        assert format_collapsed(aggregate_profiles(profiles, frame="process_request")).splitlines() == lines
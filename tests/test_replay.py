@@ -0,0 +1,128 @@
+"""
+Unit tests for recording and replaying provider traffic.
+
+Tests cover ai_council/execution/replay.py and the replay settings that
+AICouncilFactory applies to configured models.
+"""
+
+import pytest
+
+from ai_council.core.clock import VirtualClock, use_clock
+from ai_council.core.interfaces import ModelError
+from ai_council.core.models import ExecutionMode
+from ai_council.execution.mock_models import MockAIModel, MockModelBehavior
+from ai_council.execution.replay import (
+    CaptureReader, CaptureWriter, CapturedCall, RecordingModel, ReplayModel
+)
+from ai_council.factory import AICouncilFactory
+from ai_council.utils.config import create_default_config
+
+
+# =============================================================================
+# Capture File Tests
+# =============================================================================
+
+class TestCaptureFile:
+    """Tests for writing, indexing and reading capture files."""
+
+    def test_lookup_by_prompt_after_capture_grows(self, tmp_path):
+        """Test indexed lookups, compressed records and a rebuilt index after appending."""
+        path = tmp_path / "traffic.cap"
+        long_response = "A long answer. " * 100
+        with CaptureWriter(path) as writer:
+            writer.write(CapturedCall("model-a", "Explain caching", response="short"))
+            writer.write(CapturedCall("model-a", "Explain indexing", response=long_response))
+
+        with CaptureReader(path) as reader:
+            assert len(reader) == 2
+            assert reader.lookup("model-a", "Explain indexing")[0].response == long_response
+            assert reader.lookup("model-b", "Explain caching") == []
+
+        assert path.stat().st_size < len(long_response)
+        with CaptureWriter(path) as writer:
+            writer.write(CapturedCall("model-b", "Explain caching", response="other"))
+        with CaptureReader(path) as reader:
+            assert len(reader) == 3
+            assert reader.model_ids() == ["model-a", "model-b"]
+            assert reader.lookup("model-b", "Explain caching")[0].response == "other"
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the capture header is refused."""
+        path = tmp_path / "notes.txt"
+        path.write_text("not a capture")
+
+        with pytest.raises(ValueError):
+            CaptureWriter(path)
+        with pytest.raises(ValueError):
+            CaptureReader(path)
+
+
+# =============================================================================
+# Record and Replay Tests
+# =============================================================================
+
+class TestRecordAndReplay:
+    """Tests for recording model calls and serving them back."""
+
+    def test_replay_serves_recorded_responses_errors_and_timing(self, tmp_path):
+        """Test that replay returns recorded responses and errors after their recorded latency."""
+        path = tmp_path / "traffic.cap"
+        clock = VirtualClock()
+        with CaptureWriter(path) as writer:
+            model = RecordingModel(MockAIModel("model-a", response_delay=2.0, clock=clock), writer, clock)
+            failing = RecordingModel(
+                MockAIModel("model-b", behavior=MockModelBehavior.AUTHENTICATION_ERROR, clock=clock),
+                writer, clock
+            )
+            recorded = model.generate_response("Explain caching", temperature=0.2)
+            with pytest.raises(ModelError):
+                failing.generate_response("Explain caching")
+
+        with CaptureReader(path) as reader:
+            call = reader.lookup("model-a", "Explain caching")[0]
+            assert call.params == {"temperature": 0.2}
+            assert call.latency == pytest.approx(2.0)
+            assert call.completion_tokens == len(recorded) // 4
+
+            with use_clock(VirtualClock()) as replay_clock:
+                assert ReplayModel("model-a", reader).generate_response("Explain caching") == recorded
+                assert replay_clock.time() == pytest.approx(2.0)
+            with pytest.raises(ModelError) as excinfo:
+                ReplayModel("model-b", reader, timing=False).generate_response("Explain caching")
+            assert excinfo.value.error_type == "AuthenticationError"
+
+            replay = ReplayModel("model-a", reader, timing=False)
+            with pytest.raises(ModelError) as excinfo:
+                replay.generate_response("Never recorded")
+            assert excinfo.value.error_type == "ReplayMiss"
+            assert replay.misses == 1
+
+    def test_repeated_prompts_replay_in_recording_order(self, tmp_path):
+        """Test that each recording of a repeated prompt is served in turn, then cycled."""
+        path = tmp_path / "traffic.cap"
+        with CaptureWriter(path) as writer:
+            for response in ("first", "second"):
+                writer.write(CapturedCall("model-a", "Explain caching", response=response))
+
+        with CaptureReader(path) as reader:
+            replay = ReplayModel("model-a", reader, timing=False)
+            served = [replay.generate_response("Explain caching") for _ in range(3)]
+
+        assert served == ["first", "second", "first"]
+
+    def test_factory_records_then_replays_a_request(self, tmp_path):
+        """Test that a request recorded through the factory replays to the same response."""
+        def run(mode):
+            config = create_default_config()
+            config.data_dir = str(tmp_path)
+            config.replay.mode = mode
+            with use_clock(VirtualClock()):
+                layer = AICouncilFactory(config).create_orchestration_layer()
+                return layer.process_request("Explain how caching works", ExecutionMode.FAST)
+
+        recorded = run("record")
+        replayed = run("replay")
+
+        assert (tmp_path / "provider_traffic.cap").exists()
+        assert recorded.success and replayed.success
+        assert replayed.content == recorded.content
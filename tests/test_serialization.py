@@ -0,0 +1,178 @@
+"""
+Unit tests for the binary and JSON model codec.
+
+Tests cover ai_council/core/serialization.py.
+"""
+
+import dataclasses
+from datetime import datetime, timezone
+
+import pytest
+
+from ai_council.core import interfaces, serialization
+from ai_council.core.models import (
+    AgentResponse, ComplexityLevel, CostBreakdown, ExecutionMetadata, ExecutionMode,
+    FinalResponse, Priority, RiskLevel, SelfAssessment, Subtask, Task, TaskIntent, TaskType
+)
+from ai_council.core.serialization import (
+    SerializationError, decode, encode, from_json, peek_content, to_dict, to_json
+)
+
+
+def _models():
+    assessment = SelfAssessment(
+        confidence_score=0.8, assumptions=["warm cache"], risk_level=RiskLevel.MEDIUM,
+        estimated_cost=0.01, token_usage=42, execution_time=1.5, model_used="model-a"
+    )
+    return [
+        Task(content="Explain caching", intent=TaskIntent.QUESTION,
+             complexity=ComplexityLevel.MODERATE, execution_mode=ExecutionMode.FAST,
+             metadata={"source": "cli", "tags": ["a", "b"]}),
+        Subtask(parent_task_id="t1", content="Explain LRU", task_type=TaskType.RESEARCH,
+                priority=Priority.HIGH, risk_level=RiskLevel.HIGH, estimated_cost=0.2),
+        assessment,
+        AgentResponse(subtask_id="s1", model_used="model-a", content="Caching — kept close. ✓",
+                      self_assessment=assessment, metadata={"cascade_path": ["a", "b"], "n": 3}),
+        AgentResponse(subtask_id="s1", model_used="model-a", content="", success=False,
+                      error_message="timeout"),
+        FinalResponse(content="Answer", overall_confidence=0.7,
+                      execution_metadata=ExecutionMetadata(models_used=["a"], execution_path=["x"]),
+                      cost_breakdown=CostBreakdown(total_cost=0.3, model_costs={"a": 0.3},
+                                                   token_usage={"a": 10}),
+                      models_used=["a"]),
+    ]
+
+
+# =============================================================================
+# Round Trip Tests
+# =============================================================================
+
+class TestRoundTrip:
+    """Tests that every model survives both forms unchanged."""
+
+    @pytest.mark.parametrize("model", _models(), ids=lambda m: type(m).__name__)
+    def test_binary_round_trip(self, model):
+        """Test encoding and decoding the binary form."""
+        decoded = decode(encode(model), validate=True)
+
+        assert type(decoded) is type(model)
+        assert decoded == model
+
+    @pytest.mark.parametrize("model", _models(), ids=lambda m: type(m).__name__)
+    def test_json_round_trip(self, model):
+        """Test encoding and decoding the JSON form."""
+        decoded = from_json(to_json(model), validate=True)
+
+        assert type(decoded) is type(model)
+        assert decoded == model
+
+    def test_json_uses_plain_values(self):
+        """Test that enums and datetimes are written as values and ISO strings."""
+        subtask = _models()[1]
+        data = to_dict(subtask)
+
+        assert data["__type__"] == "Subtask"
+        assert data["task_type"] == "research"
+        assert data["created_at"] == subtask.created_at.isoformat()
+
+    def test_decoded_response_has_fresh_text_view(self):
+        """Test that decoded responses build their own cached view."""
+        decoded = decode(encode(_models()[3]))
+
+        assert decoded.text_view.text is decoded.content
+
+    def test_orchestration_metadata_encodes_as_dataclass(self):
+        """Test the orchestration layer's plain metadata class."""
+        metadata = interfaces.ExecutionMetadata()
+        metadata.execution_path.append("synthesis")
+        response = FinalResponse(content="Answer", overall_confidence=0.5, execution_metadata=metadata)
+
+        decoded = decode(encode(response))
+
+        assert isinstance(decoded.execution_metadata, ExecutionMetadata)
+        assert decoded.execution_metadata.execution_path == ["synthesis"]
+
+    def test_aware_datetimes_stored_as_utc(self):
+        """Test that timezone-aware datetimes decode as naive UTC."""
+        task = Task(content="Explain caching",
+                    created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+
+        assert decode(encode(task)).created_at == datetime(2024, 1, 1, 12)
+
+
+# =============================================================================
+# Content Peeking Tests
+# =============================================================================
+
+class TestPeekContent:
+    """Tests for reading content without decoding."""
+
+    def test_peek_returns_view_into_data(self):
+        """Test that content is returned as a view sharing the encoded buffer."""
+        response = AgentResponse(subtask_id="s1", model_used="m", content="Große Antwort " * 1000)
+        data = encode(response)
+
+        content = peek_content(data)
+
+        assert isinstance(content, memoryview)
+        assert content.obj is data
+        assert str(content, "utf-8") == response.content
+
+    def test_peek_without_content(self):
+        """Test objects that have no content field."""
+        assert peek_content(encode(CostBreakdown(total_cost=1.0))) is None
+
+
+# =============================================================================
+# Versioning and Error Tests
+# =============================================================================
+
+class TestVersioningAndErrors:
+    """Tests for schema evolution and malformed input."""
+
+    def test_fields_from_newer_schema_are_skipped(self, monkeypatch):
+        """Test that an older reader ignores fields appended by a newer writer."""
+        data = encode(Task(content="Explain caching", metadata={"k": "v"}))
+        schema = serialization._SCHEMAS_BY_ID[1]
+        older = dataclasses.replace(schema, fields=schema.fields[:-1])
+        monkeypatch.setitem(serialization._SCHEMAS_BY_ID, 1, older)
+
+        decoded = decode(data)
+
+        assert decoded.content == "Explain caching"
+        assert decoded.metadata == {}
+
+    def test_rejects_bad_magic_and_newer_version(self):
+        """Test header checks."""
+        data = bytearray(encode(_models()[0]))
+
+        with pytest.raises(SerializationError):
+            decode(b"XYZ" + bytes(data[3:]))
+        data[3] = serialization.CODEC_VERSION + 1
+        with pytest.raises(SerializationError):
+            decode(bytes(data))
+
+    def test_rejects_truncated_data(self):
+        """Test that truncated data raises instead of returning partial objects."""
+        data = encode(_models()[3])
+
+        with pytest.raises(SerializationError):
+            decode(data[:len(data) // 2])
+
+    def test_validation_on_decode(self):
+        """Test that validate=True applies the model rules."""
+        data = to_dict(_models()[2])
+        data["confidence_score"] = 1.5
+
+        assert serialization.from_dict(data).confidence_score == 1.5
+        with pytest.raises(SerializationError):
+            serialization.from_dict(data, validate=True)
+
+    def test_unsupported_values(self):
+        """Test that unknown types are rejected with a clear error."""
+        with pytest.raises(SerializationError):
+            encode(object())
+        with pytest.raises(SerializationError):
+            encode(Task(content="Explain caching", metadata={"value": object()}))
+        with pytest.raises(SerializationError):
+            to_json(Task(content="Explain caching", metadata={"value": object()}))
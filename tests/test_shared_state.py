@@ -0,0 +1,196 @@
+"""
+Unit tests for cross-process shared resilience state.
+
+Tests cover the SQLite backend in ai_council/core/shared_state.py and the
+managers that use it. Two backends opened on the same file stand in for two
+worker processes.
+"""
+
+import multiprocessing
+
+import pytest
+
+from ai_council.core.failure_handling import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError,
+    CircuitBreakerState, ResilienceManager
+)
+from ai_council.core.shared_state import (
+    SQLiteStateBackend, create_shared_state_backend
+)
+from ai_council.core.timeout_handler import AdaptiveTimeoutManager, RateLimitManager
+from ai_council.utils.config import AICouncilConfig
+
+
+def _consume_rate_limit(path: str, attempts: int, results) -> None:
+    backend = SQLiteStateBackend(path)
+    manager = RateLimitManager()
+    manager.attach_shared_state(backend)
+    manager.set_rate_limit("openai", 10)
+    results.put(sum(1 for _ in range(attempts) if manager.check_rate_limit("openai")[0]))
+    backend.close()
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return tmp_path / "state.db"
+
+
+@pytest.fixture
+def backends(state_path):
+    first = SQLiteStateBackend(state_path)
+    second = SQLiteStateBackend(state_path)
+    yield first, second
+    first.close()
+    second.close()
+
+
+# =============================================================================
+# Backend Creation Tests
+# =============================================================================
+
+class TestBackendCreation:
+    """Tests for building backends from configuration."""
+
+    def test_local_backend_is_none(self, tmp_path):
+        """Test that the local backend keeps state in process."""
+        assert create_shared_state_backend("local", tmp_path) is None
+
+    def test_sqlite_backend_defaults_to_data_dir(self, tmp_path):
+        """Test that the SQLite file is created under data_dir."""
+        backend = create_shared_state_backend("sqlite", tmp_path)
+        try:
+            assert backend.path == tmp_path / "resilience_state.db"
+            assert backend.path.exists()
+        finally:
+            backend.close()
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError):
+            create_shared_state_backend("redis", tmp_path)
+
+    def test_config_round_trip(self):
+        """Test that resilience settings survive to_dict/from_dict."""
+        config = AICouncilConfig.from_dict({
+            "resilience": {"shared_state_backend": "sqlite", "shared_state_path": "/tmp/x.db"}
+        })
+        restored = AICouncilConfig.from_dict(config.to_dict())
+
+        assert restored.resilience.shared_state_backend == "sqlite"
+        assert restored.resilience.shared_state_path == "/tmp/x.db"
+
+
+# =============================================================================
+# Shared Rate Limit Tests
+# =============================================================================
+
+class TestSharedRateLimits:
+    """Tests for rate limit windows shared between processes."""
+
+    def test_limit_enforced_across_managers(self, backends):
+        """Test that two managers draw from the same bucket."""
+        first, second = RateLimitManager(), RateLimitManager()
+        first.attach_shared_state(backends[0])
+        second.attach_shared_state(backends[1])
+        first.set_rate_limit("openai", 4)
+        second.set_rate_limit("openai", 4)
+
+        allowed = [first.check_rate_limit("openai")[0] for _ in range(2)]
+        allowed += [second.check_rate_limit("openai")[0] for _ in range(3)]
+
+        assert allowed == [True, True, True, True, False]
+        assert second.check_rate_limit("openai")[1] > 0.0
+        assert first.get_rate_limit_status("openai")["current_count"] == 4
+
+    def test_limit_enforced_across_processes(self, state_path):
+        """Test that separate OS processes share one bucket."""
+        SQLiteStateBackend(state_path).close()
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_consume_rate_limit, args=(str(state_path), 8, results))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert sum(results.get(timeout=5) for _ in workers) == 10
+
+
+# =============================================================================
+# Shared Circuit Breaker Tests
+# =============================================================================
+
+class TestSharedCircuitBreaker:
+    """Tests for breaker state shared between processes."""
+
+    @staticmethod
+    def _fail():
+        raise RuntimeError("provider down")
+
+    def test_breaker_opened_by_peer(self, backends):
+        """Test that failures in one process open the breaker in another."""
+        config = CircuitBreakerConfig(failure_threshold=3, recovery_timeout=60.0)
+        first = CircuitBreaker("model_api", config)
+        second = CircuitBreaker("model_api", config)
+        first.attach_shared_state(backends[0])
+        second.attach_shared_state(backends[1])
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                first.call(self._fail)
+        with pytest.raises(RuntimeError):
+            second.call(self._fail)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            first.call(lambda: "ok")
+        with pytest.raises(CircuitBreakerOpenError):
+            second.call(lambda: "ok")
+
+    def test_health_check_reports_shared_state(self, backends):
+        """Test that the resilience manager refreshes breakers from the backend."""
+        config = CircuitBreakerConfig(failure_threshold=1)
+        manager = ResilienceManager()
+        manager.create_circuit_breaker("model_api", config)
+        manager.attach_shared_state(backends[0])
+
+        peer = CircuitBreaker("model_api", config)
+        peer.attach_shared_state(backends[1])
+        with pytest.raises(RuntimeError):
+            peer.call(self._fail)
+
+        health = manager.health_check()
+        assert health["components"]["model_api"] == "unhealthy"
+        assert manager.get_circuit_breaker("model_api").state == CircuitBreakerState.OPEN
+
+
+# =============================================================================
+# Shared Latency History Tests
+# =============================================================================
+
+class TestSharedLatencyHistory:
+    """Tests for adaptive timeout history shared between processes."""
+
+    def test_history_visible_to_peer(self, backends):
+        """Test that samples recorded in one process drive another's timeout."""
+        first, second = AdaptiveTimeoutManager(), AdaptiveTimeoutManager()
+        first.attach_shared_state(backends[0])
+        second.attach_shared_state(backends[1])
+
+        for _ in range(20):
+            first.record_execution_time("model_execution", 40.0)
+
+        assert second.get_adaptive_timeout("model_execution") == pytest.approx(60.0)
+        assert second.get_performance_stats("model_execution")["count"] == 20
+
+    def test_history_is_bounded(self, backends):
+        """Test that only the most recent samples are kept."""
+        manager = AdaptiveTimeoutManager()
+        manager.max_history_size = 5
+        manager.attach_shared_state(backends[0])
+
+        for value in range(10):
+            manager.record_execution_time("analysis", float(value))
+
+        assert backends[1].get_latencies("analysis", 100) == [5.0, 6.0, 7.0, 8.0, 9.0]
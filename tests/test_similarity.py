@@ -0,0 +1,149 @@
+"""
+Unit tests for sketch-based near-duplicate detection.
+
+Tests cover ai_council/synthesis/similarity.py and its use by
+SynthesisLayerImpl redundancy removal.
+"""
+
+import random
+
+import pytest
+
+from ai_council.synthesis.layer import SynthesisLayerImpl
+from ai_council.synthesis.similarity import (
+    MinHasher, SimilarityIndex, jaccard, lsh_parameters, tokenize
+)
+
+
+def _corpus(size, seed=7):
+    """Build distinct documents, every third one a light edit of its predecessor."""
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(5000)]
+    documents = []
+    for i in range(size):
+        if i % 3 == 2:
+            words = documents[-1].split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        else:
+            words = rng.sample(vocabulary, 40)
+        documents.append(" ".join(words))
+    return documents
+
+
+def _exact_dedup(contents, threshold):
+    kept = []
+    for content in contents:
+        if not any(jaccard(tokenize(content), tokenize(other)) > threshold for other in kept):
+            kept.append(content)
+    return kept
+
+
+# =============================================================================
+# Building Block Tests
+# =============================================================================
+
+class TestSimilarityPrimitives:
+    """Tests for Jaccard, MinHash and band selection."""
+
+    def test_jaccard(self):
+        """Test exact Jaccard similarity, including empty sets."""
+        assert jaccard({"a", "b"}, {"b", "c"}) == pytest.approx(1 / 3)
+        assert jaccard(set(), {"a"}) == 0.0
+        assert jaccard(set(), set()) == 0.0
+
+    def test_signature_estimates_similarity(self):
+        """Test that matching signature slots approximate Jaccard similarity."""
+        hasher = MinHasher(num_perm=256)
+        first = {f"w{i}" for i in range(100)}
+        second = {f"w{i}" for i in range(25, 125)}
+
+        a, b = hasher.signature(first), hasher.signature(second)
+        estimate = sum(x == y for x, y in zip(a, b)) / len(a)
+
+        assert estimate == pytest.approx(jaccard(first, second), abs=0.1)
+
+    def test_banding_meets_recall_target(self):
+        """Test that chosen bands detect pairs at the threshold reliably."""
+        for threshold in (0.5, 0.6, 0.7, 0.9):
+            bands, rows = lsh_parameters(threshold, 64)
+            assert bands * rows <= 64
+            assert 1.0 - (1.0 - threshold ** rows) ** bands >= 0.99
+
+
+# =============================================================================
+# SimilarityIndex Tests
+# =============================================================================
+
+class TestSimilarityIndex:
+    """Tests for exact and LSH lookups."""
+
+    def test_exact_mode_for_small_inputs(self):
+        """Test that small indexes compare every stored item."""
+        index = SimilarityIndex(0.5)
+        index.add(tokenize("the cache is warm"))
+
+        assert index.find_similar(tokenize("the cache is cold")) == 0
+        assert index.find_similar(tokenize("completely different words")) is None
+        assert index.find_similar(set()) is None
+
+    def test_lsh_mode_matches_exact_check(self):
+        """Test that LSH lookups agree with brute force on a larger corpus."""
+        documents = _corpus(300)
+        index = SimilarityIndex(0.7, exact_limit=8)
+        for document in documents[:200]:
+            index.add(tokenize(document))
+
+        for document in documents[200:]:
+            tokens = tokenize(document)
+            expected = any(jaccard(tokens, tokenize(d)) > 0.7 for d in documents[:200])
+            assert (index.find_similar(tokens) is not None) == expected
+
+    def test_find_or_add_hashes_each_set_once(self, monkeypatch):
+        """Test that find_or_add matches find_similar then add with one signature per set."""
+        documents = _corpus(120)
+        combined = SimilarityIndex(0.7, exact_limit=8)
+        separate = SimilarityIndex(0.7, exact_limit=8)
+        for document in documents[:8]:
+            combined.add(tokenize(document))
+            separate.add(tokenize(document))
+        calls = []
+        signature = combined._hasher.signature
+        monkeypatch.setattr(combined._hasher, "signature", lambda tokens: calls.append(1) or signature(tokens))
+
+        for document in documents[8:]:
+            tokens = tokenize(document)
+            expected = separate.find_similar(tokens)
+            if expected is None:
+                separate.add(tokens)
+            assert combined.find_or_add(tokens) == expected
+
+        assert len(combined) == len(separate)
+        assert len(calls) == len(documents) - 8
+
+    def test_invalid_threshold_rejected(self):
+        """Test that thresholds outside [0, 1] raise ValueError."""
+        with pytest.raises(ValueError):
+            SimilarityIndex(1.5)
+
+
+# =============================================================================
+# Synthesis Integration Tests
+# =============================================================================
+
+class TestSynthesisRedundancy:
+    """Tests for redundancy removal built on the index."""
+
+    def test_remove_redundancy_matches_pairwise(self):
+        """Test that deduplication keeps the same contents as the pairwise check."""
+        documents = _corpus(120)
+        synthesis = SynthesisLayerImpl()
+
+        assert synthesis._remove_redundancy(documents) == _exact_dedup(documents, 0.7)
+
+    def test_unique_information_skips_known_sentences(self):
+        """Test that sentences already present aren't repeated."""
+        synthesis = SynthesisLayerImpl()
+        existing = "Caching reduces latency for hot keys. Invalidate entries on write."
+        new = "Caching reduces latency for hot keys. Use a TTL for rarely updated data."
+
+        assert synthesis._extract_unique_information(new, existing) == "Use a TTL for rarely updated data"
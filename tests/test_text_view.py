@@ -0,0 +1,113 @@
+"""
+Unit tests for the cached response text view.
+
+Tests cover ai_council/core/text_view.py and the AgentResponse.text_view
+property shared by the agent, arbitration and synthesis.
+"""
+
+import dataclasses
+
+import pytest
+
+from ai_council.core.models import AgentResponse, Subtask, TaskType
+from ai_council.core.text_view import TextView
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel
+
+
+# =============================================================================
+# TextView Tests
+# =============================================================================
+
+class TestTextView:
+    """Tests for lazily derived text forms."""
+
+    def test_derived_forms(self):
+        """Test lowercase, tokens and token set."""
+        view = TextView("  Cache HOT keys. Cache cold ones  ")
+
+        assert view.lower == "  cache hot keys. cache cold ones  "
+        assert view.stripped_length == 31
+        assert view.tokens == ["cache", "hot", "keys.", "cache", "cold", "ones"]
+        assert view.token_set == {"cache", "hot", "keys.", "cold", "ones"}
+
+    def test_forms_are_cached(self):
+        """Test that each derived form is built once."""
+        view = TextView("Some Text")
+
+        assert view.lower is view.lower
+        assert view.tokens is view.tokens
+        assert view.keyword_hits(["some"]) is view.keyword_hits(["some"])
+
+    @pytest.mark.parametrize("text", ["", "no periods", "a.b", ".start", "end.", "a..b. c"])
+    def test_sentences_match_split(self, text):
+        """Test that sentence spans reproduce str.split('.')."""
+        view = TextView(text)
+
+        assert view.sentences == text.split('.')
+        assert [text[start:end] for start, end in view.sentence_spans] == text.split('.')
+
+    def test_keyword_hits(self):
+        """Test occurrence counts and presence checks."""
+        view = TextView("Maybe yes, maybe no")
+
+        assert view.keyword_hits(["maybe", "yes", "never"]) == {"maybe": 2, "yes": 1, "never": 0}
+        assert view.count_present(["maybe", "yes", "never"]) == 2
+        assert not view.contains_any(["never"])
+
+
+# =============================================================================
+# AgentResponse Integration Tests
+# =============================================================================
+
+class TestAgentResponseTextView:
+    """Tests for the view attached to agent responses."""
+
+    def test_view_cached_until_content_changes(self):
+        """Test that the view is reused and rebuilt after the content changes."""
+        response = AgentResponse(subtask_id="s1", model_used="m", content="First answer")
+        view = response.text_view
+
+        assert response.text_view is view
+        response.content = "Second answer"
+        assert response.text_view.lower == "second answer"
+
+    def test_view_is_not_a_field(self):
+        """Test that the cached view stays out of the dataclass fields and asdict()."""
+        response = AgentResponse(subtask_id="s1", model_used="m", content="First answer")
+        response.text_view
+
+        assert "_text_view" not in {f.name for f in dataclasses.fields(AgentResponse)}
+        assert "_text_view" not in dataclasses.asdict(response)
+
+    def test_setter_rejects_mismatched_view(self):
+        """Test that a view for different text can't be attached."""
+        response = AgentResponse(subtask_id="s1", model_used="m", content="First answer")
+
+        with pytest.raises(ValueError):
+            response.text_view = TextView("Other text")
+
+    def test_agent_attaches_assessment_view(self):
+        """Test that the agent reuses its assessment view on the response."""
+        agent = BaseExecutionAgent(max_retries=0)
+        subtask = Subtask(parent_task_id="t1", content="Explain caching", task_type=TaskType.REASONING)
+        model = MockAIModel(
+            "gpt-mock", response_template="Assuming a warm cache, reads are clearly fast.",
+            failure_rate=0.0, response_delay=0.0
+        )
+
+        response = agent.execute(subtask, model)
+
+        assert response.text_view._lower is not None
+        assert response.self_assessment.assumptions[0] == "Assuming a warm cache, reads are clearly fast"
+
+    def test_assessment_hooks_accept_plain_text(self):
+        """Test that the confidence and assumption hooks build their own view."""
+        agent = BaseExecutionAgent(max_retries=0)
+        subtask = Subtask(parent_task_id="t1", content="Explain caching", task_type=TaskType.REASONING)
+        text = "Assuming a warm cache, reads are clearly fast."
+        view = TextView(text)
+
+        assert agent._calculate_confidence(text, subtask) == agent._calculate_confidence(text, subtask, view)
+        assert agent._extract_assumptions(text, subtask) == agent._extract_assumptions(text, subtask, view)
+        assert "Assuming a warm cache, reads are clearly fast" in agent._extract_assumptions(text, subtask)
@@ -0,0 +1,283 @@
+"""
+Unit tests for per-request tracing spans.
+
+Tests cover ai_council/core/tracing.py and the spans the orchestration layer
+attaches to ExecutionMetadata.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from ai_council.analysis.decomposer import BasicTaskDecomposer
+from ai_council.analysis.engine import BasicAnalysisEngine
+from ai_council.arbitration.layer import ConcreteArbitrationLayer
+from ai_council.core import serialization
+from ai_council.core.models import ExecutionMode, ModelCapabilities, TaskType
+from ai_council.core.tracing import (
+    InMemorySpanExporter, JsonlSpanExporter, OtlpJsonSpanExporter, Tracer,
+    create_span_exporter, tracer
+)
+from ai_council.execution.agent import BaseExecutionAgent
+from ai_council.execution.mock_models import MockAIModel
+from ai_council.orchestration.layer import ConcreteOrchestrationLayer
+from ai_council.routing.context_protocol import ModelContextProtocolImpl
+from ai_council.routing.registry import ModelRegistryImpl
+from ai_council.synthesis.layer import SynthesisLayerImpl
+
+
+@pytest.fixture
+def layer():
+    """Create an orchestration layer with one reliable mock model."""
+    registry = ModelRegistryImpl()
+    registry.register_model(
+        MockAIModel("mock-model", response_template="Caching keeps hot data close to the caller.",
+                    failure_rate=0.0, response_delay=0.0),
+        ModelCapabilities(
+            task_types=list(TaskType),
+            cost_per_token=0.001,
+            average_latency=1.0,
+            max_context_length=8192,
+            reliability_score=0.9
+        )
+    )
+    return ConcreteOrchestrationLayer(
+        analysis_engine=BasicAnalysisEngine(),
+        task_decomposer=BasicTaskDecomposer(),
+        model_context_protocol=ModelContextProtocolImpl(registry),
+        execution_agent=BaseExecutionAgent(max_retries=0),
+        arbitration_layer=ConcreteArbitrationLayer(),
+        synthesis_layer=SynthesisLayerImpl(),
+        model_registry=registry
+    )
+
+
+@pytest.fixture
+def exporter():
+    """Export the global tracer's spans to memory for the test."""
+    exporter = InMemorySpanExporter()
+    tracer.configure(enabled=True, exporters=[exporter])
+    yield exporter
+    tracer.configure(enabled=True, exporters=[])
+
+
+def _ancestors(spans, span):
+    by_id = {s["span_id"]: s for s in spans}
+    names = []
+    while span["parent_id"]:
+        span = by_id[span["parent_id"]]
+        names.append(span["name"])
+    return names
+
+
+# =============================================================================
+# Tracer Tests
+# =============================================================================
+
+class TestTracer:
+    """Tests for building span trees."""
+
+    def test_spans_nest_and_close(self):
+        """Test parent links, durations and the sink copy."""
+        local = Tracer()
+        sink = []
+
+        with local.trace("request", {"mode": "fast"}, sink=sink):
+            with local.span("analysis", step=1):
+                local.record_span("queue_wait", 0.0, 0.5)
+
+        assert [span["name"] for span in sink] == ["request", "analysis", "queue_wait"]
+        request, analysis, wait = sink
+        assert request["parent_id"] is None and request["attributes"] == {"mode": "fast"}
+        assert analysis["parent_id"] == request["span_id"]
+        assert wait["parent_id"] == analysis["span_id"] and wait["duration"] == 0.5
+        assert all(span["duration"] is not None for span in sink)
+        assert len(set(span["trace_id"] for span in sink)) == 1
+
+    def test_no_op_outside_trace_or_when_disabled(self):
+        """Test that spans cost nothing without an active trace."""
+        local = Tracer(enabled=False)
+        sink = []
+
+        with local.span("orphan") as span:
+            assert span is None
+        with local.trace("request", sink=sink) as trace:
+            assert trace is None
+            with local.span("stage") as span:
+                assert span is None
+
+        assert sink == []
+        assert local.record_span("wait", 0.0, 1.0) is None
+
+    def test_errors_mark_span(self):
+        """Test that an escaping exception marks the span and its trace root."""
+        local = Tracer()
+        sink = []
+
+        with pytest.raises(ValueError):
+            with local.trace("request", sink=sink):
+                with local.span("synthesis"):
+                    raise ValueError("boom")
+
+        assert [(span["status"], span["attributes"]["error"]) for span in sink] == [
+            ("error", "ValueError"), ("error", "ValueError")
+        ]
+
+    def test_bind_carries_context_to_threads(self):
+        """Test that bound work joins the trace and records its queue wait."""
+        local = Tracer()
+        sink = []
+
+        def work():
+            with local.span("model_call"):
+                return threading.current_thread().name
+
+        with local.trace("request", sink=sink):
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="worker") as pool:
+                name = pool.submit(local.bind(work, "queue_wait", subtask_id="s1")).result()
+
+        assert name.startswith("worker")
+        request, wait, call = sink
+        assert wait["name"] == "queue_wait" and wait["attributes"] == {"subtask_id": "s1"}
+        assert wait["parent_id"] == call["parent_id"] == request["span_id"]
+
+    def test_finish_trace_only_once(self):
+        """Test that a trace is exported and copied a single time."""
+        memory = InMemorySpanExporter()
+        local = Tracer(exporters=[memory])
+        sink = []
+        trace = local.start_trace("request")
+
+        local.finish_trace(trace, sink)
+        local.finish_trace(trace, sink)
+
+        assert len(sink) == 1
+        assert len(memory.spans) == 1
+
+
+# =============================================================================
+# Exporter Tests
+# =============================================================================
+
+class TestExporters:
+    """Tests for sending finished traces elsewhere."""
+
+    def test_jsonl_exporter_appends_lines(self, tmp_path):
+        """Test one JSON line per span, appended across traces."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        local = Tracer(exporters=[JsonlSpanExporter(path)])
+
+        for _ in range(2):
+            with local.trace("request"):
+                with local.span("analysis"):
+                    pass
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["name"] for record in records] == ["request", "analysis"] * 2
+
+    def test_otlp_exporter_posts_to_collector(self):
+        """Test that a local collector receives OTLP/JSON resource spans."""
+        received = []
+
+        class Collector(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                received.append((self.path, json.loads(self.rfile.read(length))))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Collector)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            exporter = OtlpJsonSpanExporter(f"http://127.0.0.1:{server.server_port}/v1/traces")
+            local = Tracer(exporters=[exporter])
+            with local.trace("request", {"execution_mode": "fast"}):
+                with local.span("model_call", attempt=2):
+                    pass
+            exporter.shutdown()
+        finally:
+            server.shutdown()
+
+        assert len(received) == 1
+        path, body = received[0]
+        spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert path == "/v1/traces"
+        assert [span["name"] for span in spans] == ["request", "model_call"]
+        assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+        assert spans[1]["attributes"] == [{"key": "attempt", "value": {"intValue": "2"}}]
+        assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+
+    def test_create_span_exporter(self, tmp_path):
+        """Test exporter selection from configuration values."""
+        assert create_span_exporter("none", tmp_path) is None
+        assert create_span_exporter("jsonl", tmp_path).path == tmp_path / "traces.jsonl"
+        assert create_span_exporter("otlp", tmp_path).endpoint == "http://localhost:4318/v1/traces"
+        with pytest.raises(ValueError):
+            create_span_exporter("zipkin", tmp_path)
+
+
+# =============================================================================
+# Pipeline Span Tests
+# =============================================================================
+
+class TestPipelineSpans:
+    """Tests for the spans attached to processed requests."""
+
+    def test_request_spans_cover_stages(self, layer, exporter):
+        """Test that every stage is a span under the request root."""
+        response = layer.process_request("Explain how caching works", ExecutionMode.BALANCED)
+        spans = response.execution_metadata.spans
+        names = [span["name"] for span in spans]
+
+        assert response.success
+        assert names[0] == "request"
+        for stage in ("analysis", "decomposition", "planning", "subtask", "model_execution",
+                      "concurrency_wait", "model_call", "synthesis"):
+            assert stage in names
+        model_call = next(span for span in spans if span["name"] == "model_call")
+        assert _ancestors(spans, model_call) == ["model_execution", "subtask", "execution", "request"]
+        assert model_call["attributes"] == {"model_id": "mock-model", "attempt": 1}
+        assert [span.span_id for span in exporter.spans] == [span["span_id"] for span in spans]
+
+    def test_stream_and_batch_attach_spans(self, layer, exporter):
+        """Test that streamed and batched responses carry their own traces."""
+        final = list(layer.process_request_stream("Explain caching", ExecutionMode.FAST))[-1]
+        results = dict(layer.process_batch(["Explain caching", "Explain queues"], ExecutionMode.FAST))
+
+        assert final.execution_metadata.spans[0]["attributes"]["streaming"] is True
+        assert "model_call" in [span["name"] for span in final.execution_metadata.spans]
+        for response in results.values():
+            spans = response.execution_metadata.spans
+            assert "queue_wait" in [span["name"] for span in spans]
+            assert len(set(span["trace_id"] for span in spans)) == 1
+        assert results[0].execution_metadata.spans[0]["trace_id"] != results[1].execution_metadata.spans[0]["trace_id"]
+
+    def test_stream_trace_not_active_between_sections(self, layer, exporter):
+        """Test that spans the consumer opens while iterating a stream stay out of its trace."""
+        with tracer.trace("consumer") as consumer:
+            items = []
+            for item in layer.process_request_stream("Explain caching", ExecutionMode.FAST):
+                with tracer.span("handle_item"):
+                    items.append(item)
+
+        stream_spans = items[-1].execution_metadata.spans
+        handled = [span for span in consumer.spans if span.name == "handle_item"]
+        assert len(handled) == len(items)
+        assert all(span.parent_id == consumer.root.span_id for span in handled)
+        assert "handle_item" not in [span["name"] for span in stream_spans]
+        assert consumer.root.trace_id not in {span["trace_id"] for span in stream_spans}
+
+    def test_spans_survive_serialization(self, layer, exporter):
+        """Test that spans round-trip through the binary encoding."""
+        response = layer.process_request("Explain caching", ExecutionMode.FAST)
+
+        decoded = serialization.decode(serialization.encode(response))
+
+        assert decoded.execution_metadata.spans == response.execution_metadata.spans
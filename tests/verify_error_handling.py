@@ -21,11 +21,11 @@ class TestErrorHandling(unittest.TestCase):
         self.mock_load_config = self.config_patcher.start()
         
         # Mock configure_logging to suppress output
-        self.logging_patcher = patch('ai_council.main.configure_logging')
+        self.logging_patcher = patch('ai_council.utils.logging.configure_logging')
         self.mock_configure_logging = self.logging_patcher.start()
         
         # Mock AICouncilFactory
-        self.factory_patcher = patch('ai_council.main.AICouncilFactory')
+        self.factory_patcher = patch('ai_council.factory.AICouncilFactory')
         self.mock_factory_cls = self.factory_patcher.start()
         self.mock_factory = self.mock_factory_cls.return_value
         
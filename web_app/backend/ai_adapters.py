@@ -10,10 +10,10 @@ from ai_council.core.interfaces import AIModel
 class OpenAIAdapter(AIModel):
     """Adapter for OpenAI models (GPT-4, GPT-3.5)."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.base_url = "https://api.openai.com/v1"
+        self.base_url = (base_url or "https://api.openai.com/v1").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -63,10 +63,10 @@ class OpenAIAdapter(AIModel):
 class AnthropicAdapter(AIModel):
     """Adapter for Anthropic Claude models."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        self.base_url = "https://api.anthropic.com/v1"
+        self.base_url = (base_url or "https://api.anthropic.com/v1").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -116,9 +116,10 @@ class AnthropicAdapter(AIModel):
 class GoogleGeminiAdapter(AIModel):
     """Adapter for Google Gemini models."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        self.base_url = (base_url or "https://generativelanguage.googleapis.com/v1beta").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -134,7 +135,7 @@ class GoogleGeminiAdapter(AIModel):
         
         # Use v1beta for gemini-pro, or try gemini-1.5-flash for v1
         # Try v1beta first
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model_id}:generateContent?key={self.api_key}"
+        url = f"{self.base_url}/models/{self.model_id}:generateContent?key={self.api_key}"
         
         data = {
             "contents": [{
@@ -166,10 +167,10 @@ class GoogleGeminiAdapter(AIModel):
 class GroqAdapter(AIModel):
     """Adapter for Groq models (Llama, Mixtral)."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
-        self.base_url = "https://api.groq.com/openai/v1"
+        self.base_url = (base_url or "https://api.groq.com/openai/v1").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -219,10 +220,10 @@ class GroqAdapter(AIModel):
 class MistralAdapter(AIModel):
     """Adapter for Mistral AI models."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("MISTRAL_API_KEY")
-        self.base_url = "https://api.mistral.ai/v1"
+        self.base_url = (base_url or "https://api.mistral.ai/v1").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -272,10 +273,10 @@ class MistralAdapter(AIModel):
 class XAIAdapter(AIModel):
     """Adapter for xAI Grok models."""
     
-    def __init__(self, model_id: str, api_key: Optional[str] = None):
+    def __init__(self, model_id: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.model_id = model_id
         self.api_key = api_key or os.getenv("XAI_API_KEY")
-        self.base_url = "https://api.x.ai/v1"
+        self.base_url = (base_url or "https://api.x.ai/v1").rstrip("/")
         
     def get_model_id(self) -> str:
         return self.model_id
@@ -322,8 +323,17 @@ class XAIAdapter(AIModel):
         return loop.run_until_complete(self.generate_async(prompt, **kwargs))
 
 
-def create_model_adapter(provider: str, model_id: str, api_key: Optional[str] = None) -> AIModel:
-    """Factory function to create appropriate model adapter."""
+def create_model_adapter(
+    provider: str,
+    model_id: str,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None
+) -> AIModel:
+    """Factory function to create appropriate model adapter.
+    
+    A base_url replaces the provider's public endpoint, for example to point
+    the adapter at a proxy or at ``python -m ai_council.bench.stub_server``.
+    """
     adapters = {
         "openai": OpenAIAdapter,
         "anthropic": AnthropicAdapter,
@@ -337,4 +347,4 @@ def create_model_adapter(provider: str, model_id: str, api_key: Optional[str] =
     if not adapter_class:
         raise ValueError(f"Unknown provider: {provider}")
     
-    return adapter_class(model_id, api_key)
+    return adapter_class(model_id, api_key, base_url)
@@ -1,9 +1,9 @@
 """
 FastAPI backend for AI Council web interface.
 """
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import asyncio
@@ -15,7 +15,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ai_council.main import AICouncil
-from ai_council.core.models import ExecutionMode
+from ai_council.core.admission import AdmissionRejectedError, BoundedExecutor
+from ai_council.core.metrics import CONTENT_TYPE, metrics_registry
+from ai_council.core.models import ExecutionMode, SynthesisSection
+from ai_council.core.profiling import PROFILE_HEADER, request_profiler
 
 app = FastAPI(title="AI Council API", version="1.0.0")
 
@@ -45,6 +48,26 @@ app.add_middleware(
 # Global AI Council instance
 ai_council = None
 
+# Runs the synchronous pipeline off the event loop, rejecting work beyond its backlog
+pipeline_executor = None
+
+
+def busy_error(error: AdmissionRejectedError) -> HTTPException:
+    """Build the 429 response for a request rejected by admission control."""
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+def _parse_mode(name: str) -> ExecutionMode:
+    """Map a request's mode name to an ExecutionMode, defaulting to balanced."""
+    try:
+        return ExecutionMode(name.lower())
+    except ValueError:
+        return ExecutionMode.BALANCED
+
 
 class RequestModel(BaseModel):
     query: str
@@ -56,10 +79,15 @@ class EstimateModel(BaseModel):
     mode: str = "balanced"
 
 
+class BatchRequestModel(BaseModel):
+    queries: List[str]
+    mode: str = "balanced"
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize AI Council on startup."""
-    global ai_council
+    global ai_council, pipeline_executor
     try:
         # Load environment variables
         from dotenv import load_dotenv
@@ -72,6 +100,10 @@ async def startup_event():
             os.environ['AI_COUNCIL_CONFIG'] = str(config_path)
         
         ai_council = AICouncil(config_path if config_path.exists() else None)
+        pipeline_executor = BoundedExecutor(
+            max_workers=ai_council.config.resilience.request_workers,
+            max_queue=ai_council.config.resilience.request_queue_size
+        )
         print("[OK] AI Council initialized successfully")
     except RuntimeError as e:
         # Handle configuration validation errors gracefully without stack trace
@@ -96,6 +128,13 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the pipeline workers."""
+    if pipeline_executor is not None:
+        pipeline_executor.shutdown(wait=False)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -111,26 +150,40 @@ async def get_status():
     """Get system status."""
     try:
         status = ai_council.get_system_status()
+        status["admission"] = pipeline_executor.get_status()
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose the metrics registry in Prometheus text exposition format."""
+    return Response(content=metrics_registry.render(), media_type=CONTENT_TYPE)
+
+
 @app.post("/api/process")
-async def process_request(request: RequestModel):
-    """Process a user request."""
+async def process_request(
+    request: RequestModel,
+    profile: Optional[str] = Header(None, alias=PROFILE_HEADER)
+):
+    """
+    Process a user request.
+    
+    An ``X-AI-Council-Profile: 1`` (or ``true``) header profiles the request
+    regardless of sampling, but only when ``profiling.allow_header`` is set in
+    the configuration; otherwise the header is ignored. The streaming and
+    batch endpoints don't honour it, since their work is spread over pool
+    threads and isn't profiled.
+    """
     try:
-        # Map mode string to ExecutionMode
-        mode_map = {
-            "fast": ExecutionMode.FAST,
-            "balanced": ExecutionMode.BALANCED,
-            "best_quality": ExecutionMode.BEST_QUALITY
-        }
-        
-        mode = mode_map.get(request.mode.lower(), ExecutionMode.BALANCED)
+        mode = _parse_mode(request.mode)
         
-        # Process the request
-        response = ai_council.process_request(request.query, mode)
+        # Process the request off the event loop
+        process = ai_council.process_request
+        if profile is not None and profile.strip().lower() in ("1", "true"):
+            process = request_profiler.forced(process)
+        response = await pipeline_executor.run(process, request.query, mode)
         
         return {
             "success": response.success,
@@ -140,26 +193,105 @@ async def process_request(request: RequestModel):
             "execution_time": response.execution_metadata.total_execution_time if response.execution_metadata else 0,
             "cost": response.cost_breakdown.total_cost if response.cost_breakdown else 0,
             "execution_path": response.execution_metadata.execution_path if response.execution_metadata else [],
+            "spans": response.execution_metadata.spans if response.execution_metadata else [],
             "error_message": response.error_message if not response.success else None
         }
+    except AdmissionRejectedError as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/process/stream")
+async def process_request_stream(request: RequestModel):
+    """
+    Process a user request, streaming sections as newline-delimited JSON.
+    
+    Streamed requests are not profiled, so ``X-AI-Council-Profile`` is ignored.
+    """
+    mode = _parse_mode(request.mode)
+    
+    try:
+        items = pipeline_executor.stream(ai_council.process_request_stream, request.query, mode)
+    except AdmissionRejectedError as e:
+        raise busy_error(e)
+    
+    async def events():
+        async for item in items:
+            if isinstance(item, SynthesisSection):
+                event = {
+                    "type": "section",
+                    "index": item.index,
+                    "subtask_id": item.subtask_id,
+                    "content": item.content,
+                    "model_used": item.model_used
+                }
+            else:
+                event = {
+                    "type": "result",
+                    "success": item.success,
+                    "content": item.content,
+                    "confidence": item.overall_confidence,
+                    "models_used": item.models_used,
+                    "execution_time": item.execution_metadata.total_execution_time if item.execution_metadata else 0,
+                    "cost": item.cost_breakdown.total_cost if item.cost_breakdown else 0,
+                    "execution_path": item.execution_metadata.execution_path if item.execution_metadata else [],
+                    "spans": item.execution_metadata.spans if item.execution_metadata else [],
+                    "error_message": item.error_message if not item.success else None
+                }
+            yield json.dumps(event) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.post("/api/process/batch")
+async def process_batch(request: BatchRequestModel):
+    """
+    Process many queries, streaming results as newline-delimited JSON in completion order.
+    
+    Batch items are not profiled, so ``X-AI-Council-Profile`` is ignored.
+    """
+    if not request.queries:
+        raise HTTPException(status_code=400, detail="queries must not be empty")
+    
+    mode = _parse_mode(request.mode)
+    
+    # The batch takes one admission slot and schedules its items on its own bounded pool
+    try:
+        results = pipeline_executor.stream(ai_council.process_batch, request.queries, mode)
+    except AdmissionRejectedError as e:
+        raise busy_error(e)
+    
+    async def events():
+        async for index, response in results:
+            event = {
+                "type": "result",
+                "index": index,
+                "success": response.success,
+                "content": response.content,
+                "confidence": response.overall_confidence,
+                "models_used": response.models_used,
+                "execution_time": response.execution_metadata.total_execution_time if response.execution_metadata else 0,
+                "cost": response.cost_breakdown.total_cost if response.cost_breakdown else 0,
+                "execution_path": response.execution_metadata.execution_path if response.execution_metadata else [],
+                "spans": response.execution_metadata.spans if response.execution_metadata else [],
+                "error_message": response.error_message if not response.success else None
+            }
+            yield json.dumps(event) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @app.post("/api/estimate")
 async def estimate_cost(request: EstimateModel):
     """Estimate cost and time for a request."""
     try:
-        mode_map = {
-            "fast": ExecutionMode.FAST,
-            "balanced": ExecutionMode.BALANCED,
-            "best_quality": ExecutionMode.BEST_QUALITY
-        }
-        
-        mode = mode_map.get(request.mode.lower(), ExecutionMode.BALANCED)
-        estimate = ai_council.estimate_cost(request.query, mode)
+        mode = _parse_mode(request.mode)
+        estimate = await pipeline_executor.run(ai_council.estimate_cost, request.query, mode)
         
         return estimate
+    except AdmissionRejectedError as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -168,8 +300,10 @@ async def estimate_cost(request: EstimateModel):
 async def analyze_tradeoffs(request: RequestModel):
     """Analyze cost-quality trade-offs."""
     try:
-        analysis = ai_council.analyze_tradeoffs(request.query)
+        analysis = await pipeline_executor.run(ai_council.analyze_tradeoffs, request.query)
         return analysis
+    except AdmissionRejectedError as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -194,14 +328,16 @@ async def websocket_endpoint(websocket: WebSocket):
             })
             
             # Process request
-            mode_map = {
-                "fast": ExecutionMode.FAST,
-                "balanced": ExecutionMode.BALANCED,
-                "best_quality": ExecutionMode.BEST_QUALITY
-            }
-            
-            execution_mode = mode_map.get(mode.lower(), ExecutionMode.BALANCED)
-            response = ai_council.process_request(query, execution_mode)
+            execution_mode = _parse_mode(mode)
+            try:
+                response = await pipeline_executor.run(ai_council.process_request, query, execution_mode)
+            except AdmissionRejectedError as e:
+                await websocket.send_json({
+                    "type": "busy",
+                    "message": str(e),
+                    "retry_after": e.retry_after
+                })
+                continue
             
             # Send result
             await websocket.send_json({